@@ -54,6 +54,7 @@ public:
     friend class EKUIter;
     friend class Key;
     friend class Hash;
+    friend class VerifyStream;
 };
 
 class CertIter
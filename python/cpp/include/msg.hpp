@@ -20,6 +20,18 @@ protected:
     BYTE *data;
     DWORD data_length;
     HCRYPTMSG get_handle() throw (CSPException);
+    void decode(BYTE *STRING, DWORD LENGTH) throw(CSPException);
+    bool verify_handle(DWORD n) throw(CSPException);
+    // инициализация с копированием данных сообщения, которые нужны функциям
+    // проверки подписи в исходном виде (см. Signature)
+    CryptMsg(BYTE *STRING, DWORD LENGTH, Crypt *ctx, bool keep_data) throw(CSPException);
+    // открытие сообщения для подписи закрытым ключом сертификата signer
+    static HCRYPTMSG open_to_sign(Cert *signer, bool detach, PCMSG_STREAM_INFO stream) throw(CSPException);
+    // открытие сообщения для шифрования на сертификатах получателей
+    static HCRYPTMSG open_to_encrypt(const std::vector<Cert *> &recipients, Crypt *ctx, PCMSG_STREAM_INFO stream) throw(CSPException);
+    // расшифрование открытого на декодирование сообщения закрытым ключом crt
+    static void decrypt_handle(HCRYPTMSG hmsg, Cert *crt) throw(CSPException, CSPNotFound);
+    static void decrypt_handle(HCRYPTMSG hmsg, CertStore *store) throw(CSPException, CSPNotFound);
 public:
     // инициализация сообщения для декодирования
     CryptMsg(BYTE *STRING, DWORD LENGTH, Crypt *ctx=NULL) throw(CSPException);
@@ -31,6 +43,9 @@ public:
     virtual ~CryptMsg() throw(CSPException);
     int num_signers() throw(CSPException);
     void get_data(BYTE **s, DWORD *slen) throw(CSPException);
+    // запись данных сообщения в буфер вызывающего без промежуточной копии
+    DWORD data_size() throw(CSPException);
+    DWORD get_data_into(BYTE *OUTBUF, DWORD OUTLEN) throw(CSPException);
     bool verify_cert(Cert *c) throw(CSPException);
     DWORD get_type() throw(CSPException);
     void add_recipient(Cert *c) throw(CSPException);
@@ -38,10 +53,17 @@ public:
     void decrypt(BYTE **s, DWORD *slen, CertStore *store) throw(CSPException, CSPNotFound);
     virtual void sign_data(BYTE *STRING, DWORD LENGTH, BYTE **s, DWORD *slen,
             Cert *signer, bool detach=0) throw(CSPException);
+    // подписывание/шифрование с сохранением закодированного сообщения в
+    // объекте, результат забирается через get_data() или get_data_into()
+    void sign(BYTE *STRING, DWORD LENGTH, Cert *signer, bool detach=0) throw(CSPException);
+    void encrypt(BYTE *STRING, DWORD LENGTH) throw(CSPException);
     bool verify(DWORD n) throw(CSPException);
 
     friend class CertStore;
     friend class CertInfo;
+    friend class SignStream;
+    friend class DecryptStream;
+    friend class EncryptStream;
 };
 
 #endif
@@ -6,7 +6,8 @@
 class RCObj
 {
 protected:
-    signed int refcount;
+    // Обертки вызываются без GIL, поэтому счетчик изменяется атомарно
+    volatile LONG refcount;
 public:
     RCObj() {
         refcount = 0;
@@ -9,7 +9,7 @@ public:
     Signature(Crypt *ctx=NULL) throw(CSPException) : CryptMsg(ctx) {}
 
     Signature(BYTE *STRING, DWORD LENGTH, Crypt *ctx=NULL) throw(CSPException)
-        : CryptMsg(STRING, LENGTH, ctx) {}
+        : CryptMsg(STRING, LENGTH, ctx, true) {}
 
     bool verify_data(BYTE *STRING, DWORD LENGTH, int n) throw(CSPException);
 
@@ -0,0 +1,100 @@
+#ifndef STREAM_HPP_INCLUDED
+#define STREAM_HPP_INCLUDED
+
+#include "common.hpp"
+#include "rcobj.hpp"
+#include "except.hpp"
+#include <vector>
+
+class Cert;
+class Crypt;
+
+/**
+ * Потоковое кодирование/декодирование CMS сообщений (CMSG_STREAM_INFO).
+ * Данные подаются порциями через update(), результат, накопленный функцией
+ * обратного вызова, возвращается из каждого update() и из finish(), так что
+ * объем занятой памяти не зависит от размера сообщения.
+ */
+class CMSStream : public RCObj
+{
+protected:
+    HCRYPTMSG hmsg;
+    std::vector<BYTE> out;
+    CMSG_STREAM_INFO stream_info;
+    bool finished;
+
+    static BOOL WINAPI stream_output(const void *pvArg, BYTE *pbData, DWORD cbData, BOOL fFinal);
+    void take_output(BYTE **s, DWORD *slen) throw(CSPException);
+    void close() throw(CSPException);
+    // вызывается перед первой порцией входных данных, если сообщение еще
+    // не открыто
+    virtual void open() throw(CSPException) {};
+    // вызывается после каждой порции входных данных
+    virtual void on_update(bool final) throw(CSPException, CSPNotFound) {};
+    CMSStream();
+public:
+    virtual ~CMSStream() throw(CSPException);
+    void update(BYTE *STRING, DWORD LENGTH, BYTE **s, DWORD *slen) throw(CSPException, CSPNotFound);
+    void finish(BYTE **s, DWORD *slen) throw(CSPException, CSPNotFound);
+};
+
+/**
+ * Потоковое подписывание: SignStream(signer, detach) -> update()... -> finish().
+ */
+class SignStream : public CMSStream
+{
+private:
+    Cert *signer;
+public:
+    SignStream(Cert *signer, bool detach=1) throw(CSPException);
+    virtual ~SignStream() throw(CSPException);
+};
+
+/**
+ * Потоковое расшифрование: DecryptStream(cert) -> update()... -> finish().
+ * Расшифрование начинается, как только из заголовка сообщения прочитаны
+ * сведения о получателях.
+ */
+class DecryptStream : public CMSStream
+{
+private:
+    Cert *cert;
+    bool decrypted;
+protected:
+    virtual void on_update(bool final) throw(CSPException, CSPNotFound);
+public:
+    DecryptStream(Cert *cert) throw(CSPException);
+    virtual ~DecryptStream() throw(CSPException);
+};
+
+/**
+ * Потоковое шифрование на сертификатах получателей:
+ * EncryptStream() -> add_recipient()... -> update()... -> finish().
+ * Сообщение кодируется с неопределенной длиной содержимого, каждая порция
+ * данных шифруется один раз.
+ */
+class EncryptStream : public CMSStream
+{
+private:
+    Crypt *cprov;
+    std::vector<Cert *> recipients;
+protected:
+    virtual void open() throw(CSPException);
+public:
+    EncryptStream(Crypt *ctx=NULL) throw(CSPException);
+    virtual ~EncryptStream() throw(CSPException);
+    void add_recipient(Cert *c) throw(CSPException);
+};
+
+/**
+ * Потоковая проверка отсоединенной подписи:
+ * VerifyStream(sig) -> update(data)... -> finish() -> verify(cert).
+ */
+class VerifyStream : public CMSStream
+{
+public:
+    VerifyStream(BYTE *STRING, DWORD LENGTH) throw(CSPException);
+    bool verify(Cert *c) throw(CSPException);
+};
+
+#endif
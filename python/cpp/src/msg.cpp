@@ -14,18 +14,26 @@ char *hashAlg(char *pubKeyAlg) {
     return (char *)szOID_CP_GOST_R3411_12_256;
 }
 
-HCRYPTMSG CryptMsg::get_handle() throw (CSPException) {
-    LOG("CryptMsg::get_handle()\n");
-    if (hmsg) {
-        return hmsg;
-    }
+void CryptMsg::decode(BYTE *STRING, DWORD LENGTH) throw(CSPException)
+{
     hmsg = CryptMsgOpenToDecode(MY_ENC_TYPE, 0, 0, cprov? cprov->hprov:0, NULL, NULL);
     if (!hmsg) {
         throw CSPException("CryptMsg.get_handle: Couldn't open message for decode");
     }
-    if ( !CryptMsgUpdate(hmsg, data, data_length, TRUE) ) {
-        throw CSPException("CCryptMsg.get_handle: couldn't update message");
+    if ( !CryptMsgUpdate(hmsg, STRING, LENGTH, TRUE) ) {
+        DWORD err = GetLastError();
+        CryptMsgClose(hmsg);
+        hmsg = 0;
+        throw CSPException("CCryptMsg.get_handle: couldn't update message", err);
     }
+}
+
+HCRYPTMSG CryptMsg::get_handle() throw (CSPException) {
+    LOG("CryptMsg::get_handle()\n");
+    if (hmsg) {
+        return hmsg;
+    }
+    decode(data, data_length);
     return hmsg;
 }
 
@@ -33,9 +41,12 @@ int CryptMsg::num_signers() throw(CSPException) {
     LOG("CryptMsg::num_signers()\n");
     if (data && data_length) {
         return CryptGetMessageSignerCount(MY_ENCODING_TYPE, data, data_length);
-    } else {
+    }
+    DWORD count = 0, temp = sizeof(DWORD);
+    if (!hmsg || !CryptMsgGetParam(hmsg, CMSG_SIGNER_COUNT_PARAM, 0, &count, &temp)) {
         return 0;
     }
+    return count;
 }
 
 bool CryptMsg::verify(DWORD n) throw(CSPException)
@@ -44,6 +55,10 @@ bool CryptMsg::verify(DWORD n) throw(CSPException)
     DWORD res, msg_size = 0;
     LOG("CryptMsg::verify(%lu)\n", n);
 
+    if (!data) {
+        return verify_handle(n);
+    }
+
     // Initialize the VerifyParams data structure.
     ZeroMemory(&VerifyParams, sizeof(VerifyParams));
     VerifyParams.cbSize = sizeof(CRYPT_VERIFY_MESSAGE_PARA);
@@ -64,6 +79,41 @@ bool CryptMsg::verify(DWORD n) throw(CSPException)
     return res && msg_size;
 }
 
+bool CryptMsg::verify_handle(DWORD n) throw(CSPException)
+{
+    // То же, что CryptVerifyMessageSignature, но по уже декодированному
+    // сообщению: сертификат n-го подписанта ищется среди сертификатов
+    // сообщения, подпись проверяется его открытым ключом.
+    HCRYPTMSG hmsg = get_handle();
+    DWORD temp = 0, msg_size = 0;
+    if (!CryptMsgGetParam(hmsg, CMSG_SIGNER_CERT_INFO_PARAM, n, NULL, &temp)) {
+        return false;
+    }
+    PCERT_INFO pci = (PCERT_INFO) malloc(temp);
+    if (!CryptMsgGetParam(hmsg, CMSG_SIGNER_CERT_INFO_PARAM, n, pci, &temp)) {
+        free(pci);
+        return false;
+    }
+    HCERTSTORE hstore = CertOpenStore(CERT_STORE_PROV_MSG, MY_ENC_TYPE, 0, 0, hmsg);
+    if (!hstore) {
+        DWORD err = GetLastError();
+        free(pci);
+        throw CSPException("CryptMsg.verify: Couldn't open message store", err);
+    }
+    PCCERT_CONTEXT pcert = CertGetSubjectCertificateFromStore(hstore, MY_ENC_TYPE, pci);
+    free(pci);
+    bool res = false;
+    if (pcert) {
+        res = CryptMsgControl(hmsg, 0, CMSG_CTRL_VERIFY_SIGNATURE, pcert->pCertInfo)
+            && CryptMsgGetParam(hmsg, CMSG_CONTENT_PARAM, 0, NULL, &msg_size)
+            && msg_size;
+        CertFreeCertificateContext(pcert);
+    }
+    CertCloseStore(hstore, 0);
+    LOG("    verification result: %lu, %i\n", n, res);
+    return res;
+}
+
 void CryptMsg::init(Crypt *ctx) throw(CSPException)
 {
     cprov = ctx;
@@ -81,6 +131,22 @@ CryptMsg::CryptMsg(BYTE *STRING, DWORD LENGTH, Crypt *ctx) throw(CSPException)
 {
     LOG("CryptMsg::CryptMsg(%p, %lu, %p)\n", STRING, LENGTH, ctx);
     init(ctx);
+    // Сообщение декодируется сразу из буфера вызывающего, без копирования,
+    // все дальнейшие операции идут через дескриптор сообщения.
+    try {
+        decode(STRING, LENGTH);
+    } catch (...) {
+        if (cprov) {
+            cprov->unref();
+        }
+        throw;
+    }
+};
+
+CryptMsg::CryptMsg(BYTE *STRING, DWORD LENGTH, Crypt *ctx, bool keep_data) throw(CSPException)
+{
+    LOG("CryptMsg::CryptMsg(%p, %lu, %p, %i)\n", STRING, LENGTH, ctx, keep_data);
+    init(ctx);
     data = new BYTE[LENGTH];
     data_length = LENGTH;
     memcpy(data, STRING, LENGTH);
@@ -101,49 +167,53 @@ void CryptMsg::add_recipient(Cert *c) throw(CSPException)
     }
 }
 
-void CryptMsg::encrypt_data(BYTE *STRING, DWORD LENGTH, BYTE **s, DWORD *slen) throw(CSPException)
+HCRYPTMSG CryptMsg::open_to_encrypt(const vector<Cert *> &recipients, Crypt *ctx, PCMSG_STREAM_INFO stream) throw(CSPException)
 {
-    LOG("CryptMsg::encrypt_data(%p, %u)\n", STRING, LENGTH);
-    CRYPT_ALGORITHM_IDENTIFIER EncryptAlgorithm;
-    CRYPT_ENCRYPT_MESSAGE_PARA EncryptParams;
     DWORD nrecs = recipients.size();
-    LOG("    nrecs: %i\n", nrecs);
-    PCCERT_CONTEXT *pRecipientCert = new PCCERT_CONTEXT[nrecs];
-    vector<Cert *>::const_iterator cii;
-    int i = 0;
-    for(cii=recipients.begin(); cii!=recipients.end(); cii++) {
-        LOG("    adding recipient cert %p\n", (*cii)->pcert);
-        pRecipientCert[i++] = (*cii)->pcert;
+    LOG("CryptMsg::open_to_encrypt(%u, %p, %p)\n", nrecs, ctx, stream);
+    vector<PCERT_INFO> infos(nrecs);
+    for (DWORD i = 0; i < nrecs; i++) {
+        infos[i] = recipients[i]->pcert->pCertInfo;
     }
-    LOG("    processed all recipient certs\n");
 
-    // Инициализация структуры с нулем.
-    memset(&EncryptAlgorithm, 0, sizeof(CRYPT_ALGORITHM_IDENTIFIER));
-//     EncryptAlgorithm.pszObjId = OID_CipherVar_Default;
-    EncryptAlgorithm.pszObjId = (LPSTR)ENCRYPT_OID;
+    CMSG_ENVELOPED_ENCODE_INFO EnvelopedInfo;
+    ZeroMemory(&EnvelopedInfo, sizeof(EnvelopedInfo));
+    EnvelopedInfo.cbSize = sizeof(CMSG_ENVELOPED_ENCODE_INFO);
+    if (ctx) {
+        EnvelopedInfo.hCryptProv = ctx->hprov;
+    }
+    EnvelopedInfo.ContentEncryptionAlgorithm.pszObjId = (LPSTR)ENCRYPT_OID;
+    EnvelopedInfo.cRecipients = nrecs;
+    EnvelopedInfo.rgpRecipients = nrecs? &infos[0] : NULL;
 
-    // Инициализация структуры CRYPT_ENCRYPT_MESSAGE_PARA.
-    memset(&EncryptParams, 0, sizeof(EncryptParams));
-    EncryptParams.cbSize =  sizeof(EncryptParams);
-    EncryptParams.dwMsgEncodingType = MY_ENCODING_TYPE;
-    if (cprov) {
-        EncryptParams.hCryptProv = cprov->hprov;
-    }
-    EncryptParams.ContentEncryptionAlgorithm = EncryptAlgorithm;
-
-    LOG("    getting encrypted data size\n");
-    // Вызов функции CryptEncryptMessage.
-    if(!CryptEncryptMessage(
-                &EncryptParams,
-                nrecs,
-                pRecipientCert,
-                STRING,
-                LENGTH,
-                NULL,
-                slen)) {
+    HCRYPTMSG henv = CryptMsgOpenToEncode(MY_ENC_TYPE, 0, CMSG_ENVELOPED, &EnvelopedInfo, NULL, stream);
+    if (!henv) {
+        DWORD err = GetLastError();
+        throw CSPException("CryptMsg.open_to_encrypt: couldn't open message for encode", err);
+    }
+    return henv;
+}
+
+void CryptMsg::encrypt_data(BYTE *STRING, DWORD LENGTH, BYTE **s, DWORD *slen) throw(CSPException)
+{
+    LOG("CryptMsg::encrypt_data(%p, %u)\n", STRING, LENGTH);
+    // В отличие от CryptEncryptMessage, который для получения размера
+    // сообщения шифрует данные дважды, данные шифруются один раз при
+    // финальном CryptMsgUpdate, после чего закодированное сообщение
+    // забирается через CMSG_CONTENT_PARAM.
+    HCRYPTMSG henv = open_to_encrypt(recipients, cprov, NULL);
+
+    if (!CryptMsgUpdate(henv, STRING, LENGTH, TRUE)) {
+        DWORD err = GetLastError();
+        LOG("    encryption error %x\n", err);
+        CryptMsgClose(henv);
+        throw CSPException("CryptMsg.encrypt_data: Encryption failed.", err);
+    }
+
+    if (!CryptMsgGetParam(henv, CMSG_CONTENT_PARAM, 0, NULL, slen)) {
         DWORD err = GetLastError();
         LOG("    error getting encrypted data size %x\n", err);
-        delete[] pRecipientCert;
+        CryptMsgClose(henv);
         throw CSPException("CryptMsg.encrypt_data: Getting EncrypBlob size failed.", err);
     }
     LOG("    encrypted data size is %u\n", *slen);
@@ -152,47 +222,67 @@ void CryptMsg::encrypt_data(BYTE *STRING, DWORD LENGTH, BYTE **s, DWORD *slen) t
 
     if(!*s) {
         DWORD err = GetLastError();
-        delete[] pRecipientCert;
+        CryptMsgClose(henv);
         throw CSPException("CryptMsg.encrypt_data: Memory allocation error while encrypting.", err);
     }
 
-    LOG("    encrypting data\n");
-    // Повторный вызов функции CryptEncryptMessage для зашифрования содержимого.
-    if(!CryptEncryptMessage(
-                &EncryptParams,
-                nrecs,
-                pRecipientCert,
-                STRING,
-                LENGTH,
-                *s,
-                slen)) {
+    if (!CryptMsgGetParam(henv, CMSG_CONTENT_PARAM, 0, *s, slen)) {
         DWORD err = GetLastError();
-        LOG("    encryption error %x\n", err);
-        delete[] pRecipientCert;
         free((void *)*s);
-        throw CSPException("CryptMsg.encrypt_data: Encryption failed.", err);
+        CryptMsgClose(henv);
+        throw CSPException("CryptMsg.encrypt_data: Getting EncrypBlob failed.", err);
     }
     LOG("    encrypted succesfully\n");
-    delete[] pRecipientCert;
+    CryptMsgClose(henv);
 }
 
 void CryptMsg::decrypt_by_cert(Cert *crt) throw(CSPException, CSPNotFound)
 {
-    HCRYPTPROV hprov;
-    DWORD dwKeySpec;
+    LOG("CryptMsg::decrypt_by_cert(%p)\n", crt);
+    decrypt_handle(get_handle(), crt);
+}
 
-    if(!( CryptAcquireCertificatePrivateKey(
-        crt->pcert,
-        0,
-        NULL,
-        &hprov,
-        &dwKeySpec,
-        NULL)))
-    {
+void CryptMsg::decrypt_handle(HCRYPTMSG hmsg, CertStore *store) throw(CSPException, CSPNotFound)
+{
+    // поиск в хранилище сертификата одного из получателей
+    DWORD num_recipients = 0;
+    DWORD temp = sizeof(DWORD);
+    if (!CryptMsgGetParam(hmsg, CMSG_RECIPIENT_COUNT_PARAM, 0, &num_recipients, &temp)) {
         DWORD err = GetLastError();
-        throw CSPException("CryptMsg.decrypt_by_cert: couldn't acquire cert private key", err);
+        throw CSPException("CryptMsg.decrypt: couldn't get recipient count", err);
     }
-    HCRYPTMSG hmsg = get_handle();
+    for (DWORD idx = 0; idx < num_recipients; idx++) {
+        temp = 0;
+        if (!CryptMsgGetParam(hmsg, CMSG_RECIPIENT_INFO_PARAM, idx, NULL, &temp)) {
+            DWORD err = GetLastError();
+            throw CSPException("CryptMsg.decrypt: couldn't get recipient info size", err);
+        }
+        PCERT_INFO pci = (PCERT_INFO) malloc(temp);
+        if (!CryptMsgGetParam(hmsg, CMSG_RECIPIENT_INFO_PARAM, idx, pci, &temp)) {
+            DWORD err = GetLastError();
+            free(pci);
+            throw CSPException("CryptMsg.decrypt: couldn't get recipient info data", err);
+        }
+        PCCERT_CONTEXT pcert = CertGetSubjectCertificateFromStore(store->hstore, MY_ENC_TYPE, pci);
+        free(pci);
+        if (pcert) {
+            Cert *crt = new Cert(pcert);
+            crt->ref();
+            try {
+                decrypt_handle(hmsg, crt);
+            } catch (...) {
+                crt->unref();
+                throw;
+            }
+            crt->unref();
+            return;
+        }
+    }
+    throw CSPNotFound("CryptMsg.decrypt: No certificate for decryption", CRYPT_E_NO_DECRYPT_CERT);
+}
+
+void CryptMsg::decrypt_handle(HCRYPTMSG hmsg, Cert *crt) throw(CSPException, CSPNotFound)
+{
     DWORD recipient_idx = 0;
     DWORD num_recipients = 0;
     DWORD temp = sizeof(DWORD);
@@ -233,6 +323,22 @@ void CryptMsg::decrypt_by_cert(Cert *crt) throw(CSPException, CSPNotFound)
         throw CSPNotFound("CryptMsg.decrypt_by_cert: cert not found in recipient infos", 0);
     }
 
+    HCRYPTPROV hprov;
+    DWORD dwKeySpec;
+    BOOL free_prov = FALSE;
+
+    if(!( CryptAcquireCertificatePrivateKey(
+        crt->pcert,
+        0,
+        NULL,
+        &hprov,
+        &dwKeySpec,
+        &free_prov)))
+    {
+        DWORD err = GetLastError();
+        throw CSPException("CryptMsg.decrypt_by_cert: couldn't acquire cert private key", err);
+    }
+
     CMSG_CTRL_DECRYPT_PARA decr_para;
     ZeroMemory(&decr_para, sizeof(decr_para));
     decr_para.cbSize = sizeof(decr_para);
@@ -240,19 +346,24 @@ void CryptMsg::decrypt_by_cert(Cert *crt) throw(CSPException, CSPNotFound)
     decr_para.dwKeySpec = dwKeySpec;
     decr_para.dwRecipientIndex = recipient_idx;
 
-    if (!CryptMsgControl(hmsg, 0, CMSG_CTRL_DECRYPT, &decr_para)) {
+    // При потоковом декодировании расшифрование идет в последующих
+    // CryptMsgUpdate, поэтому контекст ключа закрывается вместе с сообщением
+    if (!CryptMsgControl(hmsg, free_prov? CMSG_CRYPT_RELEASE_CONTEXT_FLAG : 0, CMSG_CTRL_DECRYPT, &decr_para)) {
         DWORD err = GetLastError();
+        if (free_prov) {
+            CryptReleaseContext(hprov, 0);
+        }
         throw CSPException("CryptMsg.decrypt_by_cert: decrypt failed", err);
     }
-
-    if (!CryptReleaseContext(hprov, 0)) {
-        DWORD err = GetLastError();
-        throw CSPException("CryptMsg.decrypt_by_cert: couldn't release private key", err);
-    }
 }
 
 void CryptMsg::decrypt(BYTE **s, DWORD *slen, CertStore *store) throw(CSPException, CSPNotFound)
 {
+    if (!data) {
+        decrypt_handle(get_handle(), store);
+        get_data(s, slen);
+        return;
+    }
     CRYPT_DECRYPT_MESSAGE_PARA  decryptParams;
     //   Инициализация структуры CRYPT_DECRYPT_MESSAGE_PARA.
     memset(&decryptParams, 0, sizeof(CRYPT_DECRYPT_MESSAGE_PARA));
@@ -349,66 +460,144 @@ void CryptMsg::get_data(BYTE **s, DWORD *slen) throw(CSPException)
     }
 }
 
+HCRYPTMSG CryptMsg::open_to_sign(Cert *signer, bool detach, PCMSG_STREAM_INFO stream) throw(CSPException)
+{
+    LOG("CryptMsg::open_to_sign(%p, %i, %p)\n", signer, detach, stream);
+    PCCERT_CONTEXT pCert = signer->pcert;
+    HCRYPTPROV hprov = 0;
+    DWORD keyspec = 0;
+    BOOL free_prov = FALSE;
+
+    if (!CryptAcquireCertificatePrivateKey(pCert, 0, NULL, &hprov, &keyspec, &free_prov)) {
+        DWORD err = GetLastError();
+        throw CSPException("CryptMsg.open_to_sign: couldn't acquire cert private key", err);
+    }
+
+    CMSG_SIGNER_ENCODE_INFO SignerInfo;
+    ZeroMemory(&SignerInfo, sizeof(SignerInfo));
+    SignerInfo.cbSize = sizeof(CMSG_SIGNER_ENCODE_INFO);
+    SignerInfo.pCertInfo = pCert->pCertInfo;
+    SignerInfo.hCryptProv = hprov;
+    SignerInfo.dwKeySpec = keyspec;
+    SignerInfo.HashAlgorithm.pszObjId = hashAlg(pCert->pCertInfo->SubjectPublicKeyInfo.Algorithm.pszObjId);
+
+    CERT_BLOB SignerCert;
+    SignerCert.cbData = pCert->cbCertEncoded;
+    SignerCert.pbData = pCert->pbCertEncoded;
+
+    CMSG_SIGNED_ENCODE_INFO SignedInfo;
+    ZeroMemory(&SignedInfo, sizeof(SignedInfo));
+    SignedInfo.cbSize = sizeof(CMSG_SIGNED_ENCODE_INFO);
+    SignedInfo.cSigners = 1;
+    SignedInfo.rgSigners = &SignerInfo;
+    SignedInfo.cCertEncoded = 1;
+    SignedInfo.rgCertEncoded = &SignerCert;
+
+    // Если контекст ключа открыт для нас, он закрывается вместе с сообщением
+    DWORD flags = (detach? CMSG_DETACHED_FLAG : 0) | (free_prov? CMSG_CRYPT_RELEASE_CONTEXT_FLAG : 0);
+    HCRYPTMSG hsign = CryptMsgOpenToEncode(MY_ENC_TYPE, flags, CMSG_SIGNED, &SignedInfo, NULL, stream);
+    if (!hsign) {
+        DWORD err = GetLastError();
+        if (free_prov) {
+            CryptReleaseContext(hprov, 0);
+        }
+        throw CSPException("CryptMsg.open_to_sign: couldn't open message for encode", err);
+    }
+    return hsign;
+}
+
+DWORD CryptMsg::data_size() throw(CSPException)
+{
+    DWORD slen = 0;
+    HCRYPTMSG hmsg = get_handle();
+    if (!CryptMsgGetParam(hmsg, CMSG_CONTENT_PARAM, 0, NULL, &slen)) {
+        DWORD err = GetLastError();
+        throw CSPException("CryptMsg.data_size: Couldn't get decoded data size", err);
+    }
+    return slen;
+}
+
+DWORD CryptMsg::get_data_into(BYTE *OUTBUF, DWORD OUTLEN) throw(CSPException)
+{
+    LOG("CryptMsg::get_data_into(%p, %u)\n", OUTBUF, OUTLEN);
+    DWORD slen = OUTLEN;
+    HCRYPTMSG hmsg = get_handle();
+    if (!CryptMsgGetParam(hmsg, CMSG_CONTENT_PARAM, 0, OUTBUF, &slen)) {
+        DWORD err = GetLastError();
+        if (err == ERROR_MORE_DATA) {
+            throw CSPException("CryptMsg.get_data_into: Output buffer too small", err);
+        }
+        throw CSPException("CryptMsg.get_data_into: Couldn't get decoded data", err);
+    }
+    return slen;
+}
+
+void CryptMsg::sign(BYTE *STRING, DWORD LENGTH, Cert *signer, bool detach) throw(CSPException)
+{
+    LOG("CryptMsg::sign(%p, %u, %p, %i)\n", STRING, LENGTH, signer, detach);
+    if (hmsg) {
+        throw CSPException("CryptMsg.sign: message already encoded or decoded");
+    }
+    HCRYPTMSG hsign = open_to_sign(signer, detach, NULL);
+    if (!CryptMsgUpdate(hsign, STRING, LENGTH, TRUE)) {
+        DWORD err = GetLastError();
+        CryptMsgClose(hsign);
+        throw CSPException("CryptMsg.sign: Error signing data", err);
+    }
+    hmsg = hsign;
+}
+
+void CryptMsg::encrypt(BYTE *STRING, DWORD LENGTH) throw(CSPException)
+{
+    LOG("CryptMsg::encrypt(%p, %u)\n", STRING, LENGTH);
+    if (hmsg) {
+        throw CSPException("CryptMsg.encrypt: message already encoded or decoded");
+    }
+    HCRYPTMSG henv = open_to_encrypt(recipients, cprov, NULL);
+    if (!CryptMsgUpdate(henv, STRING, LENGTH, TRUE)) {
+        DWORD err = GetLastError();
+        CryptMsgClose(henv);
+        throw CSPException("CryptMsg.encrypt: Encryption failed.", err);
+    }
+    hmsg = henv;
+}
+
 void CryptMsg::sign_data(BYTE *STRING, DWORD LENGTH, BYTE **s, DWORD *slen, Cert *signer, bool detach) throw(CSPException)
 {
     LOG("CryptMsg::sign_data(%p, %u, %p, %i)\n", STRING, LENGTH, signer, detach);
-    CRYPT_SIGN_MESSAGE_PARA  SigParams;
-    ZeroMemory(&SigParams, sizeof(SigParams));
-    PCCERT_CONTEXT pCert = signer->pcert;
+    // В отличие от CryptSignMessage, который для получения размера
+    // подписанного сообщения вычисляет подпись дважды, закрытый ключ
+    // используется один раз -- при финальном CryptMsgUpdate. Последующие
+    // запросы CMSG_CONTENT_PARAM возвращают уже закодированное сообщение.
+    HCRYPTMSG hsign = open_to_sign(signer, detach, NULL);
 
-    const BYTE* DataArray[] = { STRING };
-    DWORD SizeArray[] = { LENGTH };
-
-    // Initialize the signature structure.
-    SigParams.cbSize = sizeof(CRYPT_SIGN_MESSAGE_PARA);
-    SigParams.dwMsgEncodingType = MY_ENCODING_TYPE;
-    SigParams.pSigningCert = pCert;
-    //SigParams.HashAlgorithm.pszObjId = szOID_RSA_SHA1RSA;
-    SigParams.HashAlgorithm.pszObjId = hashAlg(pCert->pCertInfo->SubjectPublicKeyInfo.Algorithm.pszObjId);
-    SigParams.HashAlgorithm.Parameters.cbData = 0;
-    SigParams.cMsgCert = 1;
-    SigParams.rgpMsgCert = &pCert;
-    LOG("1\n");
-
-    // First, get the size of the signed BLOB.
-    if(!CryptSignMessage(
-                &SigParams,
-                detach,
-                1,
-                DataArray,
-                SizeArray,
-                NULL,
-                slen)) {
+    if (!CryptMsgUpdate(hsign, STRING, LENGTH, TRUE)) {
         DWORD err = GetLastError();
+        CryptMsgClose(hsign);
+        throw CSPException("CryptMsg.sign_data: Error signing data", err);
+    }
+
+    if (!CryptMsgGetParam(hsign, CMSG_CONTENT_PARAM, 0, NULL, slen)) {
+        DWORD err = GetLastError();
+        CryptMsgClose(hsign);
         throw CSPException("CryptMsg.sign_data: Getting signed BLOB size failed", err);
     }
-    LOG("2 %u\n", *slen);
+    LOG("    signed BLOB size: %u\n", *slen);
 
-    // Allocate memory for the signed BLOB.
     *s = (BYTE *)malloc(*slen);
-    LOG("2a\n");
     if(!*s) {
-        LOG("2b\n");
         DWORD err = GetLastError();
-        LOG("2c\n");
+        CryptMsgClose(hsign);
         throw CSPException("CryptMsg.sign_data: Memory allocation error while signing", err);
     }
-    LOG("3\n");
 
-    // Get the signed message BLOB.
-    if(!CryptSignMessage(
-                &SigParams,
-                detach,
-                1,
-                DataArray,
-                SizeArray,
-                *s,
-                slen)) {
+    if (!CryptMsgGetParam(hsign, CMSG_CONTENT_PARAM, 0, *s, slen)) {
         DWORD err = GetLastError();
         free((void *)*s);
+        CryptMsgClose(hsign);
         throw CSPException("CryptMsg.sign_data: Error getting signed BLOB", err);
     }
-    LOG("4\n");
+    CryptMsgClose(hsign);
 }
 
 CryptMsg::~CryptMsg() throw(CSPException)
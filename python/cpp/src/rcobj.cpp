@@ -1,21 +1,29 @@
 #include "common.hpp"
 #include "rcobj.hpp"
 
+#ifdef _WIN32
+#   define ATOMIC_INC(x) InterlockedIncrement(&(x))
+#   define ATOMIC_DEC(x) InterlockedDecrement(&(x))
+#else
+#   define ATOMIC_INC(x) __sync_add_and_fetch(&(x), 1)
+#   define ATOMIC_DEC(x) __sync_sub_and_fetch(&(x), 1)
+#endif
+
 int RCObj::ref()
 {
-    refcount ++;
-    LOG("    ref %p: %i\n", this, refcount);
-    return refcount;
+    LONG res = ATOMIC_INC(refcount);
+    LOG("    ref %p: %i\n", this, (int)res);
+    return res;
 }
 
 int RCObj::unref()
 {
-    refcount --;
-    if (refcount <= 0) {
+    LONG res = ATOMIC_DEC(refcount);
+    if (res <= 0) {
         LOG("    delete %p\n", this);
         delete this;
         return 0;
     }
-    LOG("    unref %p: %i\n", this, refcount);
-    return refcount;
+    LOG("    unref %p: %i\n", this, (int)res);
+    return res;
 }
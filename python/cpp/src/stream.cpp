@@ -0,0 +1,208 @@
+#include "common.hpp"
+#include "stream.hpp"
+#include "msg.hpp"
+#include "cert.hpp"
+#include "context.hpp"
+
+CMSStream::CMSStream()
+{
+    hmsg = 0;
+    finished = false;
+    ZeroMemory(&stream_info, sizeof(stream_info));
+    stream_info.cbContent = CMSG_INDEFINITE_LENGTH;
+    stream_info.pfnStreamOutput = stream_output;
+    stream_info.pvArg = this;
+}
+
+BOOL WINAPI CMSStream::stream_output(const void *pvArg, BYTE *pbData, DWORD cbData, BOOL fFinal)
+{
+    CMSStream *self = (CMSStream *)pvArg;
+    LOG("CMSStream::stream_output(%p, %u, %i)\n", self, cbData, fFinal);
+    if (cbData) {
+        self->out.insert(self->out.end(), pbData, pbData + cbData);
+    }
+    return TRUE;
+}
+
+void CMSStream::take_output(BYTE **s, DWORD *slen) throw(CSPException)
+{
+    *slen = out.size();
+    if (!*slen) {
+        return;
+    }
+    *s = (BYTE *)malloc(*slen);
+    if (!*s) {
+        throw CSPException("CMSStream: Memory allocation error");
+    }
+    memcpy(*s, &out[0], *slen);
+    out.clear();
+}
+
+void CMSStream::update(BYTE *STRING, DWORD LENGTH, BYTE **s, DWORD *slen) throw(CSPException, CSPNotFound)
+{
+    LOG("CMSStream::update(%p, %u)\n", STRING, LENGTH);
+    if (finished) {
+        throw CSPException("CMSStream.update: stream already finished");
+    }
+    if (!hmsg) {
+        open();
+    }
+    if (!CryptMsgUpdate(hmsg, STRING, LENGTH, FALSE)) {
+        DWORD err = GetLastError();
+        throw CSPException("CMSStream.update: couldn't update message", err);
+    }
+    on_update(false);
+    take_output(s, slen);
+}
+
+void CMSStream::finish(BYTE **s, DWORD *slen) throw(CSPException, CSPNotFound)
+{
+    LOG("CMSStream::finish()\n");
+    if (finished) {
+        throw CSPException("CMSStream.finish: stream already finished");
+    }
+    if (!hmsg) {
+        open();
+    }
+    finished = true;
+    if (!CryptMsgUpdate(hmsg, NULL, 0, TRUE)) {
+        DWORD err = GetLastError();
+        throw CSPException("CMSStream.finish: couldn't finalize message", err);
+    }
+    on_update(true);
+    take_output(s, slen);
+}
+
+void CMSStream::close() throw(CSPException)
+{
+    HCRYPTMSG h = hmsg;
+    hmsg = 0;
+    if (h && !CryptMsgClose(h)) {
+        throw CSPException("CMSStream: Couldn't close message");
+    }
+}
+
+CMSStream::~CMSStream() throw(CSPException)
+{
+    LOG("CMSStream::~CMSStream(%p)\n", this);
+    close();
+}
+
+SignStream::SignStream(Cert *signer, bool detach) throw(CSPException)
+{
+    LOG("SignStream::SignStream(%p, %i)\n", signer, detach);
+    hmsg = CryptMsg::open_to_sign(signer, detach, &stream_info);
+    // сертификат должен жить, пока сообщение использует его закрытый ключ
+    this->signer = signer;
+    signer->ref();
+}
+
+SignStream::~SignStream() throw(CSPException)
+{
+    LOG("SignStream::~SignStream(%p)\n", this);
+    close();
+    signer->unref();
+}
+
+DecryptStream::DecryptStream(Cert *cert) throw(CSPException)
+{
+    LOG("DecryptStream::DecryptStream(%p)\n", cert);
+    decrypted = false;
+    hmsg = CryptMsgOpenToDecode(MY_ENC_TYPE, 0, 0, 0, NULL, &stream_info);
+    if (!hmsg) {
+        DWORD err = GetLastError();
+        throw CSPException("DecryptStream: Couldn't open message for decode", err);
+    }
+    this->cert = cert;
+    cert->ref();
+}
+
+void DecryptStream::on_update(bool final) throw(CSPException, CSPNotFound)
+{
+    if (decrypted) {
+        return;
+    }
+    DWORD num_recipients = 0;
+    DWORD temp = sizeof(DWORD);
+    // пока заголовок не прочитан, сведения о получателях недоступны
+    if (!CryptMsgGetParam(hmsg, CMSG_RECIPIENT_COUNT_PARAM, 0, &num_recipients, &temp)) {
+        if (final) {
+            DWORD err = GetLastError();
+            throw CSPException("DecryptStream.finish: incomplete or not enveloped message", err);
+        }
+        return;
+    }
+    CryptMsg::decrypt_handle(hmsg, cert);
+    decrypted = true;
+}
+
+DecryptStream::~DecryptStream() throw(CSPException)
+{
+    LOG("DecryptStream::~DecryptStream(%p)\n", this);
+    close();
+    cert->unref();
+}
+
+EncryptStream::EncryptStream(Crypt *ctx) throw(CSPException)
+{
+    LOG("EncryptStream::EncryptStream(%p)\n", ctx);
+    cprov = ctx;
+    if (ctx) {
+        ctx->ref();
+    }
+}
+
+void EncryptStream::add_recipient(Cert *c) throw(CSPException)
+{
+    LOG("EncryptStream::add_recipient(%p)\n", c);
+    if (hmsg) {
+        throw CSPException("EncryptStream.add_recipient: encryption already started");
+    }
+    if (c) {
+        c->ref();
+        recipients.push_back(c);
+    }
+}
+
+void EncryptStream::open() throw(CSPException)
+{
+    hmsg = CryptMsg::open_to_encrypt(recipients, cprov, &stream_info);
+}
+
+EncryptStream::~EncryptStream() throw(CSPException)
+{
+    LOG("EncryptStream::~EncryptStream(%p)\n", this);
+    close();
+    std::vector<Cert *>::const_iterator cii;
+    for(cii=recipients.begin(); cii!=recipients.end(); cii++) {
+        (*cii)->unref();
+    }
+    if (cprov) {
+        cprov->unref();
+    }
+}
+
+VerifyStream::VerifyStream(BYTE *STRING, DWORD LENGTH) throw(CSPException)
+{
+    LOG("VerifyStream::VerifyStream(%p, %u)\n", STRING, LENGTH);
+    hmsg = CryptMsgOpenToDecode(MY_ENC_TYPE, CMSG_DETACHED_FLAG, 0, 0, NULL, NULL);
+    if (!hmsg) {
+        DWORD err = GetLastError();
+        throw CSPException("VerifyStream: Couldn't open message for decode", err);
+    }
+    // сначала декодируется подпись, затем порциями подаются подписанные данные
+    if (!CryptMsgUpdate(hmsg, STRING, LENGTH, TRUE)) {
+        DWORD err = GetLastError();
+        close();
+        throw CSPException("VerifyStream: Couldn't decode signature", err);
+    }
+}
+
+bool VerifyStream::verify(Cert *c) throw(CSPException)
+{
+    LOG("VerifyStream::verify(%p)\n", c);
+    if (!finished) {
+        throw CSPException("VerifyStream.verify: stream is not finished");
+    }
+    return CryptMsgControl(hmsg, 0, CMSG_CTRL_VERIFY_SIGNATURE, c->pcert->pCertInfo);
+}
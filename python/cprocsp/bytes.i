@@ -54,39 +54,49 @@
 
 
 %typemap(typecheck, precedence=SWIG_TYPECHECK_STRING) (BYTE *STRING, DWORD LENGTH) {
-%#if py_version_hex>=0x03000000
-   $1 = PyBytes_Check($input) ? 1 : 0;
-%#else  
-   $1 = PyString_Check($input) ? 1 : 0;
-%#endif
+   $1 = PyObject_CheckBuffer($input) ? 1 : 0;
 }
 
+/* Принимается любой объект с буферным протоколом (bytes, bytearray,
+ * memoryview, mmap...), данные не копируются. Буфер удерживается до
+ * окончания вызова, в том числе пока C++ код работает без GIL. */
 %typemap(in, numinputs=1, noblock=1) (BYTE *STRING, DWORD LENGTH)
-(char *cstr=NULL, Py_ssize_t len=0, int res=1) {
-%#if py_version_hex>=0x03000000
-  if (PyBytes_Check($input))
-%#else  
-  if (PyString_Check($input))
-%#endif
-  {
-%#if PY_VERSION_HEX>=0x03000000
-    res = PyBytes_AsStringAndSize($input, &cstr, &len);
-%#else
-    res = PyString_AsStringAndSize($input, &cstr, &len);
-%#endif
-    if (!cstr) {
-        res = 1;
-    }
-/*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF($input);*/
-/*%#endif*/
-  } 
-  
-  if(res){
+(Py_buffer view, int got_view = 0) {
+  if (PyObject_GetBuffer($input, &view, PyBUF_SIMPLE) != 0) {
     %argument_fail(SWIG_TypeError, "$type", $symname, $argnum);
-  } else {
-    $1 = (BYTE *) cstr;
-    $2 = (DWORD) len;
+  }
+  got_view = 1;
+  if (view.len > 0xFFFFFFFFUL) {
+    %argument_fail(SWIG_OverflowError, "$type", $symname, $argnum);
+  }
+  $1 = (BYTE *) view.buf;
+  $2 = (DWORD) view.len;
+};
+
+%typemap(freearg, noblock=1) (BYTE *STRING, DWORD LENGTH) {
+  if (got_view$argnum) {
+    PyBuffer_Release(&view$argnum);
   }
 };
 
+/* Буфер вызывающего, доступный для записи (bytearray, mmap...), в который
+ * выходные данные пишутся без промежуточной копии. */
+%typemap(typecheck, precedence=SWIG_TYPECHECK_STRING) (BYTE *OUTBUF, DWORD OUTLEN) {
+   $1 = PyObject_CheckBuffer($input) ? 1 : 0;
+}
+
+%typemap(in, numinputs=1, noblock=1) (BYTE *OUTBUF, DWORD OUTLEN)
+(Py_buffer view, int got_view = 0) {
+  if (PyObject_GetBuffer($input, &view, PyBUF_WRITABLE) != 0) {
+    %argument_fail(SWIG_TypeError, "$type", $symname, $argnum);
+  }
+  got_view = 1;
+  $1 = (BYTE *) view.buf;
+  $2 = view.len > 0xFFFFFFFFUL ? 0xFFFFFFFFUL : (DWORD) view.len;
+};
+
+%typemap(freearg, noblock=1) (BYTE *OUTBUF, DWORD OUTLEN) {
+  if (got_view$argnum) {
+    PyBuffer_Release(&view$argnum);
+  }
+};
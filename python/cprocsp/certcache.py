@@ -0,0 +1,131 @@
+# coding: utf-8
+from __future__ import unicode_literals, print_function
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from .certutils import Attributes
+
+
+class _FrozenList(tuple):
+    pass
+
+
+class _FrozenDict(tuple):
+    pass
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return _FrozenDict((k, _freeze(v)) for (k, v) in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_freeze(x) for x in value)
+    if isinstance(value, tuple):
+        return tuple(_freeze(x) for x in value)
+    return value
+
+
+def _thaw(value):
+    if isinstance(value, _FrozenDict):
+        return dict((k, _thaw(v)) for (k, v) in value)
+    if isinstance(value, _FrozenList):
+        return list(_thaw(x) for x in value)
+    if isinstance(value, tuple):
+        return tuple(_thaw(x) for x in value)
+    return value
+
+
+class CertCache(object):
+
+    """LRU кэш результатов разбора сертификатов и имен.
+
+    Записи хранятся по ключу (вид результата, SHA-1 исходной DER кодировки).
+    SHA-1 кодировки сертификата совпадает с его отпечатком. Результаты
+    хранятся в неизменяемом виде, а каждый вызов `get` возвращает свежую
+    копию со списками и словарями, которую вызывающий может изменять.
+
+    Объем кэша ограничен суммарной длиной исходных кодировок записей
+    :max_bytes:. При превышении вытесняются давно не использованные записи.
+
+    Пример использования:
+    > cache = CertCache(max_bytes=16 * 1024 * 1024)
+    > info = cache.get('cert_info', der, parse)
+    > print(cache.stats())
+
+    """
+
+    def __init__(self, max_bytes=16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # ключ -> (неизменяемый результат, размер)
+        self._entries = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, kind, data, parse):
+        '''
+        Результат разбора :data: функцией :parse: из кэша. При промахе
+        :parse: вызывается вне блокировки, результат сохраняется.
+
+        :kind: вид результата (строка), разные функции разбора одних и тех
+            же данных должны использовать разные виды
+        :data: DER кодировка (байтовая строка или `memoryview`)
+        :parse: функция одного аргумента (:data:)
+
+        '''
+        key = (kind, hashlib.sha1(data).digest())
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+                self.hits += 1
+                return _thaw(entry[0])
+            self.misses += 1
+        value = parse(data)
+        size = len(data)
+        if size <= self.max_bytes:
+            with self._lock:
+                old = self._entries.pop(key, None)
+                if old is not None:
+                    self._bytes -= old[1]
+                self._entries[key] = (_freeze(value), size)
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    self._bytes -= self._entries.popitem(last=False)[1][1]
+        return value
+
+    def decode_name(self, data):
+        '''
+        Разбор DER кодировки имени (Name), как `Attributes.load(data).decode()`.
+
+        '''
+        return self.get('name', data, lambda d: Attributes.load(d).decode())
+
+    def clear(self):
+        '''
+        Удаление всех записей и сброс счетчиков.
+
+        '''
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        '''
+        Счетчики кэша.
+
+        :returns: словарь вида {'hits': int, 'misses': int, 'items': int,
+            'bytes': int}
+
+        '''
+        with self._lock:
+            return dict(hits=self.hits, misses=self.misses,
+                        items=len(self._entries), bytes=self._bytes)
@@ -4,6 +4,7 @@ from . import csp
 from pyasn1.type import univ, useful, char, tag, constraint, namedtype
 from pyasn1.codec.der import encoder
 from . import decoder
+from .lazy import LazyValue
 from pyasn1_modules import rfc2459, rfc2315
 from base64 import b64decode
 import sys
@@ -33,6 +34,55 @@ def _deep_find(lst, oid):
     return False
 
 
+def _der_tlv(ident, content):
+    '''
+    DER кодировка элемента по октетам идентификатора :ident: и готовому
+    содержимому :content:.
+
+    '''
+    length = len(content)
+    if length < 0x80:
+        return ident + bytes(bytearray((length,))) + content
+    octets = bytearray()
+    while length:
+        octets.insert(0, length & 0xFF)
+        length >>= 8
+    return ident + bytes(bytearray((0x80 | len(octets),)) + octets) + content
+
+
+# Кэш DER кодировок OID-ов: строка -> кодировка
+_der_oids = {}
+
+
+def _der_oid(oid):
+    oid = str(oid)
+    res = _der_oids.get(oid)
+    if res is None:
+        if len(_der_oids) >= 4096:
+            _der_oids.clear()
+        res = _der_oids[oid] = encoder.encode(univ.ObjectIdentifier(oid))
+    return res
+
+
+def _der_prefix(value):
+    '''
+    Октеты идентификатора элемента по кодировке его пустого значения.
+
+    '''
+    return encoder.encode(value)[:-1]
+
+
+# Октеты идентификаторов строковых типов, которые кодируются без `pyasn1`
+_string_prefixes = dict(
+    (t, _der_prefix(t(b'')))
+    for t in (char.UTF8String, char.PrintableString, char.NumericString,
+              char.BMPString, char.IA5String, char.TeletexString))
+
+# Значение расширения 1.2.643.100.111 (средство электронной подписи),
+# добавляемого в запрос по умолчанию
+_default_sign_tool = encoder.encode(char.UTF8String('"КриптоПро CSP" (версия 4.0)'.encode('utf-8')))
+
+
 def set_q_defaults(params, insert_zeroes=False):
     if insert_zeroes:
         attrs = params.get('Attributes', [])[:]
@@ -49,8 +99,7 @@ def set_q_defaults(params, insert_zeroes=False):
 
     raw = params.get('RawExtensions', [])[:]
     if not any(oid == '1.2.643.100.111' for (oid, _, _) in raw):
-        extstr = encoder.encode(char.UTF8String('"КриптоПро CSP" (версия 4.0)'.encode('utf-8')))
-        raw.append(('1.2.643.100.111', extstr, False))
+        raw.append(('1.2.643.100.111', _default_sign_tool, False))
     params['RawExtensions'] = raw
 
 
@@ -65,7 +114,8 @@ class CertAttribute(object):
     def __init__(self, oid, values):
         """@todo: to be defined """
         self.oid = oid.encode('ascii')
-        self.vals = [encoder.encode(v) for v in values]
+        self.vals = [v if isinstance(v, bytes) else encoder.encode(v)
+                     for v in values]
 
     def add_to(self, req):
         n = req.add_attribute(self.oid)
@@ -91,9 +141,7 @@ class CertExtensions(CertAttribute):
 
     def __init__(self, exts):
         """@todo: to be defined """
-        val = univ.SequenceOf()
-        for i, ext in enumerate(exts):
-            val.setComponentByPosition(i, ext.asn)
+        val = _der_tlv(b'\x30', b''.join(ext.encode() for ext in exts))
         super(CertExtensions, self).__init__(csp.szOID_CERT_EXTENSIONS, [val])
 
 
@@ -105,11 +153,35 @@ class CertExtension(object):
         :oid: OID расширения
         :value: значение в ASN.1
 
+        Кодировка расширения собирается напрямую, объект `pyasn1` строится
+        только при обращении к `asn`.
+
         """
-        self.asn = rfc2459.Extension()
-        self.asn.setComponentByName('extnID', univ.ObjectIdentifier(oid))
-        self.asn.setComponentByName('critical', univ.Boolean(critical))
-        self.asn.setComponentByName('extnValue', encoder.encode(univ.OctetString(value)))
+        if not isinstance(value, bytes):
+            value = univ.OctetString(value).asOctets()
+        content = _der_oid(oid)
+        if critical:
+            content += b'\x01\x01\xff'
+        self.der = _der_tlv(b'\x30', content + _der_tlv(b'\x04', value))
+        self._asn = None
+
+    @property
+    def asn(self):
+        if self._asn is None:
+            self._asn = decoder.compileSpec(rfc2459.Extension())(self.der)[0]
+            # объект может быть изменен, далее кодировка строится по нему
+            self.der = None
+        return self._asn
+
+    @asn.setter
+    def asn(self, value):
+        self._asn = value
+        self.der = None
+
+    def encode(self):
+        if self.der is not None:
+            return self.der
+        return encoder.encode(self.asn)
 
 
 class EKU(CertExtension):
@@ -122,24 +194,101 @@ class EKU(CertExtension):
         :ekus: список OID-ов расш. использования
 
         """
-        val = rfc2459.ExtKeyUsageSyntax()
-        for i, x in enumerate(ekus):
-            val.setComponentByPosition(i, rfc2459.KeyPurposeId(str(x)))
-        super(EKU, self).__init__(csp.szOID_ENHANCED_KEY_USAGE, encoder.encode(val))
+        val = _der_tlv(b'\x30', b''.join(_der_oid(x) for x in ekus))
+        super(EKU, self).__init__(csp.szOID_ENHANCED_KEY_USAGE, val)
 
 
 class KeyUsage(CertExtension):
 
     """Расширенное использование ключа"""
 
+    # Кэш кодировок: строка с именами битов -> кодировка
+    _encoded = {}
+
     def __init__(self, mask):
         """Создание EKU
 
         :ekus: список OID-ов расш. использования
 
         """
-        val = rfc2459.KeyUsage(str(','.join(mask)))
-        super(KeyUsage, self).__init__(csp.szOID_KEY_USAGE, encoder.encode(val))
+        mask = str(','.join(mask))
+        val = self._encoded.get(mask)
+        if val is None:
+            val = encoder.encode(rfc2459.KeyUsage(mask))
+            if len(self._encoded) < 256:
+                self._encoded[mask] = val
+        super(KeyUsage, self).__init__(csp.szOID_KEY_USAGE, val)
+
+
+# Кодировки строковых типов значений атрибутов по октету идентификатора, те
+# же, что использует pyasn1 при преобразовании значения в строку
+_string_encodings = dict(
+    (t.tagSet[0][0] | t.tagSet[0][1] | t.tagSet[0][2], t.encoding)
+    for t in (char.UTF8String, char.PrintableString, char.NumericString,
+              char.BMPString, char.IA5String, char.TeletexString))
+
+
+def _read_tlv(value, pos):
+    '''
+    Заголовок TLV со смещения :pos: (длина не более чем в двух октетах).
+
+    :returns: (октет идентификатора, начало содержимого, конец содержимого)
+        или None
+
+    '''
+    header = bytearray(value[pos:pos + 4])
+    if len(header) < 2 or header[1] == 0x80:
+        return None
+    length = header[1]
+    body = pos + 2
+    if length > 0x80:
+        size = length & 0x7F
+        if size > 2 or len(header) < 2 + size:
+            return None
+        length = 0
+        for octet in header[2:2 + size]:
+            length = length << 8 | octet
+        body += size
+    if body + length > len(value):
+        return None
+    return header[0], body, body + length
+
+
+def _read_string(value, pos):
+    tlv = _read_tlv(value, pos)
+    if tlv is None or tlv[0] not in _string_encodings:
+        return None, None
+    ident, body, end = tlv
+    return value[body:end].decode(_string_encodings[ident], 'ignore'), end
+
+
+def _decode_string(value):
+    '''
+    Строковое значение атрибута имени по его DER кодировке, то же, что
+    `unicode(decoder.decode(value)[0])`, но без построения объектов `pyasn1`.
+    Для прочих типов значений и кодировок возвращает None.
+
+    '''
+    return _read_string(value, 0)[0]
+
+
+def _decode_address(value):
+    '''
+    Значение атрибута 2.5.4.16, закодированное как SEQUENCE строк (см.
+    `_stupidAddress`) -- строки склеиваются. Иначе None.
+
+    '''
+    tlv = _read_tlv(value, 0)
+    if tlv is None or tlv[0] != 0x30:
+        return None
+    res = []
+    pos, end = tlv[1], tlv[2]
+    while pos < end:
+        s, pos = _read_string(value[:end], pos)
+        if s is None:
+            return None
+        res.append(s)
+    return ''.join(res)
 
 
 def _stupidAddress(s):
@@ -164,47 +313,76 @@ class Attributes(object):
     }
 
     def __init__(self, attrs):
+        self.der = None
+        self._asn = None
         if isinstance(attrs, list):
-            self.asn = rfc2459.Name()
-            vals = rfc2459.RDNSequence()
-
-            for (i, attr) in enumerate(attrs):
+            rdns = []
+            for attr in attrs:
                 if not isinstance(attr, list):
                     attr = [attr]
-                pairset = rfc2459.RelativeDistinguishedName()
-                for (j, (oid, val)) in enumerate(attr):
-                    pair = rfc2459.AttributeTypeAndValue()
-                    pair.setComponentByName('type', rfc2459.AttributeType(str(oid)))
+                pairs = []
+                for (oid, val) in attr:
                     code, enc = self.special_encs.get(oid, (char.UTF8String, 'utf-8'))
-                    pair.setComponentByName('value',
-                                            rfc2459.AttributeValue(univ.OctetString(encoder.encode(code(unicode(val).encode(enc, 'replace'))))))
-                    pairset.setComponentByPosition(j, pair)
-
-                vals.setComponentByPosition(i, pairset)
-
-            self.asn.setComponentByPosition(0, vals)
+                    val = unicode(val).encode(enc, 'replace')
+                    prefix = _string_prefixes.get(code)
+                    if prefix is not None:
+                        val = _der_tlv(prefix, val)
+                    else:
+                        val = encoder.encode(code(val))
+                    pairs.append(_der_tlv(b'\x30', _der_oid(oid) + val))
+                # DER: элементы SET OF упорядочены по кодировкам
+                pairs.sort()
+                rdns.append(_der_tlv(b'\x31', b''.join(pairs)))
+            self.der = _der_tlv(b'\x30', b''.join(rdns))
         else:
             self.asn = attrs
 
+    @property
+    def asn(self):
+        if self._asn is None and self.der is not None:
+            self._asn = decoder.compileSpec(rfc2459.Name())(self.der)[0]
+            # объект может быть изменен, далее кодировка строится по нему
+            self.der = None
+        return self._asn
+
+    @asn.setter
+    def asn(self, value):
+        self._asn = value
+
     def encode(self):
+        if isinstance(self.der, bytes):
+            return self.der
         return encoder.encode(self.asn)
 
     @classmethod
     def load(cls, value):
-        return(cls(decoder.decode(value, asn1Spec=rfc2459.Name())[0]))
+        '''
+        Набор атрибутов из DER кодировки Name. Объект `pyasn1` строится
+        только при обращении к `asn`, `decode` и `encode` используют
+        кодировку напрямую.
+
+        '''
+        res = cls(None)
+        res.der = value
+        return res
 
     def decode(self):
+        if self.der is not None:
+            name = decoder.compileSpec(rfc2459.Name()).native(self.der)[0]
+        else:
+            name = decoder.toNative(self.asn)
         res = []
-        for rdn in self.asn[0]:
+        for rdn in name[1]:
             item = []
             for dn in rdn:
-                oid = unicode(dn[0])
-                a = decoder.decode(dn[1])[0]
+                oid = unicode(dn['type'])
+                value = dn['value']
                 if oid == '2.5.4.16':
-                    # XXX: hack for StreetAddress attribute
-                    s = ''.join(unicode(a[i]) for i in range(len(a)))
+                    s = _decode_address(value)
                 else:
-                    s = unicode(a)
+                    s = _decode_string(value)
+                if s is None:
+                    s = self._decode_value(oid, value)
                 item.append((oid, s))
             if len(item) != 1:
                 res.append(item)
@@ -212,6 +390,14 @@ class Attributes(object):
                 res.append(item[0])
         return res
 
+    @staticmethod
+    def _decode_value(oid, value):
+        a = decoder.decode(value)[0]
+        if oid == '2.5.4.16':
+            # XXX: hack for StreetAddress attribute
+            return ''.join(unicode(a[i]) for i in range(len(a)))
+        return unicode(a)
+
 
 class CertificateInfo(object):
 
@@ -223,21 +409,40 @@ class CertificateInfo(object):
 
         """
 
-        self.asn = decoder.decode(certdata, asn1Spec=rfc2459.Certificate())[0]
+        self.info = LazyValue(certdata, rfc2459.Certificate())
+
+    @property
+    def asn(self):
+        '''
+        Сертификат, декодированный целиком (при первом обращении).
+
+        '''
+        return self.info.value
 
     def EKU(self):
-        for ext in self.asn[0].getComponentByName('extensions') or []:
-            if ext[0] == rfc2459.id_ce_extKeyUsage:
-                res = decoder.decode(ext.getComponentByName('extnValue'))[0]
-                res = decoder.decode(res, asn1Spec=rfc2459.ExtKeyUsageSyntax())[0]
-                return list(str(x) for x in res)
+        for ext in self.info['tbsCertificate'].get('extensions') or []:
+            if ext['extnID'].native == str(rfc2459.id_ce_extKeyUsage):
+                value = ext['extnValue'].cast(univ.OctetString()).octets()
+                return list(LazyValue(value, rfc2459.ExtKeyUsageSyntax()).native)
         return []
 
 
+def _general_name_prefix(name):
+    gn = rfc2459.GeneralName()
+    gn.setComponentByName(name, b'')
+    return _der_prefix(gn)
+
+
 class SubjectAltName(CertExtension):
 
     """Расширенное использование ключа"""
 
+    # Октеты идентификаторов строковых элементов, которые кодируются без
+    # `pyasn1`
+    _prefixes = dict(
+        (name, _general_name_prefix(name))
+        for name in ('rfc822Name', 'dNSName', 'uniformResourceIdentifier', 'iPAddress'))
+
     def x400Address(self, val):
         return decoder.decode(
             val,
@@ -310,15 +515,20 @@ class SubjectAltName(CertExtension):
                     'registeredID' : строка
 
         """
-        val = rfc2459.SubjectAltName()
-        for (i, (t, v)) in enumerate(altnames):
-            gn = rfc2459.GeneralName()
+        val = []
+        for (t, v) in altnames:
             elt = getattr(self, t, None)
             assert elt is not None, 'unsupported element type {0}'.format(t)
-            gn.setComponentByName(t, elt(v))
-            val.setComponentByPosition(i, gn)
+            prefix = self._prefixes.get(t)
+            if prefix is not None:
+                val.append(_der_tlv(prefix, elt(v)))
+            else:
+                gn = rfc2459.GeneralName()
+                gn.setComponentByName(t, elt(v))
+                val.append(encoder.encode(gn))
 
-        super(SubjectAltName, self).__init__(rfc2459.id_ce_subjectAltName, encoder.encode(val))
+        super(SubjectAltName, self).__init__(rfc2459.id_ce_subjectAltName,
+                                             _der_tlv(b'\x30', b''.join(val)))
 
 
 class CertificatePolicies(CertExtension):
@@ -332,40 +542,46 @@ class CertificatePolicies(CertExtension):
             значение - произвольная информация в base64
 
         '''
-        pass
-        val = rfc2459.CertificatePolicies()
-        for (i, (t, v)) in enumerate(policies or []):
+        val = []
+        for (t, v) in policies or []:
+            v = v or []
+            if not len(v):
+                val.append(_der_tlv(b'\x30', _der_oid(t)))
+                continue
             pol = rfc2459.PolicyInformation()
             pol.setComponentByPosition(0, rfc2459.CertPolicyId(str(t)))
-            v = v or []
-            if len(v):
-                sq = univ.SequenceOf(
-                    componentType=rfc2459.PolicyQualifierInfo()).subtype(
-                    subtypeSpec=constraint.ValueSizeConstraint(
-                        1, rfc2459.MAX))
-                for n, (ident, qualif) in enumerate(v):
-                    pqi = rfc2459.PolicyQualifierInfo()
-                    pqi.setComponentByPosition(0, rfc2459.PolicyQualifierId(str(ident)))
-                    pqi.setComponentByPosition(1, univ.OctetString(qualif))
-                    sq.setComponentByPosition(n, pqi)
-                pol.setComponentByPosition(1, sq)
-            val.setComponentByPosition(i, pol)
+            sq = univ.SequenceOf(
+                componentType=rfc2459.PolicyQualifierInfo()).subtype(
+                subtypeSpec=constraint.ValueSizeConstraint(
+                    1, rfc2459.MAX))
+            for n, (ident, qualif) in enumerate(v):
+                pqi = rfc2459.PolicyQualifierInfo()
+                pqi.setComponentByPosition(0, rfc2459.PolicyQualifierId(str(ident)))
+                pqi.setComponentByPosition(1, univ.OctetString(qualif))
+                sq.setComponentByPosition(n, pqi)
+            pol.setComponentByPosition(1, sq)
+            val.append(encoder.encode(pol))
         super(CertificatePolicies, self).__init__(rfc2459.id_ce_certificatePolicies,
-                                                  encoder.encode(val))
+                                                  _der_tlv(b'\x30', b''.join(val)))
 
 
 class PKCS7Msg(object):
 
     """Парсинг свойств pkcs7 сообщения"""
 
-    def __init__(self, data):
+    def __init__(self, data, cache=None):
         """@todo: to be defined
 
         :data: @todo
+        :cache: `certcache.CertCache` для разбора имен издателей (по
+            умолчанию имена разбираются каждый раз)
 
         """
+        self.cache = cache
         decoder.Decoder.supportIndefLength = True
-        self.asn = decoder.decode(data, asn1Spec=rfc2315.ContentInfo())[0]
+        # Сообщение разбирается лениво: декодируются только заголовки и
+        # запрошенные поддеревья, вложенное содержимое не копируется.
+        self.info = LazyValue(data, rfc2315.ContentInfo())
         self.contentType = {
             '1.2.840.113549.1.7.1': rfc2315.Data,
             '1.2.840.113549.1.7.2': rfc2315.SignedData,
@@ -373,10 +589,62 @@ class PKCS7Msg(object):
             '1.2.840.113549.1.7.4': rfc2315.SignedAndEnvelopedData,
             '1.2.840.113549.1.7.5': rfc2315.DigestedData,
             '1.2.840.113549.1.7.6': rfc2315.EncryptedData,
-        }.get(str(self.asn[0]), None)
+        }.get(str(self.info['contentType'].value), None)
 
         assert self.contentType, 'Unsupported message content type'
-        self.content = decoder.decode(self.asn[1], asn1Spec=self.contentType())[0]
+        self.lazy_content = self.info['content'].cast(self.contentType())
+
+    @property
+    def asn(self):
+        '''
+        ContentInfo, декодированный целиком (при первом обращении).
+
+        '''
+        return self.info.value
+
+    @property
+    def content(self):
+        '''
+        Содержимое сообщения, декодированное целиком (при первом обращении).
+
+        '''
+        return self.lazy_content.value
+
+    def encapsulated(self):
+        '''
+        Вложенное содержимое сообщений типа data и signedData в виде
+        `memoryview` над исходными данными (см. `LazyValue.octets`). Для
+        отсоединенной подписи -- пустое содержимое. Для остальных типов
+        сообщений и для содержимого, не являющегося строкой октетов (в
+        PKCS#7 v1.5 signedData может вкладывать значение любого типа), --
+        None.
+
+        '''
+        if self.contentType is rfc2315.Data:
+            content = self.lazy_content
+        elif self.contentType is rfc2315.SignedData:
+            content = self.lazy_content['contentInfo'].get('content')
+            if content is None:
+                return memoryview(b'')
+            content = content.cast(rfc2315.Data())
+        else:
+            return None
+        if not content.is_octets():
+            return None
+        return content.octets()
+
+    def certificates(self):
+        '''
+        Сертификаты X.509 из сообщений типа data и signedData в виде списка
+        `memoryview` с DER кодировкой, для остальных типов сообщений -- None.
+
+        '''
+        if self.contentType is rfc2315.Data:
+            return []
+        if self.contentType is not rfc2315.SignedData:
+            return None
+        certs = self.lazy_content.get('certificates') or []
+        return [c.raw for c in certs if c.tag == rfc2459.Certificate.tagSet[0]]
 
     def data(self):
         return {}
@@ -385,23 +653,23 @@ class PKCS7Msg(object):
 
     encryptedData = data
 
-    def envelopedData(self):
+    def _issuers(self, infos):
         res = []
-        for si in self.content.getComponentByName('recipientInfos'):
-            info = si.getComponentByName('issuerAndSerialNumber')
-            attrs = Attributes(info[0]).decode()
-            sn = '{0:x}'.format(long(info[1]))
+        for si in infos:
+            info = si['issuerAndSerialNumber']
+            if self.cache is not None:
+                attrs = self.cache.decode_name(info['issuer'].raw)
+            else:
+                attrs = Attributes.load(info['issuer'].raw).decode()
+            sn = '{0:x}'.format(info['serialNumber'].native)
             res.append(dict(Issuer=attrs, SerialNumber=sn))
-        return dict(RecipientInfos=res)
+        return res
+
+    def envelopedData(self):
+        return dict(RecipientInfos=self._issuers(self.lazy_content['recipientInfos']))
 
     def signedData(self):
-        res = []
-        for si in self.content.getComponentByName('signerInfos'):
-            info = si.getComponentByName('issuerAndSerialNumber')
-            attrs = Attributes(info[0]).decode()
-            sn = '{0:x}'.format(long(info[1]))
-            res.append(dict(Issuer=attrs, SerialNumber=sn))
-        return dict(SignerInfos=res)
+        return dict(SignerInfos=self._issuers(self.lazy_content['signerInfos']))
 
     def signedAndEnvelopedData(self):
         res = {}
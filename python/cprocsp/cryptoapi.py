@@ -13,15 +13,25 @@ from .filetimes import filetime_from_dec
 from datetime import datetime, timedelta
 from binascii import b2a_qp, a2b_qp
 import sys
+import os
+import mmap
+import tempfile
 import time
 from functools import wraps
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
+from collections import deque
 if sys.version_info >= (3,):
     unicode = str
 
     def ord(x):
         return x
+    _replace = os.replace
 else:
     unicode = unicode
+    # в Python 2 нет os.replace; на Windows os.rename не заменяет
+    # существующий файл
+    _replace = os.rename
 
 PROV_KC1_GR3410_2001 = str("Crypto-Pro GOST R 34.10-2001 KC1 CSP")
 PROV_KC2_GR3410_2001 = str("Crypto-Pro GOST R 34.10-2001 KC2 CSP")
@@ -31,6 +41,35 @@ PROV_HSM = str("Crypto-Pro HSM CSP")
 PROV_GR3410_2001_HSM_LOCAL = str("Crypto-Pro GOST R 34.10-2001 HSM Local CSP")
 PROV_GR3410_2012_HSM_LOCAL = str("Crypto-Pro GOST R 34.10-2012 HSM Local CSP")
 
+# Пул контекстов криптопровайдера, используемый функциями модуля. По умолчанию
+# отключен (каждая операция открывает новый контекст), для включения нужно
+# присвоить экземпляр `pool.ContextPool`:
+# > from cprocsp.pool import ContextPool
+# > cryptoapi.context_pool = ContextPool(max_size=8, idle_timeout=300)
+context_pool = None
+
+# Кэш системного хранилища сертификатов "MY" с индексом по отпечаткам. По
+# умолчанию отключен, для включения нужно присвоить экземпляр
+# `storecache.CertStoreCache`:
+# > from cprocsp.storecache import CertStoreCache
+# > cryptoapi.store_cache = CertStoreCache(b"MY", ttl=300)
+store_cache = None
+
+# Кэш разобранных сертификатов: результатов `cert_info` и `cert_subject_id` по
+# отпечатку сертификата, а также имен издателей, общих для `cert_info` и
+# `pkcs7_info`. По умолчанию отключен, для включения нужно присвоить
+# экземпляр `certcache.CertCache`:
+# > from cprocsp.certcache import CertCache
+# > cryptoapi.cert_cache = CertCache(max_bytes=16 * 1024 * 1024)
+cert_cache = None
+
+# Максимальный размер файла, который функции `sign_file`,
+# `check_signature_file`, `encrypt_file` и `Hash.from_file` отображают в
+# память целиком. Файлы большего размера обрабатываются потоково, порциями.
+# Длины буферов в CryptoAPI 32-битные, а в 32-битном процессе к тому же мало
+# свободного адресного пространства.
+mmap_limit = 0xFFFFFFFF if sys.maxsize > 2 ** 32 else 512 * 1024 * 1024
+
 
 # Обертка для функций, которые могут не сработать из-за длительного простоя
 # туннеля, при работе с криптопровайдером внешнего хранилища. Максимальный
@@ -63,10 +102,7 @@ def _from_hex(s):
     return a2b_qp(s.replace('\\x', '='))
 
 
-def _mkcontext(cont, provider, flags=None):
-    if cont is None:
-        return None
-
+def _context_params(cont, provider, flags=None):
     cont = _from_hex(cont)
 
     if flags is None:
@@ -79,7 +115,49 @@ def _mkcontext(cont, provider, flags=None):
     else:
         provtype = PROV_GOST
 
-    return csp.Crypt(cont, provtype, flags, provider)
+    return cont, provtype, flags, provider
+
+
+def _mkcontext(cont, provider, flags=None):
+    if cont is None:
+        return None
+
+    return csp.Crypt(*_context_params(cont, provider, flags))
+
+
+@contextmanager
+def _crypt(cont, provtype, flags, provider=None):
+    if context_pool is None:
+        yield csp.Crypt(cont, provtype, flags, provider)
+        return
+    with context_pool.context(cont, provtype, flags, provider) as ctx:
+        yield ctx
+
+
+def _find_by_thumb(thumb, ctx=None):
+    """Поиск сертификатов в системном хранилище "MY" по отпечатку в
+    шестнадцатеричном виде. Если включен кэш хранилища, поиск идет по индексу.
+
+    """
+    if store_cache is not None:
+        cert = store_cache.find_by_thumb(unhexlify(thumb))
+        return [cert] if cert is not None else []
+    cs = csp.CertStore(ctx, b"MY")
+    return list(cs.find_by_thumb(unhexlify(thumb)))
+
+
+@contextmanager
+def _context(cont, provider, flags=None):
+    '''
+    Аналог `_mkcontext` для одной операции: если включен пул контекстов,
+    контекст берется из пула и возвращается в него по выходу из блока.
+
+    '''
+    if cont is None:
+        yield None
+        return
+    with _crypt(*_context_params(cont, provider, flags)) as ctx:
+        yield ctx
 
 
 def gen_key(cont, local=True, silent=False, provider=None):
@@ -100,13 +178,24 @@ def gen_key(cont, local=True, silent=False, provider=None):
         оба переданных параметра.
     :returns: True, если операция успешна
 
+    '''
+    if provider is None and not local:
+        provider = PROV_HSM
+    _gen_key(cont, provider, silent)
+    return True
+
+
+def _gen_key(cont, provider, silent):
+    '''
+    Создание контейнера и ключей в нем (см. `gen_key`).
+
+    :returns: контекст созданного контейнера
+
     '''
     silent_flag = csp.CRYPT_SILENT if silent else 0
 
     cont = _from_hex(cont)
 
-    if provider is None and not local:
-        provider = PROV_HSM
     try:
         ctx = _mkcontext(cont, provider, silent_flag)
     except (ValueError, SystemError):
@@ -129,7 +218,9 @@ def gen_key(cont, local=True, silent=False, provider=None):
         ekey = ctx.create_key(csp.CRYPT_EXPORTABLE, csp.AT_KEYEXCHANGE)
 
     assert ekey, 'NULL exchange key'
-    return True
+    if context_pool is not None:
+        context_pool.invalidate(cont)
+    return ctx
 
 
 def remove_key(cont, local=True, provider=None):
@@ -156,6 +247,8 @@ def remove_key(cont, local=True, provider=None):
     else:
         provtype = PROV_GOST
     csp.Crypt.remove(cont, provtype, provider)
+    if context_pool is not None:
+        context_pool.invalidate(cont)
     return True
 
 
@@ -203,7 +296,11 @@ def create_request(cont, params, local=True, provider=None, insert_zeroes=False)
 
     if provider is None and not local:
         provider = PROV_HSM
-    ctx = _mkcontext(cont, provider, csp.CRYPT_SILENT)
+    with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+        return _create_request(ctx, params, insert_zeroes)
+
+
+def _create_request(ctx, params, insert_zeroes=False):
     req = csp.CertRequest(ctx)
     set_q_defaults(params, insert_zeroes)
     req.set_subject(Attributes(params.get('Attributes', [])).encode())
@@ -231,6 +328,58 @@ def create_request(cont, params, local=True, provider=None, insert_zeroes=False)
     return req.get_data()
 
 
+def enroll_many(items, sink=None, local=True, silent=False, provider=None,
+                insert_zeroes=False, workers=None):
+    """Массовый выпуск запросов на сертификат: для каждого контейнера
+    создаются ключи (как в `gen_key`) и запрос (как в `create_request`).
+    Контекст криптопровайдера открывается один раз на контейнер и
+    используется для обеих операций.
+
+    :items: итерируемый объект с парами (имя контейнера, параметры запроса),
+        параметры -- как в `create_request`
+    :sink: функция двух аргументов (имя контейнера, запрос в DER-кодировке),
+        вызывается для каждого успешно созданного запроса в порядке следования
+        контейнеров. Если задана, запросы не сохраняются в результатах.
+    :local: как в `gen_key`
+    :silent: как в `gen_key`
+    :provider: как в `gen_key`
+    :insert_zeroes: как в `create_request`
+    :workers: количество потоков для параллельной обработки (по умолчанию
+        обработка идет в вызывающем потоке)
+    :returns: генератор словарей в порядке следования контейнеров:
+        {
+            'Container': имя контейнера,
+            'Request': запрос в DER-кодировке (None при ошибке или при
+                заданном :sink:),
+            'Error': исключение, возникшее при обработке контейнера, или None,
+            'Timings': {'GenKey': секунды, 'CreateRequest': секунды},
+        }
+
+    """
+    if provider is None and not local:
+        provider = PROV_HSM
+
+    def enroll_one(item):
+        cont, params = item
+        res = dict(Container=cont, Request=None, Error=None, Timings={})
+        try:
+            start = time.time()
+            ctx = _gen_key(cont, provider, silent)
+            res['Timings']['GenKey'] = time.time() - start
+            start = time.time()
+            res['Request'] = _create_request(ctx, params, insert_zeroes)
+            res['Timings']['CreateRequest'] = time.time() - start
+        except Exception as e:
+            res['Error'] = e
+        return res
+
+    for res in _pool_map(enroll_one, items, workers):
+        if sink is not None and res['Request'] is not None:
+            sink(res['Container'], res['Request'])
+            res['Request'] = None
+        yield res
+
+
 def bind_cert_to_key(cont, cert, local=True, provider=None, store=False):
     """Привязка сертификата к закрытому ключу в контейнере
 
@@ -250,16 +399,18 @@ def bind_cert_to_key(cont, cert, local=True, provider=None, store=False):
     """
     if provider is None and not local:
         provider = PROV_HSM
-    ctx = _mkcontext(cont, provider, csp.CRYPT_SILENT)
     cert = autopem(cert)
     newc = csp.Cert(cert)
-    newc.bind(ctx)
-    if store:
-        key = ctx.get_key()
-        key.store_cert(newc)
-    else:
-        cs = csp.CertStore(ctx, b"MY")
-        cs.add_cert(newc)
+    with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+        newc.bind(ctx)
+        if store:
+            key = ctx.get_key()
+            key.store_cert(newc)
+        else:
+            cs = csp.CertStore(ctx, b"MY")
+            cs.add_cert(newc)
+            if store_cache is not None:
+                store_cache.invalidate()
     return hexlify(newc.thumbprint())
 
 
@@ -279,17 +430,19 @@ def get_certificate(thumb=None, name=None, cont=None, provider=None):
     :returns: сертификат в байтовой строке
 
     """
-    ctx = _mkcontext(cont, provider, csp.CRYPT_SILENT)
     if cont is not None:
-        key = ctx.get_key()
-        return key.extract_cert()
+        with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+            key = ctx.get_key()
+            return key.extract_cert()
 
     assert thumb or name and not (
         thumb and name), 'Only one thumb or name allowed'
-    cs = csp.CertStore(ctx, b"MY")
     if thumb is not None:
-        res = list(cs.find_by_thumb(unhexlify(thumb)))
+        res = _find_by_thumb(thumb)
+    elif store_cache is not None:
+        res = store_cache.find_by_subject(b'CN=' + bytes(name))
     else:
+        cs = csp.CertStore(None, b"MY")
         res = list(c for c in cs.find_by_name(bytes(name))
                    if csp.CertInfo(c).name() == b'CN=' + bytes(name))
     assert len(res), 'Cert not found'
@@ -297,6 +450,21 @@ def get_certificate(thumb=None, name=None, cont=None, provider=None):
     return cert.extract()
 
 
+def _signer_cert(thumb, ctx):
+    """Сертификат подписанта: из системного хранилища по отпечатку, если
+    контекст не задан, иначе сертификат из контейнера, привязанный к его ключу.
+
+    """
+    if ctx is None:
+        store_lst = _find_by_thumb(thumb)
+        assert len(store_lst), 'Unable to find signing cert in system store'
+        return store_lst[0]
+    key = ctx.get_key()
+    signcert = csp.Cert(key.extract_cert())
+    signcert.bind(ctx)
+    return signcert
+
+
 def get_key(cont=None, provider=None):
     """Получение открытого ключа из контейнера
 
@@ -309,12 +477,30 @@ def get_key(cont=None, provider=None):
     :returns: данные открытого ключа в байтовой строке
 
     """
-    ctx = _mkcontext(cont, provider, csp.CRYPT_SILENT)
-    return ctx.public_key()
+    with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+        return ctx.public_key()
+
+
+def _get_data_into(msg, out):
+    """Запись содержимого сообщения в буфер :out: (`CryptMsg.get_data_into`).
+    Если буфер мал, возбуждается SystemError, в тексте и атрибуте
+    `required_size` которого указан нужный размер (`CryptMsg.data_size`).
+
+    """
+    try:
+        return msg.get_data_into(out)
+    except SystemError:
+        size = msg.data_size()
+        if size <= len(out):
+            raise
+    err = SystemError('Output buffer too small: {0} bytes required, {1} given'.format(
+        size, len(out)))
+    err.required_size = size
+    raise err
 
 
 @retry
-def sign(thumb, data, include_data, cont=None, provider=None):
+def sign(thumb, data, include_data, cont=None, provider=None, out=None):
     """Подписывание данных сертификатом
 
     :thumb: отпечаток сертификата, которым будем подписывать
@@ -326,25 +512,180 @@ def sign(thumb, data, include_data, cont=None, provider=None):
         качестве имени, тип берется из константы PROV_GOST.
         Если передан кортеж вида (тип, имя), то в создании контекста участвуют
         оба переданных параметра.
-    :returns: данные и/или подпись в виде байтовой строки
+    :out: буфер, доступный для записи (bytearray, mmap...), в который
+        результат записывается без промежуточной копии. Если буфер мал,
+        возбуждается SystemError с нужным размером буфера в атрибуте
+        `required_size` (см. `_get_data_into`).
+    :returns: данные и/или подпись в виде байтовой строки, либо, если задан
+        :out:, количество записанных в него байт
 
     """
     mess = csp.CryptMsg()
-    if cont is None:
-        ctx = _mkcontext(cont, provider)
-        cs = csp.CertStore(ctx, b"MY")
-        store_lst = list(cs.find_by_thumb(unhexlify(thumb)))
-        assert len(store_lst), 'Unable to find signing cert in system store'
-        signcert = store_lst[0]
-    else:
-        ctx = _mkcontext(cont, provider, csp.CRYPT_SILENT)
-        key = ctx.get_key()
-        signcert = csp.Cert(key.extract_cert())
-        signcert.bind(ctx)
-    sign_data = mess.sign_data(data, signcert, not(include_data))
+    with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+        signcert = _signer_cert(thumb, ctx)
+        if out is not None:
+            mess.sign(data, signcert, not(include_data))
+            return _get_data_into(mess, out)
+        sign_data = mess.sign_data(data, signcert, not(include_data))
     return sign_data
 
 
+def _pool_map(func, items, workers, window=4):
+    '''
+    Аналог `ThreadPool(workers).imap(func, items)`, но из :items: читается не
+    более `workers * window` элементов вперед, поэтому память ограничена и
+    для очень больших наборов. Без :workers: обработка идет в вызывающем
+    потоке.
+
+    '''
+    if not workers:
+        for item in items:
+            yield func(item)
+        return
+    pool = ThreadPool(workers)
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(pool.apply_async(func, (item,)))
+            if len(pending) >= workers * window:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+
+
+def sign_many(thumb, items, include_data=False, workers=None, cont=None, provider=None):
+    """Подписывание множества сообщений одним сертификатом. Контекст
+    криптопровайдера и сертификат подписанта получаются один раз на весь
+    набор данных.
+
+    :thumb: отпечаток сертификата, которым будем подписывать
+    :items: итерируемый объект с данными в байтовых строках
+    :include_data: булев флаг, если True -- данные прицепляются вместе с подписью
+    :workers: количество потоков для параллельного подписывания (по
+        умолчанию подписывание идет в вызывающем потоке)
+    :cont: контейнер для поиска сертификата (если указан -- thumb игнорируется)
+    :provider: провайдер для поиска сертификата (по умолчанию дефолтный для контейнера)
+        Если в качестве криптопровайдера передана строка, то она используется в
+        качестве имени, тип берется из константы PROV_GOST.
+        Если передан кортеж вида (тип, имя), то в создании контекста участвуют
+        оба переданных параметра.
+    :returns: генератор подписей в порядке следования данных
+
+    """
+    with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+        signcert = _signer_cert(thumb, ctx)
+        if ctx is None:
+            # Сертификат из хранилища привязывается к однажды открытому
+            # контексту его ключа, иначе закрытый ключ открывается заново
+            # при каждой подписи. Привязывается копия, чтобы не изменять
+            # свойства сертификата в хранилище.
+            ctx = csp.Crypt(signcert)
+            signcert = csp.Cert(signcert.extract())
+            signcert.bind(ctx)
+
+        def sign_one(data):
+            return csp.CryptMsg().sign_data(data, signcert, not(include_data))
+
+        for sig in _pool_map(sign_one, items, workers):
+            yield sig
+
+
+def _iter_chunks(src, chunk_size):
+    """Порции данных из файлоподобного объекта (читается блоками по
+    :chunk_size: байт) или из итерируемого объекта с байтовыми строками.
+
+    """
+    if hasattr(src, 'read'):
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in src:
+            if chunk:
+                yield chunk
+
+
+@contextmanager
+def _mapped_file(path):
+    """Открывает файл и отображает его в память только для чтения. Отдает
+    пару (файл, данные), где данные -- объект `mmap`, передаваемый в
+    CryptoAPI без копирования, пустая строка для пустого файла, либо None,
+    если файл больше `mmap_limit` и читать его нужно порциями.
+
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            yield f, b''
+            return
+        if size > mmap_limit:
+            yield f, None
+            return
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield f, data
+        finally:
+            data.close()
+
+
+def sign_stream(thumb, src, chunk_size=1024 * 1024, cont=None, provider=None):
+    """Потоковое подписывание данных отсоединенной подписью. Данные не
+    загружаются в память целиком, так что размер подписываемого файла не
+    ограничен объемом памяти.
+
+    :thumb: отпечаток сертификата, которым будем подписывать
+    :src: файлоподобный объект (открытый в бинарном режиме) или итерируемый
+        объект, возвращающий байтовые строки
+    :chunk_size: размер блока чтения из файла
+    :cont: контейнер для поиска сертификата (если указан -- thumb игнорируется)
+    :provider: провайдер для поиска сертификата (по умолчанию дефолтный для контейнера)
+        Если в качестве криптопровайдера передана строка, то она используется в
+        качестве имени, тип берется из константы PROV_GOST.
+        Если передан кортеж вида (тип, имя), то в создании контекста участвуют
+        оба переданных параметра.
+    :returns: подпись в виде байтовой строки
+
+    """
+    res = []
+    with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+        signcert = _signer_cert(thumb, ctx)
+        stream = csp.SignStream(signcert, True)
+        for chunk in _iter_chunks(src, chunk_size):
+            out = stream.update(chunk)
+            if out:
+                res.append(out)
+        out = stream.finish()
+        if out:
+            res.append(out)
+    return b''.join(res)
+
+
+def sign_file(thumb, path, include_data=False, cont=None, provider=None):
+    """Подписывание файла. Файл отображается в память и подписывается без
+    чтения в байтовую строку, файлы больше `mmap_limit` подписываются
+    потоково (см. `sign_stream`).
+
+    :thumb: отпечаток сертификата, которым будем подписывать
+    :path: путь к подписываемому файлу
+    :include_data: булев флаг, если True -- данные прицепляются вместе с
+        подписью. Для файлов больше `mmap_limit` не поддерживается.
+    :cont: контейнер для поиска сертификата (если указан -- thumb игнорируется)
+    :provider: провайдер для поиска сертификата (по умолчанию дефолтный для контейнера)
+    :returns: данные и/или подпись в виде байтовой строки
+
+    """
+    with _mapped_file(path) as (f, data):
+        if data is not None:
+            return sign(thumb, data, include_data, cont, provider)
+        if include_data:
+            raise ValueError('File is too large to be signed with included data')
+        return sign_stream(thumb, f, cont=cont, provider=provider)
+
+
 @retry
 def sign_and_encrypt(thumb, certs, data, cont=None, provider=None):
     """Подписывание данных сертификатом
@@ -366,18 +707,9 @@ def sign_and_encrypt(thumb, certs, data, cont=None, provider=None):
     for c in certs:
         cert = csp.Cert(c)
         mess.add_recipient(cert)
-    if cont is None:
-        ctx = _mkcontext(cont, provider)
-        cs = csp.CertStore(ctx, b"MY")
-        store_lst = list(cs.find_by_thumb(unhexlify(thumb)))
-        assert len(store_lst), 'Unable to find signing cert in system store'
-        signcert = store_lst[0]
-    else:
-        ctx = _mkcontext(cont, provider, csp.CRYPT_SILENT)
-        key = ctx.get_key()
-        signcert = csp.Cert(key.extract_cert())
-        signcert.bind(ctx)
-    sign_data = mess.sign_data(data, signcert)
+    with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+        signcert = _signer_cert(thumb, ctx)
+        sign_data = mess.sign_data(data, signcert)
     encrypted = mess.encrypt_data(sign_data)
     return encrypted
 
@@ -402,37 +734,148 @@ def check_signature(cert, sig, data, cont=None, provider=None):
 
     """
     sign = csp.Signature(sig)
-    if cert or cont:
-        if cert:
-            cert = autopem(cert)
-        else:
-            ctx = _mkcontext(cont, provider, csp.CRYPT_SILENT)
-            key = ctx.get_key()
-            cert = key.extract_cert()
+    if not cert and cont:
+        cert = _container_cert(cont, provider)
+    return _check_detached(sign, data, _verification_store(cert))
+
+
+def _container_cert(cont, provider):
+    with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+        key = ctx.get_key()
+        return key.extract_cert()
+
+
+def _check_detached(sign, data, cs):
+    for i, signer in _known_signers(sign, cs):
+        return sign.verify_data(data, i)
+    return False
+
+
+def verify_many(items, trusted_certs=None, workers=None):
+    """Проверка множества отсоединенных подписей. Хранилище доверенных
+    сертификатов создается (или открывается) один раз на весь набор.
+
+    :items: итерируемый объект с парами (подпись, данные) в байтовых строках
+    :trusted_certs: список сертификатов в байтовых строках. Если None,
+        используется системное хранилище.
+    :workers: количество потоков для параллельной проверки (по умолчанию
+        проверка идет в вызывающем потоке)
+    :returns: генератор пар (результат, ошибка) в порядке следования подписей.
+        Результат -- True или False, ошибка -- исключение, возникшее при
+        проверке (результат в этом случае False), или None.
+
+    """
+    if trusted_certs:
         cs = csp.CertStore()
-        cert = csp.Cert(cert)
-        cs.add_cert(cert)
+        for c in trusted_certs:
+            cs.add_cert(csp.Cert(autopem(c)))
     else:
-        cs = csp.CertStore(None, b"MY")
+        cs = _verification_store(None)
 
+    def verify_one(item):
+        sig, data = item
+        try:
+            sign = csp.Signature(sig)
+            # конструктор не проверяет данные, для испорченной подписи
+            # число подписантов отрицательно
+            if sign.num_signers() < 0:
+                raise ValueError('Invalid signature data')
+            return _check_detached(sign, data, cs), None
+        except Exception as e:
+            return False, e
+
+    for res in _pool_map(verify_one, items, workers):
+        yield res
+
+
+def check_signature_stream(sig, src, cert=None, chunk_size=1024 * 1024):
+    """Потоковая проверка отсоединенной подписи. Подписанные данные читаются
+    из :src: порциями и хэшируются по мере чтения, поэтому их размер не
+    ограничен объемом памяти.
+
+    :sig: данные подписи в байтовой строке
+    :src: файлоподобный объект (открытый в бинарном режиме) или итерируемый
+        объект, возвращающий байтовые строки
+    :cert: сертификат в байтовой строке или `None`
+    :chunk_size: размер блока чтения из файла
+    :returns: True или False
+
+    Если :cert: передан как None, подпись считается верной, если хотя бы один
+    из сертификатов в ней есть в системном хранилище и проходит проверку.
+
+    """
+    sign = csp.Signature(sig)
+    cs = _verification_store(cert)
+    signers = list(signer for i, signer in _known_signers(sign, cs))
+    if not signers:
+        return False
+
+    stream = csp.VerifyStream(sig)
+    for chunk in _iter_chunks(src, chunk_size):
+        stream.update(chunk)
+    stream.finish()
+    return stream.verify(signers[0])
+
+
+def check_signature_file(cert, sig, path, cont=None, provider=None):
+    """Проверка отсоединенной подписи под файлом. Файл отображается в
+    память, файлы больше `mmap_limit` проверяются потоково (см.
+    `check_signature_stream`). Параметры :cert:, :sig:, :cont: и :provider:
+    -- как у `check_signature`.
+
+    :path: путь к подписанному файлу
+    :returns: True или False
+
+    """
+    with _mapped_file(path) as (f, data):
+        if data is not None:
+            return check_signature(cert, sig, data, cont, provider)
+        if not cert and cont:
+            cert = _container_cert(cont, provider)
+        return check_signature_stream(sig, f, cert)
+
+
+def _verification_store(cert):
+    """Хранилище сертификатов, которым доверяем при проверке подписи:
+    временное с единственным сертификатом :cert:, либо системное.
+
+    """
+    if cert:
+        cs = csp.CertStore()
+        cs.add_cert(csp.Cert(autopem(cert)))
+        return cs
+    if store_cache is not None:
+        return store_cache.store
+    return csp.CertStore(None, b"MY")
+
+
+def _known_signers(sign, cs):
+    """Пары (номер подписанта, сертификат) для подписантов сообщения :sign:,
+    сертификаты которых есть в хранилище :cs:.
+
+    """
     for i in range(sign.num_signers()):
         isign = csp.CertInfo(sign, i)
         try:
-            if not cs.get_cert_by_info(isign):
-                continue
+            signer = cs.get_cert_by_info(isign)
         except ValueError:
             continue
-        return sign.verify_data(data, i)
-    return False
+        if signer:
+            yield i, signer
 
 
 @retry
-def encrypt(certs, data):
+def encrypt(certs, data, out=None):
     """Шифрование данных на сертификатах получателей
 
     :certs: список сертификатов в байтовых строках
     :data: данные в байтовой строке
-    :returns: шифрованные данные в байтовой строке
+    :out: буфер, доступный для записи (bytearray, mmap...), в который
+        результат записывается без промежуточной копии. Если буфер мал,
+        возбуждается SystemError с нужным размером буфера в атрибуте
+        `required_size` (см. `_get_data_into`).
+    :returns: шифрованные данные в байтовой строке, либо, если задан :out:,
+        количество записанных в него байт
 
     """
     certs = [autopem(c) for c in certs]
@@ -440,12 +883,98 @@ def encrypt(certs, data):
     for c in certs:
         cert = csp.Cert(c)
         msg.add_recipient(cert)
+    if out is not None:
+        msg.encrypt(data)
+        return _get_data_into(msg, out)
     encrypted = msg.encrypt_data(data)
     return encrypted
 
 
+def encrypt_stream(certs, src, dst, chunk_size=1024 * 1024):
+    """Потоковое шифрование данных на сертификатах получателей. Данные
+    читаются из :src: порциями и шифруются один раз, закодированное сообщение
+    (с неопределенной длиной содержимого) записывается в :dst: по мере
+    готовности.
+
+    :certs: список сертификатов в байтовых строках
+    :src: файлоподобный объект (открытый в бинарном режиме) или итерируемый
+        объект, возвращающий байтовые строки
+    :dst: объект с методом `write()`, принимающим байтовые строки
+    :chunk_size: размер блока чтения из файла
+    :returns: количество записанных байт
+
+    """
+    stream = csp.EncryptStream()
+    for c in certs:
+        stream.add_recipient(csp.Cert(autopem(c)))
+    total = 0
+    for chunk in _iter_chunks(src, chunk_size):
+        out = stream.update(chunk)
+        if out:
+            dst.write(out)
+            total += len(out)
+    out = stream.finish()
+    if out:
+        dst.write(out)
+        total += len(out)
+    return total
+
+
+def encrypt_file(certs, path, dst_path):
+    """Шифрование файла на сертификатах получателей. Исходный файл
+    отображается в память, файлы больше `mmap_limit` шифруются потоково (см.
+    `encrypt_stream`).
+
+    :certs: список сертификатов в байтовых строках
+    :path: путь к шифруемому файлу
+    :dst_path: путь к файлу, в который записывается шифрованное сообщение
+    :returns: количество записанных байт
+
+    Сообщение записывается во временный файл рядом с :dst_path: и
+    переименовывается в :dst_path: только после успешного шифрования, так что
+    при ошибке недописанный файл не остается. Совпадение :dst_path: с
+    исходным файлом недопустимо (ValueError).
+
+    """
+    if os.path.exists(dst_path) and os.path.samefile(path, dst_path):
+        raise ValueError('Source and destination are the same file')
+    with _mapped_file(path) as (f, data):
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(dst_path)),
+            prefix=os.path.basename(dst_path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as dst:
+                if data is None:
+                    size = encrypt_stream(certs, f, dst)
+                else:
+                    encrypted = encrypt(certs, data)
+                    dst.write(encrypted)
+                    size = len(encrypted)
+            _replace(tmp_path, dst_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return size
+
+
+def _recipient_cert(thumb, ctx):
+    """Сертификат получателя для расшифровки: из системного хранилища по
+    отпечатку, если он задан, иначе сертификат из контейнера, привязанный к
+    его ключу.
+
+    """
+    if thumb is not None:
+        certs = _find_by_thumb(thumb, ctx)
+        assert len(certs), 'Certificate for thumbprint not found'
+        return certs[0]
+    key = ctx.get_key()
+    cert = csp.Cert(key.extract_cert())
+    cert.bind(ctx)
+    return cert
+
+
 @retry
-def decrypt(data, thumb, cont=None, provider=None):
+def decrypt(data, thumb, cont=None, provider=None, out=None):
     """Дешифрование данных из сообщения
 
     :thumb: отпечаток сертификата для расшифровки.
@@ -457,24 +986,59 @@ def decrypt(data, thumb, cont=None, provider=None):
         качестве имени, тип берется из константы PROV_GOST.
         Если передан кортеж вида (тип, имя), то в создании контекста участвуют
         оба переданных параметра.
-    :returns: шифрованные данные в байтовой строке
+    :out: буфер, доступный для записи (bytearray, mmap...), в который
+        результат записывается без промежуточной копии. Если буфер мал,
+        возбуждается SystemError с нужным размером буфера в атрибуте
+        `required_size` (см. `_get_data_into`).
+    :returns: расшифрованные данные в байтовой строке, либо, если задан
+        :out:, количество записанных в него байт
 
     """
 
-    ctx = _mkcontext(cont, provider, csp.CRYPT_SILENT)
-    if thumb is not None:
-        cs = csp.CertStore(ctx, b"MY")
-        certs = list(cs.find_by_thumb(unhexlify(thumb)))
-        assert len(certs), 'Certificate for thumbprint not found'
-        cert = certs[0]
-    else:
-        key = ctx.get_key()
-        cert = csp.Cert(key.extract_cert())
-        cert.bind(ctx)
-    bin_data = data
-    msg = csp.CryptMsg(bin_data)
-    msg.decrypt_by_cert(cert)
-    return msg.get_data()
+    with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+        cert = _recipient_cert(thumb, ctx)
+        bin_data = data
+        msg = csp.CryptMsg(bin_data)
+        msg.decrypt_by_cert(cert)
+        if out is not None:
+            return _get_data_into(msg, out)
+        return msg.get_data()
+
+
+def decrypt_stream(src, dst, thumb=None, chunk_size=1024 * 1024, cont=None, provider=None):
+    """Потоковое дешифрование сообщения: шифрованные данные читаются из :src:
+    порциями, расшифрованные записываются в :dst: по мере готовности, так что
+    объем занятой памяти не зависит от размера сообщения.
+
+    :src: файлоподобный объект (открытый в бинарном режиме) или итерируемый
+        объект, возвращающий байтовые строки
+    :dst: объект с методом `write()`, принимающим байтовые строки
+    :thumb: отпечаток сертификата для расшифровки.
+        Если равен None, используется сертификат, сохраненный в контейнере.
+    :chunk_size: размер блока чтения из файла
+    :cont: контейнер для поиска сертификата (по умолчанию -- системный)
+    :provider: провайдер для поиска сертификата (по умолчанию дефолтный для контейнера)
+        Если в качестве криптопровайдера передана строка, то она используется в
+        качестве имени, тип берется из константы PROV_GOST.
+        Если передан кортеж вида (тип, имя), то в создании контекста участвуют
+        оба переданных параметра.
+    :returns: количество расшифрованных байт
+
+    """
+    total = 0
+    with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+        cert = _recipient_cert(thumb, ctx)
+        stream = csp.DecryptStream(cert)
+        for chunk in _iter_chunks(src, chunk_size):
+            out = stream.update(chunk)
+            if out:
+                dst.write(out)
+                total += len(out)
+        out = stream.finish()
+        if out:
+            dst.write(out)
+            total += len(out)
+    return total
 
 
 @retry
@@ -494,18 +1058,18 @@ def block_encrypt(cert, data):
         provtype, keyalg, keyexp = csp.PROV_GOST_2012_512, csp.CALG_DH_GR3410_12_512_EPHEM, csp.CALG_PRO12_EXPORT
     else:
         provtype, keyalg, keyexp = csp.PROV_GOST_2001_DH, csp.CALG_DH_EL_EPHEM, csp.CALG_PRO_EXPORT
-    ctx = csp.Crypt(b'', provtype, csp.CRYPT_VERIFYCONTEXT, None)
-    pubKey = ctx.import_public_key_info(cert)
-    keyData = pubKey.encode()
-    ephemKey = ctx.create_key(csp.CRYPT_EXPORTABLE, keyalg)
-    ephemData = ephemKey.encode()
-    agreeKey = ctx.import_key(keyData, ephemKey)
-    agreeKey.set_alg_id(keyexp)
-    sessionKey = ctx.create_key(csp.CRYPT_EXPORTABLE, csp.CALG_G28147)
-    ivData = sessionKey.get_iv()
-    sessionKeyData = sessionKey.encode(agreeKey)
-    sessionKey.set_mode(csp.CRYPT_MODE_CBCSTRICT)
-    encryptedData = sessionKey.encrypt(data)
+    with _crypt(b'', provtype, csp.CRYPT_VERIFYCONTEXT, None) as ctx:
+        pubKey = ctx.import_public_key_info(cert)
+        keyData = pubKey.encode()
+        ephemKey = ctx.create_key(csp.CRYPT_EXPORTABLE, keyalg)
+        ephemData = ephemKey.encode()
+        agreeKey = ctx.import_key(keyData, ephemKey)
+        agreeKey.set_alg_id(keyexp)
+        sessionKey = ctx.create_key(csp.CRYPT_EXPORTABLE, csp.CALG_G28147)
+        ivData = sessionKey.get_iv()
+        sessionKeyData = sessionKey.encode(agreeKey)
+        sessionKey.set_mode(csp.CRYPT_MODE_CBCSTRICT)
+        encryptedData = sessionKey.encrypt(data)
     return encryptedData, ephemData, sessionKeyData, ivData
 
 
@@ -527,29 +1091,34 @@ def block_decrypt(cont, encryptedData, ephemData, sessionKeyData, ivData, provid
         оба переданных параметра.
     :returns: дешифрованные данные (дополненные до размера, кратного блоку шифрования)
     """
-    ctx = _mkcontext(cont, provider, 0)
-    userKey = ctx.get_key(csp.AT_KEYEXCHANGE)
-    algID = ctx.get_key().alg_id()
-    if algID == csp.CALG_DH_EL_SF:
-        keyexp = csp.CALG_PRO_EXPORT
-    else:
-        keyexp = csp.CALG_PRO12_EXPORT
-    agreeKey = ctx.import_key(ephemData, userKey)
-    agreeKey.set_alg_id(keyexp)
-    sessionKey = ctx.import_key(sessionKeyData, agreeKey)
-    sessionKey.set_mode(csp.CRYPT_MODE_CBCSTRICT)
-    try:
-        sessionKey.set_padding(csp.RANDOM_PADDING)
-    except Exception:
-        pass  # XXX возможная для VipNet CSP ошибка игнорируется
-    sessionKey.set_iv(ivData)
-    return sessionKey.decrypt(encryptedData)
+    with _context(cont, provider, 0) as ctx:
+        userKey = ctx.get_key(csp.AT_KEYEXCHANGE)
+        algID = ctx.get_key().alg_id()
+        if algID == csp.CALG_DH_EL_SF:
+            keyexp = csp.CALG_PRO_EXPORT
+        else:
+            keyexp = csp.CALG_PRO12_EXPORT
+        agreeKey = ctx.import_key(ephemData, userKey)
+        agreeKey.set_alg_id(keyexp)
+        sessionKey = ctx.import_key(sessionKeyData, agreeKey)
+        sessionKey.set_mode(csp.CRYPT_MODE_CBCSTRICT)
+        try:
+            sessionKey.set_padding(csp.RANDOM_PADDING)
+        except Exception:
+            pass  # XXX возможная для VipNet CSP ошибка игнорируется
+        sessionKey.set_iv(ivData)
+        return sessionKey.decrypt(encryptedData)
 
 
-def pkcs7_info(data):
+def pkcs7_info(data, parts=None, copy=True):
     """Информация о сообщении в формате PKCS7
 
     :data: данные в байтовой строке
+    :parts: ключи результата, которые нужно заполнить (по умолчанию -- все),
+        например ('SignerInfos',). 'ContentType' заполняется всегда.
+    :copy: если False, 'Content' возвращается в виде `memoryview` над
+        :data: без копирования (для сообщений типа data и signedData с
+        содержимым, закодированным одним фрагментом)
     :returns: словарь с информацией следующего вида:
     {
         'Content': '....', # байтовая строка
@@ -561,12 +1130,35 @@ def pkcs7_info(data):
         'RecipientInfos': [ { 'SerialNumber': 'строка', 'Issuer': [(OID, строка), ...] }, ... ],
     }
 
+    Сообщение просматривается за один проход по заголовкам, декодируются
+    только информация о подписантах и получателях. Содержимое и сертификаты
+    сообщений типа data и signedData берутся прямо из :data:, для остальных
+    типов -- через CryptoAPI.
 
     """
-    msg = csp.CryptMsg(data)
-    res = PKCS7Msg(data).abstract()
-    res['Content'] = msg.get_data()
-    res['Certificates'] = list(x.extract() for x in csp.CertStore(msg))
+    def wanted(key):
+        return parts is None or key in parts
+
+    pkcs7 = PKCS7Msg(data, cache=cert_cache)
+    res = dict((k, v) for (k, v) in pkcs7.abstract().items()
+               if k == 'ContentType' or wanted(k))
+    content = pkcs7.encapsulated() if wanted('Content') else None
+    certs = pkcs7.certificates() if wanted('Certificates') else None
+    msg = None
+    if (wanted('Content') and content is None or
+            wanted('Certificates') and certs is None):
+        msg = csp.CryptMsg(data)
+    if wanted('Content'):
+        if content is None:
+            content = msg.get_data()
+        elif copy and isinstance(content, memoryview):
+            content = content.tobytes()
+        res['Content'] = content
+    if wanted('Certificates'):
+        if certs is None:
+            res['Certificates'] = list(x.extract() for x in csp.CertStore(msg))
+        else:
+            res['Certificates'] = list(c.tobytes() for c in certs)
     return res
 
 
@@ -594,20 +1186,21 @@ def provider_params(cont=None, provider=None):
         'KeysRemaining': long, # [> остаток ДСРФ <]
     }
     """
-    ctx = _mkcontext(cont, provider, csp.CRYPT_SILENT)
-    info = csp.CSPInfo(ctx)
-    assert info
-    return dict(
-        Time=info.time(),
-        Version=info.version(),
-        FreeSpace=info.free_space(),
-        NumberUL=info.number_ul(),
-        NumberSigns=info.number_signs(),
-        NumberChanges=info.number_changes(),
-        NumberKCards=info.number_kcards(),
-        NumberKeys=info.number_keys(),
-        KeysRemaining=info.keys_remaining(),
-    )
+    with _context(cont, provider, csp.CRYPT_SILENT) as ctx:
+        # параметры читаются до возврата контекста в пул
+        info = csp.CSPInfo(ctx)
+        assert info
+        return dict(
+            Time=info.time(),
+            Version=info.version(),
+            FreeSpace=info.free_space(),
+            NumberUL=info.number_ul(),
+            NumberSigns=info.number_signs(),
+            NumberChanges=info.number_changes(),
+            NumberKCards=info.number_kcards(),
+            NumberKeys=info.number_keys(),
+            KeysRemaining=info.keys_remaining(),
+        )
 
 
 def cert_subject_id(cert):
@@ -616,10 +1209,17 @@ def cert_subject_id(cert):
     :cert: сертификат в base64, или в бинарнике
     :returns: Строку из шестнадцатиричных цифр.
 
+    При включенном кэше (`cert_cache`) сертификат разбирается один раз.
+
     """
     cert = autopem(cert)
-    cert = csp.Cert(cert)
-    return hexlify(cert.subject_id())
+    if cert_cache is not None:
+        return cert_cache.get('subject_id', cert, _cert_subject_id)
+    return _cert_subject_id(cert)
+
+
+def _cert_subject_id(cert):
+    return hexlify(csp.Cert(cert).subject_id())
 
 
 def cert_info(cert):
@@ -640,8 +1240,22 @@ def cert_info(cert):
         'Extensions': [OID, OID, ...]
     }
 
+    При включенном кэше (`cert_cache`) сертификат разбирается один раз.
+
     """
     cert = autopem(cert)
+    if cert_cache is not None:
+        return cert_cache.get('cert_info', cert, _cert_info)
+    return _cert_info(cert)
+
+
+def _decode_name(der):
+    if cert_cache is not None:
+        return cert_cache.decode_name(der)
+    return Attributes.load(der).decode()
+
+
+def _cert_info(cert):
     infoasn = CertificateInfo(cert)
     cert = csp.Cert(cert)
     info = csp.CertInfo(cert)
@@ -649,13 +1263,13 @@ def cert_info(cert):
         Version=info.version(),
         ValidFrom=filetime_from_dec(info.not_before()),
         ValidTo=filetime_from_dec(info.not_after()),
-        Issuer=Attributes.load(info.issuer(False)).decode(),
+        Issuer=_decode_name(info.issuer(False)),
         Thumbprint=hexlify(cert.thumbprint()),
         UseToSign=bool(info.usage() & csp.CERT_DIGITAL_SIGNATURE_KEY_USAGE),
         UseToEncrypt=bool(info.usage() & csp.CERT_DATA_ENCIPHERMENT_KEY_USAGE),
         SerialNumber=':'.join(hex(ord(x))[2:]
                               for x in reversed(info.serial())),
-        Subject=Attributes.load(info.name(False)).decode(),
+        Subject=_decode_name(info.name(False)),
         SignatureAlgorithm=info.sign_algorithm(),
         PublicKeyAlgorithm=info.public_key_algorithm(),
         Extensions=infoasn.EKU(),
@@ -704,6 +1318,26 @@ class Hash(object):
         '''
         self._hash.update(data)
 
+    @classmethod
+    def from_file(cls, path, *args, **kwargs):
+        '''
+        Хэш содержимого файла. Остальные параметры передаются конструктору.
+        Файл отображается в память и хэшируется за один вызов, файлы больше
+        `mmap_limit` читаются порциями.
+
+        > h = Hash.from_file('data.bin')
+        > print(h.hexdigest())
+
+        '''
+        h = cls(*args, **kwargs)
+        with _mapped_file(path) as (f, data):
+            if data is None:
+                for chunk in _iter_chunks(f, 1024 * 1024):
+                    h.update(chunk)
+            elif len(data):
+                h.update(data)
+        return h
+
     def digest(self):
         '''
         Возвращает дайджест данных и закрывает хэш от дальнейших обновлений.
@@ -812,8 +1446,7 @@ class SignedHash(Hash):
         '''
         ctx = _mkcontext(cont, provider, csp.CRYPT_SILENT)
         if thumb is not None:
-            cs = csp.CertStore(ctx, b"MY")
-            store_lst = list(cs.find_by_thumb(unhexlify(thumb)))
+            store_lst = _find_by_thumb(thumb, ctx)
             assert len(store_lst), 'Unable to find signing cert in system store'
             self._ctx = csp.Crypt(store_lst[0])
         else:
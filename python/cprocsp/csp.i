@@ -25,6 +25,7 @@
 #include "sign.hpp"
 #include "request.hpp"
 #include "hash.hpp"
+#include "stream.hpp"
 %}
 
 %include "wintypes.i"
@@ -42,3 +43,4 @@
 %include "sign.i"
 %include "request.i"
 %include "hash.i"
+%include "stream.i"
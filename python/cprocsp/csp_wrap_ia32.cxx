@@ -3738,54 +3738,59 @@ SwigPyBuiltin_iternextfunc_closure(SwigPyWrapperFunction wrapper, PyObject *a) {
 
 #define SWIGTYPE_p_CERT_EXTENSION swig_types[0]
 #define SWIGTYPE_p_CERT_PUBLIC_KEY_INFO swig_types[1]
-#define SWIGTYPE_p_CRYPT_INTEGER_BLOB swig_types[2]
-#define SWIGTYPE_p_CSPInfo swig_types[3]
-#define SWIGTYPE_p_Cert swig_types[4]
-#define SWIGTYPE_p_CertExtension swig_types[5]
-#define SWIGTYPE_p_CertFind swig_types[6]
-#define SWIGTYPE_p_CertInfo swig_types[7]
-#define SWIGTYPE_p_CertIter swig_types[8]
-#define SWIGTYPE_p_CertRequest swig_types[9]
-#define SWIGTYPE_p_CertStore swig_types[10]
-#define SWIGTYPE_p_Crypt swig_types[11]
-#define SWIGTYPE_p_CryptDesc swig_types[12]
-#define SWIGTYPE_p_CryptIter swig_types[13]
-#define SWIGTYPE_p_CryptMsg swig_types[14]
-#define SWIGTYPE_p_EKUIter swig_types[15]
-#define SWIGTYPE_p_ExtIter swig_types[16]
-#define SWIGTYPE_p_FILETIME swig_types[17]
-#define SWIGTYPE_p_Hash swig_types[18]
-#define SWIGTYPE_p_Key swig_types[19]
-#define SWIGTYPE_p_PCCERT_CONTEXT swig_types[20]
-#define SWIGTYPE_p_PCERT_EXTENSION swig_types[21]
-#define SWIGTYPE_p_RCObj swig_types[22]
-#define SWIGTYPE_p_Signature swig_types[23]
-#define SWIGTYPE_p_SwigPyObject swig_types[24]
-#define SWIGTYPE_p__CERT_INFO swig_types[25]
-#define SWIGTYPE_p__CMS_DH_KEY_INFO swig_types[26]
-#define SWIGTYPE_p__CRYPTOAPI_BLOB swig_types[27]
-#define SWIGTYPE_p__CRYPT_ALGORITHM_IDENTIFIER swig_types[28]
-#define SWIGTYPE_p__CRYPT_BIT_BLOB swig_types[29]
-#define SWIGTYPE_p__GUID swig_types[30]
-#define SWIGTYPE_p__LARGE_INTEGER swig_types[31]
-#define SWIGTYPE_p__LUID swig_types[32]
-#define SWIGTYPE_p_char swig_types[33]
-#define SWIGTYPE_p_float swig_types[34]
-#define SWIGTYPE_p_int swig_types[35]
-#define SWIGTYPE_p_long swig_types[36]
-#define SWIGTYPE_p_long_long swig_types[37]
-#define SWIGTYPE_p_p_unsigned_char swig_types[38]
-#define SWIGTYPE_p_p_void swig_types[39]
-#define SWIGTYPE_p_short swig_types[40]
-#define SWIGTYPE_p_unsigned_char swig_types[41]
-#define SWIGTYPE_p_unsigned_int swig_types[42]
-#define SWIGTYPE_p_unsigned_long swig_types[43]
-#define SWIGTYPE_p_unsigned_long_long swig_types[44]
-#define SWIGTYPE_p_unsigned_short swig_types[45]
-#define SWIGTYPE_p_void swig_types[46]
-#define SWIGTYPE_p_wchar_t swig_types[47]
-static swig_type_info *swig_types[49];
-static swig_module_info swig_module = {swig_types, 48, 0, 0, 0, 0};
+#define SWIGTYPE_p_CMSStream swig_types[2]
+#define SWIGTYPE_p_CRYPT_INTEGER_BLOB swig_types[3]
+#define SWIGTYPE_p_CSPInfo swig_types[4]
+#define SWIGTYPE_p_Cert swig_types[5]
+#define SWIGTYPE_p_CertExtension swig_types[6]
+#define SWIGTYPE_p_CertFind swig_types[7]
+#define SWIGTYPE_p_CertInfo swig_types[8]
+#define SWIGTYPE_p_CertIter swig_types[9]
+#define SWIGTYPE_p_CertRequest swig_types[10]
+#define SWIGTYPE_p_CertStore swig_types[11]
+#define SWIGTYPE_p_Crypt swig_types[12]
+#define SWIGTYPE_p_CryptDesc swig_types[13]
+#define SWIGTYPE_p_CryptIter swig_types[14]
+#define SWIGTYPE_p_CryptMsg swig_types[15]
+#define SWIGTYPE_p_DecryptStream swig_types[16]
+#define SWIGTYPE_p_EKUIter swig_types[17]
+#define SWIGTYPE_p_EncryptStream swig_types[18]
+#define SWIGTYPE_p_ExtIter swig_types[19]
+#define SWIGTYPE_p_FILETIME swig_types[20]
+#define SWIGTYPE_p_Hash swig_types[21]
+#define SWIGTYPE_p_Key swig_types[22]
+#define SWIGTYPE_p_PCCERT_CONTEXT swig_types[23]
+#define SWIGTYPE_p_PCERT_EXTENSION swig_types[24]
+#define SWIGTYPE_p_RCObj swig_types[25]
+#define SWIGTYPE_p_SignStream swig_types[26]
+#define SWIGTYPE_p_Signature swig_types[27]
+#define SWIGTYPE_p_SwigPyObject swig_types[28]
+#define SWIGTYPE_p_VerifyStream swig_types[29]
+#define SWIGTYPE_p__CERT_INFO swig_types[30]
+#define SWIGTYPE_p__CMS_DH_KEY_INFO swig_types[31]
+#define SWIGTYPE_p__CRYPTOAPI_BLOB swig_types[32]
+#define SWIGTYPE_p__CRYPT_ALGORITHM_IDENTIFIER swig_types[33]
+#define SWIGTYPE_p__CRYPT_BIT_BLOB swig_types[34]
+#define SWIGTYPE_p__GUID swig_types[35]
+#define SWIGTYPE_p__LARGE_INTEGER swig_types[36]
+#define SWIGTYPE_p__LUID swig_types[37]
+#define SWIGTYPE_p_char swig_types[38]
+#define SWIGTYPE_p_float swig_types[39]
+#define SWIGTYPE_p_int swig_types[40]
+#define SWIGTYPE_p_long swig_types[41]
+#define SWIGTYPE_p_long_long swig_types[42]
+#define SWIGTYPE_p_p_unsigned_char swig_types[43]
+#define SWIGTYPE_p_p_void swig_types[44]
+#define SWIGTYPE_p_short swig_types[45]
+#define SWIGTYPE_p_unsigned_char swig_types[46]
+#define SWIGTYPE_p_unsigned_int swig_types[47]
+#define SWIGTYPE_p_unsigned_long swig_types[48]
+#define SWIGTYPE_p_unsigned_long_long swig_types[49]
+#define SWIGTYPE_p_unsigned_short swig_types[50]
+#define SWIGTYPE_p_void swig_types[51]
+#define SWIGTYPE_p_wchar_t swig_types[52]
+static swig_type_info *swig_types[54];
+static swig_module_info swig_module = {swig_types, 53, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
@@ -3905,6 +3910,7 @@ namespace swig {
 #include "sign.hpp"
 #include "request.hpp"
 #include "hash.hpp"
+#include "stream.hpp"
 
 
 SWIGINTERNINLINE PyObject*
@@ -6282,9 +6288,8 @@ SWIGINTERN int _wrap_new_Crypt__SWIG_0(PyObject *self, PyObject *args) {
   DWORD arg3 ;
   DWORD arg4 ;
   char *arg5 = (char *) 0 ;
-  char *cstr1 = NULL ;
-  Py_ssize_t len1 = 0 ;
-  int res1 = 1 ;
+  Py_buffer view1 ;
+  int got_view1 = 0 ;
   int res5 ;
   char *buf5 = 0 ;
   int alloc5 = 0 ;
@@ -6295,31 +6300,15 @@ SWIGINTERN int _wrap_new_Crypt__SWIG_0(PyObject *self, PyObject *args) {
   Crypt *result = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)"OOOO:new_Crypt",&obj1,&obj2,&obj3,&obj4)) SWIG_fail;
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res1 = PyBytes_AsStringAndSize(obj1, &cstr1, &len1);
-#else
-    res1 = PyString_AsStringAndSize(obj1, &cstr1, &len1);
-#endif
-    if (!cstr1) {
-      res1 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res1){
+  if (PyObject_GetBuffer(obj1, &view1, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_Crypt" "', argument " "1"" of type '" "BYTE *""'");
-  } else {
-    arg1 = (BYTE *) cstr1;
-    arg2 = (DWORD) len1;
   }
+  got_view1 = 1;
+  if (view1.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_Crypt" "', argument " "1"" of type '" "BYTE *""'");
+  }
+  arg1 = (BYTE *) view1.buf;
+  arg2 = (DWORD) view1.len;
 #if PY_VERSION_HEX >= 0x03000000
   arg3 = PyLong_AsUnsignedLong(obj2);
 #else
@@ -6354,10 +6343,16 @@ SWIGINTERN int _wrap_new_Crypt__SWIG_0(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Crypt, SWIG_BUILTIN_INIT |  0 );
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   if (alloc5 == SWIG_NEWOBJ) delete[] buf5;
   return -1;
 }
@@ -6369,40 +6364,23 @@ SWIGINTERN int _wrap_new_Crypt__SWIG_1(PyObject *self, PyObject *args) {
   DWORD arg2 ;
   DWORD arg3 ;
   DWORD arg4 ;
-  char *cstr1 = NULL ;
-  Py_ssize_t len1 = 0 ;
-  int res1 = 1 ;
+  Py_buffer view1 ;
+  int got_view1 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
   Crypt *result = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)"OOO:new_Crypt",&obj1,&obj2,&obj3)) SWIG_fail;
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res1 = PyBytes_AsStringAndSize(obj1, &cstr1, &len1);
-#else
-    res1 = PyString_AsStringAndSize(obj1, &cstr1, &len1);
-#endif
-    if (!cstr1) {
-      res1 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res1){
+  if (PyObject_GetBuffer(obj1, &view1, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_Crypt" "', argument " "1"" of type '" "BYTE *""'");
-  } else {
-    arg1 = (BYTE *) cstr1;
-    arg2 = (DWORD) len1;
   }
+  got_view1 = 1;
+  if (view1.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_Crypt" "', argument " "1"" of type '" "BYTE *""'");
+  }
+  arg1 = (BYTE *) view1.buf;
+  arg2 = (DWORD) view1.len;
 #if PY_VERSION_HEX >= 0x03000000
   arg3 = PyLong_AsUnsignedLong(obj2);
 #else
@@ -6432,9 +6410,15 @@ SWIGINTERN int _wrap_new_Crypt__SWIG_1(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Crypt, SWIG_BUILTIN_INIT |  0 );
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   return -1;
 }
 
@@ -6498,11 +6482,7 @@ SWIGINTERN int _wrap_new_Crypt(PyObject *self, PyObject *args) {
   if (argc == 3) {
     int _v;
     {
-#if py_version_hex>=0x03000000
-      _v = PyBytes_Check(argv[0]) ? 1 : 0;
-#else  
-      _v = PyString_Check(argv[0]) ? 1 : 0;
-#endif
+      _v = PyObject_CheckBuffer(argv[0]) ? 1 : 0;
     }
     if (_v) {
       {
@@ -6531,11 +6511,7 @@ SWIGINTERN int _wrap_new_Crypt(PyObject *self, PyObject *args) {
   if (argc == 4) {
     int _v;
     {
-#if py_version_hex>=0x03000000
-      _v = PyBytes_Check(argv[0]) ? 1 : 0;
-#else  
-      _v = PyString_Check(argv[0]) ? 1 : 0;
-#endif
+      _v = PyObject_CheckBuffer(argv[0]) ? 1 : 0;
     }
     if (_v) {
       {
@@ -7011,9 +6987,8 @@ SWIGINTERN PyObject *_wrap_Crypt_import_key__SWIG_0(PyObject *self, PyObject *ar
   Key *arg4 = (Key *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
   PyObject * obj1 = 0 ;
@@ -7026,31 +7001,15 @@ SWIGINTERN PyObject *_wrap_Crypt_import_key__SWIG_0(PyObject *self, PyObject *ar
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Crypt_import_key" "', argument " "1"" of type '" "Crypt *""'"); 
   }
   arg1 = reinterpret_cast< Crypt * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Crypt_import_key" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Crypt_import_key" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   res4 = SWIG_ConvertPtr(obj2, &argp4,SWIGTYPE_p_Key, 0 |  0 );
   if (!SWIG_IsOK(res4)) {
     SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "Crypt_import_key" "', argument " "4"" of type '" "Key *""'"); 
@@ -7070,9 +7029,15 @@ SWIGINTERN PyObject *_wrap_Crypt_import_key__SWIG_0(PyObject *self, PyObject *ar
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Key, SWIG_POINTER_OWN |  0 );
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   result->ref();
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -7084,9 +7049,8 @@ SWIGINTERN PyObject *_wrap_Crypt_import_key__SWIG_1(PyObject *self, PyObject *ar
   DWORD arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   PyObject * obj1 = 0 ;
   Key *result = 0 ;
   
@@ -7096,31 +7060,15 @@ SWIGINTERN PyObject *_wrap_Crypt_import_key__SWIG_1(PyObject *self, PyObject *ar
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Crypt_import_key" "', argument " "1"" of type '" "Crypt *""'"); 
   }
   arg1 = reinterpret_cast< Crypt * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Crypt_import_key" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Crypt_import_key" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -7135,9 +7083,15 @@ SWIGINTERN PyObject *_wrap_Crypt_import_key__SWIG_1(PyObject *self, PyObject *ar
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Key, SWIG_POINTER_OWN |  0 );
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   result->ref();
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -7163,11 +7117,7 @@ SWIGINTERN PyObject *_wrap_Crypt_import_key(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       {
-#if py_version_hex>=0x03000000
-        _v = PyBytes_Check(argv[1]) ? 1 : 0;
-#else  
-        _v = PyString_Check(argv[1]) ? 1 : 0;
-#endif
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
       }
       if (_v) {
         if (argc <= 2) {
@@ -7184,11 +7134,7 @@ SWIGINTERN PyObject *_wrap_Crypt_import_key(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       {
-#if py_version_hex>=0x03000000
-        _v = PyBytes_Check(argv[1]) ? 1 : 0;
-#else  
-        _v = PyString_Check(argv[1]) ? 1 : 0;
-#endif
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
       }
       if (_v) {
         void *vptr = 0;
@@ -7633,9 +7579,8 @@ SWIGINTERN PyObject *_wrap_Crypt_remove(PyObject *self, PyObject *args) {
   DWORD arg2 ;
   DWORD arg3 ;
   char *arg4 = (char *) 0 ;
-  char *cstr1 = NULL ;
-  Py_ssize_t len1 = 0 ;
-  int res1 = 1 ;
+  Py_buffer view1 ;
+  int got_view1 = 0 ;
   int res4 ;
   char *buf4 = 0 ;
   int alloc4 = 0 ;
@@ -7644,31 +7589,15 @@ SWIGINTERN PyObject *_wrap_Crypt_remove(PyObject *self, PyObject *args) {
   PyObject * obj2 = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)"OOO:Crypt_remove",&obj0,&obj1,&obj2)) SWIG_fail;
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj0))
-#else  
-  if (PyString_Check(obj0))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res1 = PyBytes_AsStringAndSize(obj0, &cstr1, &len1);
-#else
-    res1 = PyString_AsStringAndSize(obj0, &cstr1, &len1);
-#endif
-    if (!cstr1) {
-      res1 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj0);*/
-    /*%#endif*/
-  } 
-  
-  if(res1){
+  if (PyObject_GetBuffer(obj0, &view1, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Crypt_remove" "', argument " "1"" of type '" "BYTE *""'");
-  } else {
-    arg1 = (BYTE *) cstr1;
-    arg2 = (DWORD) len1;
   }
+  got_view1 = 1;
+  if (view1.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Crypt_remove" "', argument " "1"" of type '" "BYTE *""'");
+  }
+  arg1 = (BYTE *) view1.buf;
+  arg2 = (DWORD) view1.len;
 #if PY_VERSION_HEX >= 0x03000000
   arg3 = PyLong_AsUnsignedLong(obj1);
 #else
@@ -7698,9 +7627,15 @@ SWIGINTERN PyObject *_wrap_Crypt_remove(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_Py_Void();
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return resultobj;
 fail:
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   if (alloc4 == SWIG_NEWOBJ) delete[] buf4;
   return NULL;
 }
@@ -8408,9 +8343,8 @@ SWIGINTERN PyObject *_wrap_Key_encrypt(PyObject *self, PyObject *args) {
   DWORD *arg5 = (DWORD *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   BYTE *carray4 = 0 ;
   DWORD size4 = 0 ;
   PyObject *res4 = NULL ;
@@ -8424,31 +8358,15 @@ SWIGINTERN PyObject *_wrap_Key_encrypt(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Key_encrypt" "', argument " "1"" of type '" "Key *""'"); 
   }
   arg1 = reinterpret_cast< Key * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Key_encrypt" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Key_encrypt" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -8480,8 +8398,14 @@ SWIGINTERN PyObject *_wrap_Key_encrypt(PyObject *self, PyObject *args) {
   } else {
     resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_Py_Void());
   }
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -8495,9 +8419,8 @@ SWIGINTERN PyObject *_wrap_Key_decrypt(PyObject *self, PyObject *args) {
   DWORD *arg5 = (DWORD *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   BYTE *carray4 = 0 ;
   DWORD size4 = 0 ;
   PyObject *res4 = NULL ;
@@ -8511,31 +8434,15 @@ SWIGINTERN PyObject *_wrap_Key_decrypt(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Key_decrypt" "', argument " "1"" of type '" "Key *""'"); 
   }
   arg1 = reinterpret_cast< Key * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Key_decrypt" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Key_decrypt" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -8567,8 +8474,14 @@ SWIGINTERN PyObject *_wrap_Key_decrypt(PyObject *self, PyObject *args) {
   } else {
     resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_Py_Void());
   }
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -8749,9 +8662,8 @@ SWIGINTERN PyObject *_wrap_Key_set_iv(PyObject *self, PyObject *args) {
   DWORD arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   PyObject * obj1 = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)"O:Key_set_iv",&obj1)) SWIG_fail;
@@ -8760,31 +8672,15 @@ SWIGINTERN PyObject *_wrap_Key_set_iv(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Key_set_iv" "', argument " "1"" of type '" "Key *""'"); 
   }
   arg1 = reinterpret_cast< Key * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Key_set_iv" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Key_set_iv" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -8799,8 +8695,14 @@ SWIGINTERN PyObject *_wrap_Key_set_iv(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_Py_Void();
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -9011,38 +8913,21 @@ SWIGINTERN int _wrap_new_Cert__SWIG_2(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   BYTE *arg1 = (BYTE *) 0 ;
   DWORD arg2 ;
-  char *cstr1 = NULL ;
-  Py_ssize_t len1 = 0 ;
-  int res1 = 1 ;
+  Py_buffer view1 ;
+  int got_view1 = 0 ;
   PyObject * obj1 = 0 ;
   Cert *result = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)"O:new_Cert",&obj1)) SWIG_fail;
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res1 = PyBytes_AsStringAndSize(obj1, &cstr1, &len1);
-#else
-    res1 = PyString_AsStringAndSize(obj1, &cstr1, &len1);
-#endif
-    if (!cstr1) {
-      res1 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res1){
+  if (PyObject_GetBuffer(obj1, &view1, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_Cert" "', argument " "1"" of type '" "BYTE *""'");
-  } else {
-    arg1 = (BYTE *) cstr1;
-    arg2 = (DWORD) len1;
   }
+  got_view1 = 1;
+  if (view1.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_Cert" "', argument " "1"" of type '" "BYTE *""'");
+  }
+  arg1 = (BYTE *) view1.buf;
+  arg2 = (DWORD) view1.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -9057,9 +8942,15 @@ SWIGINTERN int _wrap_new_Cert__SWIG_2(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Cert, SWIG_BUILTIN_INIT |  0 );
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   return -1;
 }
 
@@ -9087,11 +8978,7 @@ SWIGINTERN int _wrap_new_Cert(PyObject *self, PyObject *args) {
   if (argc == 1) {
     int _v;
     {
-#if py_version_hex>=0x03000000
-      _v = PyBytes_Check(argv[0]) ? 1 : 0;
-#else  
-      _v = PyString_Check(argv[0]) ? 1 : 0;
-#endif
+      _v = PyObject_CheckBuffer(argv[0]) ? 1 : 0;
     }
     if (_v) {
       if (argc <= 1) {
@@ -9131,9 +9018,8 @@ SWIGINTERN PyObject *_wrap_Cert_self_sign(PyObject *self, PyObject *args) {
   DWORD arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   Cert *result = 0 ;
@@ -9144,31 +9030,15 @@ SWIGINTERN PyObject *_wrap_Cert_self_sign(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Cert_self_sign" "', argument " "1"" of type '" "Crypt *""'"); 
   }
   arg1 = reinterpret_cast< Crypt * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Cert_self_sign" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Cert_self_sign" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -9183,9 +9053,15 @@ SWIGINTERN PyObject *_wrap_Cert_self_sign(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Cert, SWIG_POINTER_OWN |  0 );
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   result->ref();
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -10145,9 +10021,8 @@ SWIGINTERN int _wrap_new_CertFind__SWIG_0(PyObject *self, PyObject *args) {
   DWORD arg5 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr4 = NULL ;
-  Py_ssize_t len4 = 0 ;
-  int res4 = 1 ;
+  Py_buffer view4 ;
+  int got_view4 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
@@ -10170,39 +10045,29 @@ SWIGINTERN int _wrap_new_CertFind__SWIG_0(PyObject *self, PyObject *args) {
 #else
   arg3 = PyInt_AsUnsignedLongMask(obj3);
 #endif
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj4))
-#else  
-  if (PyString_Check(obj4))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res4 = PyBytes_AsStringAndSize(obj4, &cstr4, &len4);
-#else
-    res4 = PyString_AsStringAndSize(obj4, &cstr4, &len4);
-#endif
-    if (!cstr4) {
-      res4 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj4);*/
-    /*%#endif*/
-  } 
-  
-  if(res4){
+  if (PyObject_GetBuffer(obj4, &view4, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_CertFind" "', argument " "4"" of type '" "BYTE *""'");
-  } else {
-    arg4 = (BYTE *) cstr4;
-    arg5 = (DWORD) len4;
   }
+  got_view4 = 1;
+  if (view4.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_CertFind" "', argument " "4"" of type '" "BYTE *""'");
+  }
+  arg4 = (BYTE *) view4.buf;
+  arg5 = (DWORD) view4.len;
   {
     SWIG_PYTHON_THREAD_BEGIN_ALLOW;
     result = (CertFind *)new CertFind(arg1,arg2,arg3,arg4,arg5);
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_CertFind, SWIG_BUILTIN_INIT |  0 );
+  if (got_view4) {
+    PyBuffer_Release(&view4);
+  }
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view4) {
+    PyBuffer_Release(&view4);
+  }
   return -1;
 }
 
@@ -10239,9 +10104,8 @@ SWIGINTERN int _wrap_new_CertFind__SWIG_1(PyObject *self, PyObject *args) {
   DWORD arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr3 = NULL ;
-  Py_ssize_t len3 = 0 ;
-  int res3 = 1 ;
+  Py_buffer view3 ;
+  int got_view3 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   PyObject * obj3 = 0 ;
@@ -10258,39 +10122,29 @@ SWIGINTERN int _wrap_new_CertFind__SWIG_1(PyObject *self, PyObject *args) {
 #else
   arg2 = PyInt_AsUnsignedLongMask(obj2);
 #endif
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj3))
-#else  
-  if (PyString_Check(obj3))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res3 = PyBytes_AsStringAndSize(obj3, &cstr3, &len3);
-#else
-    res3 = PyString_AsStringAndSize(obj3, &cstr3, &len3);
-#endif
-    if (!cstr3) {
-      res3 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj3);*/
-    /*%#endif*/
-  } 
-  
-  if(res3){
+  if (PyObject_GetBuffer(obj3, &view3, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_CertFind" "', argument " "3"" of type '" "BYTE *""'");
-  } else {
-    arg3 = (BYTE *) cstr3;
-    arg4 = (DWORD) len3;
   }
+  got_view3 = 1;
+  if (view3.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_CertFind" "', argument " "3"" of type '" "BYTE *""'");
+  }
+  arg3 = (BYTE *) view3.buf;
+  arg4 = (DWORD) view3.len;
   {
     SWIG_PYTHON_THREAD_BEGIN_ALLOW;
     result = (CertFind *)new CertFind(arg1,arg2,arg3,arg4);
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_CertFind, SWIG_BUILTIN_INIT |  0 );
+  if (got_view3) {
+    PyBuffer_Release(&view3);
+  }
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view3) {
+    PyBuffer_Release(&view3);
+  }
   return -1;
 }
 
@@ -10323,11 +10177,7 @@ SWIGINTERN int _wrap_new_CertFind(PyObject *self, PyObject *args) {
       }
       if (_v) {
         {
-#if py_version_hex>=0x03000000
-          _v = PyBytes_Check(argv[2]) ? 1 : 0;
-#else  
-          _v = PyString_Check(argv[2]) ? 1 : 0;
-#endif
+          _v = PyObject_CheckBuffer(argv[2]) ? 1 : 0;
         }
         if (_v) {
           if (argc <= 3) {
@@ -10363,11 +10213,7 @@ SWIGINTERN int _wrap_new_CertFind(PyObject *self, PyObject *args) {
         }
         if (_v) {
           {
-#if py_version_hex>=0x03000000
-            _v = PyBytes_Check(argv[3]) ? 1 : 0;
-#else  
-            _v = PyString_Check(argv[3]) ? 1 : 0;
-#endif
+            _v = PyObject_CheckBuffer(argv[3]) ? 1 : 0;
           }
           if (_v) {
             if (argc <= 4) {
@@ -10527,9 +10373,8 @@ SWIGINTERN int _wrap_new_CertStore__SWIG_2(PyObject *self, PyObject *args) {
   DWORD arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   CertStore *result = 0 ;
@@ -10540,31 +10385,15 @@ SWIGINTERN int _wrap_new_CertStore__SWIG_2(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_CertStore" "', argument " "1"" of type '" "Crypt *""'"); 
   }
   arg1 = reinterpret_cast< Crypt * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj2))
-#else  
-  if (PyString_Check(obj2))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj2, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj2, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj2);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj2, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_CertStore" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_CertStore" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -10579,9 +10408,15 @@ SWIGINTERN int _wrap_new_CertStore__SWIG_2(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_CertStore, SWIG_BUILTIN_INIT |  0 );
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return -1;
 }
 
@@ -10617,11 +10452,7 @@ SWIGINTERN int _wrap_new_CertStore(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       {
-#if py_version_hex>=0x03000000
-        _v = PyBytes_Check(argv[1]) ? 1 : 0;
-#else  
-        _v = PyString_Check(argv[1]) ? 1 : 0;
-#endif
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
       }
       if (_v) {
         if (argc <= 2) {
@@ -10706,9 +10537,8 @@ SWIGINTERN PyObject *_wrap_CertStore_find_by_thumb(PyObject *self, PyObject *arg
   DWORD arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   PyObject * obj1 = 0 ;
   CertFind *result = 0 ;
   
@@ -10718,31 +10548,15 @@ SWIGINTERN PyObject *_wrap_CertStore_find_by_thumb(PyObject *self, PyObject *arg
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CertStore_find_by_thumb" "', argument " "1"" of type '" "CertStore *""'"); 
   }
   arg1 = reinterpret_cast< CertStore * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CertStore_find_by_thumb" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CertStore_find_by_thumb" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -10757,8 +10571,14 @@ SWIGINTERN PyObject *_wrap_CertStore_find_by_thumb(PyObject *self, PyObject *arg
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_CertFind, SWIG_POINTER_OWN |  0 );
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -10770,9 +10590,8 @@ SWIGINTERN PyObject *_wrap_CertStore_find_by_name(PyObject *self, PyObject *args
   DWORD arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   PyObject * obj1 = 0 ;
   CertFind *result = 0 ;
   
@@ -10782,31 +10601,15 @@ SWIGINTERN PyObject *_wrap_CertStore_find_by_name(PyObject *self, PyObject *args
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CertStore_find_by_name" "', argument " "1"" of type '" "CertStore *""'"); 
   }
   arg1 = reinterpret_cast< CertStore * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CertStore_find_by_name" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CertStore_find_by_name" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -10821,8 +10624,14 @@ SWIGINTERN PyObject *_wrap_CertStore_find_by_name(PyObject *self, PyObject *args
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_CertFind, SWIG_POINTER_OWN |  0 );
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -11991,14 +11800,13 @@ SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_ExtIter) /* defines _wrap_delete_ExtIter_
 
 SWIGPY_ITERNEXTFUNC_CLOSURE(_wrap_ExtIter_next) /* defines _wrap_ExtIter_next_iternextfunc_closure */
 
-SWIGINTERN int _wrap_new_CryptMsg__SWIG_0(PyObject *self, PyObject *args) {
+SWIGINTERN int _wrap_new_CryptMsg__SWIG_1(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   BYTE *arg1 = (BYTE *) 0 ;
   DWORD arg2 ;
   Crypt *arg3 = (Crypt *) 0 ;
-  char *cstr1 = NULL ;
-  Py_ssize_t len1 = 0 ;
-  int res1 = 1 ;
+  Py_buffer view1 ;
+  int got_view1 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
   PyObject * obj1 = 0 ;
@@ -12006,31 +11814,15 @@ SWIGINTERN int _wrap_new_CryptMsg__SWIG_0(PyObject *self, PyObject *args) {
   CryptMsg *result = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)"OO:new_CryptMsg",&obj1,&obj2)) SWIG_fail;
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res1 = PyBytes_AsStringAndSize(obj1, &cstr1, &len1);
-#else
-    res1 = PyString_AsStringAndSize(obj1, &cstr1, &len1);
-#endif
-    if (!cstr1) {
-      res1 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res1){
+  if (PyObject_GetBuffer(obj1, &view1, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_CryptMsg" "', argument " "1"" of type '" "BYTE *""'");
-  } else {
-    arg1 = (BYTE *) cstr1;
-    arg2 = (DWORD) len1;
   }
+  got_view1 = 1;
+  if (view1.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_CryptMsg" "', argument " "1"" of type '" "BYTE *""'");
+  }
+  arg1 = (BYTE *) view1.buf;
+  arg2 = (DWORD) view1.len;
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_Crypt, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
     SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "new_CryptMsg" "', argument " "3"" of type '" "Crypt *""'"); 
@@ -12050,49 +11842,38 @@ SWIGINTERN int _wrap_new_CryptMsg__SWIG_0(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_CryptMsg, SWIG_BUILTIN_INIT |  0 );
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   return -1;
 }
 
 
-SWIGINTERN int _wrap_new_CryptMsg__SWIG_1(PyObject *self, PyObject *args) {
+SWIGINTERN int _wrap_new_CryptMsg__SWIG_2(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   BYTE *arg1 = (BYTE *) 0 ;
   DWORD arg2 ;
-  char *cstr1 = NULL ;
-  Py_ssize_t len1 = 0 ;
-  int res1 = 1 ;
+  Py_buffer view1 ;
+  int got_view1 = 0 ;
   PyObject * obj1 = 0 ;
   CryptMsg *result = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)"O:new_CryptMsg",&obj1)) SWIG_fail;
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res1 = PyBytes_AsStringAndSize(obj1, &cstr1, &len1);
-#else
-    res1 = PyString_AsStringAndSize(obj1, &cstr1, &len1);
-#endif
-    if (!cstr1) {
-      res1 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res1){
+  if (PyObject_GetBuffer(obj1, &view1, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_CryptMsg" "', argument " "1"" of type '" "BYTE *""'");
-  } else {
-    arg1 = (BYTE *) cstr1;
-    arg2 = (DWORD) len1;
   }
+  got_view1 = 1;
+  if (view1.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_CryptMsg" "', argument " "1"" of type '" "BYTE *""'");
+  }
+  arg1 = (BYTE *) view1.buf;
+  arg2 = (DWORD) view1.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -12107,14 +11888,20 @@ SWIGINTERN int _wrap_new_CryptMsg__SWIG_1(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_CryptMsg, SWIG_BUILTIN_INIT |  0 );
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   return -1;
 }
 
 
-SWIGINTERN int _wrap_new_CryptMsg__SWIG_2(PyObject *self, PyObject *args) {
+SWIGINTERN int _wrap_new_CryptMsg__SWIG_3(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   Crypt *arg1 = (Crypt *) 0 ;
   void *argp1 = 0 ;
@@ -12149,7 +11936,7 @@ fail:
 }
 
 
-SWIGINTERN int _wrap_new_CryptMsg__SWIG_3(PyObject *self, PyObject *args) {
+SWIGINTERN int _wrap_new_CryptMsg__SWIG_4(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   CryptMsg *result = 0 ;
   
@@ -12188,7 +11975,7 @@ SWIGINTERN int _wrap_new_CryptMsg(PyObject *self, PyObject *args) {
     argv[ii] = PyTuple_GET_ITEM(args,ii);
   }
   if (argc == 0) {
-    return _wrap_new_CryptMsg__SWIG_3(self, args);
+    return _wrap_new_CryptMsg__SWIG_4(self, args);
   }
   if (argc == 1) {
     int _v;
@@ -12196,40 +11983,32 @@ SWIGINTERN int _wrap_new_CryptMsg(PyObject *self, PyObject *args) {
     int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Crypt, 0);
     _v = SWIG_CheckState(res);
     if (_v) {
-      return _wrap_new_CryptMsg__SWIG_2(self, args);
+      return _wrap_new_CryptMsg__SWIG_3(self, args);
     }
   }
   if (argc == 1) {
     int _v;
     {
-#if py_version_hex>=0x03000000
-      _v = PyBytes_Check(argv[0]) ? 1 : 0;
-#else  
-      _v = PyString_Check(argv[0]) ? 1 : 0;
-#endif
+      _v = PyObject_CheckBuffer(argv[0]) ? 1 : 0;
     }
     if (_v) {
       if (argc <= 1) {
-        return _wrap_new_CryptMsg__SWIG_1(self, args);
+        return _wrap_new_CryptMsg__SWIG_2(self, args);
       }
-      return _wrap_new_CryptMsg__SWIG_1(self, args);
+      return _wrap_new_CryptMsg__SWIG_2(self, args);
     }
   }
   if (argc == 2) {
     int _v;
     {
-#if py_version_hex>=0x03000000
-      _v = PyBytes_Check(argv[0]) ? 1 : 0;
-#else  
-      _v = PyString_Check(argv[0]) ? 1 : 0;
-#endif
+      _v = PyObject_CheckBuffer(argv[0]) ? 1 : 0;
     }
     if (_v) {
       void *vptr = 0;
       int res = SWIG_ConvertPtr(argv[1], &vptr, SWIGTYPE_p_Crypt, 0);
       _v = SWIG_CheckState(res);
       if (_v) {
-        return _wrap_new_CryptMsg__SWIG_0(self, args);
+        return _wrap_new_CryptMsg__SWIG_1(self, args);
       }
     }
   }
@@ -12404,15 +12183,98 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_CryptMsg_verify_cert(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_CryptMsg_data_size(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   CryptMsg *arg1 = (CryptMsg *) 0 ;
-  Cert *arg2 = (Cert *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject * obj1 = 0 ;
+  DWORD result;
+  
+  if (args && PyTuple_Check(args) && PyTuple_GET_SIZE(args) > 0) SWIG_exception_fail(SWIG_TypeError, "CryptMsg_data_size takes no arguments");
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_CryptMsg, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CryptMsg_data_size" "', argument " "1"" of type '" "CryptMsg *""'"); 
+  }
+  arg1 = reinterpret_cast< CryptMsg * >(argp1);
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (DWORD)(arg1)->data_size();
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CryptMsg_get_data_into(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  CryptMsg *arg1 = (CryptMsg *) 0 ;
+  BYTE *arg2 = (BYTE *) 0 ;
+  DWORD arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
+  PyObject * obj1 = 0 ;
+  DWORD result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:CryptMsg_get_data_into",&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_CryptMsg, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CryptMsg_get_data_into" "', argument " "1"" of type '" "CryptMsg *""'"); 
+  }
+  arg1 = reinterpret_cast< CryptMsg * >(argp1);
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_WRITABLE) != 0) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CryptMsg_get_data_into" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  got_view2 = 1;
+  arg2 = (BYTE *) view2.buf;
+  arg3 = view2.len > 0xFFFFFFFFUL ? 0xFFFFFFFFUL : (DWORD) view2.len;
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (DWORD)(arg1)->get_data_into(arg2,arg3);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
+  return resultobj;
+fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CryptMsg_verify_cert(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  CryptMsg *arg1 = (CryptMsg *) 0 ;
+  Cert *arg2 = (Cert *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj1 = 0 ;
   bool result;
   
   if (!PyArg_ParseTuple(args,(char *)"O:CryptMsg_verify_cert",&obj1)) SWIG_fail;
@@ -12529,9 +12391,8 @@ SWIGINTERN PyObject *_wrap_CryptMsg_encrypt_data(PyObject *self, PyObject *args)
   DWORD *arg5 = (DWORD *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   BYTE *carray4 = 0 ;
   DWORD size4 = 0 ;
   PyObject *res4 = NULL ;
@@ -12545,31 +12406,15 @@ SWIGINTERN PyObject *_wrap_CryptMsg_encrypt_data(PyObject *self, PyObject *args)
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CryptMsg_encrypt_data" "', argument " "1"" of type '" "CryptMsg *""'"); 
   }
   arg1 = reinterpret_cast< CryptMsg * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CryptMsg_encrypt_data" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CryptMsg_encrypt_data" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -12601,8 +12446,14 @@ SWIGINTERN PyObject *_wrap_CryptMsg_encrypt_data(PyObject *self, PyObject *args)
   } else {
     resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_Py_Void());
   }
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -12688,9 +12539,8 @@ SWIGINTERN PyObject *_wrap_CryptMsg_sign_data__SWIG_0(PyObject *self, PyObject *
   bool arg7 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   BYTE *carray4 = 0 ;
   DWORD size4 = 0 ;
   void *argp6 = 0 ;
@@ -12710,31 +12560,15 @@ SWIGINTERN PyObject *_wrap_CryptMsg_sign_data__SWIG_0(PyObject *self, PyObject *
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CryptMsg_sign_data" "', argument " "1"" of type '" "CryptMsg *""'"); 
   }
   arg1 = reinterpret_cast< CryptMsg * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CryptMsg_sign_data" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CryptMsg_sign_data" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   res6 = SWIG_ConvertPtr(obj2, &argp6,SWIGTYPE_p_Cert, 0 |  0 );
   if (!SWIG_IsOK(res6)) {
     SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "CryptMsg_sign_data" "', argument " "6"" of type '" "Cert *""'"); 
@@ -12776,8 +12610,14 @@ SWIGINTERN PyObject *_wrap_CryptMsg_sign_data__SWIG_0(PyObject *self, PyObject *
   } else {
     resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_Py_Void());
   }
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -12792,9 +12632,8 @@ SWIGINTERN PyObject *_wrap_CryptMsg_sign_data__SWIG_1(PyObject *self, PyObject *
   Cert *arg6 = (Cert *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   BYTE *carray4 = 0 ;
   DWORD size4 = 0 ;
   void *argp6 = 0 ;
@@ -12811,31 +12650,15 @@ SWIGINTERN PyObject *_wrap_CryptMsg_sign_data__SWIG_1(PyObject *self, PyObject *
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CryptMsg_sign_data" "', argument " "1"" of type '" "CryptMsg *""'"); 
   }
   arg1 = reinterpret_cast< CryptMsg * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CryptMsg_sign_data" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CryptMsg_sign_data" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   res6 = SWIG_ConvertPtr(obj2, &argp6,SWIGTYPE_p_Cert, 0 |  0 );
   if (!SWIG_IsOK(res6)) {
     SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "CryptMsg_sign_data" "', argument " "6"" of type '" "Cert *""'"); 
@@ -12872,8 +12695,14 @@ SWIGINTERN PyObject *_wrap_CryptMsg_sign_data__SWIG_1(PyObject *self, PyObject *
   } else {
     resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_Py_Void());
   }
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -12899,11 +12728,7 @@ SWIGINTERN PyObject *_wrap_CryptMsg_sign_data(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       {
-#if py_version_hex>=0x03000000
-        _v = PyBytes_Check(argv[1]) ? 1 : 0;
-#else  
-        _v = PyString_Check(argv[1]) ? 1 : 0;
-#endif
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
       }
       if (_v) {
         void *vptr = 0;
@@ -12922,11 +12747,7 @@ SWIGINTERN PyObject *_wrap_CryptMsg_sign_data(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       {
-#if py_version_hex>=0x03000000
-        _v = PyBytes_Check(argv[1]) ? 1 : 0;
-#else  
-        _v = PyString_Check(argv[1]) ? 1 : 0;
-#endif
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
       }
       if (_v) {
         void *vptr = 0;
@@ -12954,30 +12775,54 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_CryptMsg_verify(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_CryptMsg_sign__SWIG_0(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   CryptMsg *arg1 = (CryptMsg *) 0 ;
-  DWORD arg2 ;
+  BYTE *arg2 = (BYTE *) 0 ;
+  DWORD arg3 ;
+  Cert *arg4 = (Cert *) 0 ;
+  bool arg5 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  bool val5 ;
+  int ecode5 = 0 ;
   PyObject * obj1 = 0 ;
-  bool result;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:CryptMsg_verify",&obj1)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OOO:CryptMsg_sign",&obj1,&obj2,&obj3)) SWIG_fail;
   res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_CryptMsg, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CryptMsg_verify" "', argument " "1"" of type '" "CryptMsg *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CryptMsg_sign" "', argument " "1"" of type '" "CryptMsg *""'"); 
   }
   arg1 = reinterpret_cast< CryptMsg * >(argp1);
-#if PY_VERSION_HEX >= 0x03000000
-  arg2 = PyLong_AsUnsignedLong(obj1);
-#else
-  arg2 = PyInt_AsUnsignedLongMask(obj1);
-#endif
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CryptMsg_sign" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CryptMsg_sign" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
+  res4 = SWIG_ConvertPtr(obj2, &argp4,SWIGTYPE_p_Cert, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "CryptMsg_sign" "', argument " "4"" of type '" "Cert *""'"); 
+  }
+  arg4 = reinterpret_cast< Cert * >(argp4);
+  ecode5 = SWIG_AsVal_bool(obj3, &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "CryptMsg_sign" "', argument " "5"" of type '" "bool""'");
+  } 
+  arg5 = static_cast< bool >(val5);
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-      result = (bool)(arg1)->verify(arg2);
+      (arg1)->sign(arg2,arg3,arg4,arg5);
       SWIG_PYTHON_THREAD_END_ALLOW;
     }
   }
@@ -12987,72 +12832,299 @@ SWIGINTERN PyObject *_wrap_CryptMsg_verify(PyObject *self, PyObject *args) {
     
   }
   
-  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  resultobj = SWIG_Py_Void();
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
 
-SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_CryptMsg) /* defines _wrap_delete_CryptMsg_destructor_closure */
-
-SWIGINTERN PyObject *_wrap_CERT_INFO_dwVersion_set(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_CryptMsg_sign__SWIG_1(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  _CERT_INFO *arg1 = (_CERT_INFO *) 0 ;
-  DWORD arg2 ;
+  CryptMsg *arg1 = (CryptMsg *) 0 ;
+  BYTE *arg2 = (BYTE *) 0 ;
+  DWORD arg3 ;
+  Cert *arg4 = (Cert *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:CERT_INFO_dwVersion_set",&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p__CERT_INFO, 0 |  0 );
+  if (!PyArg_ParseTuple(args,(char *)"OO:CryptMsg_sign",&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_CryptMsg, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CERT_INFO_dwVersion_set" "', argument " "1"" of type '" "_CERT_INFO *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CryptMsg_sign" "', argument " "1"" of type '" "CryptMsg *""'"); 
   }
-  arg1 = reinterpret_cast< _CERT_INFO * >(argp1);
-#if PY_VERSION_HEX >= 0x03000000
-  arg2 = PyLong_AsUnsignedLong(obj1);
-#else
-  arg2 = PyInt_AsUnsignedLongMask(obj1);
-#endif
-  {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-    if (arg1) (arg1)->dwVersion = arg2;
-    SWIG_PYTHON_THREAD_END_ALLOW;
+  arg1 = reinterpret_cast< CryptMsg * >(argp1);
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CryptMsg_sign" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CryptMsg_sign" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
+  res4 = SWIG_ConvertPtr(obj2, &argp4,SWIGTYPE_p_Cert, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "CryptMsg_sign" "', argument " "4"" of type '" "Cert *""'"); 
+  }
+  arg4 = reinterpret_cast< Cert * >(argp4);
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      (arg1)->sign(arg2,arg3,arg4);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
   }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
   resultobj = SWIG_Py_Void();
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_CERT_INFO_dwVersion_get(PyObject *self, PyObject *args) {
-  PyObject *resultobj = 0;
-  _CERT_INFO *arg1 = (_CERT_INFO *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  DWORD result;
+SWIGINTERN PyObject *_wrap_CryptMsg_sign(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[5] = {
+    0
+  };
+  Py_ssize_t ii;
   
-  if (args && PyTuple_Check(args) && PyTuple_GET_SIZE(args) > 0) SWIG_exception_fail(SWIG_TypeError, "CERT_INFO_dwVersion_get takes no arguments");
-  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p__CERT_INFO, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CERT_INFO_dwVersion_get" "', argument " "1"" of type '" "_CERT_INFO *""'"); 
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  argv[0] = self;
+  for (ii = 0; (ii < 3) && (ii < argc); ii++) {
+    argv[ii + 1] = PyTuple_GET_ITEM(args,ii);
   }
-  arg1 = reinterpret_cast< _CERT_INFO * >(argp1);
-  {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-    result = (DWORD) ((arg1)->dwVersion);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+  argc++;
+  if (argc == 3) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_CryptMsg, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
+      }
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_Cert, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          return _wrap_CryptMsg_sign__SWIG_1(self, args);
+        }
+      }
+    }
   }
-  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
-  return resultobj;
+  if (argc == 4) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_CryptMsg, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
+      }
+      if (_v) {
+        void *vptr = 0;
+        int res = SWIG_ConvertPtr(argv[2], &vptr, SWIGTYPE_p_Cert, 0);
+        _v = SWIG_CheckState(res);
+        if (_v) {
+          {
+            int res = SWIG_AsVal_bool(argv[3], NULL);
+            _v = SWIG_CheckState(res);
+          }
+          if (_v) {
+            return _wrap_CryptMsg_sign__SWIG_0(self, args);
+          }
+        }
+      }
+    }
+  }
+  
 fail:
-  return NULL;
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'CryptMsg_sign'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    CryptMsg::sign(BYTE *,DWORD,Cert *,bool)\n"
+    "    CryptMsg::sign(BYTE *,DWORD,Cert *)\n");
+  return 0;
 }
 
 
-SWIGINTERN PyObject *_wrap_CERT_INFO_SerialNumber_set(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_CryptMsg_encrypt(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  CryptMsg *arg1 = (CryptMsg *) 0 ;
+  BYTE *arg2 = (BYTE *) 0 ;
+  DWORD arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:CryptMsg_encrypt",&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_CryptMsg, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CryptMsg_encrypt" "', argument " "1"" of type '" "CryptMsg *""'"); 
+  }
+  arg1 = reinterpret_cast< CryptMsg * >(argp1);
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CryptMsg_encrypt" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CryptMsg_encrypt" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      (arg1)->encrypt(arg2,arg3);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_Py_Void();
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
+  return resultobj;
+fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CryptMsg_verify(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  CryptMsg *arg1 = (CryptMsg *) 0 ;
+  DWORD arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj1 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:CryptMsg_verify",&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_CryptMsg, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CryptMsg_verify" "', argument " "1"" of type '" "CryptMsg *""'"); 
+  }
+  arg1 = reinterpret_cast< CryptMsg * >(argp1);
+#if PY_VERSION_HEX >= 0x03000000
+  arg2 = PyLong_AsUnsignedLong(obj1);
+#else
+  arg2 = PyInt_AsUnsignedLongMask(obj1);
+#endif
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (bool)(arg1)->verify(arg2);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_CryptMsg) /* defines _wrap_delete_CryptMsg_destructor_closure */
+
+SWIGINTERN PyObject *_wrap_CERT_INFO_dwVersion_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  _CERT_INFO *arg1 = (_CERT_INFO *) 0 ;
+  DWORD arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:CERT_INFO_dwVersion_set",&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p__CERT_INFO, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CERT_INFO_dwVersion_set" "', argument " "1"" of type '" "_CERT_INFO *""'"); 
+  }
+  arg1 = reinterpret_cast< _CERT_INFO * >(argp1);
+#if PY_VERSION_HEX >= 0x03000000
+  arg2 = PyLong_AsUnsignedLong(obj1);
+#else
+  arg2 = PyInt_AsUnsignedLongMask(obj1);
+#endif
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (arg1) (arg1)->dwVersion = arg2;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CERT_INFO_dwVersion_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  _CERT_INFO *arg1 = (_CERT_INFO *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  DWORD result;
+  
+  if (args && PyTuple_Check(args) && PyTuple_GET_SIZE(args) > 0) SWIG_exception_fail(SWIG_TypeError, "CERT_INFO_dwVersion_get takes no arguments");
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p__CERT_INFO, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CERT_INFO_dwVersion_get" "', argument " "1"" of type '" "_CERT_INFO *""'"); 
+  }
+  arg1 = reinterpret_cast< _CERT_INFO * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (DWORD) ((arg1)->dwVersion);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_From_unsigned_SS_int(static_cast< unsigned int >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CERT_INFO_SerialNumber_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   _CERT_INFO *arg1 = (_CERT_INFO *) 0 ;
   CRYPT_INTEGER_BLOB arg2 ;
@@ -13954,9 +14026,8 @@ SWIGINTERN int _wrap_new_Signature__SWIG_2(PyObject *self, PyObject *args) {
   BYTE *arg1 = (BYTE *) 0 ;
   DWORD arg2 ;
   Crypt *arg3 = (Crypt *) 0 ;
-  char *cstr1 = NULL ;
-  Py_ssize_t len1 = 0 ;
-  int res1 = 1 ;
+  Py_buffer view1 ;
+  int got_view1 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
   PyObject * obj1 = 0 ;
@@ -13964,31 +14035,15 @@ SWIGINTERN int _wrap_new_Signature__SWIG_2(PyObject *self, PyObject *args) {
   Signature *result = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)"OO:new_Signature",&obj1,&obj2)) SWIG_fail;
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res1 = PyBytes_AsStringAndSize(obj1, &cstr1, &len1);
-#else
-    res1 = PyString_AsStringAndSize(obj1, &cstr1, &len1);
-#endif
-    if (!cstr1) {
-      res1 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res1){
+  if (PyObject_GetBuffer(obj1, &view1, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_Signature" "', argument " "1"" of type '" "BYTE *""'");
-  } else {
-    arg1 = (BYTE *) cstr1;
-    arg2 = (DWORD) len1;
   }
+  got_view1 = 1;
+  if (view1.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_Signature" "', argument " "1"" of type '" "BYTE *""'");
+  }
+  arg1 = (BYTE *) view1.buf;
+  arg2 = (DWORD) view1.len;
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_Crypt, 0 |  0 );
   if (!SWIG_IsOK(res3)) {
     SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "new_Signature" "', argument " "3"" of type '" "Crypt *""'"); 
@@ -14008,9 +14063,15 @@ SWIGINTERN int _wrap_new_Signature__SWIG_2(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Signature, SWIG_BUILTIN_INIT |  0 );
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   return -1;
 }
 
@@ -14019,38 +14080,21 @@ SWIGINTERN int _wrap_new_Signature__SWIG_3(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   BYTE *arg1 = (BYTE *) 0 ;
   DWORD arg2 ;
-  char *cstr1 = NULL ;
-  Py_ssize_t len1 = 0 ;
-  int res1 = 1 ;
+  Py_buffer view1 ;
+  int got_view1 = 0 ;
   PyObject * obj1 = 0 ;
   Signature *result = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)"O:new_Signature",&obj1)) SWIG_fail;
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res1 = PyBytes_AsStringAndSize(obj1, &cstr1, &len1);
-#else
-    res1 = PyString_AsStringAndSize(obj1, &cstr1, &len1);
-#endif
-    if (!cstr1) {
-      res1 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res1){
+  if (PyObject_GetBuffer(obj1, &view1, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_Signature" "', argument " "1"" of type '" "BYTE *""'");
-  } else {
-    arg1 = (BYTE *) cstr1;
-    arg2 = (DWORD) len1;
   }
+  got_view1 = 1;
+  if (view1.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_Signature" "', argument " "1"" of type '" "BYTE *""'");
+  }
+  arg1 = (BYTE *) view1.buf;
+  arg2 = (DWORD) view1.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -14065,9 +14109,15 @@ SWIGINTERN int _wrap_new_Signature__SWIG_3(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Signature, SWIG_BUILTIN_INIT |  0 );
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
   return -1;
 }
 
@@ -14099,11 +14149,7 @@ SWIGINTERN int _wrap_new_Signature(PyObject *self, PyObject *args) {
   if (argc == 1) {
     int _v;
     {
-#if py_version_hex>=0x03000000
-      _v = PyBytes_Check(argv[0]) ? 1 : 0;
-#else  
-      _v = PyString_Check(argv[0]) ? 1 : 0;
-#endif
+      _v = PyObject_CheckBuffer(argv[0]) ? 1 : 0;
     }
     if (_v) {
       if (argc <= 1) {
@@ -14115,11 +14161,7 @@ SWIGINTERN int _wrap_new_Signature(PyObject *self, PyObject *args) {
   if (argc == 2) {
     int _v;
     {
-#if py_version_hex>=0x03000000
-      _v = PyBytes_Check(argv[0]) ? 1 : 0;
-#else  
-      _v = PyString_Check(argv[0]) ? 1 : 0;
-#endif
+      _v = PyObject_CheckBuffer(argv[0]) ? 1 : 0;
     }
     if (_v) {
       void *vptr = 0;
@@ -14150,9 +14192,8 @@ SWIGINTERN PyObject *_wrap_Signature_verify_data(PyObject *self, PyObject *args)
   int arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   int val4 ;
   int ecode4 = 0 ;
   PyObject * obj1 = 0 ;
@@ -14165,31 +14206,15 @@ SWIGINTERN PyObject *_wrap_Signature_verify_data(PyObject *self, PyObject *args)
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Signature_verify_data" "', argument " "1"" of type '" "Signature *""'"); 
   }
   arg1 = reinterpret_cast< Signature * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Signature_verify_data" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Signature_verify_data" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   ecode4 = SWIG_AsVal_int(obj2, &val4);
   if (!SWIG_IsOK(ecode4)) {
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "Signature_verify_data" "', argument " "4"" of type '" "int""'");
@@ -14209,8 +14234,14 @@ SWIGINTERN PyObject *_wrap_Signature_verify_data(PyObject *self, PyObject *args)
   }
   
   resultobj = SWIG_From_bool(static_cast< bool >(result));
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -14226,9 +14257,8 @@ SWIGINTERN PyObject *_wrap_Signature_sign_data__SWIG_0(PyObject *self, PyObject
   bool arg7 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   BYTE *carray4 = 0 ;
   DWORD size4 = 0 ;
   void *argp6 = 0 ;
@@ -14248,31 +14278,15 @@ SWIGINTERN PyObject *_wrap_Signature_sign_data__SWIG_0(PyObject *self, PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Signature_sign_data" "', argument " "1"" of type '" "Signature *""'"); 
   }
   arg1 = reinterpret_cast< Signature * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Signature_sign_data" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Signature_sign_data" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   res6 = SWIG_ConvertPtr(obj2, &argp6,SWIGTYPE_p_Cert, 0 |  0 );
   if (!SWIG_IsOK(res6)) {
     SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "Signature_sign_data" "', argument " "6"" of type '" "Cert *""'"); 
@@ -14314,8 +14328,14 @@ SWIGINTERN PyObject *_wrap_Signature_sign_data__SWIG_0(PyObject *self, PyObject
   } else {
     resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_Py_Void());
   }
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -14330,9 +14350,8 @@ SWIGINTERN PyObject *_wrap_Signature_sign_data__SWIG_1(PyObject *self, PyObject
   Cert *arg6 = (Cert *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   BYTE *carray4 = 0 ;
   DWORD size4 = 0 ;
   void *argp6 = 0 ;
@@ -14349,31 +14368,15 @@ SWIGINTERN PyObject *_wrap_Signature_sign_data__SWIG_1(PyObject *self, PyObject
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Signature_sign_data" "', argument " "1"" of type '" "Signature *""'"); 
   }
   arg1 = reinterpret_cast< Signature * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Signature_sign_data" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Signature_sign_data" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   res6 = SWIG_ConvertPtr(obj2, &argp6,SWIGTYPE_p_Cert, 0 |  0 );
   if (!SWIG_IsOK(res6)) {
     SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "Signature_sign_data" "', argument " "6"" of type '" "Cert *""'"); 
@@ -14410,8 +14413,14 @@ SWIGINTERN PyObject *_wrap_Signature_sign_data__SWIG_1(PyObject *self, PyObject
   } else {
     resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_Py_Void());
   }
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -14437,11 +14446,7 @@ SWIGINTERN PyObject *_wrap_Signature_sign_data(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       {
-#if py_version_hex>=0x03000000
-        _v = PyBytes_Check(argv[1]) ? 1 : 0;
-#else  
-        _v = PyString_Check(argv[1]) ? 1 : 0;
-#endif
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
       }
       if (_v) {
         void *vptr = 0;
@@ -14460,11 +14465,7 @@ SWIGINTERN PyObject *_wrap_Signature_sign_data(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       {
-#if py_version_hex>=0x03000000
-        _v = PyBytes_Check(argv[1]) ? 1 : 0;
-#else  
-        _v = PyString_Check(argv[1]) ? 1 : 0;
-#endif
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
       }
       if (_v) {
         void *vptr = 0;
@@ -14559,9 +14560,8 @@ SWIGINTERN PyObject *_wrap_CertRequest_set_subject(PyObject *self, PyObject *arg
   DWORD arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   PyObject * obj1 = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)"O:CertRequest_set_subject",&obj1)) SWIG_fail;
@@ -14570,31 +14570,15 @@ SWIGINTERN PyObject *_wrap_CertRequest_set_subject(PyObject *self, PyObject *arg
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CertRequest_set_subject" "', argument " "1"" of type '" "CertRequest *""'"); 
   }
   arg1 = reinterpret_cast< CertRequest * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CertRequest_set_subject" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CertRequest_set_subject" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -14609,8 +14593,14 @@ SWIGINTERN PyObject *_wrap_CertRequest_set_subject(PyObject *self, PyObject *arg
   }
   
   resultobj = SWIG_Py_Void();
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -14702,9 +14692,8 @@ SWIGINTERN PyObject *_wrap_CertRequest_add_attribute(PyObject *self, PyObject *a
   DWORD arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   PyObject * obj1 = 0 ;
   int result;
   
@@ -14714,31 +14703,15 @@ SWIGINTERN PyObject *_wrap_CertRequest_add_attribute(PyObject *self, PyObject *a
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CertRequest_add_attribute" "', argument " "1"" of type '" "CertRequest *""'"); 
   }
   arg1 = reinterpret_cast< CertRequest * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CertRequest_add_attribute" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CertRequest_add_attribute" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -14753,8 +14726,14 @@ SWIGINTERN PyObject *_wrap_CertRequest_add_attribute(PyObject *self, PyObject *a
   }
   
   resultobj = SWIG_From_int(static_cast< int >(result));
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -14769,9 +14748,8 @@ SWIGINTERN PyObject *_wrap_CertRequest_add_attribute_value(PyObject *self, PyObj
   int res1 = 0 ;
   int val2 ;
   int ecode2 = 0 ;
-  char *cstr3 = NULL ;
-  Py_ssize_t len3 = 0 ;
-  int res3 = 1 ;
+  Py_buffer view3 ;
+  int got_view3 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   
@@ -14786,31 +14764,15 @@ SWIGINTERN PyObject *_wrap_CertRequest_add_attribute_value(PyObject *self, PyObj
     SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "CertRequest_add_attribute_value" "', argument " "2"" of type '" "int""'");
   } 
   arg2 = static_cast< int >(val2);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj2))
-#else  
-  if (PyString_Check(obj2))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res3 = PyBytes_AsStringAndSize(obj2, &cstr3, &len3);
-#else
-    res3 = PyString_AsStringAndSize(obj2, &cstr3, &len3);
-#endif
-    if (!cstr3) {
-      res3 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj2);*/
-    /*%#endif*/
-  } 
-  
-  if(res3){
+  if (PyObject_GetBuffer(obj2, &view3, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CertRequest_add_attribute_value" "', argument " "3"" of type '" "BYTE *""'");
-  } else {
-    arg3 = (BYTE *) cstr3;
-    arg4 = (DWORD) len3;
   }
+  got_view3 = 1;
+  if (view3.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CertRequest_add_attribute_value" "', argument " "3"" of type '" "BYTE *""'");
+  }
+  arg3 = (BYTE *) view3.buf;
+  arg4 = (DWORD) view3.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -14825,8 +14787,14 @@ SWIGINTERN PyObject *_wrap_CertRequest_add_attribute_value(PyObject *self, PyObj
   }
   
   resultobj = SWIG_Py_Void();
+  if (got_view3) {
+    PyBuffer_Release(&view3);
+  }
   return resultobj;
 fail:
+  if (got_view3) {
+    PyBuffer_Release(&view3);
+  }
   return NULL;
 }
 
@@ -14842,9 +14810,8 @@ SWIGINTERN int _wrap_new_Hash__SWIG_0(PyObject *self, PyObject *args) {
   int arg5 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
   int val5 ;
@@ -14861,31 +14828,15 @@ SWIGINTERN int _wrap_new_Hash__SWIG_0(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_Hash" "', argument " "1"" of type '" "Crypt *""'"); 
   }
   arg1 = reinterpret_cast< Crypt * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj2))
-#else  
-  if (PyString_Check(obj2))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj2, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj2, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj2);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj2, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_Hash" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_Hash" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_Key, 0 |  0 );
   if (!SWIG_IsOK(res4)) {
     SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "new_Hash" "', argument " "4"" of type '" "Key *""'"); 
@@ -14910,9 +14861,15 @@ SWIGINTERN int _wrap_new_Hash__SWIG_0(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Hash, SWIG_BUILTIN_INIT |  0 );
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return -1;
 }
 
@@ -14925,9 +14882,8 @@ SWIGINTERN int _wrap_new_Hash__SWIG_1(PyObject *self, PyObject *args) {
   Key *arg4 = (Key *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
   PyObject * obj1 = 0 ;
@@ -14941,31 +14897,15 @@ SWIGINTERN int _wrap_new_Hash__SWIG_1(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_Hash" "', argument " "1"" of type '" "Crypt *""'"); 
   }
   arg1 = reinterpret_cast< Crypt * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj2))
-#else  
-  if (PyString_Check(obj2))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj2, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj2, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj2);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj2, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_Hash" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_Hash" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   res4 = SWIG_ConvertPtr(obj3, &argp4,SWIGTYPE_p_Key, 0 |  0 );
   if (!SWIG_IsOK(res4)) {
     SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "new_Hash" "', argument " "4"" of type '" "Key *""'"); 
@@ -14985,9 +14925,15 @@ SWIGINTERN int _wrap_new_Hash__SWIG_1(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Hash, SWIG_BUILTIN_INIT |  0 );
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return -1;
 }
 
@@ -15000,9 +14946,8 @@ SWIGINTERN int _wrap_new_Hash__SWIG_2(PyObject *self, PyObject *args) {
   int arg4 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   int val4 ;
   int ecode4 = 0 ;
   PyObject * obj1 = 0 ;
@@ -15016,31 +14961,15 @@ SWIGINTERN int _wrap_new_Hash__SWIG_2(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_Hash" "', argument " "1"" of type '" "Crypt *""'"); 
   }
   arg1 = reinterpret_cast< Crypt * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj2))
-#else  
-  if (PyString_Check(obj2))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj2, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj2, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj2);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj2, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_Hash" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_Hash" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   ecode4 = SWIG_AsVal_int(obj3, &val4);
   if (!SWIG_IsOK(ecode4)) {
     SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "new_Hash" "', argument " "4"" of type '" "int""'");
@@ -15060,9 +14989,15 @@ SWIGINTERN int _wrap_new_Hash__SWIG_2(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Hash, SWIG_BUILTIN_INIT |  0 );
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return -1;
 }
 
@@ -15074,9 +15009,8 @@ SWIGINTERN int _wrap_new_Hash__SWIG_3(PyObject *self, PyObject *args) {
   DWORD arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   Hash *result = 0 ;
@@ -15087,31 +15021,15 @@ SWIGINTERN int _wrap_new_Hash__SWIG_3(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_Hash" "', argument " "1"" of type '" "Crypt *""'"); 
   }
   arg1 = reinterpret_cast< Crypt * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj2))
-#else  
-  if (PyString_Check(obj2))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj2, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj2, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj2);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj2, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_Hash" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_Hash" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -15126,9 +15044,15 @@ SWIGINTERN int _wrap_new_Hash__SWIG_3(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_Hash, SWIG_BUILTIN_INIT |  0 );
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   result->ref();
   return resultobj == Py_None ? -1 : 0;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return -1;
 }
 
@@ -15366,11 +15290,7 @@ SWIGINTERN int _wrap_new_Hash(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       {
-#if py_version_hex>=0x03000000
-        _v = PyBytes_Check(argv[1]) ? 1 : 0;
-#else  
-        _v = PyString_Check(argv[1]) ? 1 : 0;
-#endif
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
       }
       if (_v) {
         if (argc <= 2) {
@@ -15407,11 +15327,7 @@ SWIGINTERN int _wrap_new_Hash(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       {
-#if py_version_hex>=0x03000000
-        _v = PyBytes_Check(argv[1]) ? 1 : 0;
-#else  
-        _v = PyString_Check(argv[1]) ? 1 : 0;
-#endif
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
       }
       if (_v) {
         void *vptr = 0;
@@ -15430,11 +15346,7 @@ SWIGINTERN int _wrap_new_Hash(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       {
-#if py_version_hex>=0x03000000
-        _v = PyBytes_Check(argv[1]) ? 1 : 0;
-#else  
-        _v = PyString_Check(argv[1]) ? 1 : 0;
-#endif
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
       }
       if (_v) {
         {
@@ -15454,11 +15366,7 @@ SWIGINTERN int _wrap_new_Hash(PyObject *self, PyObject *args) {
     _v = SWIG_CheckState(res);
     if (_v) {
       {
-#if py_version_hex>=0x03000000
-        _v = PyBytes_Check(argv[1]) ? 1 : 0;
-#else  
-        _v = PyString_Check(argv[1]) ? 1 : 0;
-#endif
+        _v = PyObject_CheckBuffer(argv[1]) ? 1 : 0;
       }
       if (_v) {
         void *vptr = 0;
@@ -15579,9 +15487,8 @@ SWIGINTERN PyObject *_wrap_Hash_update(PyObject *self, PyObject *args) {
   DWORD arg3 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  char *cstr2 = NULL ;
-  Py_ssize_t len2 = 0 ;
-  int res2 = 1 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
   PyObject * obj1 = 0 ;
   
   if (!PyArg_ParseTuple(args,(char *)"O:Hash_update",&obj1)) SWIG_fail;
@@ -15590,31 +15497,15 @@ SWIGINTERN PyObject *_wrap_Hash_update(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Hash_update" "', argument " "1"" of type '" "Hash *""'"); 
   }
   arg1 = reinterpret_cast< Hash * >(argp1);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj1))
-#else  
-  if (PyString_Check(obj1))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res2 = PyBytes_AsStringAndSize(obj1, &cstr2, &len2);
-#else
-    res2 = PyString_AsStringAndSize(obj1, &cstr2, &len2);
-#endif
-    if (!cstr2) {
-      res2 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj1);*/
-    /*%#endif*/
-  } 
-  
-  if(res2){
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Hash_update" "', argument " "2"" of type '" "BYTE *""'");
-  } else {
-    arg2 = (BYTE *) cstr2;
-    arg3 = (DWORD) len2;
   }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Hash_update" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -15629,8 +15520,14 @@ SWIGINTERN PyObject *_wrap_Hash_update(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_Py_Void();
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return resultobj;
 fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
   return NULL;
 }
 
@@ -15816,9 +15713,8 @@ SWIGINTERN PyObject *_wrap_Hash_verify(PyObject *self, PyObject *args) {
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  char *cstr3 = NULL ;
-  Py_ssize_t len3 = 0 ;
-  int res3 = 1 ;
+  Py_buffer view3 ;
+  int got_view3 = 0 ;
   PyObject * obj1 = 0 ;
   PyObject * obj2 = 0 ;
   bool result;
@@ -15834,31 +15730,15 @@ SWIGINTERN PyObject *_wrap_Hash_verify(PyObject *self, PyObject *args) {
     SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Hash_verify" "', argument " "2"" of type '" "Cert *""'"); 
   }
   arg2 = reinterpret_cast< Cert * >(argp2);
-#if py_version_hex>=0x03000000
-  if (PyBytes_Check(obj2))
-#else  
-  if (PyString_Check(obj2))
-#endif
-  {
-#if PY_VERSION_HEX>=0x03000000
-    res3 = PyBytes_AsStringAndSize(obj2, &cstr3, &len3);
-#else
-    res3 = PyString_AsStringAndSize(obj2, &cstr3, &len3);
-#endif
-    if (!cstr3) {
-      res3 = 1;
-    }
-    /*%#if PY_VERSION_HEX>=0x03000000*/
-    /*Py_XDECREF(obj2);*/
-    /*%#endif*/
-  } 
-  
-  if(res3){
+  if (PyObject_GetBuffer(obj2, &view3, PyBUF_SIMPLE) != 0) {
     SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "Hash_verify" "', argument " "3"" of type '" "BYTE *""'");
-  } else {
-    arg3 = (BYTE *) cstr3;
-    arg4 = (DWORD) len3;
   }
+  got_view3 = 1;
+  if (view3.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "Hash_verify" "', argument " "3"" of type '" "BYTE *""'");
+  }
+  arg3 = (BYTE *) view3.buf;
+  arg4 = (DWORD) view3.len;
   try {
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
@@ -15873,8 +15753,14 @@ SWIGINTERN PyObject *_wrap_Hash_verify(PyObject *self, PyObject *args) {
   }
   
   resultobj = SWIG_From_bool(static_cast< bool >(result));
+  if (got_view3) {
+    PyBuffer_Release(&view3);
+  }
   return resultobj;
 fail:
+  if (got_view3) {
+    PyBuffer_Release(&view3);
+  }
   return NULL;
 }
 
@@ -15915,87 +15801,1643 @@ fail:
 
 SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_Hash) /* defines _wrap_delete_Hash_destructor_closure */
 
-static PyMethodDef SwigMethods[] = {
-	 { (char *)"SWIG_PyInstanceMethod_New", (PyCFunction)SWIG_PyInstanceMethod_New, METH_O, NULL},
-	 { (char *)"Crypt_remove", _wrap_Crypt_remove, METH_VARARGS, (char *)"\n"
-		"Crypt_remove(STRING, type, name)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"type: DWORD\n"
-		"name: char *\n"
-		"\n"
-		""},
-	 { (char *)"Crypt_enumerate", _wrap_Crypt_enumerate, METH_VARARGS, (char *)"Crypt_enumerate() -> CryptIter"},
-	 { (char *)"Cert_self_sign", _wrap_Cert_self_sign, METH_VARARGS, (char *)"\n"
-		"Cert_self_sign(ctx, STRING) -> Cert\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"ctx: Crypt *\n"
-		"STRING: BYTE *\n"
-		"\n"
-		""},
-	 { NULL, NULL, 0, NULL }
-};
+SWIGINTERN PyObject *_wrap_delete_CMSStream(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  CMSStream *arg1 = (CMSStream *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  
+  if (args && PyTuple_Check(args) && PyTuple_GET_SIZE(args) > 0) SWIG_exception_fail(SWIG_TypeError, "delete_CMSStream takes no arguments");
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_CMSStream, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_CMSStream" "', argument " "1"" of type '" "CMSStream *""'"); 
+  }
+  arg1 = reinterpret_cast< CMSStream * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    arg1->unref();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
 
-static SwigPyGetSet GUID___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet GUID_Data1_getset = { _wrap_GUID_Data1_get, _wrap_GUID_Data1_set };
-static SwigPyGetSet GUID_Data2_getset = { _wrap_GUID_Data2_get, _wrap_GUID_Data2_set };
-static SwigPyGetSet GUID_Data3_getset = { _wrap_GUID_Data3_get, _wrap_GUID_Data3_set };
-static SwigPyGetSet GUID_Data4_getset = { _wrap_GUID_Data4_get, _wrap_GUID_Data4_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin___GUID_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_GUID.__dict__", (void *) &GUID___dict___getset }
-,
-    { (char *) "Data1", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_GUID.Data1", (void *) &GUID_Data1_getset }
-,
-    { (char *) "Data2", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_GUID.Data2", (void *) &GUID_Data2_getset }
-,
-    { (char *) "Data3", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_GUID.Data3", (void *) &GUID_Data3_getset }
-,
-    { (char *) "Data4", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_GUID.Data4", (void *) &GUID_Data4_getset }
-,
-    {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
-};
 
-SWIGINTERN PyObject *
-SwigPyBuiltin___GUID_richcompare(PyObject *self, PyObject *other, int op) {
-  PyObject *result = NULL;
-  PyObject *tuple = PyTuple_New(1);
-  assert(tuple);
-  PyTuple_SET_ITEM(tuple, 0, other);
-  Py_XINCREF(other);
-  if (!result) {
-    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
-      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+SWIGINTERN PyObject *_wrap_CMSStream_update(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  CMSStream *arg1 = (CMSStream *) 0 ;
+  BYTE *arg2 = (BYTE *) 0 ;
+  DWORD arg3 ;
+  BYTE **arg4 = (BYTE **) 0 ;
+  DWORD *arg5 = (DWORD *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  Py_buffer view2 ;
+  int got_view2 = 0 ;
+  BYTE *carray4 = 0 ;
+  DWORD size4 = 0 ;
+  PyObject *res4 = NULL ;
+  PyObject * obj1 = 0 ;
+  
+  arg4 = &carray4;
+  arg5 = &size4;
+  if (!PyArg_ParseTuple(args,(char *)"O:CMSStream_update",&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_CMSStream, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CMSStream_update" "', argument " "1"" of type '" "CMSStream *""'"); 
+  }
+  arg1 = reinterpret_cast< CMSStream * >(argp1);
+  if (PyObject_GetBuffer(obj1, &view2, PyBUF_SIMPLE) != 0) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "CMSStream_update" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  got_view2 = 1;
+  if (view2.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "CMSStream_update" "', argument " "2"" of type '" "BYTE *""'");
+  }
+  arg2 = (BYTE *) view2.buf;
+  arg3 = (DWORD) view2.len;
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      (arg1)->update(arg2,arg3,arg4,arg5);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  catch(CSPNotFound &_e) {
+    PyErr_SetString(PyExc_ValueError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_Py_Void();
+  if (*arg4) {
+    if (*arg5 > INT_MAX) {
+      swig_type_info* pchar_descriptor = SWIG_pchar_descriptor();
+      res4 = pchar_descriptor ? 
+      SWIG_InternalNewPointerObj(const_cast< BYTE * >(*arg4), pchar_descriptor, 0) : SWIG_Py_Void();
     } else {
-      result = Py_NotImplemented;
-      Py_INCREF(result);
+#if PY_VERSION_HEX >= 0x03000000
+      res4 = PyBytes_FromStringAndSize((char *)*arg4, static_cast< int >(*arg5));
+#else
+      res4 = PyString_FromStringAndSize((char *)*arg4, static_cast< int >(*arg5));
+#endif
     }
+    resultobj = SWIG_Python_AppendOutput(resultobj, res4);
+    free(*arg4);
+  } else {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_Py_Void());
   }
-  Py_DECREF(tuple);
-  return result;
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
+  return resultobj;
+fail:
+  if (got_view2) {
+    PyBuffer_Release(&view2);
+  }
+  return NULL;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin___GUID_methods[] = {
-  { NULL, NULL, 0, NULL } /* Sentinel */
-};
 
-static PyHeapTypeObject SwigPyBuiltin___GUID_type = {
-  {
+SWIGINTERN PyObject *_wrap_CMSStream_finish(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  CMSStream *arg1 = (CMSStream *) 0 ;
+  BYTE **arg2 = (BYTE **) 0 ;
+  DWORD *arg3 = (DWORD *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  BYTE *carray2 = 0 ;
+  DWORD size2 = 0 ;
+  PyObject *res2 = NULL ;
+  
+  arg2 = &carray2;
+  arg3 = &size2;
+  if (args && PyTuple_Check(args) && PyTuple_GET_SIZE(args) > 0) SWIG_exception_fail(SWIG_TypeError, "CMSStream_finish takes no arguments");
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_CMSStream, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "CMSStream_finish" "', argument " "1"" of type '" "CMSStream *""'"); 
+  }
+  arg1 = reinterpret_cast< CMSStream * >(argp1);
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      (arg1)->finish(arg2,arg3);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  catch(CSPNotFound &_e) {
+    PyErr_SetString(PyExc_ValueError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_Py_Void();
+  if (*arg2) {
+    if (*arg3 > INT_MAX) {
+      swig_type_info* pchar_descriptor = SWIG_pchar_descriptor();
+      res2 = pchar_descriptor ? 
+      SWIG_InternalNewPointerObj(const_cast< BYTE * >(*arg2), pchar_descriptor, 0) : SWIG_Py_Void();
+    } else {
 #if PY_VERSION_HEX >= 0x03000000
-    PyVarObject_HEAD_INIT(NULL, 0)
+      res2 = PyBytes_FromStringAndSize((char *)*arg2, static_cast< int >(*arg3));
 #else
-    PyObject_HEAD_INIT(NULL)
-    0,                                        /* ob_size */
+      res2 = PyString_FromStringAndSize((char *)*arg2, static_cast< int >(*arg3));
 #endif
-    "csp.GUID",                               /* tp_name */
-    sizeof(SwigPyObject),                     /* tp_basicsize */
-    0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_GUID_destructor_closure,/* tp_dealloc */
-    (printfunc) 0,                            /* tp_print */
-    (getattrfunc) 0,                          /* tp_getattr */
+    }
+    resultobj = SWIG_Python_AppendOutput(resultobj, res2);
+    free(*arg2);
+  } else {
+    resultobj = SWIG_Python_AppendOutput(resultobj, SWIG_Py_Void());
+  }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_CMSStream) /* defines _wrap_delete_CMSStream_destructor_closure */
+
+SWIGINTERN int _wrap_new_SignStream__SWIG_0(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Cert *arg1 = (Cert *) 0 ;
+  bool arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  bool val2 ;
+  int ecode2 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  SignStream *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OO:new_SignStream",&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj1, &argp1,SWIGTYPE_p_Cert, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_SignStream" "', argument " "1"" of type '" "Cert *""'"); 
+  }
+  arg1 = reinterpret_cast< Cert * >(argp1);
+  ecode2 = SWIG_AsVal_bool(obj2, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "new_SignStream" "', argument " "2"" of type '" "bool""'");
+  } 
+  arg2 = static_cast< bool >(val2);
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (SignStream *)new SignStream(arg1,arg2);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_SignStream, SWIG_BUILTIN_INIT |  0 );
+  result->ref();
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN int _wrap_new_SignStream__SWIG_1(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Cert *arg1 = (Cert *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj1 = 0 ;
+  SignStream *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:new_SignStream",&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj1, &argp1,SWIGTYPE_p_Cert, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_SignStream" "', argument " "1"" of type '" "Cert *""'"); 
+  }
+  arg1 = reinterpret_cast< Cert * >(argp1);
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (SignStream *)new SignStream(arg1);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_SignStream, SWIG_BUILTIN_INIT |  0 );
+  result->ref();
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN int _wrap_new_SignStream(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[3] = {
+    0
+  };
+  Py_ssize_t ii;
+  
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 2) && (ii < argc); ii++) {
+    argv[ii] = PyTuple_GET_ITEM(args,ii);
+  }
+  if (argc == 1) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Cert, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_new_SignStream__SWIG_1(self, args);
+    }
+  }
+  if (argc == 2) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Cert, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      {
+        int res = SWIG_AsVal_bool(argv[1], NULL);
+        _v = SWIG_CheckState(res);
+      }
+      if (_v) {
+        return _wrap_new_SignStream__SWIG_0(self, args);
+      }
+    }
+  }
+  
+fail:
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'new_SignStream'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    SignStream::SignStream(Cert *,bool)\n"
+    "    SignStream::SignStream(Cert *)\n");
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_SignStream(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  SignStream *arg1 = (SignStream *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  
+  if (args && PyTuple_Check(args) && PyTuple_GET_SIZE(args) > 0) SWIG_exception_fail(SWIG_TypeError, "delete_SignStream takes no arguments");
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_SignStream, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_SignStream" "', argument " "1"" of type '" "SignStream *""'"); 
+  }
+  arg1 = reinterpret_cast< SignStream * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    arg1->unref();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_SignStream) /* defines _wrap_delete_SignStream_destructor_closure */
+
+SWIGINTERN int _wrap_new_DecryptStream(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Cert *arg1 = (Cert *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj1 = 0 ;
+  DecryptStream *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:new_DecryptStream",&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj1, &argp1,SWIGTYPE_p_Cert, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_DecryptStream" "', argument " "1"" of type '" "Cert *""'"); 
+  }
+  arg1 = reinterpret_cast< Cert * >(argp1);
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (DecryptStream *)new DecryptStream(arg1);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_DecryptStream, SWIG_BUILTIN_INIT |  0 );
+  result->ref();
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_DecryptStream(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  DecryptStream *arg1 = (DecryptStream *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  
+  if (args && PyTuple_Check(args) && PyTuple_GET_SIZE(args) > 0) SWIG_exception_fail(SWIG_TypeError, "delete_DecryptStream takes no arguments");
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_DecryptStream, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_DecryptStream" "', argument " "1"" of type '" "DecryptStream *""'"); 
+  }
+  arg1 = reinterpret_cast< DecryptStream * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    arg1->unref();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_DecryptStream) /* defines _wrap_delete_DecryptStream_destructor_closure */
+
+SWIGINTERN int _wrap_new_EncryptStream__SWIG_0(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  Crypt *arg1 = (Crypt *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj1 = 0 ;
+  EncryptStream *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:new_EncryptStream",&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj1, &argp1,SWIGTYPE_p_Crypt, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_EncryptStream" "', argument " "1"" of type '" "Crypt *""'"); 
+  }
+  arg1 = reinterpret_cast< Crypt * >(argp1);
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (EncryptStream *)new EncryptStream(arg1);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_EncryptStream, SWIG_BUILTIN_INIT |  0 );
+  result->ref();
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN int _wrap_new_EncryptStream__SWIG_1(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  EncryptStream *result = 0 ;
+  
+  if (args && PyTuple_Check(args) && PyTuple_GET_SIZE(args) > 0) SWIG_exception_fail(SWIG_TypeError, "new_EncryptStream takes no arguments");
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (EncryptStream *)new EncryptStream();
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_EncryptStream, SWIG_BUILTIN_INIT |  0 );
+  result->ref();
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  return -1;
+}
+
+
+SWIGINTERN int _wrap_new_EncryptStream(PyObject *self, PyObject *args) {
+  Py_ssize_t argc;
+  PyObject *argv[2] = {
+    0
+  };
+  Py_ssize_t ii;
+  
+  if (!PyTuple_Check(args)) SWIG_fail;
+  argc = args ? PyObject_Length(args) : 0;
+  for (ii = 0; (ii < 1) && (ii < argc); ii++) {
+    argv[ii] = PyTuple_GET_ITEM(args,ii);
+  }
+  if (argc == 0) {
+    return _wrap_new_EncryptStream__SWIG_1(self, args);
+  }
+  if (argc == 1) {
+    int _v;
+    void *vptr = 0;
+    int res = SWIG_ConvertPtr(argv[0], &vptr, SWIGTYPE_p_Crypt, 0);
+    _v = SWIG_CheckState(res);
+    if (_v) {
+      return _wrap_new_EncryptStream__SWIG_0(self, args);
+    }
+  }
+  
+fail:
+  SWIG_SetErrorMsg(PyExc_NotImplementedError,"Wrong number or type of arguments for overloaded function 'new_EncryptStream'.\n"
+    "  Possible C/C++ prototypes are:\n"
+    "    EncryptStream::EncryptStream(Crypt *)\n"
+    "    EncryptStream::EncryptStream()\n");
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_EncryptStream(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  EncryptStream *arg1 = (EncryptStream *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  
+  if (args && PyTuple_Check(args) && PyTuple_GET_SIZE(args) > 0) SWIG_exception_fail(SWIG_TypeError, "delete_EncryptStream takes no arguments");
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_EncryptStream, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_EncryptStream" "', argument " "1"" of type '" "EncryptStream *""'"); 
+  }
+  arg1 = reinterpret_cast< EncryptStream * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    arg1->unref();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_EncryptStream_add_recipient(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  EncryptStream *arg1 = (EncryptStream *) 0 ;
+  Cert *arg2 = (Cert *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj1 = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:EncryptStream_add_recipient",&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_EncryptStream, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "EncryptStream_add_recipient" "', argument " "1"" of type '" "EncryptStream *""'"); 
+  }
+  arg1 = reinterpret_cast< EncryptStream * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_Cert, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "EncryptStream_add_recipient" "', argument " "2"" of type '" "Cert *""'"); 
+  }
+  arg2 = reinterpret_cast< Cert * >(argp2);
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      (arg1)->add_recipient(arg2);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_EncryptStream) /* defines _wrap_delete_EncryptStream_destructor_closure */
+
+SWIGINTERN int _wrap_new_VerifyStream(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  BYTE *arg1 = (BYTE *) 0 ;
+  DWORD arg2 ;
+  Py_buffer view1 ;
+  int got_view1 = 0 ;
+  PyObject * obj1 = 0 ;
+  VerifyStream *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:new_VerifyStream",&obj1)) SWIG_fail;
+  if (PyObject_GetBuffer(obj1, &view1, PyBUF_SIMPLE) != 0) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_TypeError), "in method '" "new_VerifyStream" "', argument " "1"" of type '" "BYTE *""'");
+  }
+  got_view1 = 1;
+  if (view1.len > 0xFFFFFFFFUL) {
+    SWIG_exception_fail(SWIG_ArgError(SWIG_OverflowError), "in method '" "new_VerifyStream" "', argument " "1"" of type '" "BYTE *""'");
+  }
+  arg1 = (BYTE *) view1.buf;
+  arg2 = (DWORD) view1.len;
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (VerifyStream *)new VerifyStream(arg1,arg2);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_VerifyStream, SWIG_BUILTIN_INIT |  0 );
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
+  result->ref();
+  return resultobj == Py_None ? -1 : 0;
+fail:
+  if (got_view1) {
+    PyBuffer_Release(&view1);
+  }
+  return -1;
+}
+
+
+SWIGINTERN PyObject *_wrap_VerifyStream_verify(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  VerifyStream *arg1 = (VerifyStream *) 0 ;
+  Cert *arg2 = (Cert *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject * obj1 = 0 ;
+  bool result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:VerifyStream_verify",&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_VerifyStream, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "VerifyStream_verify" "', argument " "1"" of type '" "VerifyStream *""'"); 
+  }
+  arg1 = reinterpret_cast< VerifyStream * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_Cert, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "VerifyStream_verify" "', argument " "2"" of type '" "Cert *""'"); 
+  }
+  arg2 = reinterpret_cast< Cert * >(argp2);
+  try {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (bool)(arg1)->verify(arg2);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+  }
+  catch(CSPException &_e) {
+    PyErr_SetString(PyExc_SystemError, (&_e)->msg);
+    SWIG_fail;
+    
+  }
+  
+  resultobj = SWIG_From_bool(static_cast< bool >(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_VerifyStream(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  VerifyStream *arg1 = (VerifyStream *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  
+  if (args && PyTuple_Check(args) && PyTuple_GET_SIZE(args) > 0) SWIG_exception_fail(SWIG_TypeError, "delete_VerifyStream takes no arguments");
+  res1 = SWIG_ConvertPtr(self, &argp1,SWIGTYPE_p_VerifyStream, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_VerifyStream" "', argument " "1"" of type '" "VerifyStream *""'"); 
+  }
+  arg1 = reinterpret_cast< VerifyStream * >(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    arg1->unref();
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGPY_DESTRUCTOR_CLOSURE(_wrap_delete_VerifyStream) /* defines _wrap_delete_VerifyStream_destructor_closure */
+
+static PyMethodDef SwigMethods[] = {
+	 { (char *)"SWIG_PyInstanceMethod_New", (PyCFunction)SWIG_PyInstanceMethod_New, METH_O, NULL},
+	 { (char *)"Crypt_remove", _wrap_Crypt_remove, METH_VARARGS, (char *)"\n"
+		"Crypt_remove(STRING, type, name)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"type: DWORD\n"
+		"name: char *\n"
+		"\n"
+		""},
+	 { (char *)"Crypt_enumerate", _wrap_Crypt_enumerate, METH_VARARGS, (char *)"Crypt_enumerate() -> CryptIter"},
+	 { (char *)"Cert_self_sign", _wrap_Cert_self_sign, METH_VARARGS, (char *)"\n"
+		"Cert_self_sign(ctx, STRING) -> Cert\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"ctx: Crypt *\n"
+		"STRING: BYTE *\n"
+		"\n"
+		""},
+	 { NULL, NULL, 0, NULL }
+};
+
+static SwigPyGetSet GUID___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet GUID_Data1_getset = { _wrap_GUID_Data1_get, _wrap_GUID_Data1_set };
+static SwigPyGetSet GUID_Data2_getset = { _wrap_GUID_Data2_get, _wrap_GUID_Data2_set };
+static SwigPyGetSet GUID_Data3_getset = { _wrap_GUID_Data3_get, _wrap_GUID_Data3_set };
+static SwigPyGetSet GUID_Data4_getset = { _wrap_GUID_Data4_get, _wrap_GUID_Data4_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin___GUID_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_GUID.__dict__", (void *) &GUID___dict___getset }
+,
+    { (char *) "Data1", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_GUID.Data1", (void *) &GUID_Data1_getset }
+,
+    { (char *) "Data2", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_GUID.Data2", (void *) &GUID_Data2_getset }
+,
+    { (char *) "Data3", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_GUID.Data3", (void *) &GUID_Data3_getset }
+,
+    { (char *) "Data4", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_GUID.Data4", (void *) &GUID_Data4_getset }
+,
+    {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin___GUID_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  PyObject *tuple = PyTuple_New(1);
+  assert(tuple);
+  PyTuple_SET_ITEM(tuple, 0, other);
+  Py_XINCREF(other);
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  Py_DECREF(tuple);
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin___GUID_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin___GUID_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "csp.GUID",                               /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    (destructor) (destructor) _wrap_delete_GUID_destructor_closure,/* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin___GUID_type.as_number,     /* tp_as_number */
+    &SwigPyBuiltin___GUID_type.as_sequence,   /* tp_as_sequence */
+    &SwigPyBuiltin___GUID_type.as_mapping,    /* tp_as_mapping */
+    (hashfunc) SwigPyObject_hash,             /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin___GUID_type.as_buffer,     /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::_GUID",                                /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    (richcmpfunc) SwigPyBuiltin___GUID_richcompare,               /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin___GUID_methods,             /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin___GUID_getset,              /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
+    (initproc) _wrap_new_GUID,                /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+#if PY_VERSION_HEX >= 0x02060000
+    (int) 0,                                  /* tp_version_tag */
+#endif
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+#if PY_VERSION_HEX >= 0x02050000
+    0,                                        /* tp_prev */
+#endif
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+#if PY_VERSION_HEX >= 0x02050000
+    (unaryfunc) 0,                            /* nb_index */
+#endif
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+#if PY_VERSION_HEX >= 0x02060000
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+#endif
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin___GUID_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___GUID_type};
+
+static SwigPyGetSet LARGE_INTEGER___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet LARGE_INTEGER_LowPart_getset = { _wrap_LARGE_INTEGER_LowPart_get, _wrap_LARGE_INTEGER_LowPart_set };
+static SwigPyGetSet LARGE_INTEGER_HighPart_getset = { _wrap_LARGE_INTEGER_HighPart_get, _wrap_LARGE_INTEGER_HighPart_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin___LARGE_INTEGER_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_LARGE_INTEGER.__dict__", (void *) &LARGE_INTEGER___dict___getset }
+,
+    { (char *) "LowPart", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_LARGE_INTEGER.LowPart", (void *) &LARGE_INTEGER_LowPart_getset }
+,
+    { (char *) "HighPart", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_LARGE_INTEGER.HighPart", (void *) &LARGE_INTEGER_HighPart_getset }
+,
+    {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin___LARGE_INTEGER_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  PyObject *tuple = PyTuple_New(1);
+  assert(tuple);
+  PyTuple_SET_ITEM(tuple, 0, other);
+  Py_XINCREF(other);
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  Py_DECREF(tuple);
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin___LARGE_INTEGER_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin___LARGE_INTEGER_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "csp.LARGE_INTEGER",                      /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    (destructor) (destructor) _wrap_delete_LARGE_INTEGER_destructor_closure,/* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin___LARGE_INTEGER_type.as_number,                /* tp_as_number */
+    &SwigPyBuiltin___LARGE_INTEGER_type.as_sequence,              /* tp_as_sequence */
+    &SwigPyBuiltin___LARGE_INTEGER_type.as_mapping,               /* tp_as_mapping */
+    (hashfunc) SwigPyObject_hash,             /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin___LARGE_INTEGER_type.as_buffer,                /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::_LARGE_INTEGER",                       /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    (richcmpfunc) SwigPyBuiltin___LARGE_INTEGER_richcompare,      /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin___LARGE_INTEGER_methods,    /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin___LARGE_INTEGER_getset,     /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
+    (initproc) _wrap_new_LARGE_INTEGER,       /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+#if PY_VERSION_HEX >= 0x02060000
+    (int) 0,                                  /* tp_version_tag */
+#endif
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+#if PY_VERSION_HEX >= 0x02050000
+    0,                                        /* tp_prev */
+#endif
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+#if PY_VERSION_HEX >= 0x02050000
+    (unaryfunc) 0,                            /* nb_index */
+#endif
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+#if PY_VERSION_HEX >= 0x02060000
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+#endif
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin___LARGE_INTEGER_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___LARGE_INTEGER_type};
+
+static SwigPyGetSet LUID___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet LUID_LowPart_getset = { _wrap_LUID_LowPart_get, _wrap_LUID_LowPart_set };
+static SwigPyGetSet LUID_HighPart_getset = { _wrap_LUID_HighPart_get, _wrap_LUID_HighPart_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin___LUID_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_LUID.__dict__", (void *) &LUID___dict___getset }
+,
+    { (char *) "LowPart", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_LUID.LowPart", (void *) &LUID_LowPart_getset }
+,
+    { (char *) "HighPart", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_LUID.HighPart", (void *) &LUID_HighPart_getset }
+,
+    {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin___LUID_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  PyObject *tuple = PyTuple_New(1);
+  assert(tuple);
+  PyTuple_SET_ITEM(tuple, 0, other);
+  Py_XINCREF(other);
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  Py_DECREF(tuple);
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin___LUID_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin___LUID_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "csp.LUID",                               /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    (destructor) (destructor) _wrap_delete_LUID_destructor_closure,/* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin___LUID_type.as_number,     /* tp_as_number */
+    &SwigPyBuiltin___LUID_type.as_sequence,   /* tp_as_sequence */
+    &SwigPyBuiltin___LUID_type.as_mapping,    /* tp_as_mapping */
+    (hashfunc) SwigPyObject_hash,             /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin___LUID_type.as_buffer,     /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::_LUID",                                /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    (richcmpfunc) SwigPyBuiltin___LUID_richcompare,               /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin___LUID_methods,             /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin___LUID_getset,              /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
+    (initproc) _wrap_new_LUID,                /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+#if PY_VERSION_HEX >= 0x02060000
+    (int) 0,                                  /* tp_version_tag */
+#endif
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+#if PY_VERSION_HEX >= 0x02050000
+    0,                                        /* tp_prev */
+#endif
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+#if PY_VERSION_HEX >= 0x02050000
+    (unaryfunc) 0,                            /* nb_index */
+#endif
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+#if PY_VERSION_HEX >= 0x02060000
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+#endif
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin___LUID_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___LUID_type};
+
+static SwigPyGetSet RCObj___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__RCObj_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"RCObj.__dict__", (void *) &RCObj___dict___getset }
+,
+    {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin__RCObj_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  PyObject *tuple = PyTuple_New(1);
+  assert(tuple);
+  PyTuple_SET_ITEM(tuple, 0, other);
+  Py_XINCREF(other);
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  Py_DECREF(tuple);
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__RCObj_methods[] = {
+  { "ref", (PyCFunction) _wrap_RCObj_ref, METH_VARARGS, (char *) "ref() -> int" },
+  { "unref", (PyCFunction) _wrap_RCObj_unref, METH_VARARGS, (char *) "unref() -> int" },
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin__RCObj_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "csp.RCObj",                              /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    (destructor) (destructor) _wrap_delete_RCObj_destructor_closure,/* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin__RCObj_type.as_number,     /* tp_as_number */
+    &SwigPyBuiltin__RCObj_type.as_sequence,   /* tp_as_sequence */
+    &SwigPyBuiltin__RCObj_type.as_mapping,    /* tp_as_mapping */
+    (hashfunc) SwigPyObject_hash,             /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin__RCObj_type.as_buffer,     /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::RCObj",                                /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    (richcmpfunc) SwigPyBuiltin__RCObj_richcompare,               /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__RCObj_methods,             /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin__RCObj_getset,              /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
+    (initproc) _wrap_new_RCObj,               /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+#if PY_VERSION_HEX >= 0x02060000
+    (int) 0,                                  /* tp_version_tag */
+#endif
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+#if PY_VERSION_HEX >= 0x02050000
+    0,                                        /* tp_prev */
+#endif
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+#if PY_VERSION_HEX >= 0x02050000
+    (unaryfunc) 0,                            /* nb_index */
+#endif
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+#if PY_VERSION_HEX >= 0x02060000
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+#endif
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__RCObj_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__RCObj_type};
+
+static SwigPyGetSet CRYPTOAPI_BLOB___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet CRYPTOAPI_BLOB_pbData_getset = { _wrap_CRYPTOAPI_BLOB_pbData_get, _wrap_CRYPTOAPI_BLOB_pbData_set };
+static SwigPyGetSet CRYPTOAPI_BLOB_cbData_getset = { _wrap_CRYPTOAPI_BLOB_cbData_get, _wrap_CRYPTOAPI_BLOB_cbData_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin___CRYPTOAPI_BLOB_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_CRYPTOAPI_BLOB.__dict__", (void *) &CRYPTOAPI_BLOB___dict___getset }
+,
+    { (char *) "pbData", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPTOAPI_BLOB.pbData", (void *) &CRYPTOAPI_BLOB_pbData_getset }
+,
+    { (char *) "cbData", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPTOAPI_BLOB.cbData", (void *) &CRYPTOAPI_BLOB_cbData_getset }
+,
+    {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin___CRYPTOAPI_BLOB_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  PyObject *tuple = PyTuple_New(1);
+  assert(tuple);
+  PyTuple_SET_ITEM(tuple, 0, other);
+  Py_XINCREF(other);
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  Py_DECREF(tuple);
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin___CRYPTOAPI_BLOB_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin___CRYPTOAPI_BLOB_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "csp.CRYPTOAPI_BLOB",                     /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    (destructor) (destructor) _wrap_delete_CRYPTOAPI_BLOB_destructor_closure,/* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
 #if PY_VERSION_HEX >= 0x03000000
     0,                                        /* tp_compare */
@@ -16003,36 +17445,271 @@ static PyHeapTypeObject SwigPyBuiltin___GUID_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin___GUID_type.as_number,     /* tp_as_number */
-    &SwigPyBuiltin___GUID_type.as_sequence,   /* tp_as_sequence */
-    &SwigPyBuiltin___GUID_type.as_mapping,    /* tp_as_mapping */
+    &SwigPyBuiltin___CRYPTOAPI_BLOB_type.as_number,               /* tp_as_number */
+    &SwigPyBuiltin___CRYPTOAPI_BLOB_type.as_sequence,             /* tp_as_sequence */
+    &SwigPyBuiltin___CRYPTOAPI_BLOB_type.as_mapping,              /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin___GUID_type.as_buffer,     /* tp_as_buffer */
+    &SwigPyBuiltin___CRYPTOAPI_BLOB_type.as_buffer,               /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::_GUID",                                /* tp_doc */
+    "::_CRYPTOAPI_BLOB",                      /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin___GUID_richcompare,               /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin___CRYPTOAPI_BLOB_richcompare,     /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin___GUID_methods,             /* tp_methods */
+    SwigPyBuiltin___CRYPTOAPI_BLOB_methods,   /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin___GUID_getset,              /* tp_getset */
+    SwigPyBuiltin___CRYPTOAPI_BLOB_getset,    /* tp_getset */
+    0,                                        /* tp_base */
+    0,                                        /* tp_dict */
+    (descrgetfunc) 0,                         /* tp_descr_get */
+    (descrsetfunc) 0,                         /* tp_descr_set */
+    (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
+    (initproc) _wrap_new_CRYPTOAPI_BLOB,      /* tp_init */
+    (allocfunc) 0,                            /* tp_alloc */
+    (newfunc) 0,                              /* tp_new */
+    (freefunc) 0,                             /* tp_free */
+    (inquiry) 0,                              /* tp_is_gc */
+    (PyObject *) 0,                           /* tp_bases */
+    (PyObject *) 0,                           /* tp_mro */
+    (PyObject *) 0,                           /* tp_cache */
+    (PyObject *) 0,                           /* tp_subclasses */
+    (PyObject *) 0,                           /* tp_weaklist */
+    (destructor) 0,                           /* tp_del */
+#if PY_VERSION_HEX >= 0x02060000
+    (int) 0,                                  /* tp_version_tag */
+#endif
+#if PY_VERSION_HEX >= 0x03040000
+    (destructor) 0,                           /* tp_finalize */
+#endif
+#ifdef COUNT_ALLOCS
+    (Py_ssize_t) 0,                           /* tp_allocs */
+    (Py_ssize_t) 0,                           /* tp_frees */
+    (Py_ssize_t) 0,                           /* tp_maxalloc */
+#if PY_VERSION_HEX >= 0x02050000
+    0,                                        /* tp_prev */
+#endif
+    0,                                        /* tp_next */
+#endif
+  },
+#if PY_VERSION_HEX >= 0x03050000
+  {
+    (unaryfunc) 0,                            /* am_await */
+    (unaryfunc) 0,                            /* am_aiter */
+    (unaryfunc) 0,                            /* am_anext */
+  },
+#endif
+  {
+    (binaryfunc) 0,                           /* nb_add */
+    (binaryfunc) 0,                           /* nb_subtract */
+    (binaryfunc) 0,                           /* nb_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_remainder */
+    (binaryfunc) 0,                           /* nb_divmod */
+    (ternaryfunc) 0,                          /* nb_power */
+    (unaryfunc) 0,                            /* nb_negative */
+    (unaryfunc) 0,                            /* nb_positive */
+    (unaryfunc) 0,                            /* nb_absolute */
+    (inquiry) 0,                              /* nb_nonzero */
+    (unaryfunc) 0,                            /* nb_invert */
+    (binaryfunc) 0,                           /* nb_lshift */
+    (binaryfunc) 0,                           /* nb_rshift */
+    (binaryfunc) 0,                           /* nb_and */
+    (binaryfunc) 0,                           /* nb_xor */
+    (binaryfunc) 0,                           /* nb_or */
+#if PY_VERSION_HEX < 0x03000000
+    (coercion) 0,                             /* nb_coerce */
+#endif
+    (unaryfunc) 0,                            /* nb_int */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* nb_reserved */
+#else
+    (unaryfunc) 0,                            /* nb_long */
+#endif
+    (unaryfunc) 0,                            /* nb_float */
+#if PY_VERSION_HEX < 0x03000000
+    (unaryfunc) 0,                            /* nb_oct */
+    (unaryfunc) 0,                            /* nb_hex */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_add */
+    (binaryfunc) 0,                           /* nb_inplace_subtract */
+    (binaryfunc) 0,                           /* nb_inplace_multiply */
+#if PY_VERSION_HEX < 0x03000000
+    (binaryfunc) 0,                           /* nb_inplace_divide */
+#endif
+    (binaryfunc) 0,                           /* nb_inplace_remainder */
+    (ternaryfunc) 0,                          /* nb_inplace_power */
+    (binaryfunc) 0,                           /* nb_inplace_lshift */
+    (binaryfunc) 0,                           /* nb_inplace_rshift */
+    (binaryfunc) 0,                           /* nb_inplace_and */
+    (binaryfunc) 0,                           /* nb_inplace_xor */
+    (binaryfunc) 0,                           /* nb_inplace_or */
+    (binaryfunc) 0,                           /* nb_floor_divide */
+    (binaryfunc) 0,                           /* nb_true_divide */
+    (binaryfunc) 0,                           /* nb_inplace_floor_divide */
+    (binaryfunc) 0,                           /* nb_inplace_true_divide */
+#if PY_VERSION_HEX >= 0x02050000
+    (unaryfunc) 0,                            /* nb_index */
+#endif
+#if PY_VERSION_HEX >= 0x03050000
+    (binaryfunc) 0,                           /* nb_matrix_multiply */
+    (binaryfunc) 0,                           /* nb_inplace_matrix_multiply */
+#endif
+  },
+  {
+    (lenfunc) 0,                              /* mp_length */
+    (binaryfunc) 0,                           /* mp_subscript */
+    (objobjargproc) 0,                        /* mp_ass_subscript */
+  },
+  {
+    (lenfunc) 0,                              /* sq_length */
+    (binaryfunc) 0,                           /* sq_concat */
+    (ssizeargfunc) 0,                         /* sq_repeat */
+    (ssizeargfunc) 0,                         /* sq_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_slice */
+#else
+    (ssizessizeargfunc) 0,                    /* sq_slice */
+#endif
+    (ssizeobjargproc) 0,                      /* sq_ass_item */
+#if PY_VERSION_HEX >= 0x03000000
+    (void *) 0,                               /* was_sq_ass_slice */
+#else
+    (ssizessizeobjargproc) 0,                 /* sq_ass_slice */
+#endif
+    (objobjproc) 0,                           /* sq_contains */
+    (binaryfunc) 0,                           /* sq_inplace_concat */
+    (ssizeargfunc) 0,                         /* sq_inplace_repeat */
+  },
+  {
+#if PY_VERSION_HEX < 0x03000000
+    (readbufferproc) 0,                       /* bf_getreadbuffer */
+    (writebufferproc) 0,                      /* bf_getwritebuffer */
+    (segcountproc) 0,                         /* bf_getsegcount */
+    (charbufferproc) 0,                       /* bf_getcharbuffer */
+#endif
+#if PY_VERSION_HEX >= 0x02060000
+    (getbufferproc) 0,                        /* bf_getbuffer */
+    (releasebufferproc) 0,                    /* bf_releasebuffer */
+#endif
+  },
+    (PyObject *) 0,                           /* ht_name */
+    (PyObject *) 0,                           /* ht_slots */
+#if PY_VERSION_HEX >= 0x03030000
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin___CRYPTOAPI_BLOB_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___CRYPTOAPI_BLOB_type};
+
+static SwigPyGetSet CMS_DH_KEY_INFO_PubInfo_getset = { _wrap_CMS_DH_KEY_INFO_PubInfo_get, _wrap_CMS_DH_KEY_INFO_PubInfo_set };
+static SwigPyGetSet CMS_DH_KEY_INFO_pReserved_getset = { _wrap_CMS_DH_KEY_INFO_pReserved_get, _wrap_CMS_DH_KEY_INFO_pReserved_set };
+static SwigPyGetSet CMS_DH_KEY_INFO___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet CMS_DH_KEY_INFO_dwVersion_getset = { _wrap_CMS_DH_KEY_INFO_dwVersion_get, _wrap_CMS_DH_KEY_INFO_dwVersion_set };
+static SwigPyGetSet CMS_DH_KEY_INFO_Algid_getset = { _wrap_CMS_DH_KEY_INFO_Algid_get, _wrap_CMS_DH_KEY_INFO_Algid_set };
+static SwigPyGetSet CMS_DH_KEY_INFO_pszContentEncObjId_getset = { _wrap_CMS_DH_KEY_INFO_pszContentEncObjId_get, _wrap_CMS_DH_KEY_INFO_pszContentEncObjId_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin___CMS_DH_KEY_INFO_getset[] = {
+    { (char *) "PubInfo", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CMS_DH_KEY_INFO.PubInfo", (void *) &CMS_DH_KEY_INFO_PubInfo_getset }
+,
+    { (char *) "pReserved", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CMS_DH_KEY_INFO.pReserved", (void *) &CMS_DH_KEY_INFO_pReserved_getset }
+,
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_CMS_DH_KEY_INFO.__dict__", (void *) &CMS_DH_KEY_INFO___dict___getset }
+,
+    { (char *) "dwVersion", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CMS_DH_KEY_INFO.dwVersion", (void *) &CMS_DH_KEY_INFO_dwVersion_getset }
+,
+    { (char *) "Algid", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CMS_DH_KEY_INFO.Algid", (void *) &CMS_DH_KEY_INFO_Algid_getset }
+,
+    { (char *) "pszContentEncObjId", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CMS_DH_KEY_INFO.pszContentEncObjId", (void *) &CMS_DH_KEY_INFO_pszContentEncObjId_getset }
+,
+    {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
+};
+
+SWIGINTERN PyObject *
+SwigPyBuiltin___CMS_DH_KEY_INFO_richcompare(PyObject *self, PyObject *other, int op) {
+  PyObject *result = NULL;
+  PyObject *tuple = PyTuple_New(1);
+  assert(tuple);
+  PyTuple_SET_ITEM(tuple, 0, other);
+  Py_XINCREF(other);
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  Py_DECREF(tuple);
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin___CMS_DH_KEY_INFO_methods[] = {
+  { NULL, NULL, 0, NULL } /* Sentinel */
+};
+
+static PyHeapTypeObject SwigPyBuiltin___CMS_DH_KEY_INFO_type = {
+  {
+#if PY_VERSION_HEX >= 0x03000000
+    PyVarObject_HEAD_INIT(NULL, 0)
+#else
+    PyObject_HEAD_INIT(NULL)
+    0,                                        /* ob_size */
+#endif
+    "csp.CMS_DH_KEY_INFO",                    /* tp_name */
+    sizeof(SwigPyObject),                     /* tp_basicsize */
+    0,                                        /* tp_itemsize */
+    (destructor) (destructor) _wrap_delete_CMS_DH_KEY_INFO_destructor_closure,/* tp_dealloc */
+    (printfunc) 0,                            /* tp_print */
+    (getattrfunc) 0,                          /* tp_getattr */
+    (setattrfunc) 0,                          /* tp_setattr */
+#if PY_VERSION_HEX >= 0x03000000
+    0,                                        /* tp_compare */
+#else
+    (cmpfunc) 0,                              /* tp_compare */
+#endif
+    (reprfunc) 0,                             /* tp_repr */
+    &SwigPyBuiltin___CMS_DH_KEY_INFO_type.as_number,              /* tp_as_number */
+    &SwigPyBuiltin___CMS_DH_KEY_INFO_type.as_sequence,            /* tp_as_sequence */
+    &SwigPyBuiltin___CMS_DH_KEY_INFO_type.as_mapping,             /* tp_as_mapping */
+    (hashfunc) SwigPyObject_hash,             /* tp_hash */
+    (ternaryfunc) 0,                          /* tp_call */
+    (reprfunc) 0,                             /* tp_str */
+    (getattrofunc) 0,                         /* tp_getattro */
+    (setattrofunc) 0,                         /* tp_setattro */
+    &SwigPyBuiltin___CMS_DH_KEY_INFO_type.as_buffer,              /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
+#endif
+    "::_CMS_DH_KEY_INFO",                     /* tp_doc */
+    (traverseproc) 0,                         /* tp_traverse */
+    (inquiry) 0,                              /* tp_clear */
+    (richcmpfunc) SwigPyBuiltin___CMS_DH_KEY_INFO_richcompare,    /* tp_richcompare */
+    0,                                        /* tp_weaklistoffset */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin___CMS_DH_KEY_INFO_methods,  /* tp_methods */
+    0,                                        /* tp_members */
+    SwigPyBuiltin___CMS_DH_KEY_INFO_getset,   /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_GUID,                /* tp_init */
+    (initproc) _wrap_new_CMS_DH_KEY_INFO,     /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -16170,23 +17847,26 @@ static PyHeapTypeObject SwigPyBuiltin___GUID_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin___GUID_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___GUID_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin___CMS_DH_KEY_INFO_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___CMS_DH_KEY_INFO_type};
 
-static SwigPyGetSet LARGE_INTEGER___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet LARGE_INTEGER_LowPart_getset = { _wrap_LARGE_INTEGER_LowPart_get, _wrap_LARGE_INTEGER_LowPart_set };
-static SwigPyGetSet LARGE_INTEGER_HighPart_getset = { _wrap_LARGE_INTEGER_HighPart_get, _wrap_LARGE_INTEGER_HighPart_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin___LARGE_INTEGER_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_LARGE_INTEGER.__dict__", (void *) &LARGE_INTEGER___dict___getset }
+static SwigPyGetSet CRYPT_BIT_BLOB___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet CRYPT_BIT_BLOB_pbData_getset = { _wrap_CRYPT_BIT_BLOB_pbData_get, _wrap_CRYPT_BIT_BLOB_pbData_set };
+static SwigPyGetSet CRYPT_BIT_BLOB_cbData_getset = { _wrap_CRYPT_BIT_BLOB_cbData_get, _wrap_CRYPT_BIT_BLOB_cbData_set };
+static SwigPyGetSet CRYPT_BIT_BLOB_cUnusedBits_getset = { _wrap_CRYPT_BIT_BLOB_cUnusedBits_get, _wrap_CRYPT_BIT_BLOB_cUnusedBits_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin___CRYPT_BIT_BLOB_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_CRYPT_BIT_BLOB.__dict__", (void *) &CRYPT_BIT_BLOB___dict___getset }
 ,
-    { (char *) "LowPart", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_LARGE_INTEGER.LowPart", (void *) &LARGE_INTEGER_LowPart_getset }
+    { (char *) "pbData", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPT_BIT_BLOB.pbData", (void *) &CRYPT_BIT_BLOB_pbData_getset }
 ,
-    { (char *) "HighPart", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_LARGE_INTEGER.HighPart", (void *) &LARGE_INTEGER_HighPart_getset }
+    { (char *) "cbData", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPT_BIT_BLOB.cbData", (void *) &CRYPT_BIT_BLOB_cbData_getset }
+,
+    { (char *) "cUnusedBits", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPT_BIT_BLOB.cUnusedBits", (void *) &CRYPT_BIT_BLOB_cUnusedBits_getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin___LARGE_INTEGER_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin___CRYPT_BIT_BLOB_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -16204,11 +17884,11 @@ SwigPyBuiltin___LARGE_INTEGER_richcompare(PyObject *self, PyObject *other, int o
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin___LARGE_INTEGER_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin___CRYPT_BIT_BLOB_methods[] = {
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin___LARGE_INTEGER_type = {
+static PyHeapTypeObject SwigPyBuiltin___CRYPT_BIT_BLOB_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -16216,10 +17896,10 @@ static PyHeapTypeObject SwigPyBuiltin___LARGE_INTEGER_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.LARGE_INTEGER",                      /* tp_name */
+    "csp.CRYPT_BIT_BLOB",                     /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_LARGE_INTEGER_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CRYPT_BIT_BLOB_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -16229,36 +17909,36 @@ static PyHeapTypeObject SwigPyBuiltin___LARGE_INTEGER_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin___LARGE_INTEGER_type.as_number,                /* tp_as_number */
-    &SwigPyBuiltin___LARGE_INTEGER_type.as_sequence,              /* tp_as_sequence */
-    &SwigPyBuiltin___LARGE_INTEGER_type.as_mapping,               /* tp_as_mapping */
+    &SwigPyBuiltin___CRYPT_BIT_BLOB_type.as_number,               /* tp_as_number */
+    &SwigPyBuiltin___CRYPT_BIT_BLOB_type.as_sequence,             /* tp_as_sequence */
+    &SwigPyBuiltin___CRYPT_BIT_BLOB_type.as_mapping,              /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin___LARGE_INTEGER_type.as_buffer,                /* tp_as_buffer */
+    &SwigPyBuiltin___CRYPT_BIT_BLOB_type.as_buffer,               /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::_LARGE_INTEGER",                       /* tp_doc */
+    "::_CRYPT_BIT_BLOB",                      /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin___LARGE_INTEGER_richcompare,      /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin___CRYPT_BIT_BLOB_richcompare,     /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin___LARGE_INTEGER_methods,    /* tp_methods */
+    SwigPyBuiltin___CRYPT_BIT_BLOB_methods,   /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin___LARGE_INTEGER_getset,     /* tp_getset */
+    SwigPyBuiltin___CRYPT_BIT_BLOB_getset,    /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_LARGE_INTEGER,       /* tp_init */
+    (initproc) _wrap_new_CRYPT_BIT_BLOB,      /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -16396,23 +18076,23 @@ static PyHeapTypeObject SwigPyBuiltin___LARGE_INTEGER_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin___LARGE_INTEGER_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___LARGE_INTEGER_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin___CRYPT_BIT_BLOB_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___CRYPT_BIT_BLOB_type};
 
-static SwigPyGetSet LUID___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet LUID_LowPart_getset = { _wrap_LUID_LowPart_get, _wrap_LUID_LowPart_set };
-static SwigPyGetSet LUID_HighPart_getset = { _wrap_LUID_HighPart_get, _wrap_LUID_HighPart_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin___LUID_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_LUID.__dict__", (void *) &LUID___dict___getset }
+static SwigPyGetSet CRYPT_ALGORITHM_IDENTIFIER___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet CRYPT_ALGORITHM_IDENTIFIER_Parameters_getset = { _wrap_CRYPT_ALGORITHM_IDENTIFIER_Parameters_get, _wrap_CRYPT_ALGORITHM_IDENTIFIER_Parameters_set };
+static SwigPyGetSet CRYPT_ALGORITHM_IDENTIFIER_pszObjId_getset = { _wrap_CRYPT_ALGORITHM_IDENTIFIER_pszObjId_get, _wrap_CRYPT_ALGORITHM_IDENTIFIER_pszObjId_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_CRYPT_ALGORITHM_IDENTIFIER.__dict__", (void *) &CRYPT_ALGORITHM_IDENTIFIER___dict___getset }
 ,
-    { (char *) "LowPart", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_LUID.LowPart", (void *) &LUID_LowPart_getset }
+    { (char *) "Parameters", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPT_ALGORITHM_IDENTIFIER.Parameters", (void *) &CRYPT_ALGORITHM_IDENTIFIER_Parameters_getset }
 ,
-    { (char *) "HighPart", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_LUID.HighPart", (void *) &LUID_HighPart_getset }
+    { (char *) "pszObjId", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPT_ALGORITHM_IDENTIFIER.pszObjId", (void *) &CRYPT_ALGORITHM_IDENTIFIER_pszObjId_getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin___LUID_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -16430,11 +18110,11 @@ SwigPyBuiltin___LUID_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin___LUID_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_methods[] = {
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin___LUID_type = {
+static PyHeapTypeObject SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -16442,10 +18122,10 @@ static PyHeapTypeObject SwigPyBuiltin___LUID_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.LUID",                               /* tp_name */
+    "csp.CRYPT_ALGORITHM_IDENTIFIER",         /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_LUID_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CRYPT_ALGORITHM_IDENTIFIER_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -16455,36 +18135,36 @@ static PyHeapTypeObject SwigPyBuiltin___LUID_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin___LUID_type.as_number,     /* tp_as_number */
-    &SwigPyBuiltin___LUID_type.as_sequence,   /* tp_as_sequence */
-    &SwigPyBuiltin___LUID_type.as_mapping,    /* tp_as_mapping */
+    &SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type.as_number,   /* tp_as_number */
+    &SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type.as_sequence, /* tp_as_sequence */
+    &SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type.as_mapping,  /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin___LUID_type.as_buffer,     /* tp_as_buffer */
+    &SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type.as_buffer,   /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::_LUID",                                /* tp_doc */
+    "::_CRYPT_ALGORITHM_IDENTIFIER",          /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin___LUID_richcompare,               /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_richcompare,/* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin___LUID_methods,             /* tp_methods */
+    SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_methods,           /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin___LUID_getset,              /* tp_getset */
+    SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_getset,            /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_LUID,                /* tp_init */
+    (initproc) _wrap_new_CRYPT_ALGORITHM_IDENTIFIER,              /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -16622,17 +18302,23 @@ static PyHeapTypeObject SwigPyBuiltin___LUID_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin___LUID_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___LUID_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type};
 
-static SwigPyGetSet RCObj___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__RCObj_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"RCObj.__dict__", (void *) &RCObj___dict___getset }
+static SwigPyGetSet CryptDesc_name_getset = { _wrap_CryptDesc_name_get, _wrap_CryptDesc_name_set };
+static SwigPyGetSet CryptDesc___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet CryptDesc_type_getset = { _wrap_CryptDesc_type_get, _wrap_CryptDesc_type_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__CryptDesc_getset[] = {
+    { (char *) "name", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CryptDesc.name", (void *) &CryptDesc_name_getset }
+,
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CryptDesc.__dict__", (void *) &CryptDesc___dict___getset }
+,
+    { (char *) "type", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CryptDesc.type", (void *) &CryptDesc_type_getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__RCObj_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__CryptDesc_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -16650,13 +18336,11 @@ SwigPyBuiltin__RCObj_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__RCObj_methods[] = {
-  { "ref", (PyCFunction) _wrap_RCObj_ref, METH_VARARGS, (char *) "ref() -> int" },
-  { "unref", (PyCFunction) _wrap_RCObj_unref, METH_VARARGS, (char *) "unref() -> int" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__CryptDesc_methods[] = {
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__RCObj_type = {
+static PyHeapTypeObject SwigPyBuiltin__CryptDesc_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -16664,10 +18348,10 @@ static PyHeapTypeObject SwigPyBuiltin__RCObj_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.RCObj",                              /* tp_name */
+    "csp.CryptDesc",                          /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_RCObj_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CryptDesc_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -16677,36 +18361,36 @@ static PyHeapTypeObject SwigPyBuiltin__RCObj_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__RCObj_type.as_number,     /* tp_as_number */
-    &SwigPyBuiltin__RCObj_type.as_sequence,   /* tp_as_sequence */
-    &SwigPyBuiltin__RCObj_type.as_mapping,    /* tp_as_mapping */
+    &SwigPyBuiltin__CryptDesc_type.as_number, /* tp_as_number */
+    &SwigPyBuiltin__CryptDesc_type.as_sequence,                   /* tp_as_sequence */
+    &SwigPyBuiltin__CryptDesc_type.as_mapping,/* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__RCObj_type.as_buffer,     /* tp_as_buffer */
+    &SwigPyBuiltin__CryptDesc_type.as_buffer, /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::RCObj",                                /* tp_doc */
+    "::CryptDesc",                            /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__RCObj_richcompare,               /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__CryptDesc_richcompare,           /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__RCObj_methods,             /* tp_methods */
+    SwigPyBuiltin__CryptDesc_methods,         /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__RCObj_getset,              /* tp_getset */
+    SwigPyBuiltin__CryptDesc_getset,          /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_RCObj,               /* tp_init */
+    (initproc) _wrap_new_CryptDesc,           /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -16844,23 +18528,17 @@ static PyHeapTypeObject SwigPyBuiltin__RCObj_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__RCObj_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__RCObj_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__CryptDesc_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CryptDesc_type};
 
-static SwigPyGetSet CRYPTOAPI_BLOB___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet CRYPTOAPI_BLOB_pbData_getset = { _wrap_CRYPTOAPI_BLOB_pbData_get, _wrap_CRYPTOAPI_BLOB_pbData_set };
-static SwigPyGetSet CRYPTOAPI_BLOB_cbData_getset = { _wrap_CRYPTOAPI_BLOB_cbData_get, _wrap_CRYPTOAPI_BLOB_cbData_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin___CRYPTOAPI_BLOB_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_CRYPTOAPI_BLOB.__dict__", (void *) &CRYPTOAPI_BLOB___dict___getset }
-,
-    { (char *) "pbData", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPTOAPI_BLOB.pbData", (void *) &CRYPTOAPI_BLOB_pbData_getset }
-,
-    { (char *) "cbData", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPTOAPI_BLOB.cbData", (void *) &CRYPTOAPI_BLOB_cbData_getset }
+static SwigPyGetSet CryptIter___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__CryptIter_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CryptIter.__dict__", (void *) &CryptIter___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin___CRYPTOAPI_BLOB_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__CryptIter_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -16878,11 +18556,13 @@ SwigPyBuiltin___CRYPTOAPI_BLOB_richcompare(PyObject *self, PyObject *other, int
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin___CRYPTOAPI_BLOB_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin__CryptIter_methods[] = {
+  { "__iter__", (PyCFunction) _wrap_CryptIter___iter__, METH_VARARGS, (char *) "__iter__() -> CryptIter" },
+  { "next", (PyCFunction) _wrap_CryptIter_next, METH_VARARGS, (char *) "next() -> CryptDesc" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin___CRYPTOAPI_BLOB_type = {
+static PyHeapTypeObject SwigPyBuiltin__CryptIter_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -16890,10 +18570,10 @@ static PyHeapTypeObject SwigPyBuiltin___CRYPTOAPI_BLOB_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CRYPTOAPI_BLOB",                     /* tp_name */
+    "csp.CryptIter",                          /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CRYPTOAPI_BLOB_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CryptIter_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -16903,36 +18583,36 @@ static PyHeapTypeObject SwigPyBuiltin___CRYPTOAPI_BLOB_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin___CRYPTOAPI_BLOB_type.as_number,               /* tp_as_number */
-    &SwigPyBuiltin___CRYPTOAPI_BLOB_type.as_sequence,             /* tp_as_sequence */
-    &SwigPyBuiltin___CRYPTOAPI_BLOB_type.as_mapping,              /* tp_as_mapping */
+    &SwigPyBuiltin__CryptIter_type.as_number, /* tp_as_number */
+    &SwigPyBuiltin__CryptIter_type.as_sequence,                   /* tp_as_sequence */
+    &SwigPyBuiltin__CryptIter_type.as_mapping,/* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin___CRYPTOAPI_BLOB_type.as_buffer,               /* tp_as_buffer */
+    &SwigPyBuiltin__CryptIter_type.as_buffer, /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::_CRYPTOAPI_BLOB",                      /* tp_doc */
+    "::CryptIter",                            /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin___CRYPTOAPI_BLOB_richcompare,     /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__CryptIter_richcompare,           /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) 0,                          /* tp_iter */
-    (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin___CRYPTOAPI_BLOB_methods,   /* tp_methods */
+    (getiterfunc) (getiterfunc) _wrap_CryptIter___iter___getiterfunc_closure,/* tp_iter */
+    (iternextfunc) (iternextfunc) _wrap_CryptIter_next_iternextfunc_closure,/* tp_iternext */
+    SwigPyBuiltin__CryptIter_methods,         /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin___CRYPTOAPI_BLOB_getset,    /* tp_getset */
+    SwigPyBuiltin__CryptIter_getset,          /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CRYPTOAPI_BLOB,      /* tp_init */
+    (initproc) _wrap_new_CryptIter,           /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -17070,32 +18750,20 @@ static PyHeapTypeObject SwigPyBuiltin___CRYPTOAPI_BLOB_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin___CRYPTOAPI_BLOB_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___CRYPTOAPI_BLOB_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__CryptIter_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CryptIter_type};
 
-static SwigPyGetSet CMS_DH_KEY_INFO_PubInfo_getset = { _wrap_CMS_DH_KEY_INFO_PubInfo_get, _wrap_CMS_DH_KEY_INFO_PubInfo_set };
-static SwigPyGetSet CMS_DH_KEY_INFO_pReserved_getset = { _wrap_CMS_DH_KEY_INFO_pReserved_get, _wrap_CMS_DH_KEY_INFO_pReserved_set };
-static SwigPyGetSet CMS_DH_KEY_INFO___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet CMS_DH_KEY_INFO_dwVersion_getset = { _wrap_CMS_DH_KEY_INFO_dwVersion_get, _wrap_CMS_DH_KEY_INFO_dwVersion_set };
-static SwigPyGetSet CMS_DH_KEY_INFO_Algid_getset = { _wrap_CMS_DH_KEY_INFO_Algid_get, _wrap_CMS_DH_KEY_INFO_Algid_set };
-static SwigPyGetSet CMS_DH_KEY_INFO_pszContentEncObjId_getset = { _wrap_CMS_DH_KEY_INFO_pszContentEncObjId_get, _wrap_CMS_DH_KEY_INFO_pszContentEncObjId_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin___CMS_DH_KEY_INFO_getset[] = {
-    { (char *) "PubInfo", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CMS_DH_KEY_INFO.PubInfo", (void *) &CMS_DH_KEY_INFO_PubInfo_getset }
-,
-    { (char *) "pReserved", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CMS_DH_KEY_INFO.pReserved", (void *) &CMS_DH_KEY_INFO_pReserved_getset }
-,
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_CMS_DH_KEY_INFO.__dict__", (void *) &CMS_DH_KEY_INFO___dict___getset }
-,
-    { (char *) "dwVersion", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CMS_DH_KEY_INFO.dwVersion", (void *) &CMS_DH_KEY_INFO_dwVersion_getset }
-,
-    { (char *) "Algid", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CMS_DH_KEY_INFO.Algid", (void *) &CMS_DH_KEY_INFO_Algid_getset }
+static SwigPyGetSet Crypt___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet Crypt_parent_getset = { _wrap_Crypt_parent_get, _wrap_Crypt_parent_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Crypt_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"Crypt.__dict__", (void *) &Crypt___dict___getset }
 ,
-    { (char *) "pszContentEncObjId", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CMS_DH_KEY_INFO.pszContentEncObjId", (void *) &CMS_DH_KEY_INFO_pszContentEncObjId_getset }
+    { (char *) "parent", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"Crypt.parent", (void *) &Crypt_parent_getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin___CMS_DH_KEY_INFO_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__Crypt_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -17113,11 +18781,105 @@ SwigPyBuiltin___CMS_DH_KEY_INFO_richcompare(PyObject *self, PyObject *other, int
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin___CMS_DH_KEY_INFO_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin__Crypt_methods[] = {
+  { "name", (PyCFunction) _wrap_Crypt_name, METH_VARARGS, (char *) "name() -> char *" },
+  { "uniq_name", (PyCFunction) _wrap_Crypt_uniq_name, METH_VARARGS, (char *) "uniq_name() -> char *" },
+  { "prov_name", (PyCFunction) _wrap_Crypt_prov_name, METH_VARARGS, (char *) "prov_name() -> char *" },
+  { "prov_type", (PyCFunction) _wrap_Crypt_prov_type, METH_VARARGS, (char *) "prov_type() -> DWORD" },
+  { "create_key", (PyCFunction) _wrap_Crypt_create_key, METH_VARARGS, (char *) "\n"
+		"create_key(flags, keyspec=1) -> Key\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"flags: DWORD\n"
+		"keyspec: DWORD\n"
+		"\n"
+		"create_key(flags) -> Key\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"flags: DWORD\n"
+		"\n"
+		"" },
+  { "get_key", (PyCFunction) _wrap_Crypt_get_key, METH_VARARGS, (char *) "\n"
+		"get_key(keyspec=1) -> Key\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"keyspec: DWORD\n"
+		"\n"
+		"get_key() -> Key\n"
+		"" },
+  { "import_key", (PyCFunction) _wrap_Crypt_import_key, METH_VARARGS, (char *) "\n"
+		"import_key(STRING, decrypt=None) -> Key\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"decrypt: Key *\n"
+		"\n"
+		"import_key(STRING) -> Key\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "set_password", (PyCFunction) _wrap_Crypt_set_password, METH_VARARGS, (char *) "\n"
+		"set_password(pin, keyspec=1)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"pin: char *\n"
+		"keyspec: DWORD\n"
+		"\n"
+		"set_password(pin)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"pin: char *\n"
+		"\n"
+		"" },
+  { "change_password", (PyCFunction) _wrap_Crypt_change_password, METH_VARARGS, (char *) "\n"
+		"change_password(pin)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"pin: char *\n"
+		"\n"
+		"" },
+  { "public_key", (PyCFunction) _wrap_Crypt_public_key, METH_VARARGS, (char *) "\n"
+		"public_key(keyspec=1)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"keyspec: DWORD\n"
+		"\n"
+		"public_key()\n"
+		"" },
+  { "import_public_key_info", (PyCFunction) _wrap_Crypt_import_public_key_info, METH_VARARGS, (char *) "\n"
+		"import_public_key_info(pcert) -> Key\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"pcert: Cert *\n"
+		"\n"
+		"" },
+  { "remove", (PyCFunction) _wrap_Crypt_remove, METH_STATIC|METH_VARARGS, (char *) "\n"
+		"remove(STRING, type, name)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"type: DWORD\n"
+		"name: char *\n"
+		"\n"
+		"" },
+  { "enumerate", (PyCFunction) _wrap_Crypt_enumerate, METH_STATIC|METH_VARARGS, (char *) "enumerate() -> CryptIter" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin___CMS_DH_KEY_INFO_type = {
+static PyHeapTypeObject SwigPyBuiltin__Crypt_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -17125,10 +18887,10 @@ static PyHeapTypeObject SwigPyBuiltin___CMS_DH_KEY_INFO_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CMS_DH_KEY_INFO",                    /* tp_name */
+    "csp.Crypt",                              /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CMS_DH_KEY_INFO_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_Crypt_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -17138,36 +18900,36 @@ static PyHeapTypeObject SwigPyBuiltin___CMS_DH_KEY_INFO_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin___CMS_DH_KEY_INFO_type.as_number,              /* tp_as_number */
-    &SwigPyBuiltin___CMS_DH_KEY_INFO_type.as_sequence,            /* tp_as_sequence */
-    &SwigPyBuiltin___CMS_DH_KEY_INFO_type.as_mapping,             /* tp_as_mapping */
+    &SwigPyBuiltin__Crypt_type.as_number,     /* tp_as_number */
+    &SwigPyBuiltin__Crypt_type.as_sequence,   /* tp_as_sequence */
+    &SwigPyBuiltin__Crypt_type.as_mapping,    /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin___CMS_DH_KEY_INFO_type.as_buffer,              /* tp_as_buffer */
+    &SwigPyBuiltin__Crypt_type.as_buffer,     /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::_CMS_DH_KEY_INFO",                     /* tp_doc */
+    "::Crypt",                                /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin___CMS_DH_KEY_INFO_richcompare,    /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__Crypt_richcompare,               /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin___CMS_DH_KEY_INFO_methods,  /* tp_methods */
+    SwigPyBuiltin__Crypt_methods,             /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin___CMS_DH_KEY_INFO_getset,   /* tp_getset */
+    SwigPyBuiltin__Crypt_getset,              /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CMS_DH_KEY_INFO,     /* tp_init */
+    (initproc) _wrap_new_Crypt,               /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -17305,26 +19067,17 @@ static PyHeapTypeObject SwigPyBuiltin___CMS_DH_KEY_INFO_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin___CMS_DH_KEY_INFO_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___CMS_DH_KEY_INFO_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Crypt_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Crypt_type};
 
-static SwigPyGetSet CRYPT_BIT_BLOB___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet CRYPT_BIT_BLOB_pbData_getset = { _wrap_CRYPT_BIT_BLOB_pbData_get, _wrap_CRYPT_BIT_BLOB_pbData_set };
-static SwigPyGetSet CRYPT_BIT_BLOB_cbData_getset = { _wrap_CRYPT_BIT_BLOB_cbData_get, _wrap_CRYPT_BIT_BLOB_cbData_set };
-static SwigPyGetSet CRYPT_BIT_BLOB_cUnusedBits_getset = { _wrap_CRYPT_BIT_BLOB_cUnusedBits_get, _wrap_CRYPT_BIT_BLOB_cUnusedBits_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin___CRYPT_BIT_BLOB_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_CRYPT_BIT_BLOB.__dict__", (void *) &CRYPT_BIT_BLOB___dict___getset }
-,
-    { (char *) "pbData", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPT_BIT_BLOB.pbData", (void *) &CRYPT_BIT_BLOB_pbData_getset }
-,
-    { (char *) "cbData", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPT_BIT_BLOB.cbData", (void *) &CRYPT_BIT_BLOB_cbData_getset }
-,
-    { (char *) "cUnusedBits", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPT_BIT_BLOB.cUnusedBits", (void *) &CRYPT_BIT_BLOB_cUnusedBits_getset }
+static SwigPyGetSet CSPInfo___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__CSPInfo_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CSPInfo.__dict__", (void *) &CSPInfo___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin___CRYPT_BIT_BLOB_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__CSPInfo_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -17342,11 +19095,21 @@ SwigPyBuiltin___CRYPT_BIT_BLOB_richcompare(PyObject *self, PyObject *other, int
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin___CRYPT_BIT_BLOB_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin__CSPInfo_methods[] = {
+  { "free_space", (PyCFunction) _wrap_CSPInfo_free_space, METH_VARARGS, (char *) "free_space() -> DWORD" },
+  { "number_ul", (PyCFunction) _wrap_CSPInfo_number_ul, METH_VARARGS, (char *) "number_ul() -> DWORD" },
+  { "number_signs", (PyCFunction) _wrap_CSPInfo_number_signs, METH_VARARGS, (char *) "number_signs() -> DWORD" },
+  { "number_changes", (PyCFunction) _wrap_CSPInfo_number_changes, METH_VARARGS, (char *) "number_changes() -> DWORD" },
+  { "number_kcards", (PyCFunction) _wrap_CSPInfo_number_kcards, METH_VARARGS, (char *) "number_kcards() -> DWORD" },
+  { "number_keys", (PyCFunction) _wrap_CSPInfo_number_keys, METH_VARARGS, (char *) "number_keys() -> DWORD" },
+  { "keys_remaining", (PyCFunction) _wrap_CSPInfo_keys_remaining, METH_VARARGS, (char *) "keys_remaining() -> DWORD" },
+  { "time", (PyCFunction) _wrap_CSPInfo_time, METH_VARARGS, (char *) "time() -> DWORD" },
+  { "bytes", (PyCFunction) _wrap_CSPInfo_bytes, METH_VARARGS, (char *) "bytes()" },
+  { "version", (PyCFunction) _wrap_CSPInfo_version, METH_VARARGS, (char *) "version() -> WORD" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin___CRYPT_BIT_BLOB_type = {
+static PyHeapTypeObject SwigPyBuiltin__CSPInfo_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -17354,10 +19117,10 @@ static PyHeapTypeObject SwigPyBuiltin___CRYPT_BIT_BLOB_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CRYPT_BIT_BLOB",                     /* tp_name */
+    "csp.CSPInfo",                            /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CRYPT_BIT_BLOB_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CSPInfo_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -17367,36 +19130,36 @@ static PyHeapTypeObject SwigPyBuiltin___CRYPT_BIT_BLOB_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin___CRYPT_BIT_BLOB_type.as_number,               /* tp_as_number */
-    &SwigPyBuiltin___CRYPT_BIT_BLOB_type.as_sequence,             /* tp_as_sequence */
-    &SwigPyBuiltin___CRYPT_BIT_BLOB_type.as_mapping,              /* tp_as_mapping */
+    &SwigPyBuiltin__CSPInfo_type.as_number,   /* tp_as_number */
+    &SwigPyBuiltin__CSPInfo_type.as_sequence, /* tp_as_sequence */
+    &SwigPyBuiltin__CSPInfo_type.as_mapping,  /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin___CRYPT_BIT_BLOB_type.as_buffer,               /* tp_as_buffer */
+    &SwigPyBuiltin__CSPInfo_type.as_buffer,   /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::_CRYPT_BIT_BLOB",                      /* tp_doc */
+    "::CSPInfo",                              /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin___CRYPT_BIT_BLOB_richcompare,     /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__CSPInfo_richcompare,             /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin___CRYPT_BIT_BLOB_methods,   /* tp_methods */
+    SwigPyBuiltin__CSPInfo_methods,           /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin___CRYPT_BIT_BLOB_getset,    /* tp_getset */
+    SwigPyBuiltin__CSPInfo_getset,            /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CRYPT_BIT_BLOB,      /* tp_init */
+    (initproc) _wrap_new_CSPInfo,             /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -17534,23 +19297,17 @@ static PyHeapTypeObject SwigPyBuiltin___CRYPT_BIT_BLOB_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin___CRYPT_BIT_BLOB_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___CRYPT_BIT_BLOB_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__CSPInfo_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CSPInfo_type};
 
-static SwigPyGetSet CRYPT_ALGORITHM_IDENTIFIER___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet CRYPT_ALGORITHM_IDENTIFIER_Parameters_getset = { _wrap_CRYPT_ALGORITHM_IDENTIFIER_Parameters_get, _wrap_CRYPT_ALGORITHM_IDENTIFIER_Parameters_set };
-static SwigPyGetSet CRYPT_ALGORITHM_IDENTIFIER_pszObjId_getset = { _wrap_CRYPT_ALGORITHM_IDENTIFIER_pszObjId_get, _wrap_CRYPT_ALGORITHM_IDENTIFIER_pszObjId_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_CRYPT_ALGORITHM_IDENTIFIER.__dict__", (void *) &CRYPT_ALGORITHM_IDENTIFIER___dict___getset }
-,
-    { (char *) "Parameters", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPT_ALGORITHM_IDENTIFIER.Parameters", (void *) &CRYPT_ALGORITHM_IDENTIFIER_Parameters_getset }
-,
-    { (char *) "pszObjId", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CRYPT_ALGORITHM_IDENTIFIER.pszObjId", (void *) &CRYPT_ALGORITHM_IDENTIFIER_pszObjId_getset }
+static SwigPyGetSet Key___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Key_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"Key.__dict__", (void *) &Key___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__Key_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -17568,11 +19325,79 @@ SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_richcompare(PyObject *self, PyObject
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin__Key_methods[] = {
+  { "encode", (PyCFunction) _wrap_Key_encode, METH_VARARGS, (char *) "\n"
+		"encode(cryptkey=None)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"cryptkey: Key *\n"
+		"\n"
+		"encode()\n"
+		"" },
+  { "store_cert", (PyCFunction) _wrap_Key_store_cert, METH_VARARGS, (char *) "\n"
+		"store_cert(c)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"c: Cert *\n"
+		"\n"
+		"" },
+  { "extract_cert", (PyCFunction) _wrap_Key_extract_cert, METH_VARARGS, (char *) "extract_cert()" },
+  { "encrypt", (PyCFunction) _wrap_Key_encrypt, METH_VARARGS, (char *) "\n"
+		"encrypt(STRING)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "decrypt", (PyCFunction) _wrap_Key_decrypt, METH_VARARGS, (char *) "\n"
+		"decrypt(STRING)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "set_alg_id", (PyCFunction) _wrap_Key_set_alg_id, METH_VARARGS, (char *) "\n"
+		"set_alg_id(id)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"id: ALG_ID\n"
+		"\n"
+		"" },
+  { "set_mode", (PyCFunction) _wrap_Key_set_mode, METH_VARARGS, (char *) "\n"
+		"set_mode(mode)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"mode: DWORD\n"
+		"\n"
+		"" },
+  { "alg_id", (PyCFunction) _wrap_Key_alg_id, METH_VARARGS, (char *) "alg_id() -> ALG_ID" },
+  { "get_iv", (PyCFunction) _wrap_Key_get_iv, METH_VARARGS, (char *) "get_iv()" },
+  { "set_iv", (PyCFunction) _wrap_Key_set_iv, METH_VARARGS, (char *) "\n"
+		"set_iv(STRING)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "set_padding", (PyCFunction) _wrap_Key_set_padding, METH_VARARGS, (char *) "\n"
+		"set_padding(padding)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"padding: DWORD\n"
+		"\n"
+		"" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type = {
+static PyHeapTypeObject SwigPyBuiltin__Key_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -17580,10 +19405,10 @@ static PyHeapTypeObject SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CRYPT_ALGORITHM_IDENTIFIER",         /* tp_name */
+    "csp.Key",                                /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CRYPT_ALGORITHM_IDENTIFIER_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_Key_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -17593,36 +19418,36 @@ static PyHeapTypeObject SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type.as_number,   /* tp_as_number */
-    &SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type.as_sequence, /* tp_as_sequence */
-    &SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type.as_mapping,  /* tp_as_mapping */
+    &SwigPyBuiltin__Key_type.as_number,       /* tp_as_number */
+    &SwigPyBuiltin__Key_type.as_sequence,     /* tp_as_sequence */
+    &SwigPyBuiltin__Key_type.as_mapping,      /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type.as_buffer,   /* tp_as_buffer */
+    &SwigPyBuiltin__Key_type.as_buffer,       /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::_CRYPT_ALGORITHM_IDENTIFIER",          /* tp_doc */
+    "::Key",                                  /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_richcompare,/* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__Key_richcompare,                 /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_methods,           /* tp_methods */
+    SwigPyBuiltin__Key_methods,               /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_getset,            /* tp_getset */
+    SwigPyBuiltin__Key_getset,                /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CRYPT_ALGORITHM_IDENTIFIER,              /* tp_init */
+    (initproc) _wrap_new_Key,                 /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -17755,28 +19580,22 @@ static PyHeapTypeObject SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type = {
     (PyObject *) 0,                           /* ht_name */
     (PyObject *) 0,                           /* ht_slots */
 #if PY_VERSION_HEX >= 0x03030000
-    (PyObject *) 0,                           /* ht_qualname */
-    0,                                        /* ht_cached_keys */
-#endif
-};
-
-SWIGINTERN SwigPyClientData SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___CRYPT_ALGORITHM_IDENTIFIER_type};
-
-static SwigPyGetSet CryptDesc_name_getset = { _wrap_CryptDesc_name_get, _wrap_CryptDesc_name_set };
-static SwigPyGetSet CryptDesc___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet CryptDesc_type_getset = { _wrap_CryptDesc_type_get, _wrap_CryptDesc_type_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__CryptDesc_getset[] = {
-    { (char *) "name", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CryptDesc.name", (void *) &CryptDesc_name_getset }
-,
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CryptDesc.__dict__", (void *) &CryptDesc___dict___getset }
-,
-    { (char *) "type", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CryptDesc.type", (void *) &CryptDesc_type_getset }
+    (PyObject *) 0,                           /* ht_qualname */
+    0,                                        /* ht_cached_keys */
+#endif
+};
+
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Key_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Key_type};
+
+static SwigPyGetSet Cert___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Cert_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"Cert.__dict__", (void *) &Cert___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__CryptDesc_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__Cert_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -17794,11 +19613,49 @@ SwigPyBuiltin__CryptDesc_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__CryptDesc_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin__Cert_methods[] = {
+  { "duplicate", (PyCFunction) _wrap_Cert_duplicate, METH_VARARGS, (char *) "duplicate() -> Cert" },
+  { "remove_from_store", (PyCFunction) _wrap_Cert_remove_from_store, METH_VARARGS, (char *) "remove_from_store()" },
+  { "self_sign", (PyCFunction) _wrap_Cert_self_sign, METH_STATIC|METH_VARARGS, (char *) "\n"
+		"self_sign(ctx, STRING) -> Cert\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"ctx: Crypt *\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "extract", (PyCFunction) _wrap_Cert_extract, METH_VARARGS, (char *) "extract()" },
+  { "thumbprint", (PyCFunction) _wrap_Cert_thumbprint, METH_VARARGS, (char *) "thumbprint()" },
+  { "subject_id", (PyCFunction) _wrap_Cert_subject_id, METH_VARARGS, (char *) "subject_id()" },
+  { "bind", (PyCFunction) _wrap_Cert_bind, METH_VARARGS, (char *) "\n"
+		"bind(ctx, keyspec=1)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"ctx: Crypt *\n"
+		"keyspec: DWORD\n"
+		"\n"
+		"bind(ctx)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"ctx: Crypt *\n"
+		"\n"
+		"" },
+  { "set_pin", (PyCFunction) _wrap_Cert_set_pin, METH_VARARGS, (char *) "\n"
+		"set_pin(pin)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"pin: char *\n"
+		"\n"
+		"" },
+  { "eku", (PyCFunction) _wrap_Cert_eku, METH_VARARGS, (char *) "eku() -> EKUIter" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__CryptDesc_type = {
+static PyHeapTypeObject SwigPyBuiltin__Cert_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -17806,10 +19663,10 @@ static PyHeapTypeObject SwigPyBuiltin__CryptDesc_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CryptDesc",                          /* tp_name */
+    "csp.Cert",                               /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CryptDesc_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_Cert_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -17819,36 +19676,36 @@ static PyHeapTypeObject SwigPyBuiltin__CryptDesc_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__CryptDesc_type.as_number, /* tp_as_number */
-    &SwigPyBuiltin__CryptDesc_type.as_sequence,                   /* tp_as_sequence */
-    &SwigPyBuiltin__CryptDesc_type.as_mapping,/* tp_as_mapping */
+    &SwigPyBuiltin__Cert_type.as_number,      /* tp_as_number */
+    &SwigPyBuiltin__Cert_type.as_sequence,    /* tp_as_sequence */
+    &SwigPyBuiltin__Cert_type.as_mapping,     /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__CryptDesc_type.as_buffer, /* tp_as_buffer */
+    &SwigPyBuiltin__Cert_type.as_buffer,      /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::CryptDesc",                            /* tp_doc */
+    "::Cert",                                 /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__CryptDesc_richcompare,           /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__Cert_richcompare,                /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) 0,                          /* tp_iter */
+    (getiterfunc) (getiterfunc) _wrap_Cert_eku_getiterfunc_closure,/* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__CryptDesc_methods,         /* tp_methods */
+    SwigPyBuiltin__Cert_methods,              /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__CryptDesc_getset,          /* tp_getset */
+    SwigPyBuiltin__Cert_getset,               /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CryptDesc,           /* tp_init */
+    (initproc) _wrap_new_Cert,                /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -17986,17 +19843,26 @@ static PyHeapTypeObject SwigPyBuiltin__CryptDesc_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__CryptDesc_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CryptDesc_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Cert_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Cert_type};
 
-static SwigPyGetSet CryptIter___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__CryptIter_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CryptIter.__dict__", (void *) &CryptIter___dict___getset }
+static SwigPyGetSet CertIter_iter_getset = { _wrap_CertIter_iter_get, _wrap_CertIter_iter_set };
+static SwigPyGetSet CertIter___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet CertIter_parent_getset = { _wrap_CertIter_parent_get, _wrap_CertIter_parent_set };
+static SwigPyGetSet CertIter_pcert_getset = { _wrap_CertIter_pcert_get, _wrap_CertIter_pcert_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__CertIter_getset[] = {
+    { (char *) "iter", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertIter.iter", (void *) &CertIter_iter_getset }
+,
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertIter.__dict__", (void *) &CertIter___dict___getset }
+,
+    { (char *) "parent", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertIter.parent", (void *) &CertIter_parent_getset }
+,
+    { (char *) "pcert", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertIter.pcert", (void *) &CertIter_pcert_getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__CryptIter_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__CertIter_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -18014,13 +19880,13 @@ SwigPyBuiltin__CryptIter_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__CryptIter_methods[] = {
-  { "__iter__", (PyCFunction) _wrap_CryptIter___iter__, METH_VARARGS, (char *) "__iter__() -> CryptIter" },
-  { "next", (PyCFunction) _wrap_CryptIter_next, METH_VARARGS, (char *) "next() -> CryptDesc" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__CertIter_methods[] = {
+  { "__iter__", (PyCFunction) _wrap_CertIter___iter__, METH_VARARGS, (char *) "__iter__() -> CertIter" },
+  { "next", (PyCFunction) _wrap_CertIter_next, METH_VARARGS, (char *) "next() -> Cert" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__CryptIter_type = {
+static PyHeapTypeObject SwigPyBuiltin__CertIter_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -18028,10 +19894,10 @@ static PyHeapTypeObject SwigPyBuiltin__CryptIter_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CryptIter",                          /* tp_name */
+    "csp.CertIter",                           /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CryptIter_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CertIter_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -18041,36 +19907,36 @@ static PyHeapTypeObject SwigPyBuiltin__CryptIter_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__CryptIter_type.as_number, /* tp_as_number */
-    &SwigPyBuiltin__CryptIter_type.as_sequence,                   /* tp_as_sequence */
-    &SwigPyBuiltin__CryptIter_type.as_mapping,/* tp_as_mapping */
+    &SwigPyBuiltin__CertIter_type.as_number,  /* tp_as_number */
+    &SwigPyBuiltin__CertIter_type.as_sequence,/* tp_as_sequence */
+    &SwigPyBuiltin__CertIter_type.as_mapping, /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__CryptIter_type.as_buffer, /* tp_as_buffer */
+    &SwigPyBuiltin__CertIter_type.as_buffer,  /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::CryptIter",                            /* tp_doc */
+    "::CertIter",                             /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__CryptIter_richcompare,           /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__CertIter_richcompare,            /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) (getiterfunc) _wrap_CryptIter___iter___getiterfunc_closure,/* tp_iter */
-    (iternextfunc) (iternextfunc) _wrap_CryptIter_next_iternextfunc_closure,/* tp_iternext */
-    SwigPyBuiltin__CryptIter_methods,         /* tp_methods */
+    (getiterfunc) (getiterfunc) _wrap_CertIter___iter___getiterfunc_closure,/* tp_iter */
+    (iternextfunc) (iternextfunc) _wrap_CertIter_next_iternextfunc_closure,/* tp_iternext */
+    SwigPyBuiltin__CertIter_methods,          /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__CryptIter_getset,          /* tp_getset */
+    SwigPyBuiltin__CertIter_getset,           /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CryptIter,           /* tp_init */
+    (initproc) _wrap_new_CertIter,            /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -18208,20 +20074,29 @@ static PyHeapTypeObject SwigPyBuiltin__CryptIter_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__CryptIter_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CryptIter_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__CertIter_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertIter_type};
 
-static SwigPyGetSet Crypt___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet Crypt_parent_getset = { _wrap_Crypt_parent_get, _wrap_Crypt_parent_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__Crypt_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"Crypt.__dict__", (void *) &Crypt___dict___getset }
+static SwigPyGetSet CertFind_enctype_getset = { _wrap_CertFind_enctype_get, _wrap_CertFind_enctype_set };
+static SwigPyGetSet CertFind___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet CertFind_param_getset = { _wrap_CertFind_param_get, _wrap_CertFind_param_set };
+static SwigPyGetSet CertFind_chb_getset = { _wrap_CertFind_chb_get, _wrap_CertFind_chb_set };
+static SwigPyGetSet CertFind_findtype_getset = { _wrap_CertFind_findtype_get, _wrap_CertFind_findtype_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__CertFind_getset[] = {
+    { (char *) "enctype", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertFind.enctype", (void *) &CertFind_enctype_getset }
 ,
-    { (char *) "parent", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"Crypt.parent", (void *) &Crypt_parent_getset }
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertFind.__dict__", (void *) &CertFind___dict___getset }
+,
+    { (char *) "param", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertFind.param", (void *) &CertFind_param_getset }
+,
+    { (char *) "chb", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertFind.chb", (void *) &CertFind_chb_getset }
+,
+    { (char *) "findtype", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertFind.findtype", (void *) &CertFind_findtype_getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__Crypt_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__CertFind_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -18239,105 +20114,13 @@ SwigPyBuiltin__Crypt_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__Crypt_methods[] = {
-  { "name", (PyCFunction) _wrap_Crypt_name, METH_VARARGS, (char *) "name() -> char *" },
-  { "uniq_name", (PyCFunction) _wrap_Crypt_uniq_name, METH_VARARGS, (char *) "uniq_name() -> char *" },
-  { "prov_name", (PyCFunction) _wrap_Crypt_prov_name, METH_VARARGS, (char *) "prov_name() -> char *" },
-  { "prov_type", (PyCFunction) _wrap_Crypt_prov_type, METH_VARARGS, (char *) "prov_type() -> DWORD" },
-  { "create_key", (PyCFunction) _wrap_Crypt_create_key, METH_VARARGS, (char *) "\n"
-		"create_key(flags, keyspec=1) -> Key\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"flags: DWORD\n"
-		"keyspec: DWORD\n"
-		"\n"
-		"create_key(flags) -> Key\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"flags: DWORD\n"
-		"\n"
-		"" },
-  { "get_key", (PyCFunction) _wrap_Crypt_get_key, METH_VARARGS, (char *) "\n"
-		"get_key(keyspec=1) -> Key\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"keyspec: DWORD\n"
-		"\n"
-		"get_key() -> Key\n"
-		"" },
-  { "import_key", (PyCFunction) _wrap_Crypt_import_key, METH_VARARGS, (char *) "\n"
-		"import_key(STRING, decrypt=None) -> Key\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"decrypt: Key *\n"
-		"\n"
-		"import_key(STRING) -> Key\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"\n"
-		"" },
-  { "set_password", (PyCFunction) _wrap_Crypt_set_password, METH_VARARGS, (char *) "\n"
-		"set_password(pin, keyspec=1)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"pin: char *\n"
-		"keyspec: DWORD\n"
-		"\n"
-		"set_password(pin)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"pin: char *\n"
-		"\n"
-		"" },
-  { "change_password", (PyCFunction) _wrap_Crypt_change_password, METH_VARARGS, (char *) "\n"
-		"change_password(pin)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"pin: char *\n"
-		"\n"
-		"" },
-  { "public_key", (PyCFunction) _wrap_Crypt_public_key, METH_VARARGS, (char *) "\n"
-		"public_key(keyspec=1)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"keyspec: DWORD\n"
-		"\n"
-		"public_key()\n"
-		"" },
-  { "import_public_key_info", (PyCFunction) _wrap_Crypt_import_public_key_info, METH_VARARGS, (char *) "\n"
-		"import_public_key_info(pcert) -> Key\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"pcert: Cert *\n"
-		"\n"
-		"" },
-  { "remove", (PyCFunction) _wrap_Crypt_remove, METH_STATIC|METH_VARARGS, (char *) "\n"
-		"remove(STRING, type, name)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"type: DWORD\n"
-		"name: char *\n"
-		"\n"
-		"" },
-  { "enumerate", (PyCFunction) _wrap_Crypt_enumerate, METH_STATIC|METH_VARARGS, (char *) "enumerate() -> CryptIter" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__CertFind_methods[] = {
+  { "next", (PyCFunction) _wrap_CertFind_next, METH_VARARGS, (char *) "next() -> Cert" },
+  { "__iter__", (PyCFunction) _wrap_CertFind___iter__, METH_VARARGS, (char *) "__iter__() -> CertFind" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__Crypt_type = {
+static PyHeapTypeObject SwigPyBuiltin__CertFind_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -18345,10 +20128,10 @@ static PyHeapTypeObject SwigPyBuiltin__Crypt_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.Crypt",                              /* tp_name */
+    "csp.CertFind",                           /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_Crypt_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CertFind_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -18358,36 +20141,36 @@ static PyHeapTypeObject SwigPyBuiltin__Crypt_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__Crypt_type.as_number,     /* tp_as_number */
-    &SwigPyBuiltin__Crypt_type.as_sequence,   /* tp_as_sequence */
-    &SwigPyBuiltin__Crypt_type.as_mapping,    /* tp_as_mapping */
+    &SwigPyBuiltin__CertFind_type.as_number,  /* tp_as_number */
+    &SwigPyBuiltin__CertFind_type.as_sequence,/* tp_as_sequence */
+    &SwigPyBuiltin__CertFind_type.as_mapping, /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__Crypt_type.as_buffer,     /* tp_as_buffer */
+    &SwigPyBuiltin__CertFind_type.as_buffer,  /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::Crypt",                                /* tp_doc */
+    "::CertFind",                             /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__Crypt_richcompare,               /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__CertFind_richcompare,            /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) 0,                          /* tp_iter */
-    (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__Crypt_methods,             /* tp_methods */
+    (getiterfunc) (getiterfunc) _wrap_CertFind___iter___getiterfunc_closure,/* tp_iter */
+    (iternextfunc) (iternextfunc) _wrap_CertFind_next_iternextfunc_closure,/* tp_iternext */
+    SwigPyBuiltin__CertFind_methods,          /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__Crypt_getset,              /* tp_getset */
+    SwigPyBuiltin__CertFind_getset,           /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_Crypt,               /* tp_init */
+    (initproc) _wrap_new_CertFind,            /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -18525,17 +20308,17 @@ static PyHeapTypeObject SwigPyBuiltin__Crypt_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__Crypt_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Crypt_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__CertFind_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertFind_type};
 
-static SwigPyGetSet CSPInfo___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__CSPInfo_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CSPInfo.__dict__", (void *) &CSPInfo___dict___getset }
+static SwigPyGetSet CertStore___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__CertStore_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertStore.__dict__", (void *) &CertStore___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__CSPInfo_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__CertStore_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -18553,21 +20336,44 @@ SwigPyBuiltin__CSPInfo_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__CSPInfo_methods[] = {
-  { "free_space", (PyCFunction) _wrap_CSPInfo_free_space, METH_VARARGS, (char *) "free_space() -> DWORD" },
-  { "number_ul", (PyCFunction) _wrap_CSPInfo_number_ul, METH_VARARGS, (char *) "number_ul() -> DWORD" },
-  { "number_signs", (PyCFunction) _wrap_CSPInfo_number_signs, METH_VARARGS, (char *) "number_signs() -> DWORD" },
-  { "number_changes", (PyCFunction) _wrap_CSPInfo_number_changes, METH_VARARGS, (char *) "number_changes() -> DWORD" },
-  { "number_kcards", (PyCFunction) _wrap_CSPInfo_number_kcards, METH_VARARGS, (char *) "number_kcards() -> DWORD" },
-  { "number_keys", (PyCFunction) _wrap_CSPInfo_number_keys, METH_VARARGS, (char *) "number_keys() -> DWORD" },
-  { "keys_remaining", (PyCFunction) _wrap_CSPInfo_keys_remaining, METH_VARARGS, (char *) "keys_remaining() -> DWORD" },
-  { "time", (PyCFunction) _wrap_CSPInfo_time, METH_VARARGS, (char *) "time() -> DWORD" },
-  { "bytes", (PyCFunction) _wrap_CSPInfo_bytes, METH_VARARGS, (char *) "bytes()" },
-  { "version", (PyCFunction) _wrap_CSPInfo_version, METH_VARARGS, (char *) "version() -> WORD" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__CertStore_methods[] = {
+  { "__iter__", (PyCFunction) _wrap_CertStore___iter__, METH_VARARGS, (char *) "__iter__() -> CertIter" },
+  { "find_by_thumb", (PyCFunction) _wrap_CertStore_find_by_thumb, METH_VARARGS, (char *) "\n"
+		"find_by_thumb(STRING) -> CertFind\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "find_by_name", (PyCFunction) _wrap_CertStore_find_by_name, METH_VARARGS, (char *) "\n"
+		"find_by_name(STRING) -> CertFind\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "get_cert_by_info", (PyCFunction) _wrap_CertStore_get_cert_by_info, METH_VARARGS, (char *) "\n"
+		"get_cert_by_info(ci) -> Cert\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"ci: CertInfo *\n"
+		"\n"
+		"" },
+  { "add_cert", (PyCFunction) _wrap_CertStore_add_cert, METH_VARARGS, (char *) "\n"
+		"add_cert(c) -> Cert\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"c: Cert *\n"
+		"\n"
+		"" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__CSPInfo_type = {
+static PyHeapTypeObject SwigPyBuiltin__CertStore_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -18575,10 +20381,10 @@ static PyHeapTypeObject SwigPyBuiltin__CSPInfo_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CSPInfo",                            /* tp_name */
+    "csp.CertStore",                          /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CSPInfo_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CertStore_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -18588,36 +20394,36 @@ static PyHeapTypeObject SwigPyBuiltin__CSPInfo_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__CSPInfo_type.as_number,   /* tp_as_number */
-    &SwigPyBuiltin__CSPInfo_type.as_sequence, /* tp_as_sequence */
-    &SwigPyBuiltin__CSPInfo_type.as_mapping,  /* tp_as_mapping */
+    &SwigPyBuiltin__CertStore_type.as_number, /* tp_as_number */
+    &SwigPyBuiltin__CertStore_type.as_sequence,                   /* tp_as_sequence */
+    &SwigPyBuiltin__CertStore_type.as_mapping,/* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__CSPInfo_type.as_buffer,   /* tp_as_buffer */
+    &SwigPyBuiltin__CertStore_type.as_buffer, /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::CSPInfo",                              /* tp_doc */
+    "::CertStore",                            /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__CSPInfo_richcompare,             /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__CertStore_richcompare,           /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) 0,                          /* tp_iter */
+    (getiterfunc) (getiterfunc) _wrap_CertStore___iter___getiterfunc_closure,/* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__CSPInfo_methods,           /* tp_methods */
+    SwigPyBuiltin__CertStore_methods,         /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__CSPInfo_getset,            /* tp_getset */
+    SwigPyBuiltin__CertStore_getset,          /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CSPInfo,             /* tp_init */
+    (initproc) _wrap_new_CertStore,           /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -18755,17 +20561,17 @@ static PyHeapTypeObject SwigPyBuiltin__CSPInfo_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__CSPInfo_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CSPInfo_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__CertStore_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertStore_type};
 
-static SwigPyGetSet Key___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__Key_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"Key.__dict__", (void *) &Key___dict___getset }
+static SwigPyGetSet EKUIter___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__EKUIter_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"EKUIter.__dict__", (void *) &EKUIter___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__Key_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__EKUIter_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -18783,79 +20589,13 @@ SwigPyBuiltin__Key_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__Key_methods[] = {
-  { "encode", (PyCFunction) _wrap_Key_encode, METH_VARARGS, (char *) "\n"
-		"encode(cryptkey=None)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"cryptkey: Key *\n"
-		"\n"
-		"encode()\n"
-		"" },
-  { "store_cert", (PyCFunction) _wrap_Key_store_cert, METH_VARARGS, (char *) "\n"
-		"store_cert(c)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"c: Cert *\n"
-		"\n"
-		"" },
-  { "extract_cert", (PyCFunction) _wrap_Key_extract_cert, METH_VARARGS, (char *) "extract_cert()" },
-  { "encrypt", (PyCFunction) _wrap_Key_encrypt, METH_VARARGS, (char *) "\n"
-		"encrypt(STRING)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"\n"
-		"" },
-  { "decrypt", (PyCFunction) _wrap_Key_decrypt, METH_VARARGS, (char *) "\n"
-		"decrypt(STRING)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"\n"
-		"" },
-  { "set_alg_id", (PyCFunction) _wrap_Key_set_alg_id, METH_VARARGS, (char *) "\n"
-		"set_alg_id(id)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"id: ALG_ID\n"
-		"\n"
-		"" },
-  { "set_mode", (PyCFunction) _wrap_Key_set_mode, METH_VARARGS, (char *) "\n"
-		"set_mode(mode)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"mode: DWORD\n"
-		"\n"
-		"" },
-  { "alg_id", (PyCFunction) _wrap_Key_alg_id, METH_VARARGS, (char *) "alg_id() -> ALG_ID" },
-  { "get_iv", (PyCFunction) _wrap_Key_get_iv, METH_VARARGS, (char *) "get_iv()" },
-  { "set_iv", (PyCFunction) _wrap_Key_set_iv, METH_VARARGS, (char *) "\n"
-		"set_iv(STRING)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"\n"
-		"" },
-  { "set_padding", (PyCFunction) _wrap_Key_set_padding, METH_VARARGS, (char *) "\n"
-		"set_padding(padding)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"padding: DWORD\n"
-		"\n"
-		"" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__EKUIter_methods[] = {
+  { "__iter__", (PyCFunction) _wrap_EKUIter___iter__, METH_VARARGS, (char *) "__iter__() -> EKUIter" },
+  { "next", (PyCFunction) _wrap_EKUIter_next, METH_VARARGS, (char *) "next()" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__Key_type = {
+static PyHeapTypeObject SwigPyBuiltin__EKUIter_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -18863,10 +20603,10 @@ static PyHeapTypeObject SwigPyBuiltin__Key_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.Key",                                /* tp_name */
+    "csp.EKUIter",                            /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_Key_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_EKUIter_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -18876,36 +20616,36 @@ static PyHeapTypeObject SwigPyBuiltin__Key_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__Key_type.as_number,       /* tp_as_number */
-    &SwigPyBuiltin__Key_type.as_sequence,     /* tp_as_sequence */
-    &SwigPyBuiltin__Key_type.as_mapping,      /* tp_as_mapping */
+    &SwigPyBuiltin__EKUIter_type.as_number,   /* tp_as_number */
+    &SwigPyBuiltin__EKUIter_type.as_sequence, /* tp_as_sequence */
+    &SwigPyBuiltin__EKUIter_type.as_mapping,  /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__Key_type.as_buffer,       /* tp_as_buffer */
+    &SwigPyBuiltin__EKUIter_type.as_buffer,   /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::Key",                                  /* tp_doc */
+    "::EKUIter",                              /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__Key_richcompare,                 /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__EKUIter_richcompare,             /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) 0,                          /* tp_iter */
-    (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__Key_methods,               /* tp_methods */
+    (getiterfunc) (getiterfunc) _wrap_EKUIter___iter___getiterfunc_closure,/* tp_iter */
+    (iternextfunc) (iternextfunc) _wrap_EKUIter_next_iternextfunc_closure,/* tp_iternext */
+    SwigPyBuiltin__EKUIter_methods,           /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__Key_getset,                /* tp_getset */
+    SwigPyBuiltin__EKUIter_getset,            /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_Key,                 /* tp_init */
+    (initproc) _wrap_new_EKUIter,             /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -19043,17 +20783,17 @@ static PyHeapTypeObject SwigPyBuiltin__Key_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__Key_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Key_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__EKUIter_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__EKUIter_type};
 
-static SwigPyGetSet Cert___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__Cert_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"Cert.__dict__", (void *) &Cert___dict___getset }
+static SwigPyGetSet CertInfo___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__CertInfo_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertInfo.__dict__", (void *) &CertInfo___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__Cert_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__CertInfo_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -19064,56 +20804,44 @@ SwigPyBuiltin__Cert_richcompare(PyObject *self, PyObject *other, int op) {
       result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
     } else {
       result = Py_NotImplemented;
-      Py_INCREF(result);
-    }
-  }
-  Py_DECREF(tuple);
-  return result;
-}
-
-SWIGINTERN PyMethodDef SwigPyBuiltin__Cert_methods[] = {
-  { "duplicate", (PyCFunction) _wrap_Cert_duplicate, METH_VARARGS, (char *) "duplicate() -> Cert" },
-  { "remove_from_store", (PyCFunction) _wrap_Cert_remove_from_store, METH_VARARGS, (char *) "remove_from_store()" },
-  { "self_sign", (PyCFunction) _wrap_Cert_self_sign, METH_STATIC|METH_VARARGS, (char *) "\n"
-		"self_sign(ctx, STRING) -> Cert\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"ctx: Crypt *\n"
-		"STRING: BYTE *\n"
-		"\n"
-		"" },
-  { "extract", (PyCFunction) _wrap_Cert_extract, METH_VARARGS, (char *) "extract()" },
-  { "thumbprint", (PyCFunction) _wrap_Cert_thumbprint, METH_VARARGS, (char *) "thumbprint()" },
-  { "subject_id", (PyCFunction) _wrap_Cert_subject_id, METH_VARARGS, (char *) "subject_id()" },
-  { "bind", (PyCFunction) _wrap_Cert_bind, METH_VARARGS, (char *) "\n"
-		"bind(ctx, keyspec=1)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"ctx: Crypt *\n"
-		"keyspec: DWORD\n"
-		"\n"
-		"bind(ctx)\n"
+      Py_INCREF(result);
+    }
+  }
+  Py_DECREF(tuple);
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__CertInfo_methods[] = {
+  { "version", (PyCFunction) _wrap_CertInfo_version, METH_VARARGS, (char *) "version() -> DWORD" },
+  { "issuer", (PyCFunction) _wrap_CertInfo_issuer, METH_VARARGS, (char *) "\n"
+		"issuer(decode=True)\n"
 		"\n"
 		"Parameters\n"
 		"----------\n"
-		"ctx: Crypt *\n"
+		"decode: bool\n"
 		"\n"
+		"issuer()\n"
 		"" },
-  { "set_pin", (PyCFunction) _wrap_Cert_set_pin, METH_VARARGS, (char *) "\n"
-		"set_pin(pin)\n"
+  { "name", (PyCFunction) _wrap_CertInfo_name, METH_VARARGS, (char *) "\n"
+		"name(decode=True)\n"
 		"\n"
 		"Parameters\n"
 		"----------\n"
-		"pin: char *\n"
+		"decode: bool\n"
 		"\n"
+		"name()\n"
 		"" },
-  { "eku", (PyCFunction) _wrap_Cert_eku, METH_VARARGS, (char *) "eku() -> EKUIter" },
+  { "not_before", (PyCFunction) _wrap_CertInfo_not_before, METH_VARARGS, (char *) "not_before()" },
+  { "not_after", (PyCFunction) _wrap_CertInfo_not_after, METH_VARARGS, (char *) "not_after()" },
+  { "usage", (PyCFunction) _wrap_CertInfo_usage, METH_VARARGS, (char *) "usage() -> BYTE" },
+  { "sign_algorithm", (PyCFunction) _wrap_CertInfo_sign_algorithm, METH_VARARGS, (char *) "sign_algorithm() -> char *" },
+  { "public_key_algorithm", (PyCFunction) _wrap_CertInfo_public_key_algorithm, METH_VARARGS, (char *) "public_key_algorithm() -> char *" },
+  { "serial", (PyCFunction) _wrap_CertInfo_serial, METH_VARARGS, (char *) "serial()" },
+  { "extensions", (PyCFunction) _wrap_CertInfo_extensions, METH_VARARGS, (char *) "extensions() -> ExtIter" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__Cert_type = {
+static PyHeapTypeObject SwigPyBuiltin__CertInfo_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -19121,10 +20849,10 @@ static PyHeapTypeObject SwigPyBuiltin__Cert_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.Cert",                               /* tp_name */
+    "csp.CertInfo",                           /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_Cert_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CertInfo_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -19134,36 +20862,36 @@ static PyHeapTypeObject SwigPyBuiltin__Cert_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__Cert_type.as_number,      /* tp_as_number */
-    &SwigPyBuiltin__Cert_type.as_sequence,    /* tp_as_sequence */
-    &SwigPyBuiltin__Cert_type.as_mapping,     /* tp_as_mapping */
+    &SwigPyBuiltin__CertInfo_type.as_number,  /* tp_as_number */
+    &SwigPyBuiltin__CertInfo_type.as_sequence,/* tp_as_sequence */
+    &SwigPyBuiltin__CertInfo_type.as_mapping, /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__Cert_type.as_buffer,      /* tp_as_buffer */
+    &SwigPyBuiltin__CertInfo_type.as_buffer,  /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::Cert",                                 /* tp_doc */
+    "::CertInfo",                             /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__Cert_richcompare,                /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__CertInfo_richcompare,            /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) (getiterfunc) _wrap_Cert_eku_getiterfunc_closure,/* tp_iter */
+    (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__Cert_methods,              /* tp_methods */
+    SwigPyBuiltin__CertInfo_methods,          /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__Cert_getset,               /* tp_getset */
+    SwigPyBuiltin__CertInfo_getset,           /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_Cert,                /* tp_init */
+    (initproc) _wrap_new_CertInfo,            /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -19301,26 +21029,17 @@ static PyHeapTypeObject SwigPyBuiltin__Cert_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__Cert_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Cert_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__CertInfo_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertInfo_type};
 
-static SwigPyGetSet CertIter_iter_getset = { _wrap_CertIter_iter_get, _wrap_CertIter_iter_set };
-static SwigPyGetSet CertIter___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet CertIter_parent_getset = { _wrap_CertIter_parent_get, _wrap_CertIter_parent_set };
-static SwigPyGetSet CertIter_pcert_getset = { _wrap_CertIter_pcert_get, _wrap_CertIter_pcert_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__CertIter_getset[] = {
-    { (char *) "iter", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertIter.iter", (void *) &CertIter_iter_getset }
-,
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertIter.__dict__", (void *) &CertIter___dict___getset }
-,
-    { (char *) "parent", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertIter.parent", (void *) &CertIter_parent_getset }
-,
-    { (char *) "pcert", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertIter.pcert", (void *) &CertIter_pcert_getset }
+static SwigPyGetSet ExtIter___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__ExtIter_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"ExtIter.__dict__", (void *) &ExtIter___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__CertIter_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__ExtIter_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -19338,13 +21057,13 @@ SwigPyBuiltin__CertIter_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__CertIter_methods[] = {
-  { "__iter__", (PyCFunction) _wrap_CertIter___iter__, METH_VARARGS, (char *) "__iter__() -> CertIter" },
-  { "next", (PyCFunction) _wrap_CertIter_next, METH_VARARGS, (char *) "next() -> Cert" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__ExtIter_methods[] = {
+  { "__iter__", (PyCFunction) _wrap_ExtIter___iter__, METH_VARARGS, (char *) "__iter__() -> ExtIter" },
+  { "next", (PyCFunction) _wrap_ExtIter_next, METH_VARARGS, (char *) "next() -> CertExtension" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__CertIter_type = {
+static PyHeapTypeObject SwigPyBuiltin__ExtIter_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -19352,10 +21071,10 @@ static PyHeapTypeObject SwigPyBuiltin__CertIter_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CertIter",                           /* tp_name */
+    "csp.ExtIter",                            /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CertIter_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_ExtIter_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -19365,36 +21084,36 @@ static PyHeapTypeObject SwigPyBuiltin__CertIter_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__CertIter_type.as_number,  /* tp_as_number */
-    &SwigPyBuiltin__CertIter_type.as_sequence,/* tp_as_sequence */
-    &SwigPyBuiltin__CertIter_type.as_mapping, /* tp_as_mapping */
+    &SwigPyBuiltin__ExtIter_type.as_number,   /* tp_as_number */
+    &SwigPyBuiltin__ExtIter_type.as_sequence, /* tp_as_sequence */
+    &SwigPyBuiltin__ExtIter_type.as_mapping,  /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__CertIter_type.as_buffer,  /* tp_as_buffer */
+    &SwigPyBuiltin__ExtIter_type.as_buffer,   /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::CertIter",                             /* tp_doc */
+    "::ExtIter",                              /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__CertIter_richcompare,            /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__ExtIter_richcompare,             /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) (getiterfunc) _wrap_CertIter___iter___getiterfunc_closure,/* tp_iter */
-    (iternextfunc) (iternextfunc) _wrap_CertIter_next_iternextfunc_closure,/* tp_iternext */
-    SwigPyBuiltin__CertIter_methods,          /* tp_methods */
+    (getiterfunc) (getiterfunc) _wrap_ExtIter___iter___getiterfunc_closure,/* tp_iter */
+    (iternextfunc) (iternextfunc) _wrap_ExtIter_next_iternextfunc_closure,/* tp_iternext */
+    SwigPyBuiltin__ExtIter_methods,           /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__CertIter_getset,           /* tp_getset */
+    SwigPyBuiltin__ExtIter_getset,            /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CertIter,            /* tp_init */
+    (initproc) _wrap_new_ExtIter,             /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -19532,29 +21251,17 @@ static PyHeapTypeObject SwigPyBuiltin__CertIter_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__CertIter_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertIter_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__ExtIter_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__ExtIter_type};
 
-static SwigPyGetSet CertFind_enctype_getset = { _wrap_CertFind_enctype_get, _wrap_CertFind_enctype_set };
-static SwigPyGetSet CertFind___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet CertFind_param_getset = { _wrap_CertFind_param_get, _wrap_CertFind_param_set };
-static SwigPyGetSet CertFind_chb_getset = { _wrap_CertFind_chb_get, _wrap_CertFind_chb_set };
-static SwigPyGetSet CertFind_findtype_getset = { _wrap_CertFind_findtype_get, _wrap_CertFind_findtype_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__CertFind_getset[] = {
-    { (char *) "enctype", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertFind.enctype", (void *) &CertFind_enctype_getset }
-,
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertFind.__dict__", (void *) &CertFind___dict___getset }
-,
-    { (char *) "param", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertFind.param", (void *) &CertFind_param_getset }
-,
-    { (char *) "chb", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertFind.chb", (void *) &CertFind_chb_getset }
-,
-    { (char *) "findtype", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"CertFind.findtype", (void *) &CertFind_findtype_getset }
+static SwigPyGetSet CryptMsg___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__CryptMsg_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CryptMsg.__dict__", (void *) &CryptMsg___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__CertFind_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__CryptMsg_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -19572,13 +21279,113 @@ SwigPyBuiltin__CertFind_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__CertFind_methods[] = {
-  { "next", (PyCFunction) _wrap_CertFind_next, METH_VARARGS, (char *) "next() -> Cert" },
-  { "__iter__", (PyCFunction) _wrap_CertFind___iter__, METH_VARARGS, (char *) "__iter__() -> CertFind" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__CryptMsg_methods[] = {
+  { "decrypt_by_cert", (PyCFunction) _wrap_CryptMsg_decrypt_by_cert, METH_VARARGS, (char *) "\n"
+		"decrypt_by_cert(crt)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"crt: Cert *\n"
+		"\n"
+		"" },
+  { "num_signers", (PyCFunction) _wrap_CryptMsg_num_signers, METH_VARARGS, (char *) "num_signers() -> int" },
+  { "get_data", (PyCFunction) _wrap_CryptMsg_get_data, METH_VARARGS, (char *) "get_data()" },
+  { "data_size", (PyCFunction) _wrap_CryptMsg_data_size, METH_VARARGS, (char *) "data_size() -> DWORD" },
+  { "get_data_into", (PyCFunction) _wrap_CryptMsg_get_data_into, METH_VARARGS, (char *) "\n"
+		"get_data_into(OUTBUF) -> DWORD\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"OUTBUF: BYTE *\n"
+		"\n"
+		"" },
+  { "verify_cert", (PyCFunction) _wrap_CryptMsg_verify_cert, METH_VARARGS, (char *) "\n"
+		"verify_cert(c) -> bool\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"c: Cert *\n"
+		"\n"
+		"" },
+  { "get_type", (PyCFunction) _wrap_CryptMsg_get_type, METH_VARARGS, (char *) "get_type() -> DWORD" },
+  { "add_recipient", (PyCFunction) _wrap_CryptMsg_add_recipient, METH_VARARGS, (char *) "\n"
+		"add_recipient(c)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"c: Cert *\n"
+		"\n"
+		"" },
+  { "encrypt_data", (PyCFunction) _wrap_CryptMsg_encrypt_data, METH_VARARGS, (char *) "\n"
+		"encrypt_data(STRING)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "decrypt", (PyCFunction) _wrap_CryptMsg_decrypt, METH_VARARGS, (char *) "\n"
+		"decrypt(store)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"store: CertStore *\n"
+		"\n"
+		"" },
+  { "sign_data", (PyCFunction) _wrap_CryptMsg_sign_data, METH_VARARGS, (char *) "\n"
+		"sign_data(STRING, signer, detach=False)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"signer: Cert *\n"
+		"detach: bool\n"
+		"\n"
+		"sign_data(STRING, signer)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"signer: Cert *\n"
+		"\n"
+		"" },
+  { "sign", (PyCFunction) _wrap_CryptMsg_sign, METH_VARARGS, (char *) "\n"
+		"sign(STRING, signer, detach=False)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"signer: Cert *\n"
+		"detach: bool\n"
+		"\n"
+		"sign(STRING, signer)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"signer: Cert *\n"
+		"\n"
+		"" },
+  { "encrypt", (PyCFunction) _wrap_CryptMsg_encrypt, METH_VARARGS, (char *) "\n"
+		"encrypt(STRING)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "verify", (PyCFunction) _wrap_CryptMsg_verify, METH_VARARGS, (char *) "\n"
+		"verify(n) -> bool\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"n: DWORD\n"
+		"\n"
+		"" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__CertFind_type = {
+static PyHeapTypeObject SwigPyBuiltin__CryptMsg_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -19586,10 +21393,10 @@ static PyHeapTypeObject SwigPyBuiltin__CertFind_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CertFind",                           /* tp_name */
+    "csp.CryptMsg",                           /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CertFind_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CryptMsg_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -19599,36 +21406,36 @@ static PyHeapTypeObject SwigPyBuiltin__CertFind_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__CertFind_type.as_number,  /* tp_as_number */
-    &SwigPyBuiltin__CertFind_type.as_sequence,/* tp_as_sequence */
-    &SwigPyBuiltin__CertFind_type.as_mapping, /* tp_as_mapping */
+    &SwigPyBuiltin__CryptMsg_type.as_number,  /* tp_as_number */
+    &SwigPyBuiltin__CryptMsg_type.as_sequence,/* tp_as_sequence */
+    &SwigPyBuiltin__CryptMsg_type.as_mapping, /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__CertFind_type.as_buffer,  /* tp_as_buffer */
+    &SwigPyBuiltin__CryptMsg_type.as_buffer,  /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::CertFind",                             /* tp_doc */
+    "::CryptMsg",                             /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__CertFind_richcompare,            /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__CryptMsg_richcompare,            /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) (getiterfunc) _wrap_CertFind___iter___getiterfunc_closure,/* tp_iter */
-    (iternextfunc) (iternextfunc) _wrap_CertFind_next_iternextfunc_closure,/* tp_iternext */
-    SwigPyBuiltin__CertFind_methods,          /* tp_methods */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__CryptMsg_methods,          /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__CertFind_getset,           /* tp_getset */
+    SwigPyBuiltin__CryptMsg_getset,           /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CertFind,            /* tp_init */
+    (initproc) _wrap_new_CryptMsg,            /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -19766,17 +21573,53 @@ static PyHeapTypeObject SwigPyBuiltin__CertFind_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__CertFind_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertFind_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__CryptMsg_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CryptMsg_type};
 
-static SwigPyGetSet CertStore___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__CertStore_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertStore.__dict__", (void *) &CertStore___dict___getset }
+static SwigPyGetSet CERT_INFO_cExtension_getset = { _wrap_CERT_INFO_cExtension_get, _wrap_CERT_INFO_cExtension_set };
+static SwigPyGetSet CERT_INFO_rgExtension_getset = { _wrap_CERT_INFO_rgExtension_get, _wrap_CERT_INFO_rgExtension_set };
+static SwigPyGetSet CERT_INFO_Issuer_getset = { _wrap_CERT_INFO_Issuer_get, _wrap_CERT_INFO_Issuer_set };
+static SwigPyGetSet CERT_INFO_NotBefore_getset = { _wrap_CERT_INFO_NotBefore_get, _wrap_CERT_INFO_NotBefore_set };
+static SwigPyGetSet CERT_INFO_Subject_getset = { _wrap_CERT_INFO_Subject_get, _wrap_CERT_INFO_Subject_set };
+static SwigPyGetSet CERT_INFO___dict___getset = { SwigPyObject_get___dict__, 0 };
+static SwigPyGetSet CERT_INFO_dwVersion_getset = { _wrap_CERT_INFO_dwVersion_get, _wrap_CERT_INFO_dwVersion_set };
+static SwigPyGetSet CERT_INFO_SerialNumber_getset = { _wrap_CERT_INFO_SerialNumber_get, _wrap_CERT_INFO_SerialNumber_set };
+static SwigPyGetSet CERT_INFO_SignatureAlgorithm_getset = { _wrap_CERT_INFO_SignatureAlgorithm_get, _wrap_CERT_INFO_SignatureAlgorithm_set };
+static SwigPyGetSet CERT_INFO_NotAfter_getset = { _wrap_CERT_INFO_NotAfter_get, _wrap_CERT_INFO_NotAfter_set };
+static SwigPyGetSet CERT_INFO_SubjectPublicKeyInfo_getset = { _wrap_CERT_INFO_SubjectPublicKeyInfo_get, _wrap_CERT_INFO_SubjectPublicKeyInfo_set };
+static SwigPyGetSet CERT_INFO_IssuerUniqueId_getset = { _wrap_CERT_INFO_IssuerUniqueId_get, _wrap_CERT_INFO_IssuerUniqueId_set };
+static SwigPyGetSet CERT_INFO_SubjectUniqueId_getset = { _wrap_CERT_INFO_SubjectUniqueId_get, _wrap_CERT_INFO_SubjectUniqueId_set };
+SWIGINTERN PyGetSetDef SwigPyBuiltin___CERT_INFO_getset[] = {
+    { (char *) "cExtension", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.cExtension", (void *) &CERT_INFO_cExtension_getset }
+,
+    { (char *) "rgExtension", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.rgExtension", (void *) &CERT_INFO_rgExtension_getset }
+,
+    { (char *) "Issuer", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.Issuer", (void *) &CERT_INFO_Issuer_getset }
+,
+    { (char *) "NotBefore", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.NotBefore", (void *) &CERT_INFO_NotBefore_getset }
+,
+    { (char *) "Subject", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.Subject", (void *) &CERT_INFO_Subject_getset }
+,
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_CERT_INFO.__dict__", (void *) &CERT_INFO___dict___getset }
+,
+    { (char *) "dwVersion", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.dwVersion", (void *) &CERT_INFO_dwVersion_getset }
+,
+    { (char *) "SerialNumber", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.SerialNumber", (void *) &CERT_INFO_SerialNumber_getset }
+,
+    { (char *) "SignatureAlgorithm", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.SignatureAlgorithm", (void *) &CERT_INFO_SignatureAlgorithm_getset }
+,
+    { (char *) "NotAfter", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.NotAfter", (void *) &CERT_INFO_NotAfter_getset }
+,
+    { (char *) "SubjectPublicKeyInfo", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.SubjectPublicKeyInfo", (void *) &CERT_INFO_SubjectPublicKeyInfo_getset }
+,
+    { (char *) "IssuerUniqueId", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.IssuerUniqueId", (void *) &CERT_INFO_IssuerUniqueId_getset }
+,
+    { (char *) "SubjectUniqueId", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.SubjectUniqueId", (void *) &CERT_INFO_SubjectUniqueId_getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__CertStore_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin___CERT_INFO_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -19794,44 +21637,11 @@ SwigPyBuiltin__CertStore_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__CertStore_methods[] = {
-  { "__iter__", (PyCFunction) _wrap_CertStore___iter__, METH_VARARGS, (char *) "__iter__() -> CertIter" },
-  { "find_by_thumb", (PyCFunction) _wrap_CertStore_find_by_thumb, METH_VARARGS, (char *) "\n"
-		"find_by_thumb(STRING) -> CertFind\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"\n"
-		"" },
-  { "find_by_name", (PyCFunction) _wrap_CertStore_find_by_name, METH_VARARGS, (char *) "\n"
-		"find_by_name(STRING) -> CertFind\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"\n"
-		"" },
-  { "get_cert_by_info", (PyCFunction) _wrap_CertStore_get_cert_by_info, METH_VARARGS, (char *) "\n"
-		"get_cert_by_info(ci) -> Cert\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"ci: CertInfo *\n"
-		"\n"
-		"" },
-  { "add_cert", (PyCFunction) _wrap_CertStore_add_cert, METH_VARARGS, (char *) "\n"
-		"add_cert(c) -> Cert\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"c: Cert *\n"
-		"\n"
-		"" },
+SWIGINTERN PyMethodDef SwigPyBuiltin___CERT_INFO_methods[] = {
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__CertStore_type = {
+static PyHeapTypeObject SwigPyBuiltin___CERT_INFO_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -19839,10 +21649,10 @@ static PyHeapTypeObject SwigPyBuiltin__CertStore_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CertStore",                          /* tp_name */
+    "csp.CERT_INFO",                          /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CertStore_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CERT_INFO_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -19852,36 +21662,36 @@ static PyHeapTypeObject SwigPyBuiltin__CertStore_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__CertStore_type.as_number, /* tp_as_number */
-    &SwigPyBuiltin__CertStore_type.as_sequence,                   /* tp_as_sequence */
-    &SwigPyBuiltin__CertStore_type.as_mapping,/* tp_as_mapping */
+    &SwigPyBuiltin___CERT_INFO_type.as_number,/* tp_as_number */
+    &SwigPyBuiltin___CERT_INFO_type.as_sequence,                  /* tp_as_sequence */
+    &SwigPyBuiltin___CERT_INFO_type.as_mapping,                   /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__CertStore_type.as_buffer, /* tp_as_buffer */
+    &SwigPyBuiltin___CERT_INFO_type.as_buffer,/* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::CertStore",                            /* tp_doc */
+    "::_CERT_INFO",                           /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__CertStore_richcompare,           /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin___CERT_INFO_richcompare,          /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) (getiterfunc) _wrap_CertStore___iter___getiterfunc_closure,/* tp_iter */
+    (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__CertStore_methods,         /* tp_methods */
+    SwigPyBuiltin___CERT_INFO_methods,        /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__CertStore_getset,          /* tp_getset */
+    SwigPyBuiltin___CERT_INFO_getset,         /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CertStore,           /* tp_init */
+    (initproc) _wrap_new_CERT_INFO,           /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -20019,17 +21829,17 @@ static PyHeapTypeObject SwigPyBuiltin__CertStore_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__CertStore_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertStore_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin___CERT_INFO_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___CERT_INFO_type};
 
-static SwigPyGetSet EKUIter___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__EKUIter_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"EKUIter.__dict__", (void *) &EKUIter___dict___getset }
+static SwigPyGetSet CertExtension___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__CertExtension_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertExtension.__dict__", (void *) &CertExtension___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__EKUIter_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__CertExtension_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -20047,13 +21857,12 @@ SwigPyBuiltin__EKUIter_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__EKUIter_methods[] = {
-  { "__iter__", (PyCFunction) _wrap_EKUIter___iter__, METH_VARARGS, (char *) "__iter__() -> EKUIter" },
-  { "next", (PyCFunction) _wrap_EKUIter_next, METH_VARARGS, (char *) "next()" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__CertExtension_methods[] = {
+  { "oid", (PyCFunction) _wrap_CertExtension_oid, METH_VARARGS, (char *) "oid()" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__EKUIter_type = {
+static PyHeapTypeObject SwigPyBuiltin__CertExtension_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -20061,10 +21870,10 @@ static PyHeapTypeObject SwigPyBuiltin__EKUIter_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.EKUIter",                            /* tp_name */
+    "csp.CertExtension",                      /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_EKUIter_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CertExtension_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -20074,36 +21883,36 @@ static PyHeapTypeObject SwigPyBuiltin__EKUIter_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__EKUIter_type.as_number,   /* tp_as_number */
-    &SwigPyBuiltin__EKUIter_type.as_sequence, /* tp_as_sequence */
-    &SwigPyBuiltin__EKUIter_type.as_mapping,  /* tp_as_mapping */
+    &SwigPyBuiltin__CertExtension_type.as_number,                 /* tp_as_number */
+    &SwigPyBuiltin__CertExtension_type.as_sequence,               /* tp_as_sequence */
+    &SwigPyBuiltin__CertExtension_type.as_mapping,                /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__EKUIter_type.as_buffer,   /* tp_as_buffer */
+    &SwigPyBuiltin__CertExtension_type.as_buffer,                 /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::EKUIter",                              /* tp_doc */
+    "::CertExtension",                        /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__EKUIter_richcompare,             /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__CertExtension_richcompare,       /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) (getiterfunc) _wrap_EKUIter___iter___getiterfunc_closure,/* tp_iter */
-    (iternextfunc) (iternextfunc) _wrap_EKUIter_next_iternextfunc_closure,/* tp_iternext */
-    SwigPyBuiltin__EKUIter_methods,           /* tp_methods */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__CertExtension_methods,     /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__EKUIter_getset,            /* tp_getset */
+    SwigPyBuiltin__CertExtension_getset,      /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_EKUIter,             /* tp_init */
+    (initproc) _wrap_new_CertExtension,       /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -20241,17 +22050,17 @@ static PyHeapTypeObject SwigPyBuiltin__EKUIter_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__EKUIter_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__EKUIter_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__CertExtension_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertExtension_type};
 
-static SwigPyGetSet CertInfo___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__CertInfo_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertInfo.__dict__", (void *) &CertInfo___dict___getset }
+static SwigPyGetSet Signature___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Signature_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"Signature.__dict__", (void *) &Signature___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__CertInfo_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__Signature_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -20269,37 +22078,37 @@ SwigPyBuiltin__CertInfo_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__CertInfo_methods[] = {
-  { "version", (PyCFunction) _wrap_CertInfo_version, METH_VARARGS, (char *) "version() -> DWORD" },
-  { "issuer", (PyCFunction) _wrap_CertInfo_issuer, METH_VARARGS, (char *) "\n"
-		"issuer(decode=True)\n"
+SWIGINTERN PyMethodDef SwigPyBuiltin__Signature_methods[] = {
+  { "verify_data", (PyCFunction) _wrap_Signature_verify_data, METH_VARARGS, (char *) "\n"
+		"verify_data(STRING, n) -> bool\n"
 		"\n"
 		"Parameters\n"
 		"----------\n"
-		"decode: bool\n"
+		"STRING: BYTE *\n"
+		"n: int\n"
 		"\n"
-		"issuer()\n"
 		"" },
-  { "name", (PyCFunction) _wrap_CertInfo_name, METH_VARARGS, (char *) "\n"
-		"name(decode=True)\n"
+  { "sign_data", (PyCFunction) _wrap_Signature_sign_data, METH_VARARGS, (char *) "\n"
+		"sign_data(STRING, signer, detach=True)\n"
 		"\n"
 		"Parameters\n"
 		"----------\n"
-		"decode: bool\n"
+		"STRING: BYTE *\n"
+		"signer: Cert *\n"
+		"detach: bool\n"
+		"\n"
+		"sign_data(STRING, signer)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"signer: Cert *\n"
 		"\n"
-		"name()\n"
 		"" },
-  { "not_before", (PyCFunction) _wrap_CertInfo_not_before, METH_VARARGS, (char *) "not_before()" },
-  { "not_after", (PyCFunction) _wrap_CertInfo_not_after, METH_VARARGS, (char *) "not_after()" },
-  { "usage", (PyCFunction) _wrap_CertInfo_usage, METH_VARARGS, (char *) "usage() -> BYTE" },
-  { "sign_algorithm", (PyCFunction) _wrap_CertInfo_sign_algorithm, METH_VARARGS, (char *) "sign_algorithm() -> char *" },
-  { "public_key_algorithm", (PyCFunction) _wrap_CertInfo_public_key_algorithm, METH_VARARGS, (char *) "public_key_algorithm() -> char *" },
-  { "serial", (PyCFunction) _wrap_CertInfo_serial, METH_VARARGS, (char *) "serial()" },
-  { "extensions", (PyCFunction) _wrap_CertInfo_extensions, METH_VARARGS, (char *) "extensions() -> ExtIter" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__CertInfo_type = {
+static PyHeapTypeObject SwigPyBuiltin__Signature_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -20307,10 +22116,10 @@ static PyHeapTypeObject SwigPyBuiltin__CertInfo_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CertInfo",                           /* tp_name */
+    "csp.Signature",                          /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CertInfo_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_Signature_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -20320,36 +22129,36 @@ static PyHeapTypeObject SwigPyBuiltin__CertInfo_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__CertInfo_type.as_number,  /* tp_as_number */
-    &SwigPyBuiltin__CertInfo_type.as_sequence,/* tp_as_sequence */
-    &SwigPyBuiltin__CertInfo_type.as_mapping, /* tp_as_mapping */
+    &SwigPyBuiltin__Signature_type.as_number, /* tp_as_number */
+    &SwigPyBuiltin__Signature_type.as_sequence,                   /* tp_as_sequence */
+    &SwigPyBuiltin__Signature_type.as_mapping,/* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__CertInfo_type.as_buffer,  /* tp_as_buffer */
+    &SwigPyBuiltin__Signature_type.as_buffer, /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::CertInfo",                             /* tp_doc */
+    "::Signature",                            /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__CertInfo_richcompare,            /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__Signature_richcompare,           /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__CertInfo_methods,          /* tp_methods */
+    SwigPyBuiltin__Signature_methods,         /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__CertInfo_getset,           /* tp_getset */
+    SwigPyBuiltin__Signature_getset,          /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CertInfo,            /* tp_init */
+    (initproc) _wrap_new_Signature,           /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -20487,17 +22296,17 @@ static PyHeapTypeObject SwigPyBuiltin__CertInfo_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__CertInfo_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertInfo_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Signature_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Signature_type};
 
-static SwigPyGetSet ExtIter___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__ExtIter_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"ExtIter.__dict__", (void *) &ExtIter___dict___getset }
+static SwigPyGetSet CertRequest___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__CertRequest_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertRequest.__dict__", (void *) &CertRequest___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__ExtIter_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__CertRequest_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -20515,13 +22324,37 @@ SwigPyBuiltin__ExtIter_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__ExtIter_methods[] = {
-  { "__iter__", (PyCFunction) _wrap_ExtIter___iter__, METH_VARARGS, (char *) "__iter__() -> ExtIter" },
-  { "next", (PyCFunction) _wrap_ExtIter_next, METH_VARARGS, (char *) "next() -> CertExtension" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__CertRequest_methods[] = {
+  { "set_subject", (PyCFunction) _wrap_CertRequest_set_subject, METH_VARARGS, (char *) "\n"
+		"set_subject(STRING)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "get_data", (PyCFunction) _wrap_CertRequest_get_data, METH_VARARGS, (char *) "get_data()" },
+  { "add_attribute", (PyCFunction) _wrap_CertRequest_add_attribute, METH_VARARGS, (char *) "\n"
+		"add_attribute(STRING) -> int\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "add_attribute_value", (PyCFunction) _wrap_CertRequest_add_attribute_value, METH_VARARGS, (char *) "\n"
+		"add_attribute_value(n, STRING)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"n: int\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__ExtIter_type = {
+static PyHeapTypeObject SwigPyBuiltin__CertRequest_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -20529,10 +22362,10 @@ static PyHeapTypeObject SwigPyBuiltin__ExtIter_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.ExtIter",                            /* tp_name */
+    "csp.CertRequest",                        /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_ExtIter_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CertRequest_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -20542,36 +22375,36 @@ static PyHeapTypeObject SwigPyBuiltin__ExtIter_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__ExtIter_type.as_number,   /* tp_as_number */
-    &SwigPyBuiltin__ExtIter_type.as_sequence, /* tp_as_sequence */
-    &SwigPyBuiltin__ExtIter_type.as_mapping,  /* tp_as_mapping */
+    &SwigPyBuiltin__CertRequest_type.as_number,                   /* tp_as_number */
+    &SwigPyBuiltin__CertRequest_type.as_sequence,                 /* tp_as_sequence */
+    &SwigPyBuiltin__CertRequest_type.as_mapping,                  /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__ExtIter_type.as_buffer,   /* tp_as_buffer */
+    &SwigPyBuiltin__CertRequest_type.as_buffer,                   /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::ExtIter",                              /* tp_doc */
+    "::CertRequest",                          /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__ExtIter_richcompare,             /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__CertRequest_richcompare,         /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
-    (getiterfunc) (getiterfunc) _wrap_ExtIter___iter___getiterfunc_closure,/* tp_iter */
-    (iternextfunc) (iternextfunc) _wrap_ExtIter_next_iternextfunc_closure,/* tp_iternext */
-    SwigPyBuiltin__ExtIter_methods,           /* tp_methods */
+    (getiterfunc) 0,                          /* tp_iter */
+    (iternextfunc) 0,                         /* tp_iternext */
+    SwigPyBuiltin__CertRequest_methods,       /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__ExtIter_getset,            /* tp_getset */
+    SwigPyBuiltin__CertRequest_getset,        /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_ExtIter,             /* tp_init */
+    (initproc) _wrap_new_CertRequest,         /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -20709,17 +22542,17 @@ static PyHeapTypeObject SwigPyBuiltin__ExtIter_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__ExtIter_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__ExtIter_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__CertRequest_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertRequest_type};
 
-static SwigPyGetSet CryptMsg___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__CryptMsg_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CryptMsg.__dict__", (void *) &CryptMsg___dict___getset }
+static SwigPyGetSet Hash___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__Hash_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"Hash.__dict__", (void *) &Hash___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__CryptMsg_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__Hash_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -20737,79 +22570,39 @@ SwigPyBuiltin__CryptMsg_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__CryptMsg_methods[] = {
-  { "decrypt_by_cert", (PyCFunction) _wrap_CryptMsg_decrypt_by_cert, METH_VARARGS, (char *) "\n"
-		"decrypt_by_cert(crt)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"crt: Cert *\n"
-		"\n"
-		"" },
-  { "num_signers", (PyCFunction) _wrap_CryptMsg_num_signers, METH_VARARGS, (char *) "num_signers() -> int" },
-  { "get_data", (PyCFunction) _wrap_CryptMsg_get_data, METH_VARARGS, (char *) "get_data()" },
-  { "verify_cert", (PyCFunction) _wrap_CryptMsg_verify_cert, METH_VARARGS, (char *) "\n"
-		"verify_cert(c) -> bool\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"c: Cert *\n"
-		"\n"
-		"" },
-  { "get_type", (PyCFunction) _wrap_CryptMsg_get_type, METH_VARARGS, (char *) "get_type() -> DWORD" },
-  { "add_recipient", (PyCFunction) _wrap_CryptMsg_add_recipient, METH_VARARGS, (char *) "\n"
-		"add_recipient(c)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"c: Cert *\n"
-		"\n"
-		"" },
-  { "encrypt_data", (PyCFunction) _wrap_CryptMsg_encrypt_data, METH_VARARGS, (char *) "\n"
-		"encrypt_data(STRING)\n"
+SWIGINTERN PyMethodDef SwigPyBuiltin__Hash_methods[] = {
+  { "digest", (PyCFunction) _wrap_Hash_digest, METH_VARARGS, (char *) "digest()" },
+  { "update", (PyCFunction) _wrap_Hash_update, METH_VARARGS, (char *) "\n"
+		"update(STRING)\n"
 		"\n"
 		"Parameters\n"
 		"----------\n"
 		"STRING: BYTE *\n"
 		"\n"
 		"" },
-  { "decrypt", (PyCFunction) _wrap_CryptMsg_decrypt, METH_VARARGS, (char *) "\n"
-		"decrypt(store)\n"
+  { "sign", (PyCFunction) _wrap_Hash_sign, METH_VARARGS, (char *) "\n"
+		"sign(dwKeyspec=1)\n"
 		"\n"
 		"Parameters\n"
 		"----------\n"
-		"store: CertStore *\n"
+		"dwKeyspec: DWORD\n"
 		"\n"
+		"sign()\n"
 		"" },
-  { "sign_data", (PyCFunction) _wrap_CryptMsg_sign_data, METH_VARARGS, (char *) "\n"
-		"sign_data(STRING, signer, detach=False)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"signer: Cert *\n"
-		"detach: bool\n"
-		"\n"
-		"sign_data(STRING, signer)\n"
+  { "verify", (PyCFunction) _wrap_Hash_verify, METH_VARARGS, (char *) "\n"
+		"verify(cert, STRING) -> bool\n"
 		"\n"
 		"Parameters\n"
 		"----------\n"
+		"cert: Cert *\n"
 		"STRING: BYTE *\n"
-		"signer: Cert *\n"
-		"\n"
-		"" },
-  { "verify", (PyCFunction) _wrap_CryptMsg_verify, METH_VARARGS, (char *) "\n"
-		"verify(n) -> bool\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"n: DWORD\n"
 		"\n"
 		"" },
+  { "derive_key", (PyCFunction) _wrap_Hash_derive_key, METH_VARARGS, (char *) "derive_key() -> Key" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__CryptMsg_type = {
+static PyHeapTypeObject SwigPyBuiltin__Hash_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -20817,10 +22610,10 @@ static PyHeapTypeObject SwigPyBuiltin__CryptMsg_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CryptMsg",                           /* tp_name */
+    "csp.Hash",                               /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CryptMsg_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_Hash_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -20830,36 +22623,36 @@ static PyHeapTypeObject SwigPyBuiltin__CryptMsg_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__CryptMsg_type.as_number,  /* tp_as_number */
-    &SwigPyBuiltin__CryptMsg_type.as_sequence,/* tp_as_sequence */
-    &SwigPyBuiltin__CryptMsg_type.as_mapping, /* tp_as_mapping */
+    &SwigPyBuiltin__Hash_type.as_number,      /* tp_as_number */
+    &SwigPyBuiltin__Hash_type.as_sequence,    /* tp_as_sequence */
+    &SwigPyBuiltin__Hash_type.as_mapping,     /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__CryptMsg_type.as_buffer,  /* tp_as_buffer */
+    &SwigPyBuiltin__Hash_type.as_buffer,      /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::CryptMsg",                             /* tp_doc */
+    "::Hash",                                 /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__CryptMsg_richcompare,            /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__Hash_richcompare,                /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__CryptMsg_methods,          /* tp_methods */
+    SwigPyBuiltin__Hash_methods,              /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__CryptMsg_getset,           /* tp_getset */
+    SwigPyBuiltin__Hash_getset,               /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CryptMsg,            /* tp_init */
+    (initproc) _wrap_new_Hash,                /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -20997,53 +22790,17 @@ static PyHeapTypeObject SwigPyBuiltin__CryptMsg_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__CryptMsg_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CryptMsg_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__Hash_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Hash_type};
 
-static SwigPyGetSet CERT_INFO_cExtension_getset = { _wrap_CERT_INFO_cExtension_get, _wrap_CERT_INFO_cExtension_set };
-static SwigPyGetSet CERT_INFO_rgExtension_getset = { _wrap_CERT_INFO_rgExtension_get, _wrap_CERT_INFO_rgExtension_set };
-static SwigPyGetSet CERT_INFO_Issuer_getset = { _wrap_CERT_INFO_Issuer_get, _wrap_CERT_INFO_Issuer_set };
-static SwigPyGetSet CERT_INFO_NotBefore_getset = { _wrap_CERT_INFO_NotBefore_get, _wrap_CERT_INFO_NotBefore_set };
-static SwigPyGetSet CERT_INFO_Subject_getset = { _wrap_CERT_INFO_Subject_get, _wrap_CERT_INFO_Subject_set };
-static SwigPyGetSet CERT_INFO___dict___getset = { SwigPyObject_get___dict__, 0 };
-static SwigPyGetSet CERT_INFO_dwVersion_getset = { _wrap_CERT_INFO_dwVersion_get, _wrap_CERT_INFO_dwVersion_set };
-static SwigPyGetSet CERT_INFO_SerialNumber_getset = { _wrap_CERT_INFO_SerialNumber_get, _wrap_CERT_INFO_SerialNumber_set };
-static SwigPyGetSet CERT_INFO_SignatureAlgorithm_getset = { _wrap_CERT_INFO_SignatureAlgorithm_get, _wrap_CERT_INFO_SignatureAlgorithm_set };
-static SwigPyGetSet CERT_INFO_NotAfter_getset = { _wrap_CERT_INFO_NotAfter_get, _wrap_CERT_INFO_NotAfter_set };
-static SwigPyGetSet CERT_INFO_SubjectPublicKeyInfo_getset = { _wrap_CERT_INFO_SubjectPublicKeyInfo_get, _wrap_CERT_INFO_SubjectPublicKeyInfo_set };
-static SwigPyGetSet CERT_INFO_IssuerUniqueId_getset = { _wrap_CERT_INFO_IssuerUniqueId_get, _wrap_CERT_INFO_IssuerUniqueId_set };
-static SwigPyGetSet CERT_INFO_SubjectUniqueId_getset = { _wrap_CERT_INFO_SubjectUniqueId_get, _wrap_CERT_INFO_SubjectUniqueId_set };
-SWIGINTERN PyGetSetDef SwigPyBuiltin___CERT_INFO_getset[] = {
-    { (char *) "cExtension", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.cExtension", (void *) &CERT_INFO_cExtension_getset }
-,
-    { (char *) "rgExtension", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.rgExtension", (void *) &CERT_INFO_rgExtension_getset }
-,
-    { (char *) "Issuer", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.Issuer", (void *) &CERT_INFO_Issuer_getset }
-,
-    { (char *) "NotBefore", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.NotBefore", (void *) &CERT_INFO_NotBefore_getset }
-,
-    { (char *) "Subject", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.Subject", (void *) &CERT_INFO_Subject_getset }
-,
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"_CERT_INFO.__dict__", (void *) &CERT_INFO___dict___getset }
-,
-    { (char *) "dwVersion", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.dwVersion", (void *) &CERT_INFO_dwVersion_getset }
-,
-    { (char *) "SerialNumber", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.SerialNumber", (void *) &CERT_INFO_SerialNumber_getset }
-,
-    { (char *) "SignatureAlgorithm", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.SignatureAlgorithm", (void *) &CERT_INFO_SignatureAlgorithm_getset }
-,
-    { (char *) "NotAfter", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.NotAfter", (void *) &CERT_INFO_NotAfter_getset }
-,
-    { (char *) "SubjectPublicKeyInfo", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.SubjectPublicKeyInfo", (void *) &CERT_INFO_SubjectPublicKeyInfo_getset }
-,
-    { (char *) "IssuerUniqueId", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.IssuerUniqueId", (void *) &CERT_INFO_IssuerUniqueId_getset }
-,
-    { (char *) "SubjectUniqueId", (getter) SwigPyBuiltin_GetterClosure, (setter) SwigPyBuiltin_SetterClosure, (char *)"_CERT_INFO.SubjectUniqueId", (void *) &CERT_INFO_SubjectUniqueId_getset }
+static SwigPyGetSet CMSStream___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__CMSStream_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CMSStream.__dict__", (void *) &CMSStream___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin___CERT_INFO_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__CMSStream_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -21061,11 +22818,20 @@ SwigPyBuiltin___CERT_INFO_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin___CERT_INFO_methods[] = {
+SWIGINTERN PyMethodDef SwigPyBuiltin__CMSStream_methods[] = {
+  { "update", (PyCFunction) _wrap_CMSStream_update, METH_VARARGS, (char *) "\n"
+		"update(STRING)\n"
+		"\n"
+		"Parameters\n"
+		"----------\n"
+		"STRING: BYTE *\n"
+		"\n"
+		"" },
+  { "finish", (PyCFunction) _wrap_CMSStream_finish, METH_VARARGS, (char *) "finish()" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin___CERT_INFO_type = {
+static PyHeapTypeObject SwigPyBuiltin__CMSStream_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -21073,10 +22839,10 @@ static PyHeapTypeObject SwigPyBuiltin___CERT_INFO_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CERT_INFO",                          /* tp_name */
+    "csp.CMSStream",                          /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CERT_INFO_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_CMSStream_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -21086,36 +22852,36 @@ static PyHeapTypeObject SwigPyBuiltin___CERT_INFO_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin___CERT_INFO_type.as_number,/* tp_as_number */
-    &SwigPyBuiltin___CERT_INFO_type.as_sequence,                  /* tp_as_sequence */
-    &SwigPyBuiltin___CERT_INFO_type.as_mapping,                   /* tp_as_mapping */
+    &SwigPyBuiltin__CMSStream_type.as_number, /* tp_as_number */
+    &SwigPyBuiltin__CMSStream_type.as_sequence,                   /* tp_as_sequence */
+    &SwigPyBuiltin__CMSStream_type.as_mapping,/* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin___CERT_INFO_type.as_buffer,/* tp_as_buffer */
+    &SwigPyBuiltin__CMSStream_type.as_buffer, /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::_CERT_INFO",                           /* tp_doc */
+    "::CMSStream",                            /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin___CERT_INFO_richcompare,          /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__CMSStream_richcompare,           /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin___CERT_INFO_methods,        /* tp_methods */
+    SwigPyBuiltin__CMSStream_methods,         /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin___CERT_INFO_getset,         /* tp_getset */
+    SwigPyBuiltin__CMSStream_getset,          /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CERT_INFO,           /* tp_init */
+    (initproc) SwigPyBuiltin_BadInit,         /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -21253,17 +23019,17 @@ static PyHeapTypeObject SwigPyBuiltin___CERT_INFO_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin___CERT_INFO_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin___CERT_INFO_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__CMSStream_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CMSStream_type};
 
-static SwigPyGetSet CertExtension___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__CertExtension_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertExtension.__dict__", (void *) &CertExtension___dict___getset }
+static SwigPyGetSet SignStream___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__SignStream_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"SignStream.__dict__", (void *) &SignStream___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__CertExtension_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__SignStream_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -21281,12 +23047,11 @@ SwigPyBuiltin__CertExtension_richcompare(PyObject *self, PyObject *other, int op
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__CertExtension_methods[] = {
-  { "oid", (PyCFunction) _wrap_CertExtension_oid, METH_VARARGS, (char *) "oid()" },
+SWIGINTERN PyMethodDef SwigPyBuiltin__SignStream_methods[] = {
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__CertExtension_type = {
+static PyHeapTypeObject SwigPyBuiltin__SignStream_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -21294,10 +23059,10 @@ static PyHeapTypeObject SwigPyBuiltin__CertExtension_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CertExtension",                      /* tp_name */
+    "csp.SignStream",                         /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CertExtension_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_SignStream_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -21307,36 +23072,36 @@ static PyHeapTypeObject SwigPyBuiltin__CertExtension_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__CertExtension_type.as_number,                 /* tp_as_number */
-    &SwigPyBuiltin__CertExtension_type.as_sequence,               /* tp_as_sequence */
-    &SwigPyBuiltin__CertExtension_type.as_mapping,                /* tp_as_mapping */
+    &SwigPyBuiltin__SignStream_type.as_number,/* tp_as_number */
+    &SwigPyBuiltin__SignStream_type.as_sequence,                  /* tp_as_sequence */
+    &SwigPyBuiltin__SignStream_type.as_mapping,                   /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__CertExtension_type.as_buffer,                 /* tp_as_buffer */
+    &SwigPyBuiltin__SignStream_type.as_buffer,/* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::CertExtension",                        /* tp_doc */
+    "::SignStream",                           /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__CertExtension_richcompare,       /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__SignStream_richcompare,          /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__CertExtension_methods,     /* tp_methods */
+    SwigPyBuiltin__SignStream_methods,        /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__CertExtension_getset,      /* tp_getset */
+    SwigPyBuiltin__SignStream_getset,         /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CertExtension,       /* tp_init */
+    (initproc) _wrap_new_SignStream,          /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -21474,65 +23239,39 @@ static PyHeapTypeObject SwigPyBuiltin__CertExtension_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__CertExtension_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertExtension_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__SignStream_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__SignStream_type};
 
-static SwigPyGetSet Signature___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__Signature_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"Signature.__dict__", (void *) &Signature___dict___getset }
+static SwigPyGetSet DecryptStream___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__DecryptStream_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"DecryptStream.__dict__", (void *) &DecryptStream___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__Signature_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__DecryptStream_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
-  assert(tuple);
-  PyTuple_SET_ITEM(tuple, 0, other);
-  Py_XINCREF(other);
-  if (!result) {
-    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
-      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
-    } else {
-      result = Py_NotImplemented;
-      Py_INCREF(result);
-    }
-  }
-  Py_DECREF(tuple);
-  return result;
-}
-
-SWIGINTERN PyMethodDef SwigPyBuiltin__Signature_methods[] = {
-  { "verify_data", (PyCFunction) _wrap_Signature_verify_data, METH_VARARGS, (char *) "\n"
-		"verify_data(STRING, n) -> bool\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"n: int\n"
-		"\n"
-		"" },
-  { "sign_data", (PyCFunction) _wrap_Signature_sign_data, METH_VARARGS, (char *) "\n"
-		"sign_data(STRING, signer, detach=True)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"signer: Cert *\n"
-		"detach: bool\n"
-		"\n"
-		"sign_data(STRING, signer)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"signer: Cert *\n"
-		"\n"
-		"" },
+  assert(tuple);
+  PyTuple_SET_ITEM(tuple, 0, other);
+  Py_XINCREF(other);
+  if (!result) {
+    if (SwigPyObject_Check(self) && SwigPyObject_Check(other)) {
+      result = SwigPyObject_richcompare((SwigPyObject *)self, (SwigPyObject *)other, op);
+    } else {
+      result = Py_NotImplemented;
+      Py_INCREF(result);
+    }
+  }
+  Py_DECREF(tuple);
+  return result;
+}
+
+SWIGINTERN PyMethodDef SwigPyBuiltin__DecryptStream_methods[] = {
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__Signature_type = {
+static PyHeapTypeObject SwigPyBuiltin__DecryptStream_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -21540,10 +23279,10 @@ static PyHeapTypeObject SwigPyBuiltin__Signature_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.Signature",                          /* tp_name */
+    "csp.DecryptStream",                      /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_Signature_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_DecryptStream_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -21553,36 +23292,36 @@ static PyHeapTypeObject SwigPyBuiltin__Signature_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__Signature_type.as_number, /* tp_as_number */
-    &SwigPyBuiltin__Signature_type.as_sequence,                   /* tp_as_sequence */
-    &SwigPyBuiltin__Signature_type.as_mapping,/* tp_as_mapping */
+    &SwigPyBuiltin__DecryptStream_type.as_number,                 /* tp_as_number */
+    &SwigPyBuiltin__DecryptStream_type.as_sequence,               /* tp_as_sequence */
+    &SwigPyBuiltin__DecryptStream_type.as_mapping,                /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__Signature_type.as_buffer, /* tp_as_buffer */
+    &SwigPyBuiltin__DecryptStream_type.as_buffer,                 /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::Signature",                            /* tp_doc */
+    "::DecryptStream",                        /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__Signature_richcompare,           /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__DecryptStream_richcompare,       /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__Signature_methods,         /* tp_methods */
+    SwigPyBuiltin__DecryptStream_methods,     /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__Signature_getset,          /* tp_getset */
+    SwigPyBuiltin__DecryptStream_getset,      /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_Signature,           /* tp_init */
+    (initproc) _wrap_new_DecryptStream,       /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -21720,17 +23459,17 @@ static PyHeapTypeObject SwigPyBuiltin__Signature_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__Signature_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Signature_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__DecryptStream_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__DecryptStream_type};
 
-static SwigPyGetSet CertRequest___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__CertRequest_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"CertRequest.__dict__", (void *) &CertRequest___dict___getset }
+static SwigPyGetSet EncryptStream___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__EncryptStream_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"EncryptStream.__dict__", (void *) &EncryptStream___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__CertRequest_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__EncryptStream_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -21748,37 +23487,19 @@ SwigPyBuiltin__CertRequest_richcompare(PyObject *self, PyObject *other, int op)
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__CertRequest_methods[] = {
-  { "set_subject", (PyCFunction) _wrap_CertRequest_set_subject, METH_VARARGS, (char *) "\n"
-		"set_subject(STRING)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"\n"
-		"" },
-  { "get_data", (PyCFunction) _wrap_CertRequest_get_data, METH_VARARGS, (char *) "get_data()" },
-  { "add_attribute", (PyCFunction) _wrap_CertRequest_add_attribute, METH_VARARGS, (char *) "\n"
-		"add_attribute(STRING) -> int\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"\n"
-		"" },
-  { "add_attribute_value", (PyCFunction) _wrap_CertRequest_add_attribute_value, METH_VARARGS, (char *) "\n"
-		"add_attribute_value(n, STRING)\n"
+SWIGINTERN PyMethodDef SwigPyBuiltin__EncryptStream_methods[] = {
+  { "add_recipient", (PyCFunction) _wrap_EncryptStream_add_recipient, METH_VARARGS, (char *) "\n"
+		"add_recipient(c)\n"
 		"\n"
 		"Parameters\n"
 		"----------\n"
-		"n: int\n"
-		"STRING: BYTE *\n"
+		"c: Cert *\n"
 		"\n"
 		"" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__CertRequest_type = {
+static PyHeapTypeObject SwigPyBuiltin__EncryptStream_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -21786,10 +23507,10 @@ static PyHeapTypeObject SwigPyBuiltin__CertRequest_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.CertRequest",                        /* tp_name */
+    "csp.EncryptStream",                      /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_CertRequest_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_EncryptStream_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -21799,36 +23520,36 @@ static PyHeapTypeObject SwigPyBuiltin__CertRequest_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__CertRequest_type.as_number,                   /* tp_as_number */
-    &SwigPyBuiltin__CertRequest_type.as_sequence,                 /* tp_as_sequence */
-    &SwigPyBuiltin__CertRequest_type.as_mapping,                  /* tp_as_mapping */
+    &SwigPyBuiltin__EncryptStream_type.as_number,                 /* tp_as_number */
+    &SwigPyBuiltin__EncryptStream_type.as_sequence,               /* tp_as_sequence */
+    &SwigPyBuiltin__EncryptStream_type.as_mapping,                /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__CertRequest_type.as_buffer,                   /* tp_as_buffer */
+    &SwigPyBuiltin__EncryptStream_type.as_buffer,                 /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::CertRequest",                          /* tp_doc */
+    "::EncryptStream",                        /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__CertRequest_richcompare,         /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__EncryptStream_richcompare,       /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__CertRequest_methods,       /* tp_methods */
+    SwigPyBuiltin__EncryptStream_methods,     /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__CertRequest_getset,        /* tp_getset */
+    SwigPyBuiltin__EncryptStream_getset,      /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_CertRequest,         /* tp_init */
+    (initproc) _wrap_new_EncryptStream,       /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -21966,17 +23687,17 @@ static PyHeapTypeObject SwigPyBuiltin__CertRequest_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__CertRequest_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__CertRequest_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__EncryptStream_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__EncryptStream_type};
 
-static SwigPyGetSet Hash___dict___getset = { SwigPyObject_get___dict__, 0 };
-SWIGINTERN PyGetSetDef SwigPyBuiltin__Hash_getset[] = {
-    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"Hash.__dict__", (void *) &Hash___dict___getset }
+static SwigPyGetSet VerifyStream___dict___getset = { SwigPyObject_get___dict__, 0 };
+SWIGINTERN PyGetSetDef SwigPyBuiltin__VerifyStream_getset[] = {
+    { (char *) "__dict__", (getter) SwigPyBuiltin_GetterClosure, (setter) 0, (char *)"VerifyStream.__dict__", (void *) &VerifyStream___dict___getset }
 ,
     {NULL, NULL, NULL, NULL, NULL} /* Sentinel */
 };
 
 SWIGINTERN PyObject *
-SwigPyBuiltin__Hash_richcompare(PyObject *self, PyObject *other, int op) {
+SwigPyBuiltin__VerifyStream_richcompare(PyObject *self, PyObject *other, int op) {
   PyObject *result = NULL;
   PyObject *tuple = PyTuple_New(1);
   assert(tuple);
@@ -21994,39 +23715,19 @@ SwigPyBuiltin__Hash_richcompare(PyObject *self, PyObject *other, int op) {
   return result;
 }
 
-SWIGINTERN PyMethodDef SwigPyBuiltin__Hash_methods[] = {
-  { "digest", (PyCFunction) _wrap_Hash_digest, METH_VARARGS, (char *) "digest()" },
-  { "update", (PyCFunction) _wrap_Hash_update, METH_VARARGS, (char *) "\n"
-		"update(STRING)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"STRING: BYTE *\n"
-		"\n"
-		"" },
-  { "sign", (PyCFunction) _wrap_Hash_sign, METH_VARARGS, (char *) "\n"
-		"sign(dwKeyspec=1)\n"
-		"\n"
-		"Parameters\n"
-		"----------\n"
-		"dwKeyspec: DWORD\n"
-		"\n"
-		"sign()\n"
-		"" },
-  { "verify", (PyCFunction) _wrap_Hash_verify, METH_VARARGS, (char *) "\n"
-		"verify(cert, STRING) -> bool\n"
+SWIGINTERN PyMethodDef SwigPyBuiltin__VerifyStream_methods[] = {
+  { "verify", (PyCFunction) _wrap_VerifyStream_verify, METH_VARARGS, (char *) "\n"
+		"verify(c) -> bool\n"
 		"\n"
 		"Parameters\n"
 		"----------\n"
-		"cert: Cert *\n"
-		"STRING: BYTE *\n"
+		"c: Cert *\n"
 		"\n"
 		"" },
-  { "derive_key", (PyCFunction) _wrap_Hash_derive_key, METH_VARARGS, (char *) "derive_key() -> Key" },
   { NULL, NULL, 0, NULL } /* Sentinel */
 };
 
-static PyHeapTypeObject SwigPyBuiltin__Hash_type = {
+static PyHeapTypeObject SwigPyBuiltin__VerifyStream_type = {
   {
 #if PY_VERSION_HEX >= 0x03000000
     PyVarObject_HEAD_INIT(NULL, 0)
@@ -22034,10 +23735,10 @@ static PyHeapTypeObject SwigPyBuiltin__Hash_type = {
     PyObject_HEAD_INIT(NULL)
     0,                                        /* ob_size */
 #endif
-    "csp.Hash",                               /* tp_name */
+    "csp.VerifyStream",                       /* tp_name */
     sizeof(SwigPyObject),                     /* tp_basicsize */
     0,                                        /* tp_itemsize */
-    (destructor) (destructor) _wrap_delete_Hash_destructor_closure,/* tp_dealloc */
+    (destructor) (destructor) _wrap_delete_VerifyStream_destructor_closure,/* tp_dealloc */
     (printfunc) 0,                            /* tp_print */
     (getattrfunc) 0,                          /* tp_getattr */
     (setattrfunc) 0,                          /* tp_setattr */
@@ -22047,36 +23748,36 @@ static PyHeapTypeObject SwigPyBuiltin__Hash_type = {
     (cmpfunc) 0,                              /* tp_compare */
 #endif
     (reprfunc) 0,                             /* tp_repr */
-    &SwigPyBuiltin__Hash_type.as_number,      /* tp_as_number */
-    &SwigPyBuiltin__Hash_type.as_sequence,    /* tp_as_sequence */
-    &SwigPyBuiltin__Hash_type.as_mapping,     /* tp_as_mapping */
+    &SwigPyBuiltin__VerifyStream_type.as_number,                  /* tp_as_number */
+    &SwigPyBuiltin__VerifyStream_type.as_sequence,                /* tp_as_sequence */
+    &SwigPyBuiltin__VerifyStream_type.as_mapping,                 /* tp_as_mapping */
     (hashfunc) SwigPyObject_hash,             /* tp_hash */
     (ternaryfunc) 0,                          /* tp_call */
     (reprfunc) 0,                             /* tp_str */
     (getattrofunc) 0,                         /* tp_getattro */
     (setattrofunc) 0,                         /* tp_setattro */
-    &SwigPyBuiltin__Hash_type.as_buffer,      /* tp_as_buffer */
+    &SwigPyBuiltin__VerifyStream_type.as_buffer,                  /* tp_as_buffer */
 #if PY_VERSION_HEX >= 0x03000000
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,   /* tp_flags */
 #else
     Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_CHECKTYPES, /* tp_flags */
 #endif
-    "::Hash",                                 /* tp_doc */
+    "::VerifyStream",                         /* tp_doc */
     (traverseproc) 0,                         /* tp_traverse */
     (inquiry) 0,                              /* tp_clear */
-    (richcmpfunc) SwigPyBuiltin__Hash_richcompare,                /* tp_richcompare */
+    (richcmpfunc) SwigPyBuiltin__VerifyStream_richcompare,        /* tp_richcompare */
     0,                                        /* tp_weaklistoffset */
     (getiterfunc) 0,                          /* tp_iter */
     (iternextfunc) 0,                         /* tp_iternext */
-    SwigPyBuiltin__Hash_methods,              /* tp_methods */
+    SwigPyBuiltin__VerifyStream_methods,      /* tp_methods */
     0,                                        /* tp_members */
-    SwigPyBuiltin__Hash_getset,               /* tp_getset */
+    SwigPyBuiltin__VerifyStream_getset,       /* tp_getset */
     0,                                        /* tp_base */
     0,                                        /* tp_dict */
     (descrgetfunc) 0,                         /* tp_descr_get */
     (descrsetfunc) 0,                         /* tp_descr_set */
     (Py_ssize_t) offsetof(SwigPyObject, dict),/* tp_dictoffset */
-    (initproc) _wrap_new_Hash,                /* tp_init */
+    (initproc) _wrap_new_VerifyStream,        /* tp_init */
     (allocfunc) 0,                            /* tp_alloc */
     (newfunc) 0,                              /* tp_new */
     (freefunc) 0,                             /* tp_free */
@@ -22214,7 +23915,7 @@ static PyHeapTypeObject SwigPyBuiltin__Hash_type = {
 #endif
 };
 
-SWIGINTERN SwigPyClientData SwigPyBuiltin__Hash_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__Hash_type};
+SWIGINTERN SwigPyClientData SwigPyBuiltin__VerifyStream_clientdata = {0, 0, 0, 0, 0, 0, (PyTypeObject *)&SwigPyBuiltin__VerifyStream_type};
 
 
 /* -------- TYPE CONVERSION AND EQUIVALENCE RULES (BEGIN) -------- */
@@ -22228,6 +23929,12 @@ static void *_p_CertFindTo_p_CertIter(void *x, int *SWIGUNUSEDPARM(newmemory)) {
 static void *_p_SignatureTo_p_RCObj(void *x, int *SWIGUNUSEDPARM(newmemory)) {
     return (void *)((RCObj *) (CryptMsg *) ((Signature *) x));
 }
+static void *_p_CMSStreamTo_p_RCObj(void *x, int *SWIGUNUSEDPARM(newmemory)) {
+    return (void *)((RCObj *)  ((CMSStream *) x));
+}
+static void *_p_VerifyStreamTo_p_RCObj(void *x, int *SWIGUNUSEDPARM(newmemory)) {
+    return (void *)((RCObj *) (CMSStream *) ((VerifyStream *) x));
+}
 static void *_p_CertTo_p_RCObj(void *x, int *SWIGUNUSEDPARM(newmemory)) {
     return (void *)((RCObj *)  ((Cert *) x));
 }
@@ -22249,8 +23956,30 @@ static void *_p_HashTo_p_RCObj(void *x, int *SWIGUNUSEDPARM(newmemory)) {
 static void *_p_CryptTo_p_RCObj(void *x, int *SWIGUNUSEDPARM(newmemory)) {
     return (void *)((RCObj *)  ((Crypt *) x));
 }
+static void *_p_SignStreamTo_p_RCObj(void *x, int *SWIGUNUSEDPARM(newmemory)) {
+    return (void *)((RCObj *) (CMSStream *) ((SignStream *) x));
+}
+static void *_p_DecryptStreamTo_p_RCObj(void *x, int *SWIGUNUSEDPARM(newmemory)) {
+    return (void *)((RCObj *) (CMSStream *) ((DecryptStream *) x));
+}
+static void *_p_EncryptStreamTo_p_RCObj(void *x, int *SWIGUNUSEDPARM(newmemory)) {
+    return (void *)((RCObj *) (CMSStream *) ((EncryptStream *) x));
+}
+static void *_p_VerifyStreamTo_p_CMSStream(void *x, int *SWIGUNUSEDPARM(newmemory)) {
+    return (void *)((CMSStream *)  ((VerifyStream *) x));
+}
+static void *_p_SignStreamTo_p_CMSStream(void *x, int *SWIGUNUSEDPARM(newmemory)) {
+    return (void *)((CMSStream *)  ((SignStream *) x));
+}
+static void *_p_DecryptStreamTo_p_CMSStream(void *x, int *SWIGUNUSEDPARM(newmemory)) {
+    return (void *)((CMSStream *)  ((DecryptStream *) x));
+}
+static void *_p_EncryptStreamTo_p_CMSStream(void *x, int *SWIGUNUSEDPARM(newmemory)) {
+    return (void *)((CMSStream *)  ((EncryptStream *) x));
+}
 static swig_type_info _swigt__p_CERT_EXTENSION = {"_p_CERT_EXTENSION", "CERT_EXTENSION *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_CERT_PUBLIC_KEY_INFO = {"_p_CERT_PUBLIC_KEY_INFO", "CERT_PUBLIC_KEY_INFO *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_CMSStream = {"_p_CMSStream", "CMSStream *", 0, 0, (void*)&SwigPyBuiltin__CMSStream_clientdata, 0};
 static swig_type_info _swigt__p_CRYPT_INTEGER_BLOB = {"_p_CRYPT_INTEGER_BLOB", "CRYPT_INTEGER_BLOB *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_CSPInfo = {"_p_CSPInfo", "CSPInfo *", 0, 0, (void*)&SwigPyBuiltin__CSPInfo_clientdata, 0};
 static swig_type_info _swigt__p_Cert = {"_p_Cert", "Cert *", 0, 0, (void*)&SwigPyBuiltin__Cert_clientdata, 0};
@@ -22264,7 +23993,9 @@ static swig_type_info _swigt__p_Crypt = {"_p_Crypt", "Crypt *", 0, 0, (void*)&Sw
 static swig_type_info _swigt__p_CryptDesc = {"_p_CryptDesc", "CryptDesc *", 0, 0, (void*)&SwigPyBuiltin__CryptDesc_clientdata, 0};
 static swig_type_info _swigt__p_CryptIter = {"_p_CryptIter", "CryptIter *", 0, 0, (void*)&SwigPyBuiltin__CryptIter_clientdata, 0};
 static swig_type_info _swigt__p_CryptMsg = {"_p_CryptMsg", "CryptMsg *", 0, 0, (void*)&SwigPyBuiltin__CryptMsg_clientdata, 0};
+static swig_type_info _swigt__p_DecryptStream = {"_p_DecryptStream", "DecryptStream *", 0, 0, (void*)&SwigPyBuiltin__DecryptStream_clientdata, 0};
 static swig_type_info _swigt__p_EKUIter = {"_p_EKUIter", "EKUIter *", 0, 0, (void*)&SwigPyBuiltin__EKUIter_clientdata, 0};
+static swig_type_info _swigt__p_EncryptStream = {"_p_EncryptStream", "EncryptStream *", 0, 0, (void*)&SwigPyBuiltin__EncryptStream_clientdata, 0};
 static swig_type_info _swigt__p_ExtIter = {"_p_ExtIter", "ExtIter *", 0, 0, (void*)&SwigPyBuiltin__ExtIter_clientdata, 0};
 static swig_type_info _swigt__p_FILETIME = {"_p_FILETIME", "FILETIME *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_Hash = {"_p_Hash", "Hash *", 0, 0, (void*)&SwigPyBuiltin__Hash_clientdata, 0};
@@ -22272,8 +24003,10 @@ static swig_type_info _swigt__p_Key = {"_p_Key", "Key *", 0, 0, (void*)&SwigPyBu
 static swig_type_info _swigt__p_PCCERT_CONTEXT = {"_p_PCCERT_CONTEXT", "PCCERT_CONTEXT *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_PCERT_EXTENSION = {"_p_PCERT_EXTENSION", "PCERT_EXTENSION *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_RCObj = {"_p_RCObj", "RCObj *", 0, 0, (void*)&SwigPyBuiltin__RCObj_clientdata, 0};
+static swig_type_info _swigt__p_SignStream = {"_p_SignStream", "SignStream *", 0, 0, (void*)&SwigPyBuiltin__SignStream_clientdata, 0};
 static swig_type_info _swigt__p_Signature = {"_p_Signature", "Signature *", 0, 0, (void*)&SwigPyBuiltin__Signature_clientdata, 0};
 static swig_type_info _swigt__p_SwigPyObject = {"_p_SwigPyObject", "SwigPyObject *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_VerifyStream = {"_p_VerifyStream", "VerifyStream *", 0, 0, (void*)&SwigPyBuiltin__VerifyStream_clientdata, 0};
 static swig_type_info _swigt__p__CERT_INFO = {"_p__CERT_INFO", "_CERT_INFO *|CERT_INFO *", 0, 0, (void*)&SwigPyBuiltin___CERT_INFO_clientdata, 0};
 static swig_type_info _swigt__p__CMS_DH_KEY_INFO = {"_p__CMS_DH_KEY_INFO", "_CMS_DH_KEY_INFO *|CMS_DH_KEY_INFO *", 0, 0, (void*)&SwigPyBuiltin___CMS_DH_KEY_INFO_clientdata, 0};
 static swig_type_info _swigt__p__CRYPTOAPI_BLOB = {"_p__CRYPTOAPI_BLOB", "CRYPT_ATTR_BLOB *|DATA_BLOB *|CRYPT_DATA_BLOB *|CRYPT_DIGEST_BLOB *|CRYPTOAPI_BLOB *|CRYPT_DER_BLOB *|CRYPT_HASH_BLOB *|CRL_BLOB *|CERT_NAME_BLOB *|CERT_RDN_VALUE_BLOB *|CRYPT_UINT_BLOB *|CERT_BLOB *|CRYPT_OBJID_BLOB *|_CRYPTOAPI_BLOB *", 0, 0, (void*)&SwigPyBuiltin___CRYPTOAPI_BLOB_clientdata, 0};
@@ -22301,6 +24034,7 @@ static swig_type_info _swigt__p_wchar_t = {"_p_wchar_t", "WCHAR *|wchar_t *", 0,
 static swig_type_info *swig_type_initial[] = {
   &_swigt__p_CERT_EXTENSION,
   &_swigt__p_CERT_PUBLIC_KEY_INFO,
+  &_swigt__p_CMSStream,
   &_swigt__p_CRYPT_INTEGER_BLOB,
   &_swigt__p_CSPInfo,
   &_swigt__p_Cert,
@@ -22314,7 +24048,9 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_CryptDesc,
   &_swigt__p_CryptIter,
   &_swigt__p_CryptMsg,
+  &_swigt__p_DecryptStream,
   &_swigt__p_EKUIter,
+  &_swigt__p_EncryptStream,
   &_swigt__p_ExtIter,
   &_swigt__p_FILETIME,
   &_swigt__p_Hash,
@@ -22322,8 +24058,10 @@ static swig_type_info *swig_type_initial[] = {
   &_swigt__p_PCCERT_CONTEXT,
   &_swigt__p_PCERT_EXTENSION,
   &_swigt__p_RCObj,
+  &_swigt__p_SignStream,
   &_swigt__p_Signature,
   &_swigt__p_SwigPyObject,
+  &_swigt__p_VerifyStream,
   &_swigt__p__CERT_INFO,
   &_swigt__p__CMS_DH_KEY_INFO,
   &_swigt__p__CRYPTOAPI_BLOB,
@@ -22351,6 +24089,7 @@ static swig_type_info *swig_type_initial[] = {
 
 static swig_cast_info _swigc__p_CERT_EXTENSION[] = {  {&_swigt__p_CERT_EXTENSION, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_CERT_PUBLIC_KEY_INFO[] = {  {&_swigt__p_CERT_PUBLIC_KEY_INFO, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_CMSStream[] = {  {&_swigt__p_CMSStream, 0, 0, 0},  {&_swigt__p_VerifyStream, _p_VerifyStreamTo_p_CMSStream, 0, 0},  {&_swigt__p_SignStream, _p_SignStreamTo_p_CMSStream, 0, 0},  {&_swigt__p_DecryptStream, _p_DecryptStreamTo_p_CMSStream, 0, 0},  {&_swigt__p_EncryptStream, _p_EncryptStreamTo_p_CMSStream, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_CRYPT_INTEGER_BLOB[] = {  {&_swigt__p_CRYPT_INTEGER_BLOB, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_CSPInfo[] = {  {&_swigt__p_CSPInfo, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Cert[] = {  {&_swigt__p_Cert, 0, 0, 0},{0, 0, 0, 0}};
@@ -22364,16 +24103,20 @@ static swig_cast_info _swigc__p_Crypt[] = {  {&_swigt__p_Crypt, 0, 0, 0},{0, 0,
 static swig_cast_info _swigc__p_CryptDesc[] = {  {&_swigt__p_CryptDesc, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_CryptIter[] = {  {&_swigt__p_CryptIter, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_CryptMsg[] = {  {&_swigt__p_Signature, _p_SignatureTo_p_CryptMsg, 0, 0},  {&_swigt__p_CryptMsg, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_DecryptStream[] = {  {&_swigt__p_DecryptStream, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_EKUIter[] = {  {&_swigt__p_EKUIter, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_EncryptStream[] = {  {&_swigt__p_EncryptStream, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_ExtIter[] = {  {&_swigt__p_ExtIter, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_FILETIME[] = {  {&_swigt__p_FILETIME, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Hash[] = {  {&_swigt__p_Hash, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Key[] = {  {&_swigt__p_Key, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_PCCERT_CONTEXT[] = {  {&_swigt__p_PCCERT_CONTEXT, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_PCERT_EXTENSION[] = {  {&_swigt__p_PCERT_EXTENSION, 0, 0, 0},{0, 0, 0, 0}};
-static swig_cast_info _swigc__p_RCObj[] = {  {&_swigt__p_RCObj, 0, 0, 0},  {&_swigt__p_Signature, _p_SignatureTo_p_RCObj, 0, 0},  {&_swigt__p_Cert, _p_CertTo_p_RCObj, 0, 0},  {&_swigt__p_CertStore, _p_CertStoreTo_p_RCObj, 0, 0},  {&_swigt__p_CryptMsg, _p_CryptMsgTo_p_RCObj, 0, 0},  {&_swigt__p_CertInfo, _p_CertInfoTo_p_RCObj, 0, 0},  {&_swigt__p_Hash, _p_HashTo_p_RCObj, 0, 0},  {&_swigt__p_Crypt, _p_CryptTo_p_RCObj, 0, 0},  {&_swigt__p_Key, _p_KeyTo_p_RCObj, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_RCObj[] = {  {&_swigt__p_Crypt, _p_CryptTo_p_RCObj, 0, 0},  {&_swigt__p_CryptMsg, _p_CryptMsgTo_p_RCObj, 0, 0},  {&_swigt__p_Key, _p_KeyTo_p_RCObj, 0, 0},  {&_swigt__p_CertStore, _p_CertStoreTo_p_RCObj, 0, 0},  {&_swigt__p_CMSStream, _p_CMSStreamTo_p_RCObj, 0, 0},  {&_swigt__p_VerifyStream, _p_VerifyStreamTo_p_RCObj, 0, 0},  {&_swigt__p_CertInfo, _p_CertInfoTo_p_RCObj, 0, 0},  {&_swigt__p_Signature, _p_SignatureTo_p_RCObj, 0, 0},  {&_swigt__p_EncryptStream, _p_EncryptStreamTo_p_RCObj, 0, 0},  {&_swigt__p_DecryptStream, _p_DecryptStreamTo_p_RCObj, 0, 0},  {&_swigt__p_SignStream, _p_SignStreamTo_p_RCObj, 0, 0},  {&_swigt__p_RCObj, 0, 0, 0},  {&_swigt__p_Hash, _p_HashTo_p_RCObj, 0, 0},  {&_swigt__p_Cert, _p_CertTo_p_RCObj, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_SignStream[] = {  {&_swigt__p_SignStream, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_Signature[] = {  {&_swigt__p_Signature, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_SwigPyObject[] = {  {&_swigt__p_SwigPyObject, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_VerifyStream[] = {  {&_swigt__p_VerifyStream, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p__CERT_INFO[] = {  {&_swigt__p__CERT_INFO, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p__CMS_DH_KEY_INFO[] = {  {&_swigt__p__CMS_DH_KEY_INFO, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p__CRYPTOAPI_BLOB[] = {  {&_swigt__p__CRYPTOAPI_BLOB, 0, 0, 0},{0, 0, 0, 0}};
@@ -22401,6 +24144,7 @@ static swig_cast_info _swigc__p_wchar_t[] = {  {&_swigt__p_wchar_t, 0, 0, 0},{0,
 static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_CERT_EXTENSION,
   _swigc__p_CERT_PUBLIC_KEY_INFO,
+  _swigc__p_CMSStream,
   _swigc__p_CRYPT_INTEGER_BLOB,
   _swigc__p_CSPInfo,
   _swigc__p_Cert,
@@ -22414,7 +24158,9 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_CryptDesc,
   _swigc__p_CryptIter,
   _swigc__p_CryptMsg,
+  _swigc__p_DecryptStream,
   _swigc__p_EKUIter,
+  _swigc__p_EncryptStream,
   _swigc__p_ExtIter,
   _swigc__p_FILETIME,
   _swigc__p_Hash,
@@ -22422,8 +24168,10 @@ static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_PCCERT_CONTEXT,
   _swigc__p_PCERT_EXTENSION,
   _swigc__p_RCObj,
+  _swigc__p_SignStream,
   _swigc__p_Signature,
   _swigc__p_SwigPyObject,
+  _swigc__p_VerifyStream,
   _swigc__p__CERT_INFO,
   _swigc__p__CMS_DH_KEY_INFO,
   _swigc__p__CRYPTOAPI_BLOB,
@@ -24656,6 +26404,176 @@ SWIG_init(void) {
   SwigPyBuiltin_AddPublicSymbol(public_interface, "Hash");
   d = md;
   
+  /* type '::CMSStream' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__CMSStream_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_basetype = SWIG_MangledTypeQuery("_p_RCObj");
+  if (builtin_basetype && builtin_basetype->clientdata && ((SwigPyClientData *) builtin_basetype->clientdata)->pytype) {
+    builtin_bases[builtin_base_count++] = ((SwigPyClientData *) builtin_basetype->clientdata)->pytype;
+  } else {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'CMSStream' as base 'RCObj' has not been initialized.\n");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'CMSStream'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "CMSStream", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "CMSStream");
+  d = md;
+  
+  /* type '::SignStream' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__SignStream_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_basetype = SWIG_MangledTypeQuery("_p_CMSStream");
+  if (builtin_basetype && builtin_basetype->clientdata && ((SwigPyClientData *) builtin_basetype->clientdata)->pytype) {
+    builtin_bases[builtin_base_count++] = ((SwigPyClientData *) builtin_basetype->clientdata)->pytype;
+  } else {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'SignStream' as base 'CMSStream' has not been initialized.\n");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'SignStream'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "SignStream", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "SignStream");
+  d = md;
+  
+  /* type '::DecryptStream' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__DecryptStream_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_basetype = SWIG_MangledTypeQuery("_p_CMSStream");
+  if (builtin_basetype && builtin_basetype->clientdata && ((SwigPyClientData *) builtin_basetype->clientdata)->pytype) {
+    builtin_bases[builtin_base_count++] = ((SwigPyClientData *) builtin_basetype->clientdata)->pytype;
+  } else {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'DecryptStream' as base 'CMSStream' has not been initialized.\n");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'DecryptStream'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "DecryptStream", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "DecryptStream");
+  d = md;
+  
+  /* type '::EncryptStream' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__EncryptStream_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_basetype = SWIG_MangledTypeQuery("_p_CMSStream");
+  if (builtin_basetype && builtin_basetype->clientdata && ((SwigPyClientData *) builtin_basetype->clientdata)->pytype) {
+    builtin_bases[builtin_base_count++] = ((SwigPyClientData *) builtin_basetype->clientdata)->pytype;
+  } else {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'EncryptStream' as base 'CMSStream' has not been initialized.\n");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'EncryptStream'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "EncryptStream", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "EncryptStream");
+  d = md;
+  
+  /* type '::VerifyStream' */
+  builtin_pytype = (PyTypeObject *)&SwigPyBuiltin__VerifyStream_type;
+  builtin_pytype->tp_dict = d = PyDict_New();
+  SwigPyBuiltin_SetMetaType(builtin_pytype, metatype);
+  builtin_pytype->tp_new = PyType_GenericNew;
+  builtin_base_count = 0;
+  builtin_basetype = SWIG_MangledTypeQuery("_p_CMSStream");
+  if (builtin_basetype && builtin_basetype->clientdata && ((SwigPyClientData *) builtin_basetype->clientdata)->pytype) {
+    builtin_bases[builtin_base_count++] = ((SwigPyClientData *) builtin_basetype->clientdata)->pytype;
+  } else {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'VerifyStream' as base 'CMSStream' has not been initialized.\n");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  builtin_bases[builtin_base_count] = NULL;
+  SwigPyBuiltin_InitBases(builtin_pytype, builtin_bases);
+  PyDict_SetItemString(d, "this", this_descr);
+  PyDict_SetItemString(d, "thisown", thisown_descr);
+  if (PyType_Ready(builtin_pytype) < 0) {
+    PyErr_SetString(PyExc_TypeError, "Could not create type 'VerifyStream'.");
+#if PY_VERSION_HEX >= 0x03000000
+    return NULL;
+#else
+    return;
+#endif
+  }
+  Py_INCREF(builtin_pytype);
+  PyModule_AddObject(m, "VerifyStream", (PyObject *)builtin_pytype);
+  SwigPyBuiltin_AddPublicSymbol(public_interface, "VerifyStream");
+  d = md;
+  
   /* Initialize threading */
   SWIG_PYTHON_INITIALIZE_THREADS;
 #if PY_VERSION_HEX >= 0x03000000
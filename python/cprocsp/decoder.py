@@ -4,20 +4,116 @@
 # Copyright (c) 2005-2017, Ilya Etingof <etingof@gmail.com>
 # License: http://pyasn1.sf.net/license.html
 #
-from pyasn1.type import base, tag, univ, char, useful, tagmap
+# Modified for cprocsp: the decoder walks a single memoryview over the
+# substrate by integer offsets instead of slicing it at every TLV, so that
+# decoding time is linear in the substrate size. Only leaf values are
+# materialised into octet strings.
+#
+from pyasn1.type import base, tag, univ, char, useful, tagmap, namedtype
 from pyasn1.codec.ber import eoo
-from pyasn1.compat.octets import str2octs, oct2int, isOctetsType
+from pyasn1.compat.octets import str2octs, oct2int, null
 from pyasn1 import debug, error
+from binascii import hexlify
+
+
+def _octets(substrate, begin, end):
+    return substrate[begin:end].tobytes()
+
+
+def _view(substrate):
+    if isinstance(substrate, univ.OctetString):
+        substrate = substrate.asOctets()
+    try:
+        return memoryview(substrate)
+    except TypeError:
+        raise error.PyAsn1Error('Bad octet stream type')
+
+
+# Content octets of INTEGER and OBJECT IDENTIFIER values. OIDs repeat a
+# lot (RDN types, algorithms, extensions), so each distinct encoding is
+# decoded once per process.
+
+if hasattr(int, 'from_bytes'):
+    def _intFromOctets(octets):
+        return int.from_bytes(octets, 'big', signed=True)
+else:
+    def _intFromOctets(octets):
+        if not octets:
+            return 0
+        value = int(hexlify(octets), 16)
+        if oct2int(octets[0]) & 0x80:
+            value -= 1 << len(octets) * 8
+        return value
+
+_oidCache = {}
+_oidCacheSize = 4096
+
+
+def _decodeOid(octets):
+    try:
+        return _oidCache[octets]
+    except KeyError:
+        pass
+    if not octets:
+        raise error.PyAsn1Error('Empty substrate')
+    oid = []
+    subId = 0
+    for octet in bytearray(octets):
+        if octet == 0x80 and not subId:
+            # ASN.1 spec forbids leading zeros (0x80) in OID
+            # encoding, tolerating it opens a vulnerability. See
+            # http://www.cosic.esat.kuleuven.be/publications/article-1432.pdf
+            # page 7
+            raise error.PyAsn1Error('Invalid octet 0x80 in OID encoding')
+        subId = subId << 7 | octet & 0x7F
+        if octet < 0x80:
+            oid.append(subId)
+            subId = 0
+    if octet >= 0x80:
+        raise error.SubstrateUnderrunError(
+            'Short substrate for sub-OID past %s' % (tuple(oid),)
+        )
+    # Decode two leading arcs
+    first = oid[0]
+    if first < 40:
+        oid.insert(0, 0)
+    elif first < 80:
+        oid[0:1] = (1, first - 40)
+    else:
+        oid[0:1] = (2, first - 80)
+    oid = tuple(oid)
+    if len(_oidCache) >= _oidCacheSize:
+        _oidCache.clear()
+    _oidCache[octets] = oid
+    return oid
+
+
+# Segments of a constructed string (OCTET STRING or BIT STRING) are joined once instead of being
+# concatenated one by one, which is quadratic for the large indefinite
+# length content produced by streaming encoders.
+def _joinSegments(r, segments):
+    if not segments:
+        return r
+    return r.clone(r.asOctets() + str2octs('').join(segments))
+
+
+def _joinBits(r, segments):
+    if not segments:
+        return r
+    bits = list(r)
+    for segment in segments:
+        bits.extend(segment)
+    return r.clone(tuple(bits))
 
 
 class AbstractDecoder(object):
     protoComponent = None
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                      length, state, decodeFun, substrateFun):
         raise error.PyAsn1Error('Decoder not implemented for %s' % (tagSet,))
 
-    def indefLenValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def indefLenValueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                              length, state, decodeFun, substrateFun):
         raise error.PyAsn1Error('Indefinite length mode decoder not implemented for %s' % (tagSet,))
 
@@ -53,29 +149,28 @@ class ExplicitTagDecoder(AbstractSimpleDecoder):
     protoComponent = univ.Any('')
     tagFormats = (tag.tagFormatConstructed,)
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                      length, state, decodeFun, substrateFun):
         if substrateFun:
             return substrateFun(
                 self._createComponent(asn1Spec, tagSet, ''),
-                substrate, length
+                substrate, pos, end, length
             )
-        head, tail = substrate[:length], substrate[length:]
-        value, _ = decodeFun(head, asn1Spec, tagSet, length)
-        return value, tail
+        value, _ = decodeFun(substrate, pos, pos + length, asn1Spec, tagSet, length)
+        return value, pos + length
 
-    def indefLenValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def indefLenValueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                              length, state, decodeFun, substrateFun):
         if substrateFun:
             return substrateFun(
                 self._createComponent(asn1Spec, tagSet, ''),
-                substrate, length
+                substrate, pos, end, length
             )
-        value, substrate = decodeFun(substrate, asn1Spec, tagSet, length)
-        terminator, substrate = decodeFun(substrate, allowEoo=True)
+        value, pos = decodeFun(substrate, pos, end, asn1Spec, tagSet, length)
+        terminator, pos = decodeFun(substrate, pos, end, allowEoo=True)
         if eoo.endOfOctets.isSameTypeWith(terminator) and \
                 terminator == eoo.endOfOctets:
-            return value, substrate
+            return value, pos
         else:
             raise error.PyAsn1Error('Missing end-of-octets terminator')
 
@@ -103,22 +198,16 @@ class IntegerDecoder(AbstractSimpleDecoder):
         str2octs('\xfb'): -5
     }
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet, length,
-                     state, decodeFun, substrateFun):
-        head, tail = substrate[:length], substrate[length:]
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
+                     length, state, decodeFun, substrateFun):
+        head = _octets(substrate, pos, pos + length)
         if not head:
-            return self._createComponent(asn1Spec, tagSet, 0), tail
+            return self._createComponent(asn1Spec, tagSet, 0), pos + length
         if head in self.precomputedValues:
             value = self.precomputedValues[head]
         else:
-            firstOctet = oct2int(head[0])
-            if firstOctet & 0x80:
-                value = -1
-            else:
-                value = 0
-            for octet in head:
-                value = value << 8 | oct2int(octet)
-        return self._createComponent(asn1Spec, tagSet, value), tail
+            value = _intFromOctets(head)
+        return self._createComponent(asn1Spec, tagSet, value), pos + length
 
 
 class BooleanDecoder(IntegerDecoder):
@@ -133,58 +222,60 @@ class BitStringDecoder(AbstractSimpleDecoder):
     tagFormats = (tag.tagFormatSimple, tag.tagFormatConstructed)
     supportConstructedForm = True
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet, length,
-                     state, decodeFun, substrateFun):
-        head, tail = substrate[:length], substrate[length:]
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
+                     length, state, decodeFun, substrateFun):
+        stop = pos + length
         if tagSet[0][1] == tag.tagFormatSimple:  # XXX what tag to check?
-            if not head:
+            if not length:
                 raise error.PyAsn1Error('Empty substrate')
-            trailingBits = oct2int(head[0])
+            trailingBits = oct2int(substrate[pos])
             if trailingBits > 7:
                 raise error.PyAsn1Error(
                     'Trailing bits overflow %s' % trailingBits
                 )
-            head = head[1:]
-            lsb = p = 0
-            l = len(head) - 1
+            lsb = 0
+            p = pos + 1
+            l = stop - 1
             b = []
             while p <= l:
                 if p == l:
                     lsb = trailingBits
                 j = 7
-                o = oct2int(head[p])
+                o = oct2int(substrate[p])
                 while j >= lsb:
                     b.append((o >> j) & 0x01)
                     j -= 1
                 p += 1
-            return self._createComponent(asn1Spec, tagSet, b), tail
+            return self._createComponent(asn1Spec, tagSet, b), stop
         if not self.supportConstructedForm:
             raise error.PyAsn1Error('Constructed encoding form prohibited at %s' % self.__class__.__name__)
         r = self._createComponent(asn1Spec, tagSet, ())
         if substrateFun:
-            return substrateFun(r, substrate, length)
-        while head:
-            component, head = decodeFun(head, self.protoComponent)
-            r = r + component
-        return r, tail
-
-    def indefLenValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+            return substrateFun(r, substrate, pos, end, length)
+        segments = []
+        while pos < stop:
+            component, pos = decodeFun(substrate, pos, stop, self.protoComponent)
+            segments.append(tuple(component))
+        return _joinBits(r, segments), stop
+
+    def indefLenValueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                              length, state, decodeFun, substrateFun):
         r = self._createComponent(asn1Spec, tagSet, '')
         if substrateFun:
-            return substrateFun(r, substrate, length)
-        while substrate:
-            component, substrate = decodeFun(substrate, self.protoComponent,
-                                             allowEoo=True)
+            return substrateFun(r, substrate, pos, end, length)
+        segments = []
+        while pos < end:
+            component, pos = decodeFun(substrate, pos, end, self.protoComponent,
+                                       allowEoo=True)
             if eoo.endOfOctets.isSameTypeWith(component) and \
                     component == eoo.endOfOctets:
                 break
-            r = r + component
+            segments.append(tuple(component))
 #          else:
 #              raise error.SubstrateUnderrunError(
 #                  'No EOO seen before substrate ends'
 #              )
-        return r, substrate
+        return _joinBits(r, segments), pos
 
 
 class OctetStringDecoder(AbstractSimpleDecoder):
@@ -192,110 +283,71 @@ class OctetStringDecoder(AbstractSimpleDecoder):
     tagFormats = (tag.tagFormatSimple, tag.tagFormatConstructed)
     supportConstructedForm = True
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet, length,
-                     state, decodeFun, substrateFun):
-        head, tail = substrate[:length], substrate[length:]
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
+                     length, state, decodeFun, substrateFun):
+        stop = pos + length
         if tagSet[0][1] == tag.tagFormatSimple:  # XXX what tag to check?
-            return self._createComponent(asn1Spec, tagSet, head), tail
+            return self._createComponent(asn1Spec, tagSet, _octets(substrate, pos, stop)), stop
         if not self.supportConstructedForm:
             raise error.PyAsn1Error('Constructed encoding form prohibited at %s' % self.__class__.__name__)
         r = self._createComponent(asn1Spec, tagSet, '')
         if substrateFun:
-            return substrateFun(r, substrate, length)
-        while head:
-            component, head = decodeFun(head, self.protoComponent)
-            r = r + component
-        return r, tail
-
-    def indefLenValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+            return substrateFun(r, substrate, pos, end, length)
+        segments = []
+        while pos < stop:
+            component, pos = decodeFun(substrate, pos, stop, self.protoComponent)
+            segments.append(component.asOctets())
+        return _joinSegments(r, segments), stop
+
+    def indefLenValueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                              length, state, decodeFun, substrateFun):
         r = self._createComponent(asn1Spec, tagSet, '')
         if substrateFun:
-            return substrateFun(r, substrate, length)
-        while substrate:
-            component, substrate = decodeFun(substrate, self.protoComponent,
-                                             allowEoo=True)
+            return substrateFun(r, substrate, pos, end, length)
+        segments = []
+        while pos < end:
+            component, pos = decodeFun(substrate, pos, end, self.protoComponent,
+                                       allowEoo=True)
             if eoo.endOfOctets.isSameTypeWith(component) and \
                     component == eoo.endOfOctets:
                 break
-            r = r + component
+            segments.append(component.asOctets())
 #          else:
 #              raise error.SubstrateUnderrunError(
 #                  'No EOO seen before substrate ends'
 #              )
-        return r, substrate
+        return _joinSegments(r, segments), pos
 
 
 class NullDecoder(AbstractSimpleDecoder):
     protoComponent = univ.Null('')
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                      length, state, decodeFun, substrateFun):
-        head, tail = substrate[:length], substrate[length:]
         r = self._createComponent(asn1Spec, tagSet)
-        if head:
+        if length:
             raise error.PyAsn1Error('Unexpected %d-octet substrate for Null' % length)
-        return r, tail
+        return r, pos
 
 
 class ObjectIdentifierDecoder(AbstractSimpleDecoder):
     protoComponent = univ.ObjectIdentifier(())
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet, length,
-                     state, decodeFun, substrateFun):
-        head, tail = substrate[:length], substrate[length:]
-        if not head:
-            raise error.PyAsn1Error('Empty substrate')
-
-        oid = ()
-        index = 0
-        substrateLen = len(head)
-        while index < substrateLen:
-            subId = oct2int(head[index])
-            index += 1
-            if subId < 128:
-                oid = oid + (subId,)
-            elif subId > 128:
-                # Construct subid from a number of octets
-                nextSubId = subId
-                subId = 0
-                while nextSubId >= 128:
-                    subId = (subId << 7) + (nextSubId & 0x7F)
-                    if index >= substrateLen:
-                        raise error.SubstrateUnderrunError(
-                            'Short substrate for sub-OID past %s' % (oid,)
-                        )
-                    nextSubId = oct2int(head[index])
-                    index += 1
-                oid = oid + ((subId << 7) + nextSubId,)
-            elif subId == 128:
-                # ASN.1 spec forbids leading zeros (0x80) in OID
-                # encoding, tolerating it opens a vulnerability. See
-                # http://www.cosic.esat.kuleuven.be/publications/article-1432.pdf
-                # page 7
-                raise error.PyAsn1Error('Invalid octet 0x80 in OID encoding')
-
-        # Decode two leading arcs
-        if 0 <= oid[0] <= 39:
-            oid = (0,) + oid
-        elif 40 <= oid[0] <= 79:
-            oid = (1, oid[0] - 40) + oid[1:]
-        elif oid[0] >= 80:
-            oid = (2, oid[0] - 80) + oid[1:]
-        else:
-            raise error.PyAsn1Error('Malformed first OID octet: %s' % head[0])
-
-        return self._createComponent(asn1Spec, tagSet, oid), tail
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
+                     length, state, decodeFun, substrateFun):
+        oid = _decodeOid(_octets(substrate, pos, pos + length))
+        return self._createComponent(asn1Spec, tagSet, oid), pos + length
 
 
 class RealDecoder(AbstractSimpleDecoder):
     protoComponent = univ.Real()
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                      length, state, decodeFun, substrateFun):
-        head, tail = substrate[:length], substrate[length:]
+        stop = pos + length
+        head = _octets(substrate, pos, stop)
         if not head:
-            return self._createComponent(asn1Spec, tagSet, 0.0), tail
+            return self._createComponent(asn1Spec, tagSet, 0.0), stop
         fo = oct2int(head[0])
         head = head[1:]
         if fo & 0x80:  # binary encoding
@@ -354,7 +406,7 @@ class RealDecoder(AbstractSimpleDecoder):
             raise error.SubstrateUnderrunError(
                 'Unknown encoding (tag %s)' % fo
             )
-        return self._createComponent(asn1Spec, tagSet, value), tail
+        return self._createComponent(asn1Spec, tagSet, value), stop
 
 
 class SequenceDecoder(AbstractConstructedDecoder):
@@ -369,16 +421,16 @@ class SequenceDecoder(AbstractConstructedDecoder):
     def _getComponentPositionByType(self, r, t, idx):
         return r.getComponentPositionNearType(t, idx)
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                      length, state, decodeFun, substrateFun):
-        head, tail = substrate[:length], substrate[length:]
+        stop = pos + length
         r = self._createComponent(asn1Spec, tagSet)
         idx = 0
         if substrateFun:
-            return substrateFun(r, substrate, length)
-        while head:
+            return substrateFun(r, substrate, pos, end, length)
+        while pos < stop:
             asn1Spec = self._getComponentTagMap(r, idx)
-            component, head = decodeFun(head, asn1Spec)
+            component, pos = decodeFun(substrate, pos, stop, asn1Spec)
             idx = self._getComponentPositionByType(
                 r, component.getEffectiveTagSet(), idx
             )
@@ -386,17 +438,17 @@ class SequenceDecoder(AbstractConstructedDecoder):
             idx += 1
         r.setDefaultComponents()
         r.verifySizeSpec()
-        return r, tail
+        return r, stop
 
-    def indefLenValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def indefLenValueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                              length, state, decodeFun, substrateFun):
         r = self._createComponent(asn1Spec, tagSet)
         if substrateFun:
-            return substrateFun(r, substrate, length)
+            return substrateFun(r, substrate, pos, end, length)
         idx = 0
-        while substrate:
+        while pos < end:
             asn1Spec = self._getComponentTagMap(r, idx)
-            component, substrate = decodeFun(substrate, asn1Spec, allowEoo=True)
+            component, pos = decodeFun(substrate, pos, end, asn1Spec, allowEoo=True)
             if eoo.endOfOctets.isSameTypeWith(component) and \
                     component == eoo.endOfOctets:
                 break
@@ -411,36 +463,36 @@ class SequenceDecoder(AbstractConstructedDecoder):
 #              )
         r.setDefaultComponents()
         r.verifySizeSpec()
-        return r, substrate
+        return r, pos
 
 
 class SequenceOfDecoder(AbstractConstructedDecoder):
     protoComponent = univ.SequenceOf()
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                      length, state, decodeFun, substrateFun):
-        head, tail = substrate[:length], substrate[length:]
+        stop = pos + length
         r = self._createComponent(asn1Spec, tagSet)
         if substrateFun:
-            return substrateFun(r, substrate, length)
+            return substrateFun(r, substrate, pos, end, length)
         asn1Spec = r.getComponentType()
         idx = 0
-        while head:
-            component, head = decodeFun(head, asn1Spec)
+        while pos < stop:
+            component, pos = decodeFun(substrate, pos, stop, asn1Spec)
             r.setComponentByPosition(idx, component, asn1Spec is None)
             idx += 1
         r.verifySizeSpec()
-        return r, tail
+        return r, stop
 
-    def indefLenValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def indefLenValueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                              length, state, decodeFun, substrateFun):
         r = self._createComponent(asn1Spec, tagSet)
         if substrateFun:
-            return substrateFun(r, substrate, length)
+            return substrateFun(r, substrate, pos, end, length)
         asn1Spec = r.getComponentType()
         idx = 0
-        while substrate:
-            component, substrate = decodeFun(substrate, asn1Spec, allowEoo=True)
+        while pos < end:
+            component, pos = decodeFun(substrate, pos, end, asn1Spec, allowEoo=True)
             if eoo.endOfOctets.isSameTypeWith(component) and \
                     component == eoo.endOfOctets:
                 break
@@ -451,7 +503,7 @@ class SequenceOfDecoder(AbstractConstructedDecoder):
 #                  'No EOO seen before substrate ends'
 #              )
         r.verifySizeSpec()
-        return r, substrate
+        return r, pos
 
 
 class SetDecoder(SequenceDecoder):
@@ -476,75 +528,75 @@ class ChoiceDecoder(AbstractConstructedDecoder):
     protoComponent = univ.Choice()
     tagFormats = (tag.tagFormatSimple, tag.tagFormatConstructed)
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                      length, state, decodeFun, substrateFun):
-        head, tail = substrate[:length], substrate[length:]
+        stop = pos + length
         r = self._createComponent(asn1Spec, tagSet)
         if substrateFun:
-            return substrateFun(r, substrate, length)
+            return substrateFun(r, substrate, pos, end, length)
         if r.getTagSet() == tagSet:  # explicitly tagged Choice
-            component, head = decodeFun(
-                head, r.getComponentTagMap()
+            component, _ = decodeFun(
+                substrate, pos, stop, r.getComponentTagMap()
             )
         else:
-            component, head = decodeFun(
-                head, r.getComponentTagMap(), tagSet, length, state
+            component, _ = decodeFun(
+                substrate, pos, stop, r.getComponentTagMap(), tagSet, length, state
             )
         if isinstance(component, univ.Choice):
             effectiveTagSet = component.getEffectiveTagSet()
         else:
             effectiveTagSet = component.getTagSet()
         r.setComponentByType(effectiveTagSet, component, 0, asn1Spec is None)
-        return r, tail
+        return r, stop
 
-    def indefLenValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def indefLenValueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                              length, state, decodeFun, substrateFun):
         r = self._createComponent(asn1Spec, tagSet)
         if substrateFun:
-            return substrateFun(r, substrate, length)
+            return substrateFun(r, substrate, pos, end, length)
         if r.getTagSet() == tagSet:  # explicitly tagged Choice
-            component, substrate = decodeFun(substrate, r.getComponentTagMap())
+            component, pos = decodeFun(substrate, pos, end, r.getComponentTagMap())
             # eat up EOO marker
-            eooMarker, substrate = decodeFun(substrate, allowEoo=True)
+            eooMarker, pos = decodeFun(substrate, pos, end, allowEoo=True)
             if not eoo.endOfOctets.isSameTypeWith(eooMarker) or \
                     eooMarker != eoo.endOfOctets:
                 raise error.PyAsn1Error('No EOO seen before substrate ends')
         else:
-            component, substrate = decodeFun(
-                substrate, r.getComponentTagMap(), tagSet, length, state
+            component, pos = decodeFun(
+                substrate, pos, end, r.getComponentTagMap(), tagSet, length, state
             )
         if isinstance(component, univ.Choice):
             effectiveTagSet = component.getEffectiveTagSet()
         else:
             effectiveTagSet = component.getTagSet()
         r.setComponentByType(effectiveTagSet, component, 0, asn1Spec is None)
-        return r, substrate
+        return r, pos
 
 
 class AnyDecoder(AbstractSimpleDecoder):
     protoComponent = univ.Any()
     tagFormats = (tag.tagFormatSimple, tag.tagFormatConstructed)
 
-    def valueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def valueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                      length, state, decodeFun, substrateFun):
+        stop = pos + length
         if asn1Spec is None or asn1Spec is not None and tagSet != asn1Spec.getTagSet():
             # untagged Any container, recover inner header substrate
-            length = length + len(fullSubstrate) - len(substrate)
-            substrate = fullSubstrate
+            length = stop - headerPos
+            pos = headerPos
         if substrateFun:
             return substrateFun(self._createComponent(asn1Spec, tagSet),
-                                substrate, length)
-        head, tail = substrate[:length], substrate[length:]
-        return self._createComponent(asn1Spec, tagSet, value=head), tail
+                                substrate, pos, end, length)
+        return self._createComponent(asn1Spec, tagSet, value=_octets(substrate, pos, stop)), stop
 
-    def indefLenValueDecoder(self, fullSubstrate, substrate, asn1Spec, tagSet,
+    def indefLenValueDecoder(self, substrate, headerPos, pos, end, asn1Spec, tagSet,
                              length, state, decodeFun, substrateFun):
         if asn1Spec is not None and tagSet == asn1Spec.getTagSet():
             # tagged Any type -- consume header substrate
             header = ''
         else:
             # untagged Any, recover header substrate
-            header = fullSubstrate[:-len(substrate)]
+            header = _octets(substrate, headerPos, pos)
 
         r = self._createComponent(asn1Spec, tagSet, header)
 
@@ -552,18 +604,19 @@ class AnyDecoder(AbstractSimpleDecoder):
         asn1Spec = self.protoComponent
 
         if substrateFun:
-            return substrateFun(r, substrate, length)
-        while substrate:
-            component, substrate = decodeFun(substrate, asn1Spec, allowEoo=True)
+            return substrateFun(r, substrate, pos, end, length)
+        segments = []
+        while pos < end:
+            component, pos = decodeFun(substrate, pos, end, asn1Spec, allowEoo=True)
             if eoo.endOfOctets.isSameTypeWith(component) and \
                     component == eoo.endOfOctets:
                 break
-            r = r + component
+            segments.append(component.asOctets())
 #          else:
 #              raise error.SubstrateUnderrunError(
 #                  'No EOO seen before substrate ends'
 #              )
-        return r, substrate
+        return _joinSegments(r, segments), pos
 
 
 # character string types
@@ -669,6 +722,8 @@ typeMap = {
  stDumpRawValue, stErrorCondition, stStop) = [x for x in range(10)]
 
 
+
+
 class Decoder(object):
     defaultErrorState = stErrorCondition
     #    defaultErrorState = stDumpRawValue
@@ -686,38 +741,61 @@ class Decoder(object):
     def __call__(self, substrate, asn1Spec=None, tagSet=None,
                  length=None, state=stDecodeTag, recursiveFlag=1,
                  substrateFun=None, allowEoo=False):
+        view = _view(substrate)
+        rawResult = []
+        if recursiveFlag == 0 and not substrateFun:  # legacy
+            def substrateFun(a, b, c):
+                return a, b[:c]
+        if substrateFun:
+            userFun = substrateFun
+
+            def substrateFun(asn1Object, substrate, pos, end, length):
+                rawResult.append(
+                    userFun(asn1Object, _octets(substrate, pos, end), length)
+                )
+                return asn1Object, end
+        value, pos = self.decodeAt(view, 0, len(view), asn1Spec, tagSet,
+                                   length, state, substrateFun, allowEoo)
+        if rawResult:
+            return rawResult[0]
+        return value, substrate[pos:]
+
+    def decodeAt(self, substrate, pos, end, asn1Spec=None, tagSet=None,
+                 length=None, state=stDecodeTag, substrateFun=None,
+                 allowEoo=False):
+        """Decode one TLV of the *substrate* memoryview starting at offset
+        *pos* and not crossing offset *end*. Returns the decoded value and
+        the offset right past it.
+        """
         if debug.logger & debug.flagDecoder:
-            debug.logger('decoder called at scope %s with state %d, working with up to %d octets of substrate: %s' % (debug.scope, state, len(substrate), debug.hexdump(substrate)))
+            debug.logger('decoder called at scope %s with state %d, working with up to %d octets of substrate: %s' % (debug.scope, state, end - pos, debug.hexdump(_octets(substrate, pos, end))))
         if asn1Spec is not None and not isinstance(asn1Spec, (base.Asn1Item, tagmap.TagMap)):
             raise error.PyAsn1Error(
                 'asn1Spec is not valid (should be an instance of an ASN.1 Item, not %s)' % asn1Spec.__class__.__name__)
 
         value = base.noValue
 
-        fullSubstrate = substrate
+        headerPos = pos
         while state != stStop:
             if state == stDecodeTag:
-                if not substrate:
+                if pos >= end:
                     raise error.SubstrateUnderrunError(
                         'Short octet stream on tag decoding'
                     )
-                if not isOctetsType(substrate) and \
-                        not isinstance(substrate, univ.OctetString):
-                    raise error.PyAsn1Error('Bad octet stream type')
                 # Decode tag
-                firstOctet = substrate[0]
-                substrate = substrate[1:]
+                firstOctet = substrate[pos]
+                pos += 1
                 if firstOctet in self.__tagCache:
                     lastTag = self.__tagCache[firstOctet]
                 else:
                     t = oct2int(firstOctet)
                     # Look for end-of-octets sentinel
                     if t == 0:
-                        if substrate and oct2int(substrate[0]) == 0:
+                        if pos < end and oct2int(substrate[pos]) == 0:
                             if allowEoo and self.supportIndefLength:
                                 debug.logger and debug.logger & debug.flagDecoder and debug.logger(
                                     'end-of-octets sentinel found')
-                                value, substrate = eoo.endOfOctets, substrate[1:]
+                                value, pos = eoo.endOfOctets, pos + 1
                                 state = stStop
                                 continue
                             else:
@@ -732,13 +810,13 @@ class Decoder(object):
                         short = False
                         tagId = 0
                         while True:
-                            if not substrate:
+                            if pos >= end:
                                 raise error.SubstrateUnderrunError(
                                     'Short octet stream on long tag decoding'
                                 )
-                            t = oct2int(substrate[0])
+                            t = oct2int(substrate[pos])
                             tagId = tagId << 7 | (t & 0x7F)
-                            substrate = substrate[1:]
+                            pos += 1
                             if not t & 0x80:
                                 break
                     lastTag = tag.Tag(
@@ -762,11 +840,11 @@ class Decoder(object):
                     'tag decoded into %s, decoding length' % tagSet)
             if state == stDecodeLength:
                 # Decode length
-                if not substrate:
+                if pos >= end:
                     raise error.SubstrateUnderrunError(
                         'Short octet stream on length decoding'
                     )
-                firstOctet = oct2int(substrate[0])
+                firstOctet = oct2int(substrate[pos])
                 if firstOctet == 128:
                     size = 1
                     length = -1
@@ -776,27 +854,26 @@ class Decoder(object):
                     size = firstOctet & 0x7F
                     # encoded in size bytes
                     length = 0
-                    lengthString = substrate[1:size + 1]
                     # missing check on maximum size, which shouldn't be a
                     # problem, we can handle more than is possible
-                    if len(lengthString) != size:
+                    if end - pos - 1 < size:
                         raise error.SubstrateUnderrunError(
                             '%s<%s at %s' %
-                            (size, len(lengthString), tagSet)
+                            (size, end - pos - 1, tagSet)
                         )
-                    for char in lengthString:
-                        length = (length << 8) | oct2int(char)
+                    for index in range(pos + 1, pos + size + 1):
+                        length = (length << 8) | oct2int(substrate[index])
                     size += 1
-                substrate = substrate[size:]
-                if length != -1 and len(substrate) < length:
+                pos += size
+                if length != -1 and end - pos < length:
                     raise error.SubstrateUnderrunError(
-                        '%d-octet short' % (length - len(substrate))
+                        '%d-octet short' % (length - (end - pos))
                     )
                 if length == -1 and not self.supportIndefLength:
                     raise error.PyAsn1Error('Indefinite length encoding not supported by this codec')
                 state = stGetValueDecoder
                 debug.logger and debug.logger & debug.flagDecoder and debug.logger(
-                    'value length decoded into %d, payload substrate is: %s' % (length, debug.hexdump(length == -1 and substrate or substrate[:length]))
+                    'value length decoded into %d, payload substrate is: %s' % (length, debug.hexdump(_octets(substrate, pos, length == -1 and end or pos + length)))
                 )
             if state == stGetValueDecoder:
                 if asn1Spec is None:
@@ -903,22 +980,19 @@ class Decoder(object):
                     'codec %s chosen, decoding value' % concreteDecoder.__class__.__name__)
                 state = stDecodeValue
             if state == stDecodeValue:
-                if recursiveFlag == 0 and not substrateFun:  # legacy
-                    def substrateFun(a, b, c):
-                        return a, b[:c]
                 if length == -1:  # indef length
-                    value, substrate = concreteDecoder.indefLenValueDecoder(
-                        fullSubstrate, substrate, asn1Spec, tagSet, length,
-                        stGetValueDecoder, self, substrateFun
+                    value, pos = concreteDecoder.indefLenValueDecoder(
+                        substrate, headerPos, pos, end, asn1Spec, tagSet, length,
+                        stGetValueDecoder, self.decodeAt, substrateFun
                     )
                 else:
-                    value, substrate = concreteDecoder.valueDecoder(
-                        fullSubstrate, substrate, asn1Spec, tagSet, length,
-                        stGetValueDecoder, self, substrateFun
+                    value, pos = concreteDecoder.valueDecoder(
+                        substrate, headerPos, pos, end, asn1Spec, tagSet, length,
+                        stGetValueDecoder, self.decodeAt, substrateFun
                     )
                 state = stStop
                 debug.logger and debug.logger & debug.flagDecoder and debug.logger(
-                    'codec %s yields type %s, value:\n%s\n...remaining substrate is: %s' % (concreteDecoder.__class__.__name__, value.__class__.__name__, value.prettyPrint(), substrate and debug.hexdump(substrate) or '<none>'))
+                    'codec %s yields type %s, value:\n%s\n...remaining substrate is: %s' % (concreteDecoder.__class__.__name__, value.__class__.__name__, value.prettyPrint(), pos < end and debug.hexdump(_octets(substrate, pos, end)) or '<none>'))
             if state == stErrorCondition:
                 raise error.PyAsn1Error(
                     '%s not in asn1Spec: %s' % (tagSet, asn1Spec)
@@ -926,7 +1000,7 @@ class Decoder(object):
         if debug.logger and debug.logger & debug.flagDecoder:
             debug.scope.pop()
             debug.logger('decoder left scope %s, call completed' % debug.scope)
-        return value, substrate
+        return value, pos
 
 
 #: Turns BER octet stream into an ASN.1 object.
@@ -938,7 +1012,7 @@ class Decoder(object):
 #: Parameters
 #: ----------
 #: substrate: :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
-#:     BER octetstream
+#:     BER octetstream, or any other object supporting the buffer protocol
 #:
 #: asn1Spec: any pyasn1 type object e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative
 #:     A pyasn1 type object to act as a template guiding the decoder. Depending on the ASN.1 structure
@@ -959,3 +1033,718 @@ decode = Decoder(tagMap, typeMap)
 
 # XXX
 # non-recursive decoding; return position rather than substrate
+
+
+# Compiled decoders
+#
+# Decoding against a fixed asn1Spec (X.509 certificates, names, CMS
+# structures) does not need the generic state machine. A tree of nodes
+# mirroring the spec is built once; every node knows the identifier octets
+# it expects and, for constructed types, which component an identifier
+# octet selects. Values are built by the same value decoders and pyasn1
+# calls as above. Whatever the compiled tree does not expect (indefinite
+# length, long tags, unknown components, malformed input) is handed over
+# to the generic decoder for that subtree, so results are the same and
+# malformed input raises the same exception types.
+#
+# Values are not built through clone() and setComponentByPosition(): every
+# node keeps the instance state of an empty clone of its spec and new
+# objects get a copy of it with the decoded payload filled in, which is
+# what the pyasn1 constructors would leave behind. This is only done for
+# the stock pyasn1 constructors and for simple types without subtype
+# constraints, everything else still goes through clone().
+#
+# The same tree can produce plain Python values instead of pyasn1 objects
+# (see toNative() for the mapping). No pyasn1 objects are created then
+# except on the fallback path, and subtype and size constraints are not
+# verified.
+
+def _identOctet(t):
+    if t[2] >= 0x1F:
+        return None
+    return t[0] | t[1] | t[2]
+
+
+def _peel(substrate, pos, end, idents):
+    """Match nested definite length headers with identifier octets *idents*
+    (outermost first) at *pos*. Returns the innermost content bounds and the
+    end of the outermost TLV, or None if the headers do not match.
+    """
+    stop = None
+    for ident in idents:
+        if end - pos < 2 or oct2int(substrate[pos]) != ident:
+            return None
+        length = oct2int(substrate[pos + 1])
+        pos += 2
+        if length > 0x80:
+            size = length & 0x7F
+            if end - pos < size:
+                return None
+            length = 0
+            for octet in bytearray(substrate[pos:pos + size]):
+                length = length << 8 | octet
+            pos += size
+        elif length == 0x80:
+            return None
+        if end - pos < length:
+            return None
+        end = pos + length
+        if stop is None:
+            stop = end
+    return pos, end, stop
+
+
+_newObject = object.__new__
+
+
+def _function(cls, name):
+    method = getattr(cls, name)
+    return getattr(method, '__func__', method)
+
+
+_simpleInits = (_function(univ.Integer, '__init__'),
+                _function(univ.OctetString, '__init__'))
+_simplePrettyIns = (_function(univ.Integer, 'prettyIn'),
+                    _function(univ.OctetString, 'prettyIn'))
+_constructedInits = (_function(univ.Sequence, '__init__'),
+                     _function(univ.SequenceOf, '__init__'))
+
+
+def _valueFactory(spec, sample):
+    """Returns a function making the same object as spec.clone(value) for
+    *value* of the type prettyIn() returns unchanged (like *sample*), or
+    None if the spec does not allow that shortcut
+    """
+    cls = spec.__class__
+    if _function(cls, '__init__') not in _simpleInits or \
+            _function(cls, 'prettyIn') not in _simplePrettyIns or \
+            len(spec.getSubtypeSpec()):
+        return None
+    state = spec.clone(sample).__dict__
+
+    def make(value):
+        obj = _newObject(cls)
+        obj.__dict__ = d = state.copy()
+        d['_value'] = value
+        d['_AbstractSimpleAsn1Item__hashedValue'] = hash(value)
+        return obj
+    return make
+
+
+def _emptyFactory(spec):
+    """Returns a function making the same object as spec.clone() for
+    constructed types, or None if the spec does not allow that shortcut
+    """
+    cls = spec.__class__
+    if _function(cls, '__init__') not in _constructedInits:
+        return None
+    # component types are immutable, a single copy is shared
+    state = spec.clone().__dict__
+
+    def make(componentValues, count):
+        obj = _newObject(cls)
+        obj.__dict__ = d = state.copy()
+        d['_componentValues'] = componentValues
+        d['_componentValuesSet'] = count
+        return obj
+    return make
+
+
+class _Node(object):
+    def __init__(self, spec):
+        self.spec = spec
+        self.tagSet = spec.getTagSet()
+        self.sizeSpec = len(getattr(spec, 'getSizeSpec', tuple)())
+        idents = [_identOctet(self.tagSet[i])
+                  for i in range(len(self.tagSet) - 1, -1, -1)]
+        self.idents = None if None in idents else tuple(idents)
+
+    def link(self, compileNode):
+        pass
+
+    def firstOctets(self):
+        """Identifier octets this value may start with, None for any"""
+        if self.idents is None:
+            return ()
+        return self.idents[:1]
+
+    def fallback(self, substrate, pos, end):
+        return decode.decodeAt(substrate, pos, end, self.spec)
+
+    def nativeFallback(self, substrate, pos, end):
+        value, pos = self.fallback(substrate, pos, end)
+        return toNative(value), pos
+
+    def native(self, substrate, pos, end):
+        value, pos = self.decode(substrate, pos, end)
+        return toNative(value), pos
+
+
+class _SimpleNode(_Node):
+    def __init__(self, spec, concreteDecoder):
+        _Node.__init__(self, spec)
+        self.concreteDecoder = concreteDecoder
+
+    def decode(self, substrate, pos, end):
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds:
+            return self.fallback(substrate, pos, end)
+        body, bodyEnd, stop = bounds
+        value, _ = self.concreteDecoder.valueDecoder(
+            substrate, body, body, bodyEnd, self.spec, self.tagSet,
+            bodyEnd - body, stGetValueDecoder, decode.decodeAt, None
+        )
+        return value, stop
+
+
+class _IntegerNode(_SimpleNode):
+    def __init__(self, spec, concreteDecoder):
+        _SimpleNode.__init__(self, spec, concreteDecoder)
+        self.make = _valueFactory(spec, 0)
+
+    def decode(self, substrate, pos, end):
+        if self.make is None:
+            return _SimpleNode.decode(self, substrate, pos, end)
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds:
+            return self.fallback(substrate, pos, end)
+        body, bodyEnd, stop = bounds
+        return self.make(_intFromOctets(_octets(substrate, body, bodyEnd))), stop
+
+    def native(self, substrate, pos, end):
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds:
+            return self.nativeFallback(substrate, pos, end)
+        body, bodyEnd, stop = bounds
+        return _intFromOctets(_octets(substrate, body, bodyEnd)), stop
+
+
+class _BooleanNode(_SimpleNode):
+    def native(self, substrate, pos, end):
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds:
+            return self.nativeFallback(substrate, pos, end)
+        body, bodyEnd, stop = bounds
+        return bool(_intFromOctets(_octets(substrate, body, bodyEnd))), stop
+
+
+class _NullNode(_SimpleNode):
+    def native(self, substrate, pos, end):
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds or bounds[0] != bounds[1]:
+            return self.nativeFallback(substrate, pos, end)
+        return None, bounds[2]
+
+
+class _OctetStringNode(_SimpleNode):
+    def __init__(self, spec, concreteDecoder):
+        _SimpleNode.__init__(self, spec, concreteDecoder)
+        self.make = _valueFactory(spec, null)
+
+    def decode(self, substrate, pos, end):
+        if self.make is None:
+            return _SimpleNode.decode(self, substrate, pos, end)
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds:
+            return self.fallback(substrate, pos, end)
+        body, bodyEnd, stop = bounds
+        return self.make(_octets(substrate, body, bodyEnd)), stop
+
+    def native(self, substrate, pos, end):
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds:
+            return self.nativeFallback(substrate, pos, end)
+        body, bodyEnd, stop = bounds
+        return _octets(substrate, body, bodyEnd), stop
+
+
+_bitTable = [tuple((octet >> bit) & 1 for bit in range(7, -1, -1))
+             for octet in range(256)]
+
+
+class _BitStringNode(_SimpleNode):
+    def _bits(self, substrate, pos, end):
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds or bounds[0] == bounds[1]:
+            return None, None
+        body, bodyEnd, stop = bounds
+        trailingBits = oct2int(substrate[body])
+        if trailingBits > 7:
+            return None, None
+        bits = []
+        for octet in bytearray(substrate[body + 1:bodyEnd]):
+            bits.extend(_bitTable[octet])
+        if trailingBits and bits:
+            del bits[-trailingBits:]
+        return bits, stop
+
+    def decode(self, substrate, pos, end):
+        bits, stop = self._bits(substrate, pos, end)
+        if bits is None:
+            return self.fallback(substrate, pos, end)
+        return self.spec.clone(bits), stop
+
+    def native(self, substrate, pos, end):
+        bits, stop = self._bits(substrate, pos, end)
+        if bits is None:
+            return self.nativeFallback(substrate, pos, end)
+        return tuple(bits), stop
+
+
+class _ObjectIdentifierNode(_SimpleNode):
+    # OID values are immutable and few distinct ones occur in practice,
+    # decoded objects are shared between results
+    cacheSize = 1024
+
+    def __init__(self, spec, concreteDecoder):
+        _SimpleNode.__init__(self, spec, concreteDecoder)
+        self.values = {}
+        self.names = {}
+
+    def _cached(self, cache, convert, substrate, pos, end):
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds or bounds[0] == bounds[1]:
+            return None, None
+        body, bodyEnd, stop = bounds
+        octets = _octets(substrate, body, bodyEnd)
+        try:
+            return cache[octets], stop
+        except KeyError:
+            pass
+        try:
+            oid = _decodeOid(octets)
+        except error.PyAsn1Error:
+            return None, None
+        if len(cache) >= self.cacheSize:
+            cache.clear()
+        value = cache[octets] = convert(oid)
+        return value, stop
+
+    def decode(self, substrate, pos, end):
+        value, stop = self._cached(self.values, self.spec.clone,
+                                   substrate, pos, end)
+        if value is None:
+            return self.fallback(substrate, pos, end)
+        return value, stop
+
+    def native(self, substrate, pos, end):
+        value, stop = self._cached(self.names, _oidName, substrate, pos, end)
+        if value is None:
+            return self.nativeFallback(substrate, pos, end)
+        return value, stop
+
+
+def _oidName(oid):
+    return '.'.join([str(arc) for arc in oid])
+
+
+class _AnyNode(_Node):
+    def __init__(self, spec):
+        _Node.__init__(self, spec)
+        self.make = _valueFactory(spec, null) or spec.clone
+
+    def firstOctets(self):
+        if not self.idents:
+            return None
+        return _Node.firstOctets(self)
+
+    def _bounds(self, substrate, pos, end):
+        if self.idents is None:
+            return None
+        if self.idents:
+            # tagged Any -- the value is the content
+            bounds = _peel(substrate, pos, end, self.idents)
+            if not bounds:
+                return None
+            return bounds[0], bounds[2]
+        # untagged Any -- the value is the whole TLV
+        if pos >= end or oct2int(substrate[pos]) & 0x1F == 0x1F:
+            return None
+        bounds = _peel(substrate, pos, end, (oct2int(substrate[pos]),))
+        if not bounds:
+            return None
+        return pos, bounds[2]
+
+    def decode(self, substrate, pos, end):
+        bounds = self._bounds(substrate, pos, end)
+        if not bounds:
+            return self.fallback(substrate, pos, end)
+        return self.make(_octets(substrate, bounds[0], bounds[1])), bounds[1]
+
+    def native(self, substrate, pos, end):
+        bounds = self._bounds(substrate, pos, end)
+        if not bounds:
+            return self.nativeFallback(substrate, pos, end)
+        return _octets(substrate, bounds[0], bounds[1]), bounds[1]
+
+
+class _SequenceNode(_Node):
+    def link(self, compileNode):
+        namedTypes = self.spec.getComponentType()
+        self.components = [compileNode(namedTypes.getTypeByPosition(i))
+                           for i in range(len(namedTypes))]
+        self.tables = [self._table(namedTypes, idx)
+                       for idx in range(len(namedTypes) + 1)]
+        self.decoders = [component.decode for component in self.components]
+        self.natives = [component.native for component in self.components]
+        self.names = [namedTypes.getNameByPosition(i)
+                      for i in range(len(namedTypes))]
+        self.required = [i for i in range(len(namedTypes))
+                         if not self._skippable(namedTypes[i])]
+        self.defaults = [(i, toNative(namedTypes.getTypeByPosition(i)))
+                         for i in range(len(namedTypes))
+                         if isinstance(namedTypes[i], namedtype.DefaultedNamedType)]
+        self.defaultTypes = [(i, namedTypes.getTypeByPosition(i))
+                             for i, _ in reversed(self.defaults)]
+        self.make = None if self.unordered else _emptyFactory(self.spec)
+
+    def _table(self, namedTypes, idx):
+        table = {}
+        default = None
+        for i in range(idx, len(self.components)):
+            octets = self.components[i].firstOctets()
+            if octets is None:
+                if default is None:
+                    default = i
+            else:
+                for octet in octets:
+                    table.setdefault(octet, i)
+            if not self._skippable(namedTypes[i]):
+                break
+        return table, default
+
+    def _skippable(self, namedType):
+        return isinstance(namedType, (namedtype.OptionalNamedType,
+                                      namedtype.DefaultedNamedType))
+
+    def decode(self, substrate, pos, end):
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds:
+            return self.fallback(substrate, pos, end)
+        body, bodyEnd, stop = bounds
+        tables = self.tables
+        decoders = self.decoders
+        unordered = self.unordered
+        positions = []
+        values = []
+        idx = 0
+        while body < bodyEnd:
+            table, default = tables[idx]
+            idx = table.get(oct2int(substrate[body]), default)
+            if idx is None:
+                return self.fallback(substrate, pos, end)
+            component, body = decoders[idx](substrate, body, bodyEnd)
+            positions.append(idx)
+            values.append(component)
+            idx = 0 if unordered else idx + 1
+        if self.make is not None:
+            return self._make(positions, values), stop
+        value = self.spec.clone()
+        if unordered:
+            # a repeated SET component replaces the previous one
+            for idx, component in zip(positions, values):
+                value.setComponentByPosition(idx, component, False)
+            value.setDefaultComponents()
+        else:
+            # the last component first, so that the list of components is
+            # allocated once
+            for idx in range(len(positions) - 1, -1, -1):
+                value.setComponentByPosition(positions[idx], values[idx], False)
+            if len(positions) != len(decoders):
+                value.setDefaultComponents()
+        if self.sizeSpec:
+            value.verifySizeSpec()
+        return value, stop
+
+    def _make(self, positions, values):
+        count = len(positions)
+        size = positions[-1] + 1 if count else 0
+        if size != count:
+            componentValues = [None] * size
+            for idx, component in zip(positions, values):
+                componentValues[idx] = component
+        else:
+            componentValues = values
+        if count != len(self.decoders):
+            for idx in self.required:
+                if idx >= size or componentValues[idx] is None:
+                    # raises the same error as the generic decoder
+                    self.make(componentValues, count).setDefaultComponents()
+            # what setDefaultComponents() would do
+            for idx, defaultType in self.defaultTypes:
+                if idx >= size:
+                    componentValues.extend([None] * (idx + 1 - size))
+                    size = idx + 1
+                if componentValues[idx] is None:
+                    componentValues[idx] = defaultType.clone()
+                    count += 1
+        value = self.make(componentValues, count)
+        if self.sizeSpec:
+            value.verifySizeSpec()
+        return value
+
+    def native(self, substrate, pos, end):
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds:
+            return self.nativeFallback(substrate, pos, end)
+        body, bodyEnd, stop = bounds
+        tables = self.tables
+        natives = self.natives
+        names = self.names
+        unordered = self.unordered
+        value = {}
+        idx = 0
+        while body < bodyEnd:
+            table, default = tables[idx]
+            idx = table.get(oct2int(substrate[body]), default)
+            if idx is None:
+                return self.nativeFallback(substrate, pos, end)
+            value[names[idx]], body = natives[idx](substrate, body, bodyEnd)
+            idx = 0 if unordered else idx + 1
+        if len(value) != len(natives):
+            for idx in self.required:
+                if names[idx] not in value:
+                    return self.nativeFallback(substrate, pos, end)
+            for idx, default in self.defaults:
+                value.setdefault(names[idx], default)
+        return value, stop
+
+    unordered = False
+
+
+class _SetNode(_SequenceNode):
+    unordered = True
+
+    def _table(self, namedTypes, idx):
+        table = {}
+        default = None
+        for i, component in enumerate(self.components):
+            octets = component.firstOctets()
+            if octets is None:
+                if default is None:
+                    default = i
+            else:
+                for octet in octets:
+                    table.setdefault(octet, i)
+        return table, default
+
+
+class _SequenceOfNode(_Node):
+    def link(self, compileNode):
+        self.component = compileNode(self.spec.getComponentType())
+        self.make = _emptyFactory(self.spec)
+
+    def decode(self, substrate, pos, end):
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds:
+            return self.fallback(substrate, pos, end)
+        body, bodyEnd, stop = bounds
+        if self.make is not None:
+            decode = self.component.decode
+            items = []
+            while body < bodyEnd:
+                item, body = decode(substrate, body, bodyEnd)
+                items.append(item)
+            value = self.make(items, len(items))
+            if self.sizeSpec:
+                value.verifySizeSpec()
+            return value, stop
+        value = self.spec.clone()
+        component = self.component
+        idx = 0
+        while body < bodyEnd:
+            item, body = component.decode(substrate, body, bodyEnd)
+            value.setComponentByPosition(idx, item, False)
+            idx += 1
+        if self.sizeSpec:
+            value.verifySizeSpec()
+        return value, stop
+
+    def native(self, substrate, pos, end):
+        bounds = self.idents and _peel(substrate, pos, end, self.idents)
+        if not bounds:
+            return self.nativeFallback(substrate, pos, end)
+        body, bodyEnd, stop = bounds
+        native = self.component.native
+        value = []
+        while body < bodyEnd:
+            item, body = native(substrate, body, bodyEnd)
+            value.append(item)
+        return tuple(value), stop
+
+
+class _ChoiceNode(_Node):
+    def link(self, compileNode):
+        namedTypes = self.spec.getComponentType()
+        self.components = [compileNode(namedTypes.getTypeByPosition(i))
+                           for i in range(len(namedTypes))]
+        self.table = {}
+        for i, component in enumerate(self.components):
+            for octet in component.firstOctets() or ():
+                self.table.setdefault(octet, i)
+
+    def firstOctets(self):
+        if self.idents:
+            return self.idents[:1]
+        if self.idents is None:
+            return ()
+        return tuple(self.table)
+
+    def _select(self, substrate, pos, end):
+        if self.idents is None:
+            return None
+        if self.idents:
+            bounds = _peel(substrate, pos, end, self.idents)
+            if not bounds:
+                return None
+            body, bodyEnd, stop = bounds
+        else:
+            body, bodyEnd, stop = pos, end, None
+        if body >= bodyEnd:
+            return None
+        idx = self.table.get(oct2int(substrate[body]))
+        if idx is None:
+            return None
+        return idx, body, bodyEnd, stop
+
+    def decode(self, substrate, pos, end):
+        selected = self._select(substrate, pos, end)
+        if selected is None:
+            return self.fallback(substrate, pos, end)
+        idx, body, bodyEnd, stop = selected
+        component, body = self.components[idx].decode(substrate, body, bodyEnd)
+        value = self.spec.clone()
+        value.setComponentByPosition(idx, component, False)
+        return value, body if stop is None else stop
+
+    def native(self, substrate, pos, end):
+        selected = self._select(substrate, pos, end)
+        if selected is None:
+            return self.nativeFallback(substrate, pos, end)
+        idx, body, bodyEnd, stop = selected
+        component, body = self.components[idx].native(substrate, body, bodyEnd)
+        value = self.spec.getComponentType().getNameByPosition(idx), component
+        return value, body if stop is None else stop
+
+
+def _compileNode(asn1Spec, memo):
+    key = id(asn1Spec)
+    if key in memo:
+        return memo[key]
+    concreteDecoder = typeMap.get(asn1Spec.typeId)
+    if concreteDecoder is None:
+        concreteDecoder = tagMap.get(asn1Spec.baseTagSet)
+    if isinstance(concreteDecoder, SetDecoder):
+        node = _SetNode(asn1Spec)
+    elif isinstance(concreteDecoder, SequenceDecoder):
+        node = _SequenceNode(asn1Spec)
+    elif isinstance(concreteDecoder, SequenceOfDecoder):
+        node = _SequenceOfNode(asn1Spec)
+    elif isinstance(concreteDecoder, ChoiceDecoder):
+        node = _ChoiceNode(asn1Spec)
+    elif isinstance(concreteDecoder, AnyDecoder):
+        node = _AnyNode(asn1Spec)
+    else:
+        if isinstance(concreteDecoder, BitStringDecoder):
+            node = _BitStringNode(asn1Spec, concreteDecoder)
+        elif isinstance(concreteDecoder, ObjectIdentifierDecoder):
+            node = _ObjectIdentifierNode(asn1Spec, concreteDecoder)
+        elif isinstance(concreteDecoder, BooleanDecoder):
+            node = _BooleanNode(asn1Spec, concreteDecoder)
+        elif isinstance(concreteDecoder, IntegerDecoder):
+            node = _IntegerNode(asn1Spec, concreteDecoder)
+        elif isinstance(concreteDecoder, NullDecoder):
+            node = _NullNode(asn1Spec, concreteDecoder)
+        elif isinstance(concreteDecoder, OctetStringDecoder):
+            node = _OctetStringNode(asn1Spec, concreteDecoder)
+        else:
+            node = _SimpleNode(asn1Spec, concreteDecoder)
+        if concreteDecoder is None:
+            node.idents = None
+    memo[key] = node
+    node.link(lambda spec: _compileNode(spec, memo))
+    return node
+
+
+class CompiledDecoder(object):
+    """Decoder specialised for a fixed *asn1Spec*. Produces the same
+    pyasn1 objects as `decode(substrate, asn1Spec=asn1Spec)`.
+    """
+
+    def __init__(self, asn1Spec):
+        self.asn1Spec = asn1Spec
+        self.__root = _compileNode(asn1Spec, {})
+
+    def __call__(self, substrate):
+        view = _view(substrate)
+        value, pos = self.__root.decode(view, 0, len(view))
+        return value, substrate[pos:]
+
+    def decodeAt(self, substrate, pos, end):
+        return self.__root.decode(substrate, pos, end)
+
+    def native(self, substrate):
+        """Decodes *substrate* into plain Python values (see `toNative`)"""
+        view = _view(substrate)
+        value, pos = self.__root.native(view, 0, len(view))
+        return value, substrate[pos:]
+
+    def nativeAt(self, substrate, pos, end):
+        return self.__root.native(substrate, pos, end)
+
+
+_compiledCache = {}
+
+
+def compileSpec(asn1Spec):
+    """Returns a `CompiledDecoder` for *asn1Spec*. Decoders for specs
+    defined as classes (like the rfc2459 and rfc2315 types) are built once
+    per class and tag set and then shared.
+    """
+    if asn1Spec.__class__.__module__.startswith('pyasn1.type.'):
+        return CompiledDecoder(asn1Spec)
+    key = (asn1Spec.__class__, asn1Spec.getTagSet(), asn1Spec.getSubtypeSpec())
+    try:
+        return _compiledCache[key]
+    except KeyError:
+        return _compiledCache.setdefault(key, CompiledDecoder(asn1Spec))
+
+
+def toNative(value):
+    """Converts pyasn1 object *value* into plain Python values:
+
+    * SEQUENCE, SET -- dict of present components by name
+    * SEQUENCE OF, SET OF -- tuple
+    * CHOICE -- tuple (component name, value)
+    * INTEGER, ENUMERATED -- int; BOOLEAN -- bool; NULL -- None; REAL -- float
+    * OBJECT IDENTIFIER -- dotted str
+    * BIT STRING -- tuple of bits
+    * OCTET STRING, character strings, times, ANY -- octets
+    """
+    if isinstance(value, univ.Choice):
+        return value.getName(), toNative(value.getComponent())
+    if isinstance(value, univ.SequenceAndSetBase):
+        res = {}
+        namedTypes = value.getComponentType()
+        for idx in range(len(namedTypes)):
+            component = value.getComponentByPosition(idx)
+            if component is not None:
+                res[namedTypes.getNameByPosition(idx)] = toNative(component)
+        return res
+    if isinstance(value, (univ.SequenceOf, univ.SetOf)):
+        return tuple([toNative(component) for component in value])
+    if isinstance(value, univ.OctetString):
+        return value.asOctets()
+    if isinstance(value, univ.BitString):
+        return tuple(value)
+    if isinstance(value, univ.ObjectIdentifier):
+        return _oidName(value)
+    if isinstance(value, univ.Boolean):
+        return bool(value)
+    if isinstance(value, univ.Integer):
+        return int(value)
+    if isinstance(value, univ.Null):
+        return None
+    if isinstance(value, univ.Real):
+        return float(value)
+    raise error.PyAsn1Error('No native form for %r' % (value,))
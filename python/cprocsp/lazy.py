@@ -0,0 +1,361 @@
+# coding: utf-8
+'''
+Ленивый разбор DER/BER данных по ASN.1 спецификации.
+
+Значение (`LazyValue`) хранит только ссылку на исходные данные и границы
+своего TLV. Составные значения разбираются до уровня заголовков вложенных
+TLV и только при обращении к компонентам, полностью (в объекты `pyasn1`)
+декодируются лишь те поддеревья, у которых запрошено свойство `value`.
+Нетронутые поддеревья (например, вложенное содержимое большого PKCS#7
+сообщения) не декодируются и не копируются.
+
+Пример использования:
+> ci = LazyValue(data, rfc2315.ContentInfo())
+> sd = ci['content'].cast(rfc2315.SignedData())
+> for si in sd['signerInfos']:
+>     print(si.value['issuerAndSerialNumber'].prettyPrint())
+
+'''
+from __future__ import unicode_literals, print_function
+
+from pyasn1.type import tag, univ
+from pyasn1.compat.octets import oct2int
+from pyasn1 import error
+
+from . import decoder
+
+_eoc = tag.Tag(tag.tagClassUniversal, tag.tagFormatSimple, 0)
+_octets = univ.OctetString.tagSet[0]
+
+
+def read_header(substrate, pos, end):
+    '''
+    Разбор заголовка TLV, начинающегося со смещения :pos: и не выходящего за
+    смещение :end:.
+
+    :returns: кортеж (тег `pyasn1.type.tag.Tag`, смещение начала содержимого,
+        длина содержимого или -1 для неопределенной длины)
+
+    '''
+    if pos >= end:
+        raise error.SubstrateUnderrunError('Short octet stream on tag decoding')
+    t = oct2int(substrate[pos])
+    pos += 1
+    tagClass, tagFormat, tagId = t & 0xC0, t & 0x20, t & 0x1F
+    if tagId == 0x1F:
+        tagId = 0
+        while True:
+            if pos >= end:
+                raise error.SubstrateUnderrunError('Short octet stream on long tag decoding')
+            t = oct2int(substrate[pos])
+            pos += 1
+            tagId = tagId << 7 | (t & 0x7F)
+            if not t & 0x80:
+                break
+    if pos >= end:
+        raise error.SubstrateUnderrunError('Short octet stream on length decoding')
+    first = oct2int(substrate[pos])
+    pos += 1
+    if first == 0x80:
+        length = -1
+    elif first < 0x80:
+        length = first
+    else:
+        size = first & 0x7F
+        if end - pos < size:
+            raise error.SubstrateUnderrunError('Short octet stream on length decoding')
+        length = 0
+        for i in range(pos, pos + size):
+            length = length << 8 | oct2int(substrate[i])
+        pos += size
+    if length > end - pos:
+        raise error.SubstrateUnderrunError('%d-octet short' % (length - (end - pos)))
+    return tag.Tag(tagClass, tagFormat, tagId), pos, length
+
+
+def skip(substrate, pos, end):
+    '''
+    Смещение за концом TLV, начинающегося со смещения :pos:. Для значений
+    неопределенной длины проходятся только заголовки вложенных TLV, без
+    рекурсии и декодирования значений.
+
+    '''
+    depth = 0
+    while True:
+        t, pos, length = read_header(substrate, pos, end)
+        if length == -1:
+            depth += 1
+            continue
+        if t == _eoc and not length:
+            if not depth:
+                raise error.PyAsn1Error('Unexpected end-of-contents sentinel')
+            depth -= 1
+        else:
+            pos += length
+        if not depth:
+            return pos
+
+
+def _content_end(substrate, pos, length, end):
+    '''
+    Смещение конца содержимого (без завершающих нулей для неопределенной
+    длины).
+
+    '''
+    if length != -1:
+        return pos + length
+    while True:
+        t, body, l = read_header(substrate, pos, end)
+        if t == _eoc and not l:
+            return pos
+        pos = skip(substrate, pos, end)
+
+
+def _view(substrate):
+    if isinstance(substrate, memoryview):
+        return substrate
+    if isinstance(substrate, univ.OctetString):
+        substrate = substrate.asOctets()
+    return memoryview(substrate)
+
+
+def _any_position(spec, idx):
+    '''
+    Позиция компонента SEQUENCE типа ANY без тегов, начиная с :idx: (такому
+    компоненту соответствует значение с любым тегом).
+
+    '''
+    namedTypes = spec.getComponentType()
+    for i in range(idx, len(namedTypes)):
+        t = namedTypes.getTypeByPosition(i)
+        if isinstance(t, univ.Any) and not t.getTagSet():
+            return i
+        if not (namedTypes[i].isOptional or namedTypes[i].isDefaulted):
+            break
+    raise error.PyAsn1Error('Type position out of range')
+
+
+class LazyValue(object):
+
+    """Значение ASN.1, декодируемое по требованию.
+
+    :substrate: данные (байтовая строка или любой объект с буферным протоколом)
+    :asn1Spec: спецификация значения (объект `pyasn1`)
+    :pos: смещение начала TLV в данных
+    :end: граница, за которую TLV не может выходить (по умолчанию -- конец
+        данных)
+    :stop: смещение за концом TLV, если оно уже известно
+
+    """
+
+    def __init__(self, substrate, asn1Spec=None, pos=0, end=None, stop=None):
+        self.substrate = _view(substrate)
+        self.asn1Spec = asn1Spec
+        self.pos = pos
+        self._limit = len(self.substrate) if end is None else end
+        self._stop = stop
+        self.name = None
+        self._value = None
+        self._native = None
+        self._children = None
+
+    @property
+    def end(self):
+        '''
+        Смещение за концом TLV.
+
+        '''
+        if self._stop is None:
+            self._stop = skip(self.substrate, self.pos, self._limit)
+        return self._stop
+
+    @property
+    def tag(self):
+        '''
+        Внешний тег значения (`pyasn1.type.tag.Tag`).
+
+        '''
+        return read_header(self.substrate, self.pos, self._limit)[0]
+
+    @property
+    def raw(self):
+        '''
+        Закодированное значение целиком (TLV) в виде `memoryview` над
+        исходными данными, без копирования.
+
+        '''
+        return self.substrate[self.pos:self.end]
+
+    @property
+    def value(self):
+        '''
+        Полностью декодированное значение (объект `pyasn1`). Декодируется при
+        первом обращении, при известной спецификации -- скомпилированным
+        декодером (`decoder.compileSpec`).
+
+        '''
+        if self._value is None:
+            if self.asn1Spec is None:
+                self._value = decoder.decode.decodeAt(
+                    self.substrate, self.pos, self.end)[0]
+            else:
+                self._value = decoder.compileSpec(self.asn1Spec).decodeAt(
+                    self.substrate, self.pos, self.end)[0]
+        return self._value
+
+    @property
+    def native(self):
+        '''
+        Значение, декодированное в простые типы Python (словари, кортежи,
+        числа, байтовые строки, OID в виде строк, см. `decoder.toNative`)
+        без построения объектов `pyasn1`. Декодируется при первом обращении.
+
+        '''
+        if self._native is None:
+            if self.asn1Spec is None:
+                value = decoder.toNative(self.value)
+            else:
+                value = decoder.compileSpec(self.asn1Spec).nativeAt(
+                    self.substrate, self.pos, self.end)[0]
+            self._native = (value,)
+        return self._native[0]
+
+    def _inner(self):
+        '''
+        Границы (начало, предел) значения после снятия явных (EXPLICIT)
+        тегов спецификации.
+
+        '''
+        layers = 0
+        if self.asn1Spec is not None:
+            layers = len(self.asn1Spec.getTagSet()) - len(self.asn1Spec.baseTagSet)
+        pos, end = self.pos, self._limit
+        for _ in range(layers):
+            t, pos, length = read_header(self.substrate, pos, end)
+            end = _content_end(self.substrate, pos, length, end)
+        return pos, end
+
+    def cast(self, asn1Spec):
+        '''
+        Содержимое значения типа ANY в виде `LazyValue` с заданной
+        спецификацией.
+
+        '''
+        pos, end = self._inner()
+        return LazyValue(self.substrate, asn1Spec, pos, end)
+
+    def is_octets(self):
+        '''
+        Является ли значение (после снятия явных тегов спецификации) строкой
+        октетов -- универсальным тегом OCTET STRING в простой или составной
+        форме.
+
+        '''
+        pos, end = self._inner()
+        t = read_header(self.substrate, pos, end)[0]
+        return t[0] == tag.tagClassUniversal and t[2] == _octets[2]
+
+    def octets(self):
+        '''
+        Содержимое строки октетов в виде `memoryview` над исходными данными
+        без копирования. Если строка закодирована фрагментами (составная
+        форма), фрагменты склеиваются в байтовую строку. Для значений других
+        типов -- исключение `PyAsn1Error`.
+
+        '''
+        pos, end = self._inner()
+        t, body, length = read_header(self.substrate, pos, end)
+        if t[0] != tag.tagClassUniversal or t[2] != _octets[2]:
+            raise error.PyAsn1Error('Value is not an OCTET STRING: %r' % (t,))
+        if t[1] == tag.tagFormatSimple:
+            return self.substrate[body:body + length]
+        return self.value.asOctets()
+
+    def _content(self):
+        pos, end = self._inner()
+        t, body, length = read_header(self.substrate, pos, end)
+        return body, _content_end(self.substrate, body, length, end)
+
+    def _match(self, pos, end, tagMap):
+        '''
+        Набор тегов вложенного значения, достаточный для поиска его
+        спецификации в :tagMap: (с учетом явных тегов).
+
+        '''
+        tagSet = None
+        while True:
+            t, body, length = read_header(self.substrate, pos, end)
+            tagSet = tag.TagSet((), t) if tagSet is None else t + tagSet
+            if tagMap is None or tagSet in tagMap:
+                return tagSet
+            if t[1] != tag.tagFormatConstructed or t[0] == tag.tagClassUniversal:
+                return tagSet
+            pos, end = body, _content_end(self.substrate, body, length, end)
+
+    def children(self):
+        '''
+        Вложенные значения в виде списка `LazyValue`. Для SEQUENCE и SET у
+        каждого значения есть атрибут `name` -- имя компонента в
+        спецификации.
+
+        '''
+        if self._children is not None:
+            return self._children
+        spec = self.asn1Spec
+        pos, end = self._content()
+        res = []
+        idx = 0
+        while pos < end:
+            stop = skip(self.substrate, pos, end)
+            if isinstance(spec, (univ.SequenceOf, univ.SetOf)):
+                child = LazyValue(self.substrate, spec.getComponentType(), pos, stop, stop)
+            elif isinstance(spec, (univ.Sequence, univ.Set)):
+                if isinstance(spec, univ.Set):
+                    tagSet = self._match(pos, stop, spec.getComponentTagMap())
+                    idx = spec.getComponentPositionByType(tagSet)
+                else:
+                    try:
+                        tagMap = spec.getComponentTagMapNearPosition(idx)
+                    except error.PyAsn1Error:
+                        tagMap = None
+                    tagSet = self._match(pos, stop, tagMap)
+                    try:
+                        idx = spec.getComponentPositionNearType(tagSet, idx)
+                    except error.PyAsn1Error:
+                        idx = _any_position(spec, idx)
+                child = LazyValue(self.substrate, spec.getComponentType().getTypeByPosition(idx),
+                                  pos, stop, stop)
+                child.name = spec.getComponentType().getNameByPosition(idx)
+                idx += 1
+            else:
+                child = LazyValue(self.substrate, None, pos, stop, stop)
+            res.append(child)
+            pos = stop
+        self._children = res
+        return res
+
+    def get(self, key, default=None):
+        '''
+        Компонент SEQUENCE или SET по имени, либо элемент SEQUENCE OF или SET
+        OF по номеру. Если компонент отсутствует, возвращает :default:.
+
+        '''
+        children = self.children()
+        if isinstance(key, int):
+            return children[key] if -len(children) <= key < len(children) else default
+        for child in children:
+            if child.name == key:
+                return child
+        return default
+
+    def __getitem__(self, key):
+        res = self.get(key)
+        if res is None:
+            raise KeyError(key)
+        return res
+
+    def __iter__(self):
+        return iter(self.children())
+
+    def __len__(self):
+        return len(self.children())
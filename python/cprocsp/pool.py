@@ -0,0 +1,154 @@
+# coding: utf-8
+from __future__ import unicode_literals, print_function
+
+import threading
+import time
+from contextlib import contextmanager
+
+from . import csp
+from .cryptoapi import _from_hex
+
+
+class ContextPool(object):
+
+    """Пул контекстов криптопровайдера (`csp.Crypt`).
+
+    Контексты хранятся по ключу (контейнер, провайдер, тип провайдера, флаги)
+    и выдаются в монопольное пользование на время операции. Повторное
+    открытие контекста (CryptAcquireContext) при работе с HSM стоит
+    миллисекунды, поэтому для коротких сообщений пул заметно снижает
+    задержку.
+
+    :max_size: максимальное число простаивающих контекстов в пуле
+    :idle_timeout: время простоя в секундах, после которого контекст закрывается
+    :check_after: время простоя в секундах, после которого контекст перед
+        выдачей проверяется запросом к провайдеру
+
+    Пример использования:
+    > pool = ContextPool(max_size=8)
+    > with pool.context(b'cont', PROV_GOST, 0, None) as ctx:
+    >     key = ctx.get_key()
+
+    """
+
+    def __init__(self, max_size=16, idle_timeout=300, check_after=30):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.check_after = check_after
+        self._lock = threading.Lock()
+        # ключ -> список пар (контекст, время возврата в пул)
+        self._idle = {}
+        # контейнер -> поколение, увеличивается при инвалидации
+        self._generations = {}
+        self._generation = 0
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(lst) for lst in self._idle.values())
+
+    def _current_generation(self, key):
+        return (self._generation, self._generations.get(key[0], 0))
+
+    def _evict(self, now):
+        for key in list(self._idle):
+            lst = [(ctx, ts) for (ctx, ts) in self._idle[key]
+                   if now - ts < self.idle_timeout]
+            if lst:
+                self._idle[key] = lst
+            else:
+                del self._idle[key]
+
+    def _evict_oldest(self):
+        oldest = None
+        for key, lst in self._idle.items():
+            if lst and (oldest is None or lst[0][1] < oldest[1]):
+                oldest = (key, lst[0][1])
+        if oldest is not None:
+            key = oldest[0]
+            del self._idle[key][0]
+            if not self._idle[key]:
+                del self._idle[key]
+
+    @staticmethod
+    def _healthy(ctx):
+        try:
+            ctx.prov_type()
+        except Exception:
+            return False
+        return True
+
+    def acquire(self, cont, provtype, flags, provider=None):
+        '''
+        Получение контекста из пула или открытие нового.
+
+        :returns: пара (контекст, метка поколения) -- метку нужно передать в
+            `release()` вместе с контекстом.
+
+        '''
+        key = (cont, provider, provtype, flags)
+        while True:
+            now = time.time()
+            with self._lock:
+                self._evict(now)
+                gen = self._current_generation(key)
+                lst = self._idle.get(key)
+                if not lst:
+                    break
+                ctx, ts = lst.pop()
+                if not lst:
+                    del self._idle[key]
+            if now - ts < self.check_after or self._healthy(ctx):
+                return ctx, gen
+        return csp.Crypt(cont, provtype, flags, provider), gen
+
+    def release(self, ctx, gen, cont, provtype, flags, provider=None):
+        '''
+        Возврат контекста в пул. Контекст, выданный до последней инвалидации,
+        в пул не возвращается.
+
+        '''
+        key = (cont, provider, provtype, flags)
+        with self._lock:
+            if gen != self._current_generation(key):
+                return
+            if self.max_size <= 0:
+                return
+            while sum(len(lst) for lst in self._idle.values()) >= self.max_size:
+                self._evict_oldest()
+            self._idle.setdefault(key, []).append((ctx, time.time()))
+
+    def invalidate(self, cont=None):
+        '''
+        Сброс контекстов пула. Если передан :cont:, сбрасываются только
+        контексты указанного контейнера, иначе все. Имя контейнера в виде
+        строки (как в функциях `cryptoapi`, с экранированием `\\x..`)
+        декодируется так же, как при открытии контекста; байтовая строка
+        считается уже декодированным именем.
+
+        Контексты, выданные на момент вызова, после использования будут
+        закрыты, а не возвращены в пул.
+
+        '''
+        if cont is not None and not isinstance(cont, bytes):
+            cont = _from_hex(cont)
+        with self._lock:
+            if cont is None:
+                self._generation += 1
+                self._idle.clear()
+                return
+            self._generations[cont] = self._generations.get(cont, 0) + 1
+            for key in list(self._idle):
+                if key[0] == cont:
+                    del self._idle[key]
+
+    @contextmanager
+    def context(self, cont, provtype, flags, provider=None):
+        '''
+        Контекстный менеджер для монопольного использования контекста.
+        Если внутри блока возникло исключение, контекст считается
+        неисправным и в пул не возвращается.
+
+        '''
+        ctx, gen = self.acquire(cont, provtype, flags, provider)
+        yield ctx
+        self.release(ctx, gen, cont, provtype, flags, provider)
@@ -4,46 +4,114 @@
 import re
 import sys
 
+_name_re = re.compile(r'\s*(?P<name>[^=]+?)\s*(?==)')
+_value_re = re.compile(r'=\s*(?P<val>"([^\\"]|\\.)*?"|(\\.|[^,=\n+<>#;])*)\s*')
+_extra_re = re.compile(r'\s*\+\s*')
+_separator_re = re.compile(r'\s*[,;]\s*')
+
+# Кэш разобранных строк: (строка, flat) -> результат в виде кортежей
+_cache = {}
+_cache_size = 1024
+
+
+def _read_name(s, pos):
+    match = _name_re.match(s, pos)
+    if match is None:
+        raise ValueError('Invalid RDN: attribute name expected at {0}'.format(pos))
+    return match.group('name'), match.end()
+
+
+def _read_value(s, pos):
+    match = _value_re.match(s, pos)
+    if match is None:
+        raise ValueError('Invalid RDN: "=" expected at {0}'.format(pos))
+    return match.group('val'), match.end()
+
+
+def _read_pairs(s, pos):
+    '''
+    Разбор пар (имя, значение), объединенных через "+", начиная с позиции
+    :pos:.
+
+    :returns: (список пар, позиция после разобранного)
+
+    '''
+    pairs = []
+    while True:
+        name, pos = _read_name(s, pos)
+        val, pos = _read_value(s, pos)
+        pairs.append((name, val))
+        match = _extra_re.match(s, pos)
+        if match is None:
+            return pairs, pos
+        pos = match.end()
+
+
 def read_name(s):
-    match = re.match(r'\s*(?P<name>[^=]+?)\s*(?P<rest>=([\n]|.)*)', s)
-    return match.group('name'), match.group('rest')
+    name, pos = _read_name(s, 0)
+    return name, s[pos:]
 
 
 def read_value(s):
-    match = re.match(r'=\s*(?P<val>"([^\\"]|\\.)*?"|(\\.|[^,=\n+<>#;])*)\s*(?P<rest>([\n]|.)*)', s)
-    return match.group('val'), match.group('rest')
+    val, pos = _read_value(s, 0)
+    return val, s[pos:]
 
 
 def read_extra(s):
-    match = re.match(r'\s*\+\s*(?P<rest>([\n]|.)*)', s)
+    match = _extra_re.match(s)
     if match:
-        return read_pair(match.group('rest'))
+        pairs, pos = _read_pairs(s, match.end())
+        return pairs, s[pos:]
     else:
         return [], s
 
 
 def read_pair(s):
-    name, rest = read_name(s)
-    val, rest = read_value(rest)
-    extra, rest = read_extra(rest)
-    extra.insert(0, (name, val))
-    return extra, rest
+    pairs, pos = _read_pairs(s, 0)
+    return pairs, s[pos:]
 
 
-def read_rdn(s, flat=True):
+def _read_rdn(s, flat):
+    res = []
     if not(s.strip()):
-        return []
-    p, rest = read_pair(s)
-    match = re.match(r'\s*[,;]\s*(?P<rest>([\n]|.)*)', rest)
-    if match:
-        extra = read_rdn(match.group('rest'))
-    else:
-        extra = []
-    if flat:
-        p.extend(extra)
-        return p
-    extra.insert(0, p)
-    return extra
+        return res
+    pos = 0
+    while True:
+        pairs, pos = _read_pairs(s, pos)
+        if flat:
+            res.extend(pairs)
+        else:
+            res.append(pairs)
+        match = _separator_re.match(s, pos)
+        if match is None:
+            break
+        pos = match.end()
+        # остаток из одних пробелов (не всегда совпадающих с \s) не разбирается
+        if pos == len(s) or (s[pos].isspace() and not(s[pos:].strip())):
+            break
+    return res
+
+
+def read_rdn(s, flat=True):
+    '''
+    Разбор строки в формате RDN (вида "CN=Имя, O=Организация + OU=Отдел").
+    Строка разбирается за один проход, результаты разбора кэшируются.
+
+    :s: исходная строка
+    :flat: если True, возвращается список пар (имя, значение), иначе список
+        списков пар по компонентам RDN (пары внутри компонента объединяются
+        через "+")
+
+    '''
+    key = (s, flat)
+    res = _cache.get(key)
+    if res is None:
+        res = _read_rdn(s, flat)
+        if len(_cache) >= _cache_size:
+            _cache.clear()
+        _cache[key] = tuple(res) if flat else tuple(tuple(x) for x in res)
+        return res
+    return list(res) if flat else [list(x) for x in res]
 
 class RDN(dict):
     """Объектно-ориентированная обертка вокруг парсера РДН"""
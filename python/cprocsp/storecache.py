@@ -0,0 +1,126 @@
+# coding: utf-8
+from __future__ import unicode_literals, print_function
+
+import threading
+import time
+
+from . import csp
+
+
+class CertStoreCache(object):
+
+    """Долгоживущий дескриптор системного хранилища сертификатов с индексами.
+
+    Вместо открытия хранилища и линейного поиска (CertFindCertificateInStore)
+    на каждую операцию сертификаты один раз перечисляются и раскладываются по
+    словарям: отпечаток -> сертификат, идентификатор ключа субъекта ->
+    сертификат, имя субъекта -> список сертификатов.
+
+    Индекс перечитывается по истечении :ttl: секунд, при явном вызове
+    `invalidate()`, а также при промахе поиска (не чаще раза в
+    :miss_interval: секунд), чтобы находились только что добавленные
+    сертификаты.
+
+    Пример использования:
+    > cache = CertStoreCache(b"MY", ttl=300)
+    > cert = cache.find_by_thumb(unhexlify(thumb))
+
+    """
+
+    def __init__(self, name=b"MY", ttl=60, miss_interval=5):
+        self.name = name
+        self.ttl = ttl
+        self.miss_interval = miss_interval
+        self._lock = threading.Lock()
+        self._loaded = None
+        self._store = None
+        self._by_thumb = {}
+        self._by_key_id = {}
+        self._by_subject = {}
+
+    def refresh(self):
+        '''
+        Повторное открытие хранилища и перестроение индексов.
+
+        '''
+        store = csp.CertStore(None, self.name)
+        by_thumb, by_key_id, by_subject = {}, {}, {}
+        for cert in store:
+            by_thumb[cert.thumbprint()] = cert
+            try:
+                by_key_id[cert.subject_id()] = cert
+            except SystemError:
+                pass
+            by_subject.setdefault(csp.CertInfo(cert).name(), []).append(cert)
+        with self._lock:
+            self._store = store
+            self._by_thumb = by_thumb
+            self._by_key_id = by_key_id
+            self._by_subject = by_subject
+            self._loaded = time.time()
+
+    def invalidate(self):
+        '''
+        Сброс индексов, при следующем поиске хранилище будет перечитано.
+
+        '''
+        with self._lock:
+            self._loaded = None
+
+    def _age(self):
+        with self._lock:
+            if self._loaded is None:
+                return None
+            return time.time() - self._loaded
+
+    def _lookup(self, index, key):
+        age = self._age()
+        if age is None or age >= self.ttl:
+            self.refresh()
+            age = 0
+        res = getattr(self, index).get(key)
+        if res is None and age >= self.miss_interval:
+            self.refresh()
+            res = getattr(self, index).get(key)
+        return res
+
+    @property
+    def store(self):
+        '''
+        Открытое хранилище `csp.CertStore`, соответствующее текущим индексам.
+
+        '''
+        age = self._age()
+        if age is None or age >= self.ttl:
+            self.refresh()
+        return self._store
+
+    def find_by_thumb(self, thumb):
+        '''
+        Поиск сертификата по отпечатку.
+
+        :thumb: отпечаток в бинарном виде
+        :returns: `csp.Cert` или None
+
+        '''
+        return self._lookup('_by_thumb', thumb)
+
+    def find_by_key_id(self, key_id):
+        '''
+        Поиск сертификата по идентификатору ключа субъекта.
+
+        :key_id: идентификатор в бинарном виде
+        :returns: `csp.Cert` или None
+
+        '''
+        return self._lookup('_by_key_id', key_id)
+
+    def find_by_subject(self, name):
+        '''
+        Поиск сертификатов по имени субъекта в виде, возвращаемом
+        `csp.CertInfo.name()`, например b'CN=Test'.
+
+        :returns: список `csp.Cert`
+
+        '''
+        return list(self._lookup('_by_subject', name) or [])
@@ -0,0 +1,6 @@
+/* vim: ft=swig
+*/
+
+%feature("ref") CMSStream "$this->ref();"
+%feature("unref") CMSStream "$this->unref();"
+%include "stream.hpp"
@@ -25,6 +25,7 @@ def swig(size=void_size):
         '-python',
         '-py3',
         '-builtin',
+        '-threads',
         '-c++',
         '-Icpp/include',
         '-DSIZEOF_VOID_P={0}'.format(size),
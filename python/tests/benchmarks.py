@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+Замеры производительности основных операций. Требуют созданного тестами
+контейнера и сертификата (см. `tests.setup_package`).
+
+Запуск всех замеров:
+> python -m tests.benchmarks
+
+Запуск выбранных замеров:
+> python -m tests.benchmarks sign
+'''
+from __future__ import unicode_literals, print_function
+import os
+import sys
+import tempfile
+import time
+from timeit import Timer
+
+from cprocsp import cryptoapi, certutils
+from . import test_container, test_provider, get_test_thumb
+
+
+def _number_signs():
+    try:
+        return cryptoapi.provider_params(test_container, test_provider)['NumberSigns']
+    except (SystemError, ValueError):
+        return None
+
+
+def bench_sign(number=100):
+    '''
+    Подписывание коротких сообщений. Для HSM дополнительно выводится число
+    операций с закрытым ключом на одну подпись по счетчику провайдера
+    (должна быть одна).
+
+    '''
+    thumb = get_test_thumb()
+    data = os.urandom(1024 * 10)
+
+    def sign():
+        cryptoapi.sign(thumb, data, False, cont=test_container,
+                       provider=test_provider)
+
+    signs_before = _number_signs()
+    t = min(Timer(sign).repeat(repeat=3, number=number))
+    signs_after = _number_signs()
+    print('sign: {0:.2f} ms/op'.format(t * 1000 / number))
+    if signs_before is not None and signs_after != signs_before:
+        print('sign: {0:.2f} private key ops/signature'.format(
+            float(signs_after - signs_before) / (3 * number)))
+
+
+def _write_random_file(fn, size, block=1024 * 1024):
+    with open(fn, 'wb') as f:
+        for _ in range(size // block):
+            f.write(os.urandom(block))
+
+
+def bench_encrypt_stream(size=128 * 1024 * 1024):
+    '''
+    Шифрование большого файла: целиком в памяти (`encrypt`) и потоково из
+    файла в файл (`encrypt_stream`).
+
+    '''
+    cert = cryptoapi.get_certificate(get_test_thumb())
+    tmpdir = tempfile.mkdtemp()
+    src_fn = os.path.join(tmpdir, 'data.bin')
+    dst_fn = os.path.join(tmpdir, 'data.p7e')
+    _write_random_file(src_fn, size)
+    mb = float(size) / (1024 * 1024)
+
+    def encrypt_in_memory():
+        with open(src_fn, 'rb') as f:
+            cryptoapi.encrypt([cert], f.read())
+
+    def encrypt_streaming():
+        with open(src_fn, 'rb') as src, open(dst_fn, 'wb') as dst:
+            cryptoapi.encrypt_stream([cert], src, dst)
+
+    try:
+        for name, f in (('encrypt', encrypt_in_memory),
+                        ('encrypt_stream', encrypt_streaming)):
+            t = min(Timer(f).repeat(repeat=3, number=1))
+            print('{0}: {1:.0f} MB in {2:.2f} s, {3:.1f} MB/s'.format(
+                name, mb, t, mb / t))
+    finally:
+        for fn in (src_fn, dst_fn):
+            if os.path.exists(fn):
+                os.unlink(fn)
+        os.rmdir(tmpdir)
+
+
+def bench_decode_pkcs7(sizes=(1, 2, 5, 10), number=3):
+    '''
+    Разбор PKCS#7 сообщений размером до 10 МБ: подписанных с
+    присоединенными данными (длины определены) и шифрованных потоково
+    (содержимое неопределенной длины). Замеряется декодирование всего
+    сообщения (`decoder.decode`) и полный обход `certutils.PKCS7Msg`
+    (содержимое, вложенные данные, сертификаты) -- конструктор
+    `PKCS7Msg` ленивый и разбирает только заголовок. Время на мегабайт не
+    должно расти с размером сообщения.
+
+    '''
+    from io import BytesIO
+    from pyasn1_modules import rfc2315
+    from cprocsp import decoder
+
+    def decode(msg):
+        decoder.decode(msg, asn1Spec=rfc2315.ContentInfo())
+
+    def walk(msg):
+        m = certutils.PKCS7Msg(msg)
+        m.content
+        m.encapsulated()
+        m.certificates()
+
+    thumb = get_test_thumb()
+    cert = cryptoapi.get_certificate(thumb)
+    for mb in sizes:
+        data = os.urandom(mb * 1024 * 1024)
+        signed = cryptoapi.sign(thumb, data, True)
+        dst = BytesIO()
+        cryptoapi.encrypt_stream([cert], BytesIO(data), dst, chunk_size=4096)
+        for name, msg in (('signed', signed), ('enveloped', dst.getvalue())):
+            for mode, f in (('decode', lambda: decode(msg)),
+                            ('walk', lambda: walk(msg))):
+                t = min(Timer(f).repeat(repeat=3, number=number)) / number
+                print('decode_pkcs7 {0} {1} {2} MB: {3:.1f} ms, {4:.2f} ms/MB'.format(
+                    name, mode, mb, t * 1000, t * 1000 / mb))
+
+
+def bench_decode_cert(number=1000):
+    '''
+    Разбор сертификата (`rfc2459.Certificate`) универсальным декодером
+    (`decoder.decode`), скомпилированным по спецификации
+    (`decoder.compileSpec`) и им же в простые типы Python (`native`).
+
+    '''
+    from pyasn1_modules import rfc2459
+    from cprocsp import decoder
+    data = cryptoapi.get_certificate(get_test_thumb())
+    compiled = decoder.compileSpec(rfc2459.Certificate())
+    for name, f in (('generic', lambda: decoder.decode(data, asn1Spec=rfc2459.Certificate())),
+                    ('compiled', lambda: compiled(data)),
+                    ('native', lambda: compiled.native(data))):
+        t = min(Timer(f).repeat(repeat=3, number=number)) / number
+        print('decode_cert {0}: {1:.3f} ms'.format(name, t * 1000))
+
+
+def _int_bytewise(octets):
+    # прежний побайтовый разбор INTEGER, для сравнения
+    octets = bytearray(octets)
+    value = -1 if octets and octets[0] & 0x80 else 0
+    for octet in octets:
+        value = value << 8 | octet
+    return value
+
+
+def bench_decode_primitives(number=10000):
+    '''
+    Разбор OID и INTEGER: OID с мемоизацией по кодировке и без нее (кэш
+    очищается перед каждым разбором), INTEGER (2048 бит) через
+    `int.from_bytes` и побайтово.
+
+    '''
+    from cprocsp import decoder
+    oid = b'\x2a\x85\x03\x64\x01'
+    integer = b'\x7f' + os.urandom(255)
+    assert decoder._intFromOctets(integer) == _int_bytewise(integer)
+
+    def oid_uncached():
+        decoder._oidCache.clear()
+        decoder._decodeOid(oid)
+
+    for name, f in (('oid', oid_uncached),
+                    ('oid memoized', lambda: decoder._decodeOid(oid)),
+                    ('integer bytewise', lambda: _int_bytewise(integer)),
+                    ('integer', lambda: decoder._intFromOctets(integer))):
+        t = min(Timer(f).repeat(repeat=3, number=number)) / number
+        print('decode_primitives {0}: {1:.2f} us'.format(name, t * 1000000))
+
+
+def bench_request_exts(number=1000):
+    '''
+    Сборка субъекта и расширений запроса на сертификат (без обращения к
+    криптопровайдеру).
+
+    '''
+    params = dict(
+        Attributes=[('2.5.4.3', 'Тест'), ('2.5.4.6', 'RU'),
+                    ('1.2.643.100.1', '1234567890123'), ('2.5.4.10', 'ООО Тест')],
+        EKU=['1.3.6.1.5.5.7.3.2', '1.3.6.1.5.5.7.3.4'],
+        KeyUsage=['digitalSignature', 'nonRepudiation'],
+        SubjectAltName=[('rfc822Name', 'test@example.com')],
+        CertificatePolicies=[('1.2.643.100.113.1', [])])
+
+    def build():
+        p = dict(params)
+        certutils.set_q_defaults(p, True)
+        certutils.Attributes(p['Attributes']).encode()
+        exts = [certutils.KeyUsage(p['KeyUsage']), certutils.EKU(p['EKU']),
+                certutils.SubjectAltName(p['SubjectAltName']),
+                certutils.CertificatePolicies(p['CertificatePolicies'])]
+        exts += [certutils.CertExtension(str(oid), data, bool(crit))
+                 for (oid, data, crit) in p['RawExtensions']]
+        certutils.CertExtensions(exts)
+
+    t = min(Timer(build).repeat(repeat=3, number=number)) / number
+    print('request_exts: {0:.2f} us'.format(t * 1000000))
+
+
+def bench_enroll(number=20, workers=4):
+    '''
+    Массовый выпуск запросов во временных контейнерах: среднее время
+    создания ключей и запроса по `Timings` и общее время на запрос.
+
+    '''
+    conts = ['bench_enroll{0}'.format(i) for i in range(number)]
+    items = [(c, dict(Attributes=[('2.5.4.3', c)], KeyUsage=['digitalSignature']))
+             for c in conts]
+    try:
+        start = time.time()
+        results = list(cryptoapi.enroll_many(items, workers=workers))
+        total = time.time() - start
+    finally:
+        for c in conts:
+            cryptoapi.remove_key(c)
+    errors = [r['Error'] for r in results if r['Error'] is not None]
+    assert not errors, errors
+    for step in ('GenKey', 'CreateRequest'):
+        t = sum(r['Timings'][step] for r in results) / number
+        print('enroll {0}: {1:.2f} ms/op'.format(step, t * 1000))
+    print('enroll total ({0} workers): {1:.2f} ms/op'.format(
+        workers, total * 1000 / number))
+
+
+benchmarks = dict(
+    sign=bench_sign,
+    encrypt_stream=bench_encrypt_stream,
+    decode_pkcs7=bench_decode_pkcs7,
+    decode_cert=bench_decode_cert,
+    decode_primitives=bench_decode_primitives,
+    request_exts=bench_request_exts,
+    enroll=bench_enroll,
+)
+
+
+def main(names):
+    for name in names or sorted(benchmarks):
+        benchmarks[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
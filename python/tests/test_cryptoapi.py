@@ -4,10 +4,12 @@ from __future__ import unicode_literals, print_function
 from pyasn1_modules.rfc2459 import id_at_commonName as CN
 from cprocsp import cryptoapi, certutils, csp
 import sys
-from binascii import hexlify
+from binascii import hexlify, unhexlify
 from base64 import b64decode
 from datetime import datetime, timedelta
 import os
+import threading
+import time
 
 from . import case_path, test_local, test_container,\
     get_test_thumb, test_cn, test_provider
@@ -414,3 +416,441 @@ def test_block_encrypt_decrypt():
 def test_provider_params(provider=None):
     info = cryptoapi.provider_params(test_container, provider)
     assert len(info) == 9
+
+
+def test_context_pool():
+    from cprocsp.pool import ContextPool
+    pool = ContextPool(max_size=2)
+    old_pool, cryptoapi.context_pool = cryptoapi.context_pool, pool
+    try:
+        thumb = get_test_thumb()
+        sig1 = cryptoapi.sign(thumb, msg, False, cont=test_container,
+                              provider=test_provider)
+        assert len(pool) == 1
+        sig2 = cryptoapi.sign(thumb, msg, False, cont=test_container,
+                              provider=test_provider)
+        assert len(pool) == 1
+        assert cryptoapi.check_signature(None, sig1, msg, cont=test_container,
+                                         provider=test_provider)
+        assert cryptoapi.check_signature(None, sig2, msg, cont=test_container,
+                                         provider=test_provider)
+        pool.invalidate(test_container)
+        assert len(pool) == 0
+    finally:
+        cryptoapi.context_pool = old_pool
+
+
+def test_store_cache():
+    from cprocsp.storecache import CertStoreCache
+    cache = CertStoreCache(b"MY", ttl=300)
+    thumb = get_test_thumb()
+    cert = cryptoapi.get_certificate(thumb)
+    old_cache, cryptoapi.store_cache = cryptoapi.store_cache, cache
+    try:
+        assert cryptoapi.get_certificate(thumb) == cert
+        assert cryptoapi.get_certificate(name=test_cn) == cert
+        key_id = unhexlify(cryptoapi.cert_subject_id(cert))
+        assert cache.find_by_key_id(key_id).extract() == cert
+        sig = cryptoapi.sign(thumb, msg, False)
+        assert cryptoapi.check_signature(None, sig, msg)
+        assert cache.find_by_thumb(b'\0' * 20) is None
+        cache.invalidate()
+        assert cryptoapi.get_certificate(thumb) == cert
+    finally:
+        cryptoapi.store_cache = old_cache
+
+
+def test_sign_releases_gil():
+    thumb = get_test_thumb()
+    data = os.urandom(20 * 1024 * 1024)
+    ticks = [0]
+    stop = threading.Event()
+
+    def ticker():
+        while not stop.is_set():
+            ticks[0] += 1
+
+    t = threading.Thread(target=ticker)
+    t.start()
+    try:
+        time.sleep(0.1)
+        before = ticks[0]
+        time.sleep(0.2)
+        rate = (ticks[0] - before) / 0.2
+        before = ticks[0]
+        start = time.time()
+        cryptoapi.sign(thumb, data, False)
+        elapsed = time.time() - start
+        during = ticks[0] - before
+    finally:
+        stop.set()
+        t.join()
+    # при захваченном GIL поток на чистом Python стоял бы всю подпись
+    assert during > 0.25 * rate * elapsed
+
+
+def test_sign_stream():
+    from io import BytesIO
+    thumb = get_test_thumb()
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    sig = cryptoapi.sign_stream(thumb, BytesIO(data), chunk_size=64 * 1024)
+    assert cryptoapi.check_signature(None, sig, data)
+    assert not cryptoapi.check_signature(None, sig, data[:-1])
+    chunks = (data[i:i + 100000] for i in range(0, len(data), 100000))
+    sig = cryptoapi.sign_stream(thumb, chunks, cont=test_container,
+                                provider=test_provider)
+    assert cryptoapi.check_signature(None, sig, data)
+
+
+def test_decrypt_stream():
+    from io import BytesIO
+    thumb = get_test_thumb()
+    cert = cryptoapi.get_certificate(thumb)
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    encrypted_data = cryptoapi.encrypt([cert], data)
+    dst = BytesIO()
+    n = cryptoapi.decrypt_stream(BytesIO(encrypted_data), dst, thumb,
+                                 chunk_size=64 * 1024)
+    assert n == len(data)
+    assert dst.getvalue() == data
+    dst = BytesIO()
+    cryptoapi.decrypt_stream(BytesIO(encrypted_data), dst, cont=test_container,
+                             provider=test_provider)
+    assert dst.getvalue() == data
+
+
+def test_encrypt_stream():
+    from io import BytesIO
+    thumb = get_test_thumb()
+    cert = cryptoapi.get_certificate(thumb)
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    dst = BytesIO()
+    n = cryptoapi.encrypt_stream([cert], BytesIO(data), dst,
+                                 chunk_size=64 * 1024)
+    encrypted_data = dst.getvalue()
+    assert n == len(encrypted_data)
+    assert cryptoapi.decrypt(encrypted_data, thumb) == data
+    dst = BytesIO()
+    cryptoapi.decrypt_stream(BytesIO(encrypted_data), dst, thumb)
+    assert dst.getvalue() == data
+
+
+def test_check_signature_stream():
+    from io import BytesIO
+    thumb = get_test_thumb()
+    cert = cryptoapi.get_certificate(thumb)
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    sig = cryptoapi.sign(thumb, data, False)
+    assert cryptoapi.check_signature_stream(sig, BytesIO(data),
+                                            chunk_size=64 * 1024)
+    assert cryptoapi.check_signature_stream(sig, BytesIO(data), cert)
+    assert not cryptoapi.check_signature_stream(sig, BytesIO(data[:-1]))
+    chunks = (data[i:i + 100000] for i in range(0, len(data), 100000))
+    assert cryptoapi.check_signature_stream(sig, chunks, cert)
+
+
+def test_enroll_many():
+    if TEST_ALL is None:
+        return
+    conts = ['test_container_bulk{0}'.format(i) for i in range(4)]
+    items = [(c, dict(Attributes=[(CN, c)], KeyUsage=['digitalSignature'],
+                      EKU=[csp.szOID_PKIX_KP_CLIENT_AUTH]))
+             for c in conts]
+    requests = []
+    try:
+        results = list(cryptoapi.enroll_many(
+            iter(items + [(conts[0], None)]),
+            sink=lambda cont, req: requests.append((cont, req)), workers=2))
+        assert [r['Container'] for r in results] == conts + [conts[0]]
+        assert all(r['Error'] is None for r in results[:-1])
+        assert all(r['Request'] is None for r in results)
+        assert results[-1]['Error'] is not None
+        assert sorted(results[0]['Timings']) == ['CreateRequest', 'GenKey']
+        assert [c for (c, _) in requests] == conts
+        assert all(c.encode('ascii') in req for (c, req) in requests)
+    finally:
+        for c in conts:
+            cryptoapi.remove_key(c)
+
+
+def test_sign_many():
+    thumb = get_test_thumb()
+    items = [os.urandom(1000 + i) for i in range(20)]
+    sigs = list(cryptoapi.sign_many(thumb, items))
+    assert len(sigs) == len(items)
+    assert all(cryptoapi.check_signature(None, s, d) for s, d in zip(sigs, items))
+    sigs = list(cryptoapi.sign_many(thumb, iter(items), include_data=True,
+                                    workers=4, cont=test_container,
+                                    provider=test_provider))
+    assert [cryptoapi.pkcs7_info(s)['Content'] for s in sigs] == items
+
+
+def test_verify_many():
+    thumb = get_test_thumb()
+    cert = cryptoapi.get_certificate(thumb)
+    items = [os.urandom(1000 + i) for i in range(20)]
+    sigs = list(cryptoapi.sign_many(thumb, items))
+    pairs = list(zip(sigs, items))
+    pairs.append((sigs[0], items[1]))
+    pairs.append((b'garbage', items[0]))
+    for res in (list(cryptoapi.verify_many(pairs)),
+                list(cryptoapi.verify_many(pairs, [cert], workers=4))):
+        assert all(ok and err is None for ok, err in res[:-2])
+        assert res[-2] == (False, None)
+        assert not res[-1][0] and res[-1][1] is not None
+
+
+def test_output_buffer():
+    thumb = get_test_thumb()
+    cert = cryptoapi.get_certificate(thumb)
+    data = os.urandom(1024 * 1024)
+    buf = bytearray(len(data) + 64 * 1024)
+    n = cryptoapi.sign(thumb, data, True, out=buf)
+    assert cryptoapi.pkcs7_info(bytes(buf[:n]))['Content'] == data
+    n = cryptoapi.encrypt([cert], data, out=buf)
+    encrypted_data = bytes(buf[:n])
+    n = cryptoapi.decrypt(encrypted_data, thumb, out=buf)
+    assert buf[:n] == data
+    # мал буфер -- в исключении нужный размер
+    small = bytearray(1024)
+    try:
+        cryptoapi.decrypt(encrypted_data, thumb, out=small)
+        assert False, 'Small buffer accepted'
+    except SystemError as e:
+        required = e.required_size
+    assert required >= len(data)
+    buf = bytearray(required)
+    n = cryptoapi.decrypt(encrypted_data, thumb, out=buf)
+    assert buf[:n] == data
+
+
+def test_file_functions():
+    thumb = get_test_thumb()
+    cert = cryptoapi.get_certificate(thumb)
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    fn = case_path('file_functions.bin')
+    enc_fn = fn + '.p7e'
+    with open(fn, 'wb') as f:
+        f.write(data)
+    limit = cryptoapi.mmap_limit
+    try:
+        for cryptoapi.mmap_limit in (limit, 1024):
+            sig = cryptoapi.sign_file(thumb, fn)
+            assert cryptoapi.check_signature(None, sig, data)
+            assert cryptoapi.check_signature_file(cert, sig, fn)
+            assert not cryptoapi.check_signature_file(cert, sig, case_path('fss.cer'))
+            assert (cryptoapi.Hash.from_file(fn).digest() ==
+                    cryptoapi.Hash(data).digest())
+            n = cryptoapi.encrypt_file([cert], fn, enc_fn)
+            with open(enc_fn, 'rb') as f:
+                encrypted_data = f.read()
+            assert len(encrypted_data) == n
+            assert cryptoapi.decrypt(encrypted_data, thumb) == data
+        attached = cryptoapi.sign_file(thumb, fn, include_data=True)
+        assert cryptoapi.pkcs7_info(attached)['Content'] == data
+        # шифрование файла в самого себя отвергается, исходный файл цел
+        try:
+            cryptoapi.encrypt_file([cert], fn, fn)
+            assert False, 'Same source and destination accepted'
+        except ValueError:
+            pass
+        with open(fn, 'rb') as f:
+            assert f.read() == data
+    finally:
+        cryptoapi.mmap_limit = limit
+        for f in (fn, enc_fn):
+            if os.path.exists(f):
+                os.unlink(f)
+
+
+def test_pkcs7_msg_indefinite_length():
+    from io import BytesIO
+    thumb = get_test_thumb()
+    cert = cryptoapi.get_certificate(thumb)
+    dst = BytesIO()
+    cryptoapi.encrypt_stream([cert], BytesIO(os.urandom(10 * 1024 * 1024)), dst,
+                             chunk_size=4096)
+    info = certutils.PKCS7Msg(dst.getvalue()).abstract()
+    assert info['ContentType'] == 'envelopedData'
+    assert len(info['RecipientInfos']) == 1
+
+
+def test_constructed_bit_string():
+    from cprocsp import decoder
+    decoder.Decoder.supportIndefLength = True
+    segments = b'\x03\x03\x00\xab\xcd\x03\x02\x04\xf0'
+    bits = (1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1, 1, 1)
+    for data in (b'\x23\x09' + segments, b'\x23\x80' + segments + b'\x00\x00'):
+        value, rest = decoder.decode(data)
+        assert tuple(value) == bits
+        assert not rest
+    many = decoder.decode(b'\x23\x80' + b'\x03\x02\x00\x55' * 20000 + b'\x00\x00')[0]
+    assert tuple(many) == (0, 1) * 80000
+
+
+def test_pkcs7_msg_lazy():
+    from pyasn1.type import univ
+    thumb = get_test_thumb()
+    data = os.urandom(50 * 1024 * 1024)
+    signed = cryptoapi.sign(thumb, data, True)
+    pkcs7 = certutils.PKCS7Msg(signed)
+    assert len(pkcs7.abstract()['SignerInfos']) == 1
+    content = pkcs7.lazy_content['contentInfo']['content'].cast(univ.OctetString())
+    assert content.value.asOctets() == data
+    assert [c.name for c in pkcs7.lazy_content][-1] == 'signerInfos'
+
+
+def test_pkcs7_info_parts():
+    thumb = get_test_thumb()
+    data = os.urandom(1024 * 1024)
+    signed = cryptoapi.sign(thumb, data, True)
+    info = cryptoapi.pkcs7_info(signed, copy=False)
+    assert isinstance(info['Content'], memoryview)
+    assert info['Content'] == data
+    assert info['Certificates'] == [cryptoapi.get_certificate(thumb)]
+    info = cryptoapi.pkcs7_info(signed, parts=('SignerInfos',))
+    assert sorted(info) == ['ContentType', 'SignerInfos']
+    detached = cryptoapi.pkcs7_info(cryptoapi.sign(thumb, data, False))
+    assert detached['Content'] == b''
+    # signedData с вложенным содержимым, не являющимся строкой октетов:
+    # содержимое берется через CryptoAPI
+    from pyasn1.codec.der import encoder
+    from pyasn1_modules import rfc2315
+    from cprocsp import decoder
+    ci = decoder.decode(signed, asn1Spec=rfc2315.ContentInfo())[0]
+    sd = decoder.decode(ci['content'].asOctets(), asn1Spec=rfc2315.SignedData())[0]
+    for raw in (b'\x02\x01\x05', b'\x30\x03\x02\x01\x05'):
+        inner = rfc2315.ContentInfo()
+        inner['contentType'] = rfc2315.digestedData
+        inner['content'] = inner.getComponentType().getTypeByPosition(1).clone(raw)
+        sd['contentInfo'] = inner
+        ci['content'] = ci['content'].clone(encoder.encode(sd))
+        msg = encoder.encode(ci)
+        assert certutils.PKCS7Msg(msg).encapsulated() is None
+        info = cryptoapi.pkcs7_info(msg)
+        assert info['Content'] == csp.CryptMsg(msg).get_data()
+        assert info['Certificates'] == [cryptoapi.get_certificate(thumb)]
+
+
+def test_compiled_decoder():
+    from pyasn1.codec.der import encoder
+    from pyasn1_modules import rfc2459, rfc2315
+    from cprocsp import decoder
+    cases = [(x, rfc2459.Certificate) for x in ('fss.cer', 'fns.cer', 'res1.cer', 'res2.cer', 'res3.cer')]
+    cases += [(x, rfc2315.ContentInfo) for x in ('data1.p7s', 'data2.p7s', 'logical.cms')]
+    for fn, spec in cases:
+        data = open(case_path(fn), 'rb').read()
+        if data.startswith(b'-----'):
+            data = certutils.autopem(data)
+        value, rest = decoder.compileSpec(spec())(data)
+        expected, expected_rest = decoder.decode(data, asn1Spec=spec())
+        assert value.prettyPrint() == expected.prettyPrint()
+        assert encoder.encode(value) == encoder.encode(expected)
+        assert rest == expected_rest
+    # результаты разбора независимы друг от друга
+    data = open(case_path('fss.cer'), 'rb').read()
+    compiled = decoder.compileSpec(rfc2459.Certificate())
+    first, second = compiled(data)[0], compiled(data)[0]
+    serial = int(second[0]['serialNumber'])
+    first[0].setComponentByName('serialNumber', serial + 1)
+    first[0]['extensions'].setComponentByPosition(0, first[0]['extensions'][1])
+    assert int(second[0]['serialNumber']) == serial
+    assert encoder.encode(second) == data
+    assert decoder.compileSpec(rfc2459.Name()) is decoder.compileSpec(rfc2459.Name())
+
+
+def test_native_decoder():
+    from pyasn1_modules import rfc2459
+    from cprocsp import decoder
+    compiled = decoder.compileSpec(rfc2459.Certificate())
+    for fn in ('fss.cer', 'fns.cer', 'res1.cer', 'res2.cer', 'res3.cer'):
+        data = open(case_path(fn), 'rb').read()
+        if data.startswith(b'-----'):
+            data = certutils.autopem(data)
+        cert = compiled(data)[0]
+        native = compiled.native(data)[0]
+        assert native == decoder.toNative(cert)
+        tbs = native['tbsCertificate']
+        assert tbs['serialNumber'] == int(cert[0]['serialNumber'])
+        assert tbs['signature']['algorithm'] == str(cert[0]['signature'][0])
+        issuer = certutils.CertificateInfo(data).info['tbsCertificate']['issuer'].raw
+        assert certutils.Attributes.load(issuer).decode() == \
+            certutils.Attributes(cert[0]['issuer']).decode()
+
+
+def test_fast_name_decoder():
+    from pyasn1.codec.der import encoder
+    from pyasn1.type import char, univ
+    from cprocsp import decoder
+    values = [char.UTF8String('Тест'), char.PrintableString('test'),
+              char.BMPString('Тест'), char.IA5String('a@b.c'),
+              char.NumericString('0123'), char.TeletexString(b'\xd2\xe5st'),
+              char.UTF8String(b'bad \xff utf8'), char.PrintableString('x' * 300)]
+    for value in values:
+        der = encoder.encode(value)
+        assert certutils._decode_string(der) == unicode(decoder.decode(der)[0])
+    assert certutils._decode_string(encoder.encode(univ.Integer(1))) is None
+    address = univ.SequenceOf(componentType=char.UTF8String())
+    address.setComponentByPosition(0, char.UTF8String('ул. '))
+    address.setComponentByPosition(1, char.UTF8String('Тестовая'))
+    der = encoder.encode(address)
+    assert certutils._decode_address(der) == \
+        certutils.Attributes._decode_value('2.5.4.16', der)
+
+
+def test_request_templates():
+    from pyasn1.codec.der import encoder
+    attrs = [[('2.5.4.3', 'Тест'), ('2.5.4.6', 'RU')], ('2.5.4.10', 'x' * 300),
+             ('1.2.643.100.1', '1234567890123'), ('2.5.4.16', 'ул. Тестовая')]
+    exts = [certutils.EKU(['1.3.6.1.5.5.7.3.2', '1.3.6.1.5.5.7.3.4']),
+            certutils.KeyUsage(['digitalSignature', 'nonRepudiation']),
+            certutils.SubjectAltName([('rfc822Name', 'test@example.com'),
+                                      ('directoryName', [('2.5.4.3', 'Тест')])]),
+            certutils.CertificatePolicies([('1.2.643.100.113.1', [])]),
+            certutils.CertExtension('1.2.3', b'\x05\x00', True)]
+    for item in [certutils.Attributes(attrs)] + exts:
+        der = item.encode()
+        assert encoder.encode(item.asn) == der
+        assert item.encode() == der
+    params = {}
+    certutils.set_q_defaults(params)
+    assert params['RawExtensions'][0][0] == '1.2.643.100.111'
+
+
+def test_cert_cache():
+    from cprocsp.certcache import CertCache
+    cert = open(case_path('fss.cer'), 'rb').read()
+    expected = cryptoapi.cert_info(cert)
+    old_cache, cryptoapi.cert_cache = cryptoapi.cert_cache, CertCache(max_bytes=64 * 1024)
+    try:
+        info = cryptoapi.cert_info(cert)
+        assert info == expected
+        info['Subject'].append(('2.5.4.3', 'changed'))
+        assert cryptoapi.cert_info(cert) == expected
+        assert cryptoapi.cert_subject_id(cert) == cryptoapi.cert_subject_id(cert)
+        stats = cryptoapi.cert_cache.stats()
+        assert stats['hits'] == 2
+        assert stats['bytes'] <= 64 * 1024
+        thumb = get_test_thumb()
+        signed = cryptoapi.sign(thumb, b'data', True)
+        info = cryptoapi.pkcs7_info(signed)
+        assert info == cryptoapi.pkcs7_info(signed)
+        assert cryptoapi.cert_cache.stats()['hits'] == 3
+    finally:
+        cryptoapi.cert_cache = old_cache
+
+
+def test_read_rdn():
+    from cprocsp import rdn
+    s = 'CN=Тест+ O="ООО \\"Тест\\", Москва" ; C=RU,\n2.5.4.7 = Москва, '
+    expected = [('CN', 'Тест'), ('O', '"ООО \\"Тест\\", Москва"'),
+                ('C', 'RU'), ('2.5.4.7', 'Москва')]
+    assert rdn.read_rdn(s) == expected
+    res = rdn.read_rdn(s)
+    res.append(('OU', 'x'))
+    assert rdn.read_rdn(s) == expected
+    assert rdn.read_rdn(s, flat=False) == [expected[:2], expected[2:3], expected[3:]]
+    assert rdn.read_rdn('  ') == []
+    assert rdn.RDN(s)['C'] == 'RU'
+    long_name = ', '.join('CN=name{0}'.format(i) for i in range(5000))
+    assert len(rdn.read_rdn(long_name)) == 5000
@@ -453,6 +453,21 @@ def test_msg_signatures():
     assert all(msg.verify_cert(c) for c in cs)
 
 
+def test_msg_decode_no_copy():
+    '''
+    Сообщение декодируется прямо из переданного буфера, копия данных не
+    хранится: после создания `CryptMsg` буфер можно изменять или удалять.
+    '''
+    cs = csp.CertStore(None, b"MY")
+    cert = list(cs.find_by_name(test_cn))[0]
+    buf = bytearray(csp.CryptMsg().sign_data(b'hurblewurble', cert))
+    msg = csp.CryptMsg(buf)
+    buf[:] = b'\0' * len(buf)
+    assert msg.num_signers() == 1
+    assert msg.verify(0)
+    assert msg.get_data() == b'hurblewurble'
+
+
 def test_detached_sign2():
     '''
     Класс `Signature` наследует всю функциональность `CryptMsg`, но
@@ -668,6 +683,26 @@ def test_hash_digest_random():
     assert digest1 == digest2
 
 
+def test_hash_buffer_input():
+    '''
+    Входные данные принимаются из любого объекта с буферным протоколом.
+    '''
+    ctx = csp.Crypt(
+        b'',
+        PROV_GOST,
+        csp.CRYPT_VERIFYCONTEXT,
+        test_provider
+    )
+    data = os.urandom(1024)
+    length = 0 if test_cn.endswith(b'2012') else 2001
+    digest = csp.Hash(ctx, data, length).digest()
+    for buf in (bytearray(data), memoryview(data), memoryview(b'xx' + data)[2:]):
+        hash1 = csp.Hash(ctx, length)
+        hash1.update(buf)
+        assert hash1.digest() == digest
+        assert csp.Hash(ctx, buf, length).digest() == digest
+
+
 def test_hash_digest_empty():
     ctx = csp.Crypt(
         b'',